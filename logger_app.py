@@ -1,17 +1,22 @@
-import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox, filedialog
 import sys
+import json
 import argparse
+import multiprocessing
 from pathlib import Path
-from phologtolabstreaminglayer.logger_app import LoggerApp
+from typing import Optional
 from phologtolabstreaminglayer.features.hide_console import auto_hide_console
-from phopylslhelper.mixins.app_helpers import SingletonInstanceMixin
+# NOTE: tkinter and the GUI app are imported inside `main()` so `--headless` never loads them
 
-def main(xdf_folder: Path, unsafe: bool = False):
+def main(xdf_folder: Path, unsafe: bool = False, ingest_port: Optional[int] = None):
     """ 
         unsafe: bool = False skips the singleton lock check on startup, the user should first confirmt that there aren't multiple instances running.
+        ingest_port: marker ingest socket port (None for the default, 0 disables it).
 
     """
+    import tkinter as tk
+    from tkinter import messagebox
+    from phologtolabstreaminglayer.logger_app import LoggerApp
+
     # Check if another instance is already running (unless --unsafe)
     if not unsafe and LoggerApp.is_instance_running():
         messagebox.showerror("Instance Already Running", 
@@ -21,7 +26,7 @@ def main(xdf_folder: Path, unsafe: bool = False):
         sys.exit(1)
     
     root = tk.Tk()
-    app = LoggerApp(root, xdf_folder=xdf_folder)
+    app = LoggerApp(root, xdf_folder=xdf_folder, ingest_port=ingest_port)
     
     # Try to acquire the singleton lock (unless --unsafe)
     if not unsafe and not app.acquire_singleton_lock():
@@ -47,19 +52,44 @@ def main(xdf_folder: Path, unsafe: bool = False):
 
 def console_main():
     """Console script entry point for uv run logger_app"""
-    # Hide the Windows console window (no-op on other platforms)
-    auto_hide_console()
-    
+    # Frozen (PyInstaller) builds: let spawned worker processes (e.g. live transcription) run their target instead of the app
+    multiprocessing.freeze_support()
+
     parser = argparse.ArgumentParser(description='PhoLogToLabStreamingLayer')
     parser.add_argument('--unsafe', action='store_true', help='Override safety checks and allow multiple instances')
+    parser.add_argument('--xdf-folder', type=Path, default=None, help='Folder for recordings')
+    parser.add_argument('--headless', action='store_true', help='Run outlets, stream discovery and recording without a GUI (controlled by signals or the control socket)')
+    parser.add_argument('--control-port', type=int, default=None, help='Headless control socket port on 127.0.0.1 (default 13380, 0 disables it)')
+    parser.add_argument('--rotate-minutes', type=float, default=None, help='Headless: split the recording into a new file every N minutes')
+    parser.add_argument('--no-auto-record', action='store_true', help='Headless: do not start recording automatically')
+    parser.add_argument('--ingest-port', type=int, default=None, help='Marker ingest socket port on 127.0.0.1 for other processes (default 13381, 0 disables it)')
+    parser.add_argument('--control', metavar='COMMAND', default=None, help='Send a command (e.g. "status", "split", "log some text") to a running headless daemon and print its reply')
     args = parser.parse_args()
     unsafe = args.unsafe
+
+    if args.control is not None:
+        from phologtolabstreaminglayer.headless_daemon import send_control_command
+        try:
+            reply = send_control_command(args.control, port=args.control_port)
+        except OSError as e:
+            print(f"Could not reach the headless daemon: {e}", file=sys.stderr)
+            sys.exit(2)
+        print(json.dumps(reply, indent=2))
+        sys.exit(0 if reply.get('ok') else 1)
+
+    if args.headless:
+        # Headless mode keeps the console (it's where the log goes) and never imports tkinter
+        from phologtolabstreaminglayer.headless_daemon import run_headless_daemon
+        sys.exit(run_headless_daemon(xdf_folder=args.xdf_folder, control_port=args.control_port, rotate_minutes=args.rotate_minutes, auto_record=not args.no_auto_record, ingest_port=args.ingest_port))
+
+    # Hide the Windows console window (no-op on other platforms)
+    auto_hide_console()
     
     _default_xdf_folder = Path(r'E:\Dropbox (Personal)\Databases\UnparsedData\PhoLogToLabStreamingLayer_logs').resolve()
     # _default_xdf_folder = Path('/media/halechr/MAX/cloud/University of Michigan Dropbox/Pho Hale/Personal/LabRecordedTextLog').resolve() ## Lab computer
     # LoggerApp._default_xdf_folder = _default_xdf_folder
     # assert _default_xdf_folder.exists(), f"XDF folder does not exist: {_default_xdf_folder}"
-    main(xdf_folder=_default_xdf_folder, unsafe=unsafe)
+    main(xdf_folder=(args.xdf_folder or _default_xdf_folder), unsafe=unsafe, ingest_port=args.ingest_port)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Microbenchmarks of the programmatic client (`phologtolabstreaminglayer.client.LoggerClient`).
+
+Measures:
+    per-call    - cost of one `client.log(...)` call on the calling thread (timestamp + queueing), as a bulk mean and as
+                  percentiles of individually timed calls
+    end-to-end  - markers per second from the first `log` until `flush()` returns (everything received by the logger)
+    disconnected- cost of `log` while no logger is reachable (markers are only buffered)
+    push_sample - for comparison, one `pylsl.StreamOutlet.push_sample` per marker on an outlet of our own
+
+By default the client talks to a stand-in logger started in a child process (a `MarkerIngestServer` whose outlet
+dispatchers push to a no-op outlet), so no app or LSL network is needed. Use `--port` to benchmark against a running
+logger instead (its markers are then really sent).
+
+Usage:
+    python scripts/benchmark_client.py --n 200000
+    python scripts/benchmark_client.py --port 13381 --n 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+import pylsl
+
+from phologtolabstreaminglayer.client import LoggerClient
+
+
+class _NullOutlet:
+    def push_chunk(self, samples, timestamps):
+        pass
+
+    def push_sample(self, sample, timestamp):
+        pass
+
+
+def _stand_in_logger(port_queue):
+    """Child process: a marker ingest server with no-op outlets, until killed."""
+    from phologtolabstreaminglayer.features.outlet_dispatcher import OutletDispatcher
+    from phologtolabstreaminglayer.features.marker_ingest_server import MarkerIngestServer
+    dispatchers = {a_name: OutletDispatcher(a_name, outlet=_NullOutlet()) for a_name in ('TextLogger', 'EventBoard')}
+    for a_dispatcher in dispatchers.values():
+        a_dispatcher.start()
+    server = MarkerIngestServer(get_dispatcher=dispatchers.get, port=0)
+    server.start()
+    port_queue.put(server.port)
+    while True:
+        time.sleep(1.0)
+
+
+def _percentiles_us(samples_ns) -> str:
+    samples_ns = sorted(samples_ns)
+    pick = lambda q: samples_ns[min(len(samples_ns) - 1, int(q * len(samples_ns)))] / 1000.0
+    return f"p50 {pick(0.50):6.2f} us  p99 {pick(0.99):6.2f} us  p99.9 {pick(0.999):7.2f} us  max {samples_ns[-1] / 1000.0:8.1f} us"
+
+
+def bench_per_call(port: int, n: int):
+    with LoggerClient(port=port, max_buffered=n + 1) as client:
+        client.flush()
+        t = time.perf_counter()
+        for i in range(n):
+            client.log("benchmark marker")
+        bulk_sec = time.perf_counter() - t
+        client.flush(timeout=60.0)
+
+        timings_ns = []
+        perf_counter_ns = time.perf_counter_ns
+        for i in range(min(n, 50000)):
+            t0 = perf_counter_ns()
+            client.log("benchmark marker")
+            timings_ns.append(perf_counter_ns() - t0)
+        client.flush(timeout=60.0)
+    print(f"per-call      : mean {bulk_sec / n * 1e6:6.2f} us/call (bulk, n={n});  individually timed: {_percentiles_us(timings_ns)}")
+
+
+def bench_end_to_end(port: int, n: int, repeats: int = 3):
+    rates = []
+    for _ in range(repeats):
+        with LoggerClient(port=port, max_buffered=n + 1) as client:
+            client.flush()
+            t = time.perf_counter()
+            for i in range(n):
+                client.log(f"benchmark marker {i}")
+            ok = client.flush(timeout=120.0)
+            elapsed = time.perf_counter() - t
+            if not ok:
+                print("end-to-end    : flush timed out")
+                return
+            rates.append(n / elapsed)
+    print(f"end-to-end    : {statistics.median(rates):10.0f} markers/s (median of {repeats}, n={n}, until flush() returned)")
+
+
+def bench_disconnected(n: int):
+    client = LoggerClient(port=1, max_buffered=n + 1, reconnect_interval_sec=60.0) # nothing listens on port 1
+    t = time.perf_counter()
+    for i in range(n):
+        client.log("benchmark marker")
+    elapsed = time.perf_counter() - t
+    print(f"disconnected  : mean {elapsed / n * 1e6:6.2f} us/call ({client.pending} buffered)")
+    client._running = False # don't wait for a logger that isn't there
+
+
+def bench_push_sample(n: int):
+    try:
+        outlet = pylsl.StreamOutlet(pylsl.StreamInfo('ClientBenchmark', 'Markers', 1, pylsl.IRREGULAR_RATE, pylsl.cf_string, 'client_benchmark'))
+    except Exception as e:
+        print(f"push_sample   : skipped ({e})")
+        return
+    t = time.perf_counter()
+    for i in range(n):
+        outlet.push_sample(["benchmark marker"], pylsl.local_clock())
+    elapsed = time.perf_counter() - t
+    print(f"push_sample   : mean {elapsed / n * 1e6:6.2f} us/call (own outlet, for comparison)")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Microbenchmarks of the logger client")
+    parser.add_argument('--n', type=int, default=100000, help='Markers per measurement')
+    parser.add_argument('--port', type=int, default=None, help='Ingest port of a running logger (default: start a stand-in logger)')
+    args = parser.parse_args()
+
+    stand_in = None
+    port = args.port
+    if port is None:
+        port_queue = multiprocessing.get_context('spawn').Queue()
+        stand_in = multiprocessing.get_context('spawn').Process(target=_stand_in_logger, args=(port_queue,), daemon=True)
+        stand_in.start()
+        port = port_queue.get(timeout=30.0)
+        print(f"stand-in logger on port {port}")
+    try:
+        bench_per_call(port, args.n)
+        bench_end_to_end(port, args.n)
+        bench_disconnected(args.n)
+        bench_push_sample(min(args.n, 20000))
+    finally:
+        if stand_in is not None:
+            stand_in.terminate()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
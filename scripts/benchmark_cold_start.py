@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Measure cold-start time of the logger app with lazy imports vs. eager imports.
+
+Each run is a fresh Python process. "lazy" is the normal mode; "eager" sets PHO_LOGTOLABSTREAMINGLAYER_EAGER_IMPORTS=1,
+which makes every `lazy_import(...)` load immediately (the pre-lazy-import behaviour).
+
+Modes:
+    import  - time to `import phologtolabstreaminglayer.logger_app` (no display needed)
+    window  - time from process start until the main window has been built and processed its first events
+              (needs a display; the app is closed right after)
+
+Usage:
+    python scripts/benchmark_cold_start.py --mode import --runs 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+
+_import_snippet = """
+import time
+t = time.perf_counter()
+import phologtolabstreaminglayer.logger_app
+print(time.perf_counter() - t)
+"""
+
+_window_snippet = """
+import time
+t = time.perf_counter()
+import tkinter as tk
+from phologtolabstreaminglayer.logger_app import LoggerApp
+root = tk.Tk()
+app = LoggerApp(root)
+root.update()
+print(time.perf_counter() - t)
+app.on_closing()
+"""
+
+
+def run_once(mode: str, eager: bool, project_root: Path) -> float:
+    """Run one fresh process and return the measured seconds."""
+    env = dict(os.environ)
+    env['PHO_LOGTOLABSTREAMINGLAYER_EAGER_IMPORTS'] = '1' if eager else '0'
+    env['PYTHONPATH'] = os.pathsep.join([str(project_root / 'src'), env.get('PYTHONPATH', '')])
+    snippet = _import_snippet if mode == 'import' else _window_snippet
+    result = subprocess.run([sys.executable, '-c', snippet], cwd=project_root, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"benchmark run failed:\n{result.stderr}")
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark cold start with lazy vs. eager imports")
+    parser.add_argument('--mode', choices=('import', 'window'), default='import')
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    project_root = Path(__file__).resolve().parents[1]
+    results = {}
+    for a_label, is_eager in (('eager', True), ('lazy', False)):
+        times = [run_once(args.mode, is_eager, project_root) for _ in range(args.runs)]
+        results[a_label] = statistics.median(times)
+        print(f"{a_label:>5}: median {results[a_label] * 1000.0:8.1f} ms  (runs: {', '.join(f'{t * 1000.0:.0f}' for t in times)})")
+
+    if results['eager'] > 0:
+        print(f"lazy/eager: {results['lazy'] / results['eager']:.2f}x  (saved {(results['eager'] - results['lazy']) * 1000.0:.0f} ms)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
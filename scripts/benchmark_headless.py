@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Compare the resident memory (RSS) and idle CPU use of the headless daemon against the GUI app.
+
+Each mode is started as a fresh process (`logger_app.py --headless` / `logger_app.py --unsafe`), left to settle, then
+sampled with psutil for a fixed window. Memory and CPU are reported for the main process and for its whole process
+tree (the GUI mode also runs the transcription worker process). The GUI mode needs a display.
+
+Usage:
+    python scripts/benchmark_headless.py --settle 20 --duration 30
+    python scripts/benchmark_headless.py --modes headless   # no display available
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import psutil
+
+
+_benchmark_control_port: int = 13390
+
+
+def _tree(process: psutil.Process):
+    try:
+        return [process] + process.children(recursive=True)
+    except psutil.NoSuchProcess:
+        return [process]
+
+
+def measure(mode: str, project_root: Path, settle_sec: float, duration_sec: float, interval_sec: float = 1.0) -> dict:
+    """Start the app in `mode` ('headless' or 'gui'), sample it and stop it. Returns the measurements."""
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join([str(project_root / 'src'), env.get('PYTHONPATH', '')])
+    args = [sys.executable, str(project_root / 'logger_app.py'), '--unsafe']
+    if mode == 'headless':
+        args += ['--headless', '--control-port', str(_benchmark_control_port), '--no-auto-record']
+    proc = subprocess.Popen(args, cwd=project_root, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        main_process = psutil.Process(proc.pid)
+        time.sleep(settle_sec)
+        if proc.poll() is not None:
+            raise RuntimeError(f"{mode} mode exited early with code {proc.returncode}")
+
+        for a_process in _tree(main_process):
+            a_process.cpu_percent(None) # prime the CPU counters
+        main_rss, tree_rss, main_cpu, tree_cpu = [], [], [], []
+        end_t = time.monotonic() + duration_sec
+        while time.monotonic() < end_t:
+            time.sleep(interval_sec)
+            processes = _tree(main_process)
+            cpu_by_process, rss_by_process = {}, {}
+            for a_process in processes:
+                try:
+                    cpu_by_process[a_process.pid] = a_process.cpu_percent(None)
+                    rss_by_process[a_process.pid] = a_process.memory_info().rss
+                except psutil.NoSuchProcess:
+                    continue
+            main_rss.append(rss_by_process.get(main_process.pid, 0))
+            main_cpu.append(cpu_by_process.get(main_process.pid, 0.0))
+            tree_rss.append(sum(rss_by_process.values()))
+            tree_cpu.append(sum(cpu_by_process.values()))
+        return {
+            'main_rss_mb': statistics.median(main_rss) / (1024 * 1024),
+            'tree_rss_mb': statistics.median(tree_rss) / (1024 * 1024),
+            'main_cpu_pct': statistics.mean(main_cpu),
+            'tree_cpu_pct': statistics.mean(tree_cpu),
+            'threads': main_process.num_threads(),
+        }
+    finally:
+        if mode == 'headless' and proc.poll() is None:
+            subprocess.run([sys.executable, str(project_root / 'logger_app.py'), '--control', 'shutdown', '--control-port', str(_benchmark_control_port)], cwd=project_root, env=env, capture_output=True)
+            try:
+                proc.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                pass
+        if proc.poll() is None:
+            for a_process in reversed(_tree(psutil.Process(proc.pid))):
+                try:
+                    a_process.kill()
+                except psutil.NoSuchProcess:
+                    pass
+            proc.wait(timeout=10)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark RSS and idle CPU of headless vs. GUI mode")
+    parser.add_argument('--modes', nargs='+', choices=('headless', 'gui'), default=['headless', 'gui'])
+    parser.add_argument('--settle', type=float, default=20.0, help='Seconds to wait after start before sampling')
+    parser.add_argument('--duration', type=float, default=30.0, help='Sampling window in seconds')
+    args = parser.parse_args()
+
+    project_root = Path(__file__).resolve().parents[1]
+    results = {}
+    for a_mode in args.modes:
+        results[a_mode] = measure(a_mode, project_root, settle_sec=args.settle, duration_sec=args.duration)
+        r = results[a_mode]
+        print(f"{a_mode:>8}: RSS {r['main_rss_mb']:7.1f} MB (tree {r['tree_rss_mb']:7.1f} MB)  idle CPU {r['main_cpu_pct']:5.1f}% (tree {r['tree_cpu_pct']:5.1f}%)  threads {r['threads']}")
+
+    if ('headless' in results) and ('gui' in results) and results['gui']['main_rss_mb'] > 0:
+        print(f"headless/gui RSS: {results['headless']['main_rss_mb'] / results['gui']['main_rss_mb']:.2f}x (tree {results['headless']['tree_rss_mb'] / results['gui']['tree_rss_mb']:.2f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
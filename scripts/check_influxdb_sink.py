@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Exercises the InfluxDB marker sink (`phologtolabstreaminglayer.features.influxdb_sink.InfluxDBMarkerSink`) against a
+local stand-in HTTP server, so no InfluxDB installation is needed.
+
+The stand-in accepts `POST /api/v2/write` like InfluxDB (204 No Content) and records every line it receives. It can be
+made slow (`--delay-ms`, every request) or flaky (`--fail-first N` answers the first N requests with 503 and
+Retry-After) to check that:
+    - markers arrive as valid line protocol, batched (`--batch-size`)
+    - failed batches are retried and nothing is lost while the retry buffer has room
+    - `write_batch` stays non-blocking however slow the server is (its worst call time is reported)
+    - markers beyond `--max-buffered` are dropped and counted instead of growing memory
+
+Usage:
+    python scripts/check_influxdb_sink.py --n 20000
+    python scripts/check_influxdb_sink.py --n 5000 --fail-first 3 --delay-ms 200
+    python scripts/check_influxdb_sink.py --url http://localhost:8086 --org lab --bucket test --token ...  # a real server
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+import pylsl
+
+from phologtolabstreaminglayer.features.influxdb_sink import InfluxDBMarkerSink
+
+
+class _StandInInfluxDB(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, delay_sec: float, fail_first: int):
+        super().__init__(('127.0.0.1', 0), _StandInHandler)
+        self.delay_sec = delay_sec
+        self.n_fail_remaining = fail_first
+        self.lines = []
+        self.n_requests = 0
+        self.n_failed_requests = 0
+        self.lock = threading.Lock()
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        server: _StandInInfluxDB = self.server
+        time.sleep(server.delay_sec)
+        with server.lock:
+            server.n_requests += 1
+            should_fail = server.n_fail_remaining > 0
+            if should_fail:
+                server.n_fail_remaining -= 1
+                server.n_failed_requests += 1
+            else:
+                server.lines.extend(body.decode('utf-8').splitlines())
+        if should_fail:
+            self.send_response(503)
+            self.send_header('Retry-After', '0')
+            self.end_headers()
+        else:
+            self.send_response(204)
+            self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--n', type=int, default=20000, help='markers to write')
+    parser.add_argument('--chunk', type=int, default=10, help='markers per write_batch call')
+    parser.add_argument('--batch-size', type=int, default=500)
+    parser.add_argument('--max-buffered', type=int, default=50000)
+    parser.add_argument('--delay-ms', type=float, default=0.0, help='stand-in: delay of every request')
+    parser.add_argument('--fail-first', type=int, default=0, help='stand-in: answer the first N requests with 503')
+    parser.add_argument('--url', help='write to this InfluxDB instead of the stand-in')
+    parser.add_argument('--org', default='lab')
+    parser.add_argument('--bucket', default='markers')
+    parser.add_argument('--token', default=None)
+    args = parser.parse_args()
+
+    server = None
+    url = args.url
+    if url is None:
+        server = _StandInInfluxDB(delay_sec=args.delay_ms / 1000.0, fail_first=args.fail_first)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    sink = InfluxDBMarkerSink(url=url, token=args.token, org=args.org, bucket=args.bucket, batch_size=args.batch_size, flush_interval_ms=200,
+                              retry_interval_ms=100, max_retries=10, max_buffered_lines=args.max_buffered, close_timeout_sec=30.0)
+    sink.start()
+
+    worst_call_sec = 0.0
+    start_t = time.perf_counter()
+    n_sent = 0
+    while n_sent < args.n:
+        n = min(args.chunk, args.n - n_sent)
+        now = pylsl.local_clock()
+        samples = [[f"event_{(n_sent + i) % 8}|Button {(n_sent + i) % 8}|2025-01-01T00:00:00|TOGGLE:True"] for i in range(n)]
+        call_t = time.perf_counter()
+        sink.write_batch('EventBoard', samples, [now] * n)
+        worst_call_sec = max(worst_call_sec, time.perf_counter() - call_t)
+        n_sent += n
+    queue_sec = time.perf_counter() - start_t
+    sink.close()
+    total_sec = time.perf_counter() - start_t
+
+    metrics = sink.get_metrics()
+    print(f"write_batch: {args.n} markers queued in {queue_sec * 1000.0:.1f} ms, worst call {worst_call_sec * 1e6:.0f} us")
+    print(f"closed after {total_sec:.2f} s: {metrics}")
+    if server is not None:
+        print(f"stand-in: {server.n_requests} request(s) ({server.n_failed_requests} failed on purpose), {len(server.lines)} line(s) received")
+        if server.lines:
+            print(f"  first line: {server.lines[0]}")
+        expected = args.n - metrics['lines_dropped'] - metrics['lines_failed']
+        ok = (len(server.lines) == expected)
+        print("OK" if ok else f"MISMATCH: expected {expected} line(s)")
+        server.shutdown()
+        return 0 if ok else 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
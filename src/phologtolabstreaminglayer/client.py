@@ -0,0 +1,368 @@
+# Python client for a running logger instance
+# Copyright (C) 2025 Pho Hale. All rights reserved.
+
+"""
+Programmatic logging from other Python code (stimulus scripts, analysis loops, ...) to a running logger, GUI or
+headless, through its marker ingest socket (see `features/marker_ingest_server.py`).
+
+Every call is fire-and-forget: it takes the `pylsl.local_clock()` timestamp right away (so the marker's time doesn't
+depend on when it's sent), appends a protocol line to an in-memory buffer and returns. A background thread sends the
+buffer in batches, reconnects when the logger goes away and keeps everything buffered (bounded by `max_buffered`)
+until it's back. `flush()` blocks until everything logged so far has been received.
+
+Nothing is sent twice: only lines that were not completely written to the connection are resent after a reconnect (the
+logger discards a line cut off by a closed connection). Sends wait longer than the logger's longest backpressure pause,
+so a busy logger doesn't look like a dead one.
+
+Usage:
+    from phologtolabstreaminglayer.client import LoggerClient
+    with LoggerClient() as client:
+        client.log("TRIAL_START 12")
+        client.event("button_1_1")          # fire an EventBoard button like a click
+    # or, with a shared client:
+    from phologtolabstreaminglayer import client
+    client.log("hello")
+
+This module provides:
+- LoggerClient: the batching, reconnecting client
+- get_client / log / event / flush: a lazily created shared client and shortcuts to it
+"""
+
+import atexit
+import json
+import select
+import socket
+import threading
+from collections import deque
+from typing import Optional, Dict, Any
+
+import pylsl
+
+from phologtolabstreaminglayer.features.marker_ingest_server import get_default_ingest_port
+
+
+class _FlushRequest:
+    """Queued behind the lines to flush; the sender sets `done` once the logger acknowledged everything before it."""
+
+    __slots__ = ('done', 'ok')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.ok = False
+
+
+class LoggerClient:
+    """Sends markers to a running logger's ingest socket from a background thread.
+
+    All methods are thread-safe. Markers logged while the logger isn't reachable are kept (oldest first, up to
+    `max_buffered`) and sent once it is. Markers written to a connection that then broke are not resent (they may or may
+    not have arrived); the next `flush()` reports False for them.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: Optional[int] = None, max_batch_size: int = 1024, flush_interval_sec: float = 0.005,
+                 max_buffered: int = 100000, reconnect_interval_sec: float = 1.0, connect_timeout_sec: float = 2.0, send_timeout_sec: float = 30.0,
+                 autostart: bool = True):
+        """
+        Args:
+            host: Host of the logger (its ingest socket only listens on 127.0.0.1 by default).
+            port: Ingest port; None for the default (PHO_LOGTOLABSTREAMINGLAYER_INGEST_PORT or 13381).
+            max_batch_size: Most lines sent in one batch; a full batch wakes the sender immediately.
+            flush_interval_sec: Longest time a logged line waits before the sender picks it up.
+            max_buffered: Most unsent lines kept (e.g. while disconnected); further calls return False and are counted as dropped.
+            reconnect_interval_sec: Wait between connection attempts.
+            connect_timeout_sec: Timeout of one connection attempt.
+            send_timeout_sec: Timeout of a send and of the reply to a flush once connected; must be longer than the logger's
+                longest backpressure wait (`MarkerIngestServer.max_backpressure_wait_sec`, 5 s by default).
+            autostart: Start the sender thread now (otherwise on `start()` or the first call).
+        """
+        self.host = host
+        self.port: int = get_default_ingest_port() if port is None else int(port)
+        self.max_batch_size = max_batch_size
+        self.flush_interval_sec = flush_interval_sec
+        self.max_buffered = max_buffered
+        self.reconnect_interval_sec = reconnect_interval_sec
+        self.connect_timeout_sec = connect_timeout_sec
+        self.send_timeout_sec = send_timeout_sec
+
+        self._queue: deque = deque()  # protocol lines (str) and _FlushRequests; `append`/`popleft` are atomic
+        self._wakeup = threading.Event()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._socket: Optional[socket.socket] = None
+        self._reader = None
+        self._n_lines_unacknowledged = 0  # written to the current connection since its last ping reply
+        self._unacknowledged_lines_lost = False  # a connection broke with such lines: the next flush can't confirm them
+
+        # Metrics
+        self.lines_sent = 0
+        self.batches_sent = 0
+        self.lines_dropped = 0
+        self.connects = 0
+        self.send_errors = 0
+        self.lines_unconfirmed = 0  # written to a connection that broke before they were acknowledged
+        self.last_error: Optional[str] = None
+        if autostart:
+            self.start()
+
+
+    @property
+    def is_connected(self) -> bool:
+        return self._socket is not None
+
+
+    @property
+    def pending(self) -> int:
+        """Number of lines waiting to be sent."""
+        return len(self._queue)
+
+
+    def start(self):
+        """Start the sender thread (idempotent)."""
+        with self._start_lock:
+            if self._running:
+                return
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name="LoggerClient", daemon=True)
+            self._thread.start()
+
+
+    def close(self, timeout: float = 5.0):
+        """Flush (waiting up to `timeout` for the logger) and stop the sender thread."""
+        if self._running:
+            self.flush(timeout=timeout)
+        self._running = False
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        self._disconnect()
+
+
+    def __enter__(self) -> "LoggerClient":
+        self.start()
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+    # ---------------------------------------------------------------------------- #
+    #                                    Sending                                   #
+    # ---------------------------------------------------------------------------- #
+
+    def log(self, text: str, timestamp: Optional[float] = None, stream: str = 'TextLogger', offset: float = 0.0) -> bool:
+        """
+        Queue a text marker (fire-and-forget).
+
+        Args:
+            text: The marker text.
+            timestamp: LSL timestamp (`pylsl.local_clock()` time) of the marker; defaults to now.
+            stream: 'TextLogger' or 'EventBoard'.
+            offset: Seconds to subtract from the timestamp (the event happened this long ago).
+
+        Returns:
+            False if the marker was dropped because `max_buffered` lines are already waiting.
+        """
+        if timestamp is None:
+            timestamp = pylsl.local_clock()
+        marker_timestamp = float(timestamp) - float(offset) # plain float: the repr of e.g. numpy.float64 is not a number under NumPy 2
+        if (stream == 'TextLogger') and ('\n' not in text) and ('\r' not in text):
+            line = f"@{marker_timestamp!r} {text}\n" # compact form
+        else:
+            line = json.dumps({'text': text, 'stream': stream, 'timestamp': marker_timestamp}) + '\n'
+        return self._enqueue(line)
+
+
+    def event(self, button_id: str, offset: float = 0.0, timestamp: Optional[float] = None) -> bool:
+        """Queue firing an EventBoard button like a click (toggle buttons flip), fire-and-forget. Returns False if dropped."""
+        if timestamp is None:
+            timestamp = pylsl.local_clock()
+        return self._enqueue(json.dumps({'event': button_id, 'offset': float(offset), 'timestamp': float(timestamp)}) + '\n')
+
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Block until everything queued so far was received by the logger.
+
+        Returns:
+            False on timeout (the rest stays queued), or if some markers were written to a connection that broke before
+            the logger acknowledged them (they are not resent, so they may be missing).
+        """
+        if not self._running:
+            self.start()
+        request = _FlushRequest()
+        self._queue.append(request)
+        self._wakeup.set()
+        return request.done.wait(timeout) and request.ok
+
+
+    def _enqueue(self, line: str) -> bool:
+        queue = self._queue
+        if len(queue) >= self.max_buffered:
+            self.lines_dropped += 1
+            return False
+        queue.append(line)
+        if not self._running:
+            self.start()
+        if len(queue) >= self.max_batch_size:
+            self._wakeup.set()
+        return True
+
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {'connected': self.is_connected, 'pending': self.pending, 'lines_sent': self.lines_sent, 'batches_sent': self.batches_sent,
+                'lines_dropped': self.lines_dropped, 'connects': self.connects, 'send_errors': self.send_errors, 'lines_unconfirmed': self.lines_unconfirmed,
+                'last_error': self.last_error}
+
+
+    # ---------------------------------------------------------------------------- #
+    #                                 Sender Thread                                #
+    # ---------------------------------------------------------------------------- #
+
+    def _run(self):
+        while self._running or self._queue:
+            if not self._queue:
+                self._wakeup.wait(self.flush_interval_sec)
+                self._wakeup.clear()
+                continue
+            if (self._socket is not None) and self._is_peer_closed():
+                self._disconnect() # the logger went away: reconnect instead of writing into a dead connection
+            if (self._socket is None) and not self._connect():
+                if not self._running:
+                    break # closing and the logger is gone: give up on what's left
+                self._wakeup.wait(self.reconnect_interval_sec)
+                self._wakeup.clear()
+                continue
+            batch, flush_request = self._take_batch()
+            encoded_lines = [a_line.encode('utf-8') for a_line in batch]
+            n_bytes_sent = 0
+            is_batch_written = False
+            try:
+                if batch:
+                    data = memoryview(b''.join(encoded_lines))
+                    while n_bytes_sent < len(data):
+                        n_bytes_sent += self._socket.send(data[n_bytes_sent:])
+                    is_batch_written = True
+                    self.lines_sent += len(batch)
+                    self.batches_sent += 1
+                    self._n_lines_unacknowledged += len(batch)
+                if flush_request is not None:
+                    self._socket.sendall(b'!ping\n')
+                    reply = self._reader.readline()
+                    if not reply:
+                        raise ConnectionError("connection closed while flushing")
+                    # Only a reply on the connection that carried the lines confirms them
+                    flush_request.ok = bool(json.loads(reply).get('ok')) and not self._unacknowledged_lines_lost
+                    self._n_lines_unacknowledged = 0
+                    self._unacknowledged_lines_lost = False
+                    flush_request.done.set()
+            except (OSError, ValueError) as e:
+                self.send_errors += 1
+                self.last_error = str(e)
+                unsent_lines = [] if is_batch_written else self._unsent_lines(batch, encoded_lines, n_bytes_sent)
+                if not is_batch_written:
+                    self.lines_sent += len(batch) - len(unsent_lines)
+                    self._n_lines_unacknowledged += len(batch) - len(unsent_lines)
+                self._disconnect()
+                # Put the lines that weren't written back in front (in order) to send them after reconnecting
+                if flush_request is not None:
+                    self._queue.appendleft(flush_request)
+                self._queue.extendleft(reversed(unsent_lines))
+
+
+    @staticmethod
+    def _unsent_lines(batch: list, encoded_lines: list, n_bytes_sent: int) -> list:
+        """The lines of `batch` not completely written (the logger drops a line cut off by a closed connection, so it's resent)"""
+        end_offset = 0
+        for a_line_idx, an_encoded_line in enumerate(encoded_lines):
+            end_offset += len(an_encoded_line)
+            if end_offset > n_bytes_sent:
+                return batch[a_line_idx:]
+        return []
+
+
+    def _take_batch(self):
+        """Pop up to `max_batch_size` lines, stopping after a flush request. Returns (lines, flush_request or None)."""
+        batch = []
+        try:
+            while len(batch) < self.max_batch_size:
+                item = self._queue.popleft()
+                if isinstance(item, _FlushRequest):
+                    return batch, item
+                batch.append(item)
+        except IndexError:
+            pass
+        return batch, None
+
+
+    def _connect(self) -> bool:
+        try:
+            a_socket = socket.create_connection((self.host, self.port), timeout=self.connect_timeout_sec)
+        except OSError as e:
+            self.last_error = str(e)
+            return False
+        a_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        a_socket.settimeout(self.send_timeout_sec) # not the connect timeout: the logger pauses reading for a while under backpressure
+        self._socket = a_socket
+        self._reader = a_socket.makefile('r', encoding='utf-8')
+        self.connects += 1
+        return True
+
+
+    def _is_peer_closed(self) -> bool:
+        """Whether the logger closed the connection (it only ever sends replies to our pings, so anything readable now is EOF)"""
+        try:
+            readable, _, _ = select.select([self._socket], [], [], 0)
+            return bool(readable) and (self._socket.recv(1, socket.MSG_PEEK) == b'')
+        except (OSError, ValueError):
+            return True
+
+
+    def _disconnect(self):
+        if self._n_lines_unacknowledged > 0:
+            self.lines_unconfirmed += self._n_lines_unacknowledged
+            self._unacknowledged_lines_lost = True
+            self._n_lines_unacknowledged = 0
+        for a_closeable in (self._reader, self._socket):
+            if a_closeable is not None:
+                try:
+                    a_closeable.close()
+                except OSError:
+                    pass
+        self._reader = None
+        self._socket = None
+
+
+# ---------------------------------------------------------------------------- #
+#                                 Shared Client                                #
+# ---------------------------------------------------------------------------- #
+
+_shared_client: Optional[LoggerClient] = None
+_shared_client_lock = threading.Lock()
+
+
+def get_client() -> LoggerClient:
+    """The shared client (created on first use with the default port, flushed at interpreter exit)."""
+    global _shared_client
+    if _shared_client is None:
+        with _shared_client_lock:
+            if _shared_client is None:
+                _shared_client = LoggerClient()
+                atexit.register(_shared_client.close, 2.0)
+    return _shared_client
+
+
+def log(text: str, timestamp: Optional[float] = None, stream: str = 'TextLogger', offset: float = 0.0) -> bool:
+    """`LoggerClient.log` on the shared client."""
+    return get_client().log(text, timestamp=timestamp, stream=stream, offset=offset)
+
+
+def event(button_id: str, offset: float = 0.0, timestamp: Optional[float] = None) -> bool:
+    """`LoggerClient.event` on the shared client."""
+    return get_client().event(button_id, offset=offset, timestamp=timestamp)
+
+
+def flush(timeout: float = 5.0) -> bool:
+    """`LoggerClient.flush` on the shared client."""
+    return get_client().flush(timeout=timeout)
@@ -0,0 +1,189 @@
+# Asynchronous, leveled application logging
+# Copyright (C) 2025 Pho Hale. All rights reserved.
+
+"""
+Structured logging for the app's hot paths (sending markers, stream discovery, recording).
+
+Records are handed to a `logging.handlers.QueueHandler`, so the calling thread only pays for building the record and
+an unbounded `SimpleQueue.put`. A `QueueListener` thread formats them and fans them out to a rotating log file and to
+any subscribers (e.g. the GUI console panel). Calls at a disabled level cost one cached `isEnabledFor` check.
+
+Per-module verbosity: every module logs to a child of the `phologtolabstreaminglayer` logger (see `get_logger`), and
+levels can be set per child with `set_module_log_level` or the PHO_LOGTOLABSTREAMINGLAYER_LOG_LEVELS environment
+variable, e.g. `PHO_LOGTOLABSTREAMINGLAYER_LOG_LEVELS="lsl=DEBUG,discovery=WARNING"`.
+
+This module provides:
+- get_logger: get a module logger
+- setup_app_logging / shutdown_app_logging: start/stop the queue listener and file sink
+- add_log_subscriber / remove_log_subscriber: receive formatted log lines (from the listener thread)
+- set_module_log_level: change a module's verbosity at runtime
+"""
+
+import logging
+import logging.handlers
+import os
+import queue
+import threading
+from pathlib import Path
+from typing import Optional, Callable, Dict, List, Union
+
+
+APP_LOGGER_NAME: str = "phologtolabstreaminglayer"
+_log_levels_env_variable_name: str = "PHO_LOGTOLABSTREAMINGLAYER_LOG_LEVELS"
+_default_log_format: str = "%(asctime)s.%(msecs)03d [%(levelname)s] %(name)s: %(message)s"
+_default_date_format: str = "%Y-%m-%d %H:%M:%S"
+
+# Module-level state
+_listener: Optional[logging.handlers.QueueListener] = None
+_fanout_handler: Optional["_SubscriberFanOutHandler"] = None
+_setup_lock = threading.Lock()
+
+
+class _SubscriberFanOutHandler(logging.Handler):
+    """Forwards each formatted record to every subscriber callback as (text, source)."""
+
+    def __init__(self):
+        super().__init__()
+        self._subscribers: List[Callable[[str, str], None]] = []
+
+
+    def add_subscriber(self, callback: Callable[[str, str], None]):
+        self._subscribers.append(callback)
+
+
+    def remove_subscriber(self, callback: Callable[[str, str], None]):
+        try:
+            self._subscribers.remove(callback)
+        except ValueError:
+            pass
+
+
+    def emit(self, record: logging.LogRecord):
+        if not self._subscribers:
+            return
+        try:
+            text = self.format(record) + "\n"
+        except Exception:
+            self.handleError(record)
+            return
+        source = "stderr" if record.levelno >= logging.WARNING else "stdout"
+        for a_callback in list(self._subscribers):
+            try:
+                a_callback(text, source)
+            except Exception:
+                pass  # Don't let a broken subscriber stop the others
+
+
+def get_logger(module_name: str) -> logging.Logger:
+    """Get the logger for an app module, e.g. `get_logger('lsl')` -> 'phologtolabstreaminglayer.lsl'."""
+    return logging.getLogger(f"{APP_LOGGER_NAME}.{module_name}")
+
+
+def set_module_log_level(module_name: str, level: Union[int, str]):
+    """Set the verbosity of one app module (e.g. 'lsl', 'discovery', 'recording')."""
+    if isinstance(level, str):
+        level = logging.getLevelName(level.strip().upper())
+    get_logger(module_name).setLevel(level)
+
+
+def _apply_module_levels_from_env():
+    """Apply per-module levels from PHO_LOGTOLABSTREAMINGLAYER_LOG_LEVELS ("module=LEVEL,module=LEVEL")."""
+    spec = os.environ.get(_log_levels_env_variable_name, '').strip()
+    for an_item in spec.split(','):
+        if '=' not in an_item:
+            continue
+        a_module_name, a_level = an_item.split('=', 1)
+        try:
+            set_module_log_level(a_module_name.strip(), a_level)
+        except (TypeError, ValueError):
+            pass
+
+
+def setup_app_logging(log_folder: Optional[Path] = None, level: Union[int, str] = logging.INFO, module_levels: Optional[Dict[str, Union[int, str]]] = None,
+                      max_bytes: int = 5 * 1024 * 1024, backup_count: int = 5, extra_handlers: Optional[List[logging.Handler]] = None) -> logging.Logger:
+    """
+    Start asynchronous logging for the app (idempotent).
+
+    Args:
+        log_folder: Folder for the rotating `logger_app.log` file sink. If None, no file sink is created.
+        level: Level of the top-level app logger.
+        module_levels: Optional per-module levels, e.g. {'lsl': 'DEBUG'}. Environment variable overrides are applied after these.
+        max_bytes: Size at which the log file is rotated.
+        backup_count: Number of rotated log files to keep.
+        extra_handlers: Additional handlers driven by the listener thread (e.g. a stderr StreamHandler for headless use).
+
+    Returns:
+        The top-level app logger.
+    """
+    global _listener, _fanout_handler
+    app_logger = logging.getLogger(APP_LOGGER_NAME)
+    with _setup_lock:
+        if _listener is not None:
+            return app_logger
+
+        if isinstance(level, str):
+            level = logging.getLevelName(level.strip().upper())
+        app_logger.setLevel(level)
+        app_logger.propagate = False
+
+        formatter = logging.Formatter(_default_log_format, datefmt=_default_date_format)
+        handlers: List[logging.Handler] = []
+        if log_folder is not None:
+            try:
+                Path(log_folder).mkdir(parents=True, exist_ok=True)
+                file_handler = logging.handlers.RotatingFileHandler(Path(log_folder) / "logger_app.log", maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+                file_handler.setFormatter(formatter)
+                handlers.append(file_handler)
+            except Exception as e:
+                print(f"Error creating log file sink in '{log_folder}': {e}")
+
+        _fanout_handler = _SubscriberFanOutHandler()
+        _fanout_handler.setFormatter(formatter)
+        handlers.append(_fanout_handler)
+        for a_handler in (extra_handlers or []):
+            if a_handler.formatter is None:
+                a_handler.setFormatter(formatter)
+            handlers.append(a_handler)
+
+        log_queue = queue.SimpleQueue()
+        app_logger.handlers.clear()
+        app_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+
+        for a_module_name, a_level in (module_levels or {}).items():
+            set_module_log_level(a_module_name, a_level)
+        _apply_module_levels_from_env()
+
+    return app_logger
+
+
+def add_log_subscriber(callback: Callable[[str, str], None]):
+    """Receive every formatted log line as callback(text, source) where source is "stdout" or "stderr" (called on the listener thread)."""
+    if _fanout_handler is not None:
+        _fanout_handler.add_subscriber(callback)
+
+
+def remove_log_subscriber(callback: Callable[[str, str], None]):
+    """Stop forwarding log lines to a callback added with `add_log_subscriber`."""
+    if _fanout_handler is not None:
+        _fanout_handler.remove_subscriber(callback)
+
+
+def shutdown_app_logging():
+    """Flush queued records and stop the listener thread."""
+    global _listener, _fanout_handler
+    with _setup_lock:
+        if _listener is None:
+            return
+        try:
+            _listener.stop()
+        except Exception:
+            pass
+        for a_handler in _listener.handlers:
+            try:
+                a_handler.close()
+            except Exception:
+                pass
+        _listener = None
+        _fanout_handler = None
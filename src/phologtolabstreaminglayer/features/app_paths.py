@@ -0,0 +1,43 @@
+# Per-user application data locations
+# Copyright (C) 2025 Pho Hale. All rights reserved.
+
+"""
+Helpers for locating the per-user folder where the app keeps its own files (log history, databases, reports).
+
+Recordings still go to the user-selected XDF folder; this folder is only for app-internal state that must not
+depend on the current working directory.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+
+_app_data_folder_env_variable_name: str = "PHO_LOGTOLABSTREAMINGLAYER_DATA_DIR"
+_app_folder_name: str = "PhoLogToLabStreamingLayer"
+
+
+def get_app_data_folder(*subfolders: str, create: bool = True) -> Path:
+    """
+    Get (and by default create) the per-user app data folder, optionally joined with `subfolders`.
+
+    Can be overridden with the PHO_LOGTOLABSTREAMINGLAYER_DATA_DIR environment variable.
+
+    Returns:
+        %LOCALAPPDATA%/PhoLogToLabStreamingLayer on Windows, ~/Library/Application Support/PhoLogToLabStreamingLayer on
+        macOS and $XDG_DATA_HOME (or ~/.local/share)/PhoLogToLabStreamingLayer elsewhere.
+    """
+    override = os.environ.get(_app_data_folder_env_variable_name, '').strip()
+    if override:
+        base_folder = Path(override)
+    elif sys.platform == 'win32':
+        base_folder = Path(os.environ.get('LOCALAPPDATA', Path.home() / 'AppData' / 'Local')) / _app_folder_name
+    elif sys.platform == 'darwin':
+        base_folder = Path.home() / 'Library' / 'Application Support' / _app_folder_name
+    else:
+        base_folder = Path(os.environ.get('XDG_DATA_HOME', Path.home() / '.local' / 'share')) / _app_folder_name
+
+    folder = base_folder.joinpath(*subfolders).resolve()
+    if create:
+        folder.mkdir(parents=True, exist_ok=True)
+    return folder
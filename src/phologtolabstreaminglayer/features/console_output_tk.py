@@ -8,14 +8,17 @@ it in a collapsible panel with auto-scroll and line limiting.
 This module provides:
 - TkTextStream: A thread-safe text stream wrapper for stdout/stderr capture
 - ConsoleOutputFrame: A collapsible frame widget for displaying console output
+
+Captured output is delivered line by line into a bounded queue (overflow is counted and dropped) and rendered on a
+fixed tick with a per-tick character budget, so a print storm from a library cannot stall the GUI.
 """
 
 import sys
 import tkinter as tk
 from tkinter import ttk, scrolledtext
-from typing import Optional, Callable, TextIO
+from typing import Optional, Callable, TextIO, List, Tuple
 import threading
-import queue
+from collections import deque
 
 # Try to import hide_console to check if console was hidden
 try:
@@ -34,11 +37,15 @@ class TkTextStream:
     """A thread-safe text stream that captures writes and forwards them to a callback.
     
     This class wraps stdout/stderr to capture all output while still passing it through
-    to the original stream. Uses a queue for thread-safe communication.
+    to the original stream. Writes are coalesced into whole lines: the callback only fires once a
+    write completes at least one line (or the pending partial line grows past `max_partial_line_chars`,
+    or `flush()` is called), so `print()`'s separate newline write does not cost a second callback.
     
     Attributes:
         source: The source identifier for this stream ("stdout" or "stderr").
     """
+    # A partial line longer than this is forwarded without waiting for its newline
+    max_partial_line_chars: int = 4096
     
     def __init__(self, original_stream: Optional[TextIO], source: str = "stdout", write_callback: Optional[Callable[[str, str], None]] = None, pass_through: bool = True):
         """
@@ -47,7 +54,7 @@ class TkTextStream:
         Args:
             original_stream: The original stream to pass output through to (can be None).
             source: Source identifier ("stdout", "stderr", or custom).
-            write_callback: Optional callback function called on every write with (text, source).
+            write_callback: Optional callback function called with (text, source) for each batch of complete lines.
             pass_through: Whether to pass output through to original_stream. Defaults to True.
                           Set to False when console was hidden to avoid hangs.
         """
@@ -83,27 +90,52 @@ class TkTextStream:
             except Exception:
                 pass  # Don't let passthrough errors break the capture
         
-        # Fire callback if registered
+        callback = self._write_callback
+        if callback is None:
+            return len(text)
+
+        # Coalesce into complete lines; keep any trailing partial line buffered
         with self._lock:
-            callback = self._write_callback
-        
-        if callback is not None:
-            try:
-                callback(text, self._source)
-            except Exception:
-                pass  # Don't let callback errors break the stream
+            self._buffer += text
+            last_newline_index = self._buffer.rfind('\n')
+            if last_newline_index >= 0:
+                complete_text = self._buffer[:last_newline_index + 1]
+                self._buffer = self._buffer[last_newline_index + 1:]
+            elif len(self._buffer) >= self.max_partial_line_chars:
+                complete_text = self._buffer
+                self._buffer = ""
+            else:
+                complete_text = None
+
+        if complete_text:
+            self._fire_callback(callback, complete_text)
         
         return len(text)
 
 
+    def _fire_callback(self, callback: Callable[[str, str], None], text: str):
+        """Forward captured text to the callback."""
+        try:
+            callback(text, self._source)
+        except Exception:
+            pass  # Don't let callback errors break the stream
+
+
     def flush(self):
-        """Flush the stream."""
+        """Flush the stream (including any buffered partial line)."""
         if self._pass_through and self._original_stream is not None:
             try:
                 self._original_stream.flush()
             except Exception:
                 pass
 
+        callback = self._write_callback
+        with self._lock:
+            pending_text = self._buffer
+            self._buffer = ""
+        if pending_text and callback is not None:
+            self._fire_callback(callback, pending_text)
+
 
     def isatty(self) -> bool:
         """Check if this is a TTY."""
@@ -147,8 +179,10 @@ class ConsoleOutputFrame(ttk.Frame):
     Features:
         - Collapsible panel with toggle button
         - Auto-scroll with toggle control
-        - Line limit to prevent memory issues
+        - Line limit to prevent memory issues (trimmed in batches)
         - Thread-safe text updates via tkinter's after() method
+        - Bounded capture queue with a dropped-line counter
+        - Rate-limited rendering: one batched insert per tick, capped at a character budget
         - Clear button
     
     Args:
@@ -161,13 +195,22 @@ class ConsoleOutputFrame(ttk.Frame):
         height: Height of the text area in lines. Defaults to 10.
         pass_through: Whether to pass output through to original streams. Defaults to None (auto-detect).
                       If None, automatically detects if console was hidden and disables passthrough.
+        max_queued_chunks: Maximum number of captured chunks waiting to be rendered; further output is dropped and counted.
+        render_interval_ms: Minimum time between render ticks. Defaults to 100.
+        max_chars_per_tick: Maximum number of characters inserted into the widget per tick. Defaults to 20000.
     """
     
-    def __init__(self, parent, root: tk.Tk, capture_stdout: bool = True, capture_stderr: bool = True, max_lines: int = 10000, initial_visible: bool = False, height: int = 10, pass_through: Optional[bool] = None):
+    def __init__(self, parent, root: tk.Tk, capture_stdout: bool = True, capture_stderr: bool = True, max_lines: int = 10000, initial_visible: bool = False, height: int = 10, pass_through: Optional[bool] = None,
+                 max_queued_chunks: int = 5000, render_interval_ms: int = 100, max_chars_per_tick: int = 20000):
         super().__init__(parent)
         
         self._root = root
         self._max_lines = max_lines
+        self._trim_batch = max(1, max_lines // 10)
+        self._line_count = 0
+        self._max_queued_chunks = max_queued_chunks
+        self._render_interval_ms = render_interval_ms
+        self._max_chars_per_tick = max_chars_per_tick
         self._auto_scroll = True
         self._visible = initial_visible
         self._height = height
@@ -189,10 +232,12 @@ class ConsoleOutputFrame(ttk.Frame):
         self._capture_stdout = capture_stdout
         self._capture_stderr = capture_stderr
         
-        # Thread-safe queue for text updates
-        self._text_queue: queue.Queue = queue.Queue()
+        # Bounded queue of (text, source) chunks waiting to be rendered
+        self._text_queue: deque = deque()
         self._update_scheduled = False
         self._update_lock = threading.Lock()
+        self._dropped_chunks = 0
+        self._reported_dropped_chunks = 0
         
         self._setup_ui()
         self._setup_streams()
@@ -229,6 +274,9 @@ class ConsoleOutputFrame(ttk.Frame):
         self._auto_scroll_var = tk.BooleanVar(value=True)
         auto_scroll_cb = ttk.Checkbutton(toolbar, text="Auto-scroll", variable=self._auto_scroll_var, command=self._on_auto_scroll_toggled)
         auto_scroll_cb.grid(row=0, column=1)
+
+        self._dropped_label = ttk.Label(toolbar, text="", foreground="red")
+        self._dropped_label.grid(row=0, column=2, padx=(10, 0))
         
         # Text display area
         self._text_area = scrolledtext.ScrolledText(self._content_frame, height=self._height, wrap=tk.WORD, state=tk.DISABLED)
@@ -263,47 +311,74 @@ class ConsoleOutputFrame(ttk.Frame):
         if self._shutting_down:
             return
         
-        # Queue the text for thread-safe processing
+        with self._update_lock:
+            # Queue the text for thread-safe processing, dropping (and counting) on overflow
+            if len(self._text_queue) >= self._max_queued_chunks:
+                self._dropped_chunks += 1
+                return
+            self._text_queue.append((text, source))
+
+            # Schedule UI update if not already scheduled
+            if self._update_scheduled:
+                return
+            self._update_scheduled = True
         try:
-            self._text_queue.put_nowait((text, source))
-        except queue.Full:
-            pass  # Drop if queue is full
-        
-        # Schedule UI update if not already scheduled
+            self._root.after(self._render_interval_ms, self._process_text_queue)
+        except Exception:
+            with self._update_lock:
+                self._update_scheduled = False
+
+
+    def _take_render_batch(self) -> List[Tuple[str, str]]:
+        """Pop queued chunks up to the per-tick character budget, merging consecutive chunks with the same tag."""
+        batch: List[Tuple[str, str]] = []
+        n_chars = 0
         with self._update_lock:
-            if not self._update_scheduled:
-                self._update_scheduled = True
-                try:
-                    self._root.after(10, self._process_text_queue)
-                except Exception:
-                    self._update_scheduled = False
+            while self._text_queue and (n_chars < self._max_chars_per_tick):
+                text, source = self._text_queue.popleft()
+                tag = "stderr" if source == "stderr" else "stdout"
+                n_chars += len(text)
+                if batch and batch[-1][1] == tag:
+                    batch[-1] = (batch[-1][0] + text, tag)
+                else:
+                    batch.append((text, tag))
+
+            dropped_since_last_tick = self._dropped_chunks - self._reported_dropped_chunks
+            self._reported_dropped_chunks = self._dropped_chunks
+
+            # Reschedule if there is still a backlog, otherwise allow the next write to schedule
+            self._update_scheduled = bool(self._text_queue)
+
+        if dropped_since_last_tick > 0:
+            batch.append((f"[... {dropped_since_last_tick} console write(s) dropped, output too fast ...]\n", "stderr"))
+        return batch
 
 
     def _process_text_queue(self):
-        """Process queued text updates (called on main thread)."""
+        """Render one tick's worth of queued text updates (called on main thread)."""
         if self._shutting_down:
             return
         
-        with self._update_lock:
-            self._update_scheduled = False
-        
-        # Process all queued items
-        items_to_process = []
-        try:
-            while True:
-                items_to_process.append(self._text_queue.get_nowait())
-        except queue.Empty:
-            pass
-        
-        if not items_to_process:
+        batch = self._take_render_batch()
+        if self._update_scheduled:
+            try:
+                self._root.after(self._render_interval_ms, self._process_text_queue)
+            except Exception:
+                with self._update_lock:
+                    self._update_scheduled = False
+
+        if not batch:
             return
         
         try:
             self._text_area.configure(state=tk.NORMAL)
             
-            for text, source in items_to_process:
-                tag = "stderr" if source == "stderr" else "stdout"
-                self._text_area.insert(tk.END, text, tag)
+            # Single insert call for the whole batch: insert(index, text1, tags1, text2, tags2, ...)
+            insert_args = []
+            for text, tag in batch:
+                insert_args.extend((text, tag))
+                self._line_count += text.count('\n')
+            self._text_area.insert(tk.END, *insert_args)
             
             # Limit buffer size
             self._enforce_line_limit()
@@ -313,6 +388,9 @@ class ConsoleOutputFrame(ttk.Frame):
             # Auto-scroll if enabled
             if self._auto_scroll:
                 self._text_area.see(tk.END)
+
+            if self._dropped_chunks > 0:
+                self._dropped_label.configure(text=f"Dropped: {self._dropped_chunks}")
                 
         except tk.TclError:
             # Widget is being destroyed
@@ -320,17 +398,24 @@ class ConsoleOutputFrame(ttk.Frame):
 
 
     def _enforce_line_limit(self):
-        """Remove old lines if buffer exceeds max_lines."""
+        """Remove old lines in one batch once the buffer exceeds max_lines by the trim batch size."""
+        if self._line_count <= (self._max_lines + self._trim_batch):
+            return
         try:
-            line_count = int(self._text_area.index('end-1c').split('.')[0])
-            if line_count > self._max_lines:
-                # Calculate how many lines to remove
-                lines_to_remove = line_count - self._max_lines
-                self._text_area.delete('1.0', f'{lines_to_remove + 1}.0')
+            # Calculate how many lines to remove
+            lines_to_remove = self._line_count - self._max_lines
+            self._text_area.delete('1.0', f'{lines_to_remove + 1}.0')
+            self._line_count -= lines_to_remove
         except (tk.TclError, ValueError):
             pass
 
 
+    @property
+    def dropped_count(self) -> int:
+        """Number of captured writes dropped because the render queue was full."""
+        return self._dropped_chunks
+
+
     def toggle_visibility(self):
         """Toggle the visibility of the console output panel."""
         self._visible = not self._visible
@@ -368,6 +453,7 @@ class ConsoleOutputFrame(ttk.Frame):
             self._text_area.configure(state=tk.NORMAL)
             self._text_area.delete('1.0', tk.END)
             self._text_area.configure(state=tk.DISABLED)
+            self._line_count = 0
         except tk.TclError:
             pass
 
@@ -0,0 +1,383 @@
+# Compiled EventBoard configuration with validation and hot reload
+# Copyright (C) 2025 Pho Hale. All rights reserved.
+
+"""
+Turns the raw `eventboard_config.json` dict into a validated, indexed structure so that every lookup on the click path
+(by button id or by event name) is a dict access instead of a scan of the button list.
+
+Large boards are split into pages: each button may name a `"page"` (default "Main"), and an optional top-level
+`"pages"` list sets their order. Grid cells only have to be unique within a page. Buttons may also define a global
+`"hotkey"` and/or a window-local `"local_hotkey"` (see `eventboard_hotkeys`).
+
+This module provides:
+- EventBoardConfigError: raised with every validation problem found in a config
+- EventBoardButtonConfig: one validated button
+- CompiledEventBoardConfig: the validated board with id -> button and event_name -> button indexes
+- get_default_eventboard_config: the built-in 3x5 board used when no config file is found
+- resolve_eventboard_config_path / load_eventboard_config_file: locate and compile the config file
+- EventBoardConfigWatcher: polls the config file and reports recompiled configs (or errors) on change
+"""
+
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Optional, Callable, Dict, List, Any, Tuple
+
+from phologtolabstreaminglayer.features.app_logging import get_logger
+from phologtolabstreaminglayer.features.app_paths import get_app_data_folder
+
+logger = get_logger('eventboard')
+
+_eventboard_config_env_variable_name: str = "PHO_LOGTOLABSTREAMINGLAYER_EVENTBOARD_CONFIG"
+_default_eventboard_config_filename: str = "eventboard_config.json"
+default_eventboard_page_name: str = "Main"
+_valid_button_types = ('instantaneous', 'toggleable')
+default_eventboard_button_color: str = "#2196F3"
+# Anything Tk accepts: '#rgb' with 1-4 hex digits per component, or a color name ('red', 'light blue', 'gray50', ...).
+# Whether a name exists is only known to Tk, so the GUI checks that when it creates the button (see `winfo_rgb`).
+_color_pattern = re.compile(r'^(?:#(?:[0-9a-fA-F]{3}){1,4}|[A-Za-z][A-Za-z0-9 ]*)$')
+
+
+class EventBoardConfigError(ValueError):
+    """An EventBoard config failed to load or validate. `errors` lists every problem found."""
+
+    def __init__(self, errors: List[str], path: Optional[Path] = None):
+        self.errors = list(errors)
+        self.path = path
+        location = f" in {path}" if path is not None else ""
+        super().__init__(f"{len(self.errors)} EventBoard config error(s){location}: " + "; ".join(self.errors))
+
+
+class EventBoardButtonConfig:
+    """A single validated EventBoard button."""
+
+    __slots__ = ('id', 'row', 'col', 'text', 'event_name', 'color', 'type', 'code', 'page', 'hotkey', 'local_hotkey', 'raw')
+
+    def __init__(self, id: str, row: int, col: int, text: str, event_name: str, color: str, type: str, code: int, raw: Dict[str, Any], page: str = default_eventboard_page_name,
+                 hotkey: Optional[str] = None, local_hotkey: Optional[str] = None):
+        self.id = id
+        self.page = page
+        self.hotkey = hotkey
+        self.local_hotkey = local_hotkey
+        self.row = row
+        self.col = col
+        self.text = text
+        self.event_name = event_name
+        self.color = color
+        self.type = type
+        self.code = code
+        self.raw = raw
+
+
+    @property
+    def is_toggleable(self) -> bool:
+        return self.type == 'toggleable'
+
+
+    @property
+    def widget_signature(self) -> Tuple:
+        """Everything that affects the button's widgets; buttons with equal signatures don't need to be rebuilt on reload."""
+        return (self.page, self.row, self.col, self.text, self.event_name, self.color, self.type)
+
+
+    def __repr__(self) -> str:
+        return f"EventBoardButtonConfig(id={self.id!r}, event_name={self.event_name!r}, type={self.type!r}, page={self.page!r}, row={self.row}, col={self.col})"
+
+
+class CompiledEventBoardConfig:
+    """A validated EventBoard config with O(1) lookups.
+
+    Usage:
+        compiled = CompiledEventBoardConfig.from_dict(config_data['eventboard_config'])
+        button = compiled.by_id['button_1_1']
+        event_id = compiled.event_codes['TASK_START']
+    """
+
+    def __init__(self, title: str, typed_outlet: bool, buttons: List[EventBoardButtonConfig], raw: Dict[str, Any], page_order: Optional[List[str]] = None,
+                 warnings: Optional[List[str]] = None):
+        self.title = title
+        self.typed_outlet = typed_outlet
+        self.buttons = buttons
+        self.raw = raw
+        self.warnings: List[str] = list(warnings or [])  # problems that don't prevent loading (e.g. a repeated event_name)
+        self.by_id: Dict[str, EventBoardButtonConfig] = {a_button.id: a_button for a_button in buttons}
+        self.by_event_name: Dict[str, EventBoardButtonConfig] = {}
+        self.event_codes: Dict[str, int] = {}
+        for a_button in buttons: # a repeated event name resolves to its first button
+            self.by_event_name.setdefault(a_button.event_name, a_button)
+            self.event_codes.setdefault(a_button.event_name, a_button.code)
+        self.buttons_by_page: Dict[str, List[EventBoardButtonConfig]] = {}
+        for a_button in buttons:
+            self.buttons_by_page.setdefault(a_button.page, []).append(a_button)
+        # Listed pages first (in the listed order), then any other page in order of first use; pages without buttons are dropped
+        ordered_pages = [a_page for a_page in (page_order or []) if a_page in self.buttons_by_page]
+        self.pages: List[str] = ordered_pages + [a_page for a_page in self.buttons_by_page if a_page not in ordered_pages]
+
+
+    @property
+    def event_codes_signature(self) -> Tuple:
+        """The event id table written to the 'EventBoardCodes' stream's desc XML; its outlet must be recreated on reload when this changes."""
+        return tuple((a_button.code, a_button.event_name, a_button.text, a_button.type) for a_button in self.buttons)
+
+
+    @property
+    def hotkey_signature(self) -> Tuple:
+        """All (button id, hotkey, local_hotkey) bindings; hotkeys only need to be re-registered on reload when this changes."""
+        return tuple((a_button.id, a_button.hotkey, a_button.local_hotkey) for a_button in self.buttons if (a_button.hotkey or a_button.local_hotkey))
+
+
+    def get_button(self, button_id: str) -> Optional[EventBoardButtonConfig]:
+        return self.by_id.get(button_id)
+
+
+    def get_button_by_event_name(self, event_name: str) -> Optional[EventBoardButtonConfig]:
+        return self.by_event_name.get(event_name)
+
+
+    @property
+    def is_paged(self) -> bool:
+        """Whether the board has more than one page."""
+        return len(self.pages) > 1
+
+
+    def get_grid_shape(self, page: str) -> Tuple[int, int]:
+        """(n_rows, n_cols) spanned by the buttons of `page` (at least 3x5, the classic board size)."""
+        page_buttons = self.buttons_by_page.get(page, [])
+        n_rows = max([3] + [a_button.row for a_button in page_buttons])
+        n_cols = max([5] + [a_button.col for a_button in page_buttons])
+        return (n_rows, n_cols)
+
+
+    def diff(self, other: "CompiledEventBoardConfig") -> Tuple[List[str], List[str], List[str]]:
+        """Compare against a newer config: returns (added_ids, removed_ids, changed_ids), where changed means the widgets must be rebuilt (including moves to another page)."""
+        added_ids = [a_id for a_id in other.by_id if a_id not in self.by_id]
+        removed_ids = [a_id for a_id in self.by_id if a_id not in other.by_id]
+        changed_ids = [a_id for a_id, a_button in other.by_id.items() if (a_id in self.by_id) and (self.by_id[a_id].widget_signature != a_button.widget_signature)]
+        return (added_ids, removed_ids, changed_ids)
+
+
+    @classmethod
+    def from_dict(cls, eventboard_config: Dict[str, Any], path: Optional[Path] = None) -> "CompiledEventBoardConfig":
+        """
+        Validate and compile the `"eventboard_config"` section of the config file.
+
+        Raises:
+            EventBoardConfigError: listing every problem found (duplicate ids/codes/grid cells, bad types, ...). A repeated
+                event_name is only a warning (see `warnings`), configs that use one for several buttons keep loading.
+        """
+        errors: List[str] = []
+        warnings: List[str] = []
+        if not isinstance(eventboard_config, dict):
+            raise EventBoardConfigError([f"'eventboard_config' must be an object, got {type(eventboard_config).__name__}"], path=path)
+
+        raw_buttons = eventboard_config.get('buttons', [])
+        if not isinstance(raw_buttons, list):
+            raise EventBoardConfigError([f"'buttons' must be a list, got {type(raw_buttons).__name__}"], path=path)
+        page_order = eventboard_config.get('pages', [])
+        if (not isinstance(page_order, list)) or (not all(isinstance(a_page, str) for a_page in page_order)):
+            errors.append("'pages' must be a list of page names")
+            page_order = []
+
+        buttons: List[EventBoardButtonConfig] = []
+        seen_ids: Dict[str, int] = {}
+        seen_event_names: Dict[str, int] = {}
+        seen_codes: Dict[int, int] = {}
+        seen_cells: Dict[Tuple[str, int, int], int] = {}
+        seen_hotkeys: Dict[Tuple[str, str], int] = {}
+        for i, a_raw_button in enumerate(raw_buttons):
+            label = f"buttons[{i}]"
+            if not isinstance(a_raw_button, dict):
+                errors.append(f"{label} must be an object")
+                continue
+            try:
+                row = int(a_raw_button.get('row', 1))
+                col = int(a_raw_button.get('col', 1))
+            except (TypeError, ValueError):
+                errors.append(f"{label}: 'row' and 'col' must be integers")
+                continue
+            if (row < 1) or (col < 1):
+                errors.append(f"{label}: 'row' and 'col' are 1-based and must be >= 1")
+            page = str(a_raw_button.get('page', default_eventboard_page_name))
+            button_id = str(a_raw_button.get('id', f'button_{row}_{col}' if (page == default_eventboard_page_name) else f'{page}_button_{row}_{col}'))
+            event_name = str(a_raw_button.get('event_name', 'UNKNOWN_EVENT'))
+            button_type = a_raw_button.get('type', 'instantaneous')
+            color = str(a_raw_button.get('color', default_eventboard_button_color)).strip()
+            try:
+                code = int(a_raw_button.get('code', i + 1))
+            except (TypeError, ValueError):
+                errors.append(f"{label}: 'code' must be an integer")
+                code = i + 1
+
+            if button_type not in _valid_button_types:
+                errors.append(f"{label} ('{button_id}'): 'type' must be one of {_valid_button_types}, got {button_type!r}")
+            if not _color_pattern.match(color):
+                errors.append(f"{label} ('{button_id}'): 'color' must be a hex color like '#2196F3' or a color name like 'red', got {color!r}")
+            if code <= 0:
+                errors.append(f"{label} ('{button_id}'): 'code' must be > 0 (0 is reserved for unknown events)")
+            if button_id in seen_ids:
+                errors.append(f"{label}: duplicate id '{button_id}' (also buttons[{seen_ids[button_id]}])")
+            if event_name in seen_event_names:
+                warnings.append(f"{label}: duplicate event_name '{event_name}' (also buttons[{seen_event_names[event_name]}]), remote events by that name fire the first one")
+            if code in seen_codes:
+                errors.append(f"{label}: duplicate code {code} (also buttons[{seen_codes[code]}])")
+            if (page, row, col) in seen_cells:
+                errors.append(f"{label}: row {row}, col {col} of page '{page}' is already used by buttons[{seen_cells[(page, row, col)]}]")
+            seen_ids.setdefault(button_id, i)
+            seen_event_names.setdefault(event_name, i)
+            seen_codes.setdefault(code, i)
+            seen_cells.setdefault((page, row, col), i)
+
+            hotkeys: Dict[str, Optional[str]] = {}
+            for a_hotkey_kind in ('hotkey', 'local_hotkey'):
+                a_hotkey = a_raw_button.get(a_hotkey_kind)
+                if a_hotkey is None:
+                    hotkeys[a_hotkey_kind] = None
+                    continue
+                if (not isinstance(a_hotkey, str)) or (not a_hotkey.strip()):
+                    errors.append(f"{label} ('{button_id}'): '{a_hotkey_kind}' must be a non-empty string like 'ctrl+alt+1'")
+                    hotkeys[a_hotkey_kind] = None
+                    continue
+                a_hotkey = normalize_hotkey(a_hotkey)
+                if (a_hotkey_kind, a_hotkey) in seen_hotkeys:
+                    errors.append(f"{label}: duplicate {a_hotkey_kind} '{a_hotkey}' (also buttons[{seen_hotkeys[(a_hotkey_kind, a_hotkey)]}])")
+                seen_hotkeys.setdefault((a_hotkey_kind, a_hotkey), i)
+                hotkeys[a_hotkey_kind] = a_hotkey
+
+            buttons.append(EventBoardButtonConfig(id=button_id, row=row, col=col, text=str(a_raw_button.get('text', 'Button')), event_name=event_name,
+                                                  color=color, type=button_type, code=code, raw=a_raw_button, page=page,
+                                                  hotkey=hotkeys['hotkey'], local_hotkey=hotkeys['local_hotkey']))
+
+        if errors:
+            raise EventBoardConfigError(errors, path=path)
+        return cls(title=str(eventboard_config.get('title', 'Event Board')), typed_outlet=bool(eventboard_config.get('typed_outlet', False)), buttons=buttons, raw=eventboard_config, page_order=page_order,
+                   warnings=warnings)
+
+
+def normalize_hotkey(hotkey: str) -> str:
+    """Normalize a `keyboard`-style hotkey ("Ctrl + Alt + 1" -> "ctrl+alt+1")."""
+    return '+'.join(a_part.strip().lower() for a_part in hotkey.split('+'))
+
+
+def get_default_eventboard_config() -> Dict[str, Any]:
+    """Get default EventBoard configuration"""
+    return {
+        "title": "Event Board",
+        "buttons": [
+            {"id": f"button_{i}_{j}", "row": i, "col": j, "text": f"Button {i}-{j}",
+             "event_name": f"EVENT_{i}_{j}", "color": "#2196F3", "type": "instantaneous"}
+            for i in range(1, 4) for j in range(1, 6)
+        ]
+    }
+
+
+def resolve_eventboard_config_path(filename: str = _default_eventboard_config_filename) -> Optional[Path]:
+    """
+    Find the EventBoard config file without depending on the current working directory alone.
+
+    Search order: the PHO_LOGTOLABSTREAMINGLAYER_EVENTBOARD_CONFIG environment variable, the current working directory,
+    the app data folder, then the repository/install root next to `src/`.
+
+    Returns:
+        The first existing path, or None if no config file was found.
+    """
+    candidates: List[Path] = []
+    override = os.environ.get(_eventboard_config_env_variable_name, '').strip()
+    if override:
+        candidates.append(Path(override))
+    candidates.append(Path.cwd() / filename)
+    try:
+        candidates.append(get_app_data_folder(create=False) / filename)
+    except Exception:
+        pass
+    candidates.append(Path(__file__).resolve().parents[3] / filename)
+
+    for a_candidate in candidates:
+        if a_candidate.is_file():
+            return a_candidate.resolve()
+    return None
+
+
+def load_eventboard_config_file(path: Path) -> CompiledEventBoardConfig:
+    """
+    Read and compile an EventBoard config file.
+
+    Raises:
+        EventBoardConfigError: if the file can't be read, isn't valid JSON, or fails validation.
+    """
+    path = Path(path)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            config_data = json.load(f)
+    except json.JSONDecodeError as e:
+        raise EventBoardConfigError([f"invalid JSON at line {e.lineno}, column {e.colno}: {e.msg}"], path=path)
+    except OSError as e:
+        raise EventBoardConfigError([f"could not read file: {e}"], path=path)
+    if not isinstance(config_data, dict):
+        raise EventBoardConfigError(["top-level JSON value must be an object"], path=path)
+    return CompiledEventBoardConfig.from_dict(config_data.get('eventboard_config', {}), path=path)
+
+
+class EventBoardConfigWatcher:
+    """Polls an EventBoard config file and recompiles it whenever its modification time or size changes.
+
+    Callbacks run on the watcher thread; GUI code should marshal them to the Tk thread (e.g. via `UIUpdateBus`).
+    """
+
+    def __init__(self, path: Path, on_change: Callable[[CompiledEventBoardConfig], None], on_error: Optional[Callable[[EventBoardConfigError], None]] = None, poll_interval_sec: float = 1.0):
+        """
+        Args:
+            path: The config file to watch.
+            on_change: Called with the newly compiled config after a valid change.
+            on_error: Called with the error when a changed file fails to load or validate (the previous config stays in effect).
+            poll_interval_sec: How often the file's stat is checked.
+        """
+        self.path = Path(path)
+        self.on_change = on_change
+        self.on_error = on_error
+        self.poll_interval_sec = poll_interval_sec
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._last_stat = self._get_stat()
+
+
+    def _get_stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = self.path.stat()
+            return (st.st_mtime_ns, st.st_size)
+        except OSError:
+            return None
+
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="EventBoardConfigWatcher", daemon=True)
+        self._thread.start()
+
+
+    def stop(self, timeout: float = 2.0):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+
+    def _run(self):
+        while not self._stop_event.wait(self.poll_interval_sec):
+            current_stat = self._get_stat()
+            if (current_stat is None) or (current_stat == self._last_stat):
+                continue # missing files (e.g. mid-save by an editor) are ignored until they reappear
+            self._last_stat = current_stat
+            try:
+                compiled = load_eventboard_config_file(self.path)
+            except EventBoardConfigError as e:
+                if self.on_error is not None:
+                    self.on_error(e)
+                continue
+            try:
+                self.on_change(compiled)
+            except Exception as e:
+                logger.error("Error applying reloaded EventBoard config: %s", e)
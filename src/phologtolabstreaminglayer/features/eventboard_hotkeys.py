@@ -0,0 +1,182 @@
+# Per-button EventBoard hotkeys (global and window-local)
+# Copyright (C) 2025 Pho Hale. All rights reserved.
+
+"""
+Binds EventBoard buttons to keyboard shortcuts so events can be fired without clicking.
+
+Each button may define a `"hotkey"` (global, registered through the `keyboard` package so it works while the app is in
+the background) and/or a `"local_hotkey"` (only while an app window has focus, bound through Tk). Both use the
+`keyboard` package's syntax, e.g. "ctrl+alt+1". Hotkey callbacks fire the event directly from the calling thread (the
+`keyboard` hook thread or the Tk thread) without creating any window; the time from the key callback to the marker
+being queued for its outlet is measured.
+
+This module provides:
+- keyboard_hotkey_to_tk_sequence: convert "ctrl+shift+f1" to "<Control-Shift-Key-F1>"
+- LatencyStats: running count/last/mean/max of a latency in milliseconds
+- EventBoardHotkeyBinder: registers/unregisters the hotkeys of a compiled EventBoard config
+"""
+
+import threading
+import time
+import tkinter as tk
+from typing import Callable, Dict, List, Any
+
+from phologtolabstreaminglayer.features.app_logging import get_logger
+from phologtolabstreaminglayer.features.eventboard_config import CompiledEventBoardConfig, normalize_hotkey
+
+logger = get_logger('eventboard')
+
+_tk_modifier_names: Dict[str, str] = {
+    'ctrl': 'Control', 'control': 'Control',
+    'alt': 'Alt',
+    'shift': 'Shift',
+    'win': 'Mod4', 'windows': 'Mod4', 'cmd': 'Command', 'command': 'Command',
+}
+_tk_key_names: Dict[str, str] = {
+    'space': 'space', 'enter': 'Return', 'return': 'Return', 'esc': 'Escape', 'escape': 'Escape', 'tab': 'Tab',
+    'backspace': 'BackSpace', 'delete': 'Delete', 'insert': 'Insert', 'home': 'Home', 'end': 'End',
+    'page up': 'Prior', 'page down': 'Next', 'up': 'Up', 'down': 'Down', 'left': 'Left', 'right': 'Right',
+}
+
+
+def keyboard_hotkey_to_tk_sequence(hotkey: str) -> str:
+    """
+    Convert a single-chord `keyboard`-style hotkey to a Tk event sequence.
+
+    Raises:
+        ValueError: if the hotkey is empty, has no non-modifier key or has more than one.
+    """
+    parts = [a_part for a_part in normalize_hotkey(hotkey).split('+') if a_part]
+    modifiers = [_tk_modifier_names[a_part] for a_part in parts if a_part in _tk_modifier_names]
+    keys = [a_part for a_part in parts if a_part not in _tk_modifier_names]
+    if len(keys) != 1:
+        raise ValueError(f"hotkey {hotkey!r} must have exactly one non-modifier key")
+    key = keys[0]
+    if key in _tk_key_names:
+        key = _tk_key_names[key]
+    elif (len(key) > 1) and key.startswith('f') and key[1:].isdigit():
+        key = key.upper() # function keys: "f5" -> "F5"
+    elif len(key) != 1:
+        raise ValueError(f"unsupported key {key!r} in hotkey {hotkey!r}")
+    if ('Shift' in modifiers) and key.isalpha() and (len(key) == 1):
+        key = key.upper() # Tk reports shifted letters as upper case keysyms
+    return '<' + '-'.join(modifiers + ['Key', key]) + '>'
+
+
+class LatencyStats:
+    """Thread-safe running statistics of a latency, in milliseconds."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.count = 0
+        self.last_ms = 0.0
+        self.max_ms = 0.0
+        self._total_ms = 0.0
+
+
+    def add(self, latency_ms: float):
+        with self._lock:
+            self.count += 1
+            self.last_ms = latency_ms
+            self.max_ms = max(self.max_ms, latency_ms)
+            self._total_ms += latency_ms
+
+
+    def get_metrics(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                'count': self.count,
+                'last_ms': self.last_ms,
+                'mean_ms': (self._total_ms / self.count) if self.count > 0 else 0.0,
+                'max_ms': self.max_ms,
+            }
+
+
+class EventBoardHotkeyBinder:
+    """Registers the global and window-local hotkeys of an EventBoard config.
+
+    `fire_callback(button_id, source, trigger_perf_counter)` is called on the `keyboard` hook thread for global hotkeys
+    and on the Tk thread for local ones, so it must be thread-safe.
+    """
+
+    def __init__(self, root: tk.Tk, fire_callback: Callable[[str, str, float], Any]):
+        self._root = root
+        self._fire_callback = fire_callback
+        self._global_hotkey_handles: List[Any] = []
+        self._local_sequences: List[str] = []
+        self._keyboard = None
+
+
+    @property
+    def global_hotkey_count(self) -> int:
+        return len(self._global_hotkey_handles)
+
+
+    @property
+    def local_hotkey_count(self) -> int:
+        return len(self._local_sequences)
+
+
+    def register(self, compiled_config: CompiledEventBoardConfig) -> List[str]:
+        """
+        Replace any registered hotkeys with those of `compiled_config` (Tk thread).
+
+        Returns:
+            A list of problems (hotkeys that could not be registered); the others are registered regardless.
+        """
+        self.unregister_all()
+        problems: List[str] = []
+        for a_button in compiled_config.buttons:
+            if a_button.hotkey:
+                try:
+                    self._register_global(a_button.hotkey, a_button.id)
+                except Exception as e:
+                    problems.append(f"global hotkey '{a_button.hotkey}' for '{a_button.id}': {e}")
+            if a_button.local_hotkey:
+                try:
+                    self._register_local(a_button.local_hotkey, a_button.id)
+                except Exception as e:
+                    problems.append(f"local hotkey '{a_button.local_hotkey}' for '{a_button.id}': {e}")
+        return problems
+
+
+    def _register_global(self, hotkey: str, button_id: str):
+        if self._keyboard is None:
+            import keyboard # imported on first use: hooking the keyboard needs extra privileges on some platforms
+            self._keyboard = keyboard
+
+        def _on_global_hotkey(bid=button_id):
+            self._fire_callback(bid, 'global_hotkey', time.perf_counter())
+
+        self._global_hotkey_handles.append(self._keyboard.add_hotkey(hotkey, _on_global_hotkey, suppress=False))
+
+
+    def _register_local(self, hotkey: str, button_id: str):
+        sequence = keyboard_hotkey_to_tk_sequence(hotkey)
+        has_modifier = any(a_part in _tk_modifier_names for a_part in normalize_hotkey(hotkey).split('+'))
+
+        def _on_local_hotkey(event, bid=button_id):
+            trigger_perf_counter = time.perf_counter()
+            if (not has_modifier) and isinstance(event.widget, (tk.Entry, tk.Text)):
+                return None # plain keys still type normally into text fields
+            self._fire_callback(bid, 'local_hotkey', trigger_perf_counter)
+            return "break"
+
+        self._root.bind_all(sequence, _on_local_hotkey)
+        self._local_sequences.append(sequence)
+
+
+    def unregister_all(self):
+        """Remove every hotkey registered by this binder."""
+        for a_handle in self._global_hotkey_handles:
+            try:
+                self._keyboard.remove_hotkey(a_handle)
+            except Exception as e:
+                logger.error("Error removing EventBoard global hotkey: %s", e)
+        self._global_hotkey_handles.clear()
+        for a_sequence in self._local_sequences:
+            try:
+                self._root.unbind_all(a_sequence)
+            except tk.TclError:
+                pass  # GUI is being destroyed
+        self._local_sequences.clear()
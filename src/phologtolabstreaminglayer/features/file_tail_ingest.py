@@ -0,0 +1,576 @@
+# File-tail ingest of instrument log files
+# Copyright (C) 2025 Pho Hale. All rights reserved.
+
+"""
+Follows plain-text log files written by other programs (e.g. lab instruments) and forwards every appended line as a
+marker, so they don't have to be re-typed into the Manual Log tab.
+
+Configured by `file_tail_config.json` (searched like the EventBoard config, or PHO_LOGTOLABSTREAMINGLAYER_FILE_TAIL_CONFIG):
+    {"file_tail": {"poll_interval_sec": 0.25, "files": [
+        {"path": "C:/Instrument/run.log", "prefix": "PUMP: ", "start_at": "end", "unmatched": "TextLogger",
+         "mappings": [
+            {"pattern": "^#", "ignore": true},
+            {"pattern": "INFUSION (?P<state>START|STOP)", "stream": "EventBoard", "text": "PUMP_INFUSION_{state}|{line}"},
+            {"pattern": "STIM ON", "event": "button_1_1"}
+         ]}
+    ]}}
+Each line is checked against the file's mappings in order and the first match decides what happens: `ignore` drops it,
+`event` fires that EventBoard button (like a click), otherwise `text` (a `str.format` template of `{line}` and the
+pattern's named groups, default "{line}") is sent to `stream` (default TextLogger). Lines no mapping matches go to the
+`unmatched` stream (default TextLogger, null to drop them), prefixed with `prefix`.
+
+Every poll reads what was appended since the last one and hands it to the outlet dispatchers as one batch per stream,
+timestamped with the LSL time it was read. Files are identified by (device, inode): when a file is rotated (renamed
+and recreated) the rest of the old file is read before switching to the new one, and a truncated or rewritten file
+(noticed by its size or the bytes just before the read offset) is read again from the start. The read offset of every
+file is checkpointed (after its lines are queued) to `file_tail/checkpoints.json` in the app data folder, so a restart
+resumes where it stopped instead of sending lines twice. While a target outlet's
+queue is backed up, reading pauses and the file itself is the buffer: a poll never consumes more lines for a stream
+than its dispatcher's queue has room for, the rest stay in the file for the next polls.
+
+This module provides:
+- FileTailConfigError: raised with every problem found in a file-tail config
+- TailedFileConfig / FileTailMapping: one followed file and one of its regex mappings
+- resolve_file_tail_config_path / load_file_tail_config_file: locate and load the config file
+- FileTailIngest: the background thread following the files
+- create_file_tail_ingest_from_config: build a FileTailIngest from the resolved config file (None if there is none)
+"""
+
+import json
+import os
+import re
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Callable, Dict, List, Any, Tuple
+
+import pylsl
+
+from phologtolabstreaminglayer.features.app_logging import get_logger
+from phologtolabstreaminglayer.features.app_paths import get_app_data_folder
+from phologtolabstreaminglayer.features.outlet_dispatcher import OutletDispatcher
+
+logger = get_logger('file_tail')
+
+_file_tail_config_env_variable_name: str = "PHO_LOGTOLABSTREAMINGLAYER_FILE_TAIL_CONFIG"
+_default_file_tail_config_filename: str = "file_tail_config.json"
+_accepted_stream_names = ('TextLogger', 'EventBoard')
+
+
+class FileTailConfigError(ValueError):
+    """A file-tail config failed to load or validate. `errors` lists every problem found."""
+
+    def __init__(self, errors: List[str], path: Optional[Path] = None):
+        self.errors = list(errors)
+        self.path = path
+        location = f" in {path}" if path is not None else ""
+        super().__init__(f"{len(self.errors)} file-tail config error(s){location}: " + "; ".join(self.errors))
+
+
+class FileTailMapping:
+    """A regex and what to do with the lines it matches."""
+
+    __slots__ = ('pattern', 'regex', 'stream', 'text', 'event', 'ignore')
+
+    def __init__(self, pattern: str, stream: str = 'TextLogger', text: str = '{line}', event: Optional[str] = None, ignore: bool = False):
+        self.pattern = pattern
+        self.regex = re.compile(pattern)
+        self.stream = stream
+        self.text = text
+        self.event = event
+        self.ignore = ignore
+
+
+def _check_text_template(mapping: FileTailMapping) -> Optional[str]:
+    """Why `mapping.text` can't be formatted with the placeholders its regex provides, or None if it can."""
+    if 'line' in mapping.regex.groupindex:
+        return f"pattern {mapping.pattern!r} has a named group 'line', which clashes with the '{{line}}' placeholder"
+    try:
+        mapping.text.format(line='', **{a_group_name: '' for a_group_name in mapping.regex.groupindex})
+    except Exception as e: # KeyError (unknown placeholder), IndexError ('{0}'), AttributeError ('{line.x}'), ValueError (bad format spec), ...
+        return f"invalid 'text' template {mapping.text!r} for pattern {mapping.pattern!r}: {type(e).__name__}: {e}"
+    return None
+
+
+class TailedFileConfig:
+    """One followed file."""
+
+    def __init__(self, path: Path, mappings: List[FileTailMapping], prefix: str = '', unmatched: Optional[str] = 'TextLogger', start_at: str = 'end', encoding: str = 'utf-8'):
+        self.path = Path(path)
+        self.mappings = mappings
+        self.prefix = prefix
+        self.unmatched = unmatched
+        self.start_at = start_at
+        self.encoding = encoding
+
+
+    @classmethod
+    def from_dict(cls, raw: Dict[str, Any], label: str, errors: List[str]) -> Optional["TailedFileConfig"]:
+        """Validate one entry of `"files"`, appending problems to `errors` (returns None if it's unusable)."""
+        if not isinstance(raw, dict) or not raw.get('path'):
+            errors.append(f"{label} must be an object with a 'path'")
+            return None
+        n_errors = len(errors)
+        unmatched = raw.get('unmatched', 'TextLogger')
+        if (unmatched is not None) and (unmatched not in _accepted_stream_names):
+            errors.append(f"{label}: 'unmatched' must be one of {_accepted_stream_names} or null, got {unmatched!r}")
+        start_at = raw.get('start_at', 'end')
+        if start_at not in ('end', 'beginning'):
+            errors.append(f"{label}: 'start_at' must be 'end' or 'beginning', got {start_at!r}")
+        mappings = []
+        for i, a_raw_mapping in enumerate(raw.get('mappings', [])):
+            mapping_label = f"{label}.mappings[{i}]"
+            if not isinstance(a_raw_mapping, dict) or not isinstance(a_raw_mapping.get('pattern'), str):
+                errors.append(f"{mapping_label} must be an object with a 'pattern' string")
+                continue
+            stream = a_raw_mapping.get('stream', 'TextLogger')
+            if stream not in _accepted_stream_names:
+                errors.append(f"{mapping_label}: 'stream' must be one of {_accepted_stream_names}, got {stream!r}")
+                continue
+            try:
+                a_mapping = FileTailMapping(a_raw_mapping['pattern'], stream=stream, text=str(a_raw_mapping.get('text', '{line}')),
+                                            event=(str(a_raw_mapping['event']) if a_raw_mapping.get('event') else None), ignore=bool(a_raw_mapping.get('ignore', False)))
+            except re.error as e:
+                errors.append(f"{mapping_label}: invalid pattern {a_raw_mapping['pattern']!r}: {e}")
+                continue
+            template_error = _check_text_template(a_mapping)
+            if template_error is not None:
+                errors.append(f"{mapping_label}: {template_error}")
+                continue
+            mappings.append(a_mapping)
+        if len(errors) > n_errors:
+            return None
+        return cls(path=Path(os.path.expandvars(os.path.expanduser(str(raw['path'])))), mappings=mappings, prefix=str(raw.get('prefix', '')),
+                   unmatched=unmatched, start_at=start_at, encoding=str(raw.get('encoding', 'utf-8')))
+
+
+    def map_line(self, line: str) -> Tuple[Optional[str], Optional[str]]:
+        """What to send for `line`: (stream_name, text), ('@event', button_id), or (None, None) to drop it."""
+        for a_mapping in self.mappings:
+            match = a_mapping.regex.search(line)
+            if match is None:
+                continue
+            if a_mapping.ignore:
+                return (None, None)
+            if a_mapping.event is not None:
+                return ('@event', a_mapping.event)
+            return (a_mapping.stream, self.prefix + a_mapping.text.format(line=line, **match.groupdict()))
+        if self.unmatched is None:
+            return (None, None)
+        return (self.unmatched, self.prefix + line)
+
+
+def resolve_file_tail_config_path(filename: str = _default_file_tail_config_filename) -> Optional[Path]:
+    """
+    Find the file-tail config: the PHO_LOGTOLABSTREAMINGLAYER_FILE_TAIL_CONFIG environment variable, the current working
+    directory, the app data folder, then the repository/install root next to `src/`.
+
+    Returns:
+        The first existing path, or None if there is no config (file tailing is then off).
+    """
+    candidates: List[Path] = []
+    override = os.environ.get(_file_tail_config_env_variable_name, '').strip()
+    if override:
+        candidates.append(Path(override))
+    candidates.append(Path.cwd() / filename)
+    try:
+        candidates.append(get_app_data_folder(create=False) / filename)
+    except Exception:
+        pass
+    candidates.append(Path(__file__).resolve().parents[3] / filename)
+
+    for a_candidate in candidates:
+        if a_candidate.is_file():
+            return a_candidate.resolve()
+    return None
+
+
+def load_file_tail_config_file(path: Path) -> Tuple[List[TailedFileConfig], float]:
+    """
+    Read and validate a file-tail config file.
+
+    Returns:
+        (tailed files, poll interval in seconds)
+
+    Raises:
+        FileTailConfigError: if the file can't be read, isn't valid JSON, or fails validation.
+    """
+    path = Path(path)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            config_data = json.load(f)
+    except json.JSONDecodeError as e:
+        raise FileTailConfigError([f"invalid JSON at line {e.lineno}, column {e.colno}: {e.msg}"], path=path)
+    except OSError as e:
+        raise FileTailConfigError([f"could not read file: {e}"], path=path)
+    file_tail_config = config_data.get('file_tail', {}) if isinstance(config_data, dict) else None
+    if not isinstance(file_tail_config, dict) or not isinstance(file_tail_config.get('files', []), list):
+        raise FileTailConfigError(["expected an object like {\"file_tail\": {\"files\": [...]}}"], path=path)
+
+    errors: List[str] = []
+    tailed_files = []
+    for i, a_raw_file in enumerate(file_tail_config.get('files', [])):
+        a_tailed_file = TailedFileConfig.from_dict(a_raw_file, f"files[{i}]", errors)
+        if a_tailed_file is not None:
+            tailed_files.append(a_tailed_file)
+    try:
+        poll_interval_sec = float(file_tail_config.get('poll_interval_sec', 0.25))
+    except (TypeError, ValueError):
+        errors.append("'poll_interval_sec' must be a number")
+        poll_interval_sec = 0.25
+    if errors:
+        raise FileTailConfigError(errors, path=path)
+    return tailed_files, max(0.01, poll_interval_sec)
+
+
+def _read_fingerprint(handle, offset: int, n_bytes: int = 32) -> bytes:
+    """The (up to) `n_bytes` bytes before `offset`, leaving the handle's position unchanged."""
+    position = handle.tell()
+    try:
+        handle.seek(max(0, offset - n_bytes))
+        return handle.read(min(offset, n_bytes))
+    finally:
+        handle.seek(position)
+
+
+class _TailState:
+    """Read position and counters of one followed file (only used by the ingest thread)."""
+
+    def __init__(self, config: TailedFileConfig):
+        self.config = config
+        self.key = str(config.path.resolve())
+        self.handle = None
+        self.identity: Optional[Tuple[int, int]] = None  # (st_dev, st_ino) of the open file
+        self.offset = 0  # bytes consumed up to the last complete line
+        self.pending = b''  # trailing partial line
+        self.fingerprint = b''  # the last bytes before `offset`, to notice a file rewritten in place (same inode, not shorter)
+        self.last_size = -1
+        self.checkpointed_offset: Optional[int] = None
+        self.was_missing = False  # the file didn't exist when we first looked, so it's read from its start once it appears
+        self.lines_read = 0
+        self.markers_queued = 0
+        self.markers_dropped = 0
+        self.events_fired = 0
+        self.lines_ignored = 0
+        self.errors = 0
+        self.rotations = 0
+        self.truncations = 0
+        self.last_error: Optional[str] = None
+
+
+    def close(self):
+        if self.handle is not None:
+            try:
+                self.handle.close()
+            except OSError:
+                pass
+        self.handle = None
+        self.identity = None
+        self.pending = b''
+
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {'path': self.key, 'open': self.handle is not None, 'offset': self.offset, 'lines_read': self.lines_read, 'markers_queued': self.markers_queued,
+                'markers_dropped': self.markers_dropped, 'events_fired': self.events_fired, 'lines_ignored': self.lines_ignored, 'errors': self.errors,
+                'rotations': self.rotations, 'truncations': self.truncations, 'last_error': self.last_error}
+
+
+class FileTailIngest:
+    """Follows the configured files on a background thread and queues their new lines on our outlet dispatchers.
+
+    Usage:
+        tailed_files, poll_interval_sec = load_file_tail_config_file(resolve_file_tail_config_path())
+        file_tail = FileTailIngest(tailed_files, get_dispatcher=self.outlet_dispatchers.get, fire_event=..., poll_interval_sec=poll_interval_sec)
+        file_tail.start()
+        ...
+        file_tail.stop()
+    """
+
+    def __init__(self, tailed_files: List[TailedFileConfig], get_dispatcher: Callable[[str], Optional[OutletDispatcher]], fire_event: Optional[Callable[[str, float, float], bool]] = None,
+                 poll_interval_sec: float = 0.25, checkpoint_path: Optional[Path] = None, max_read_bytes: int = 1048576, high_water_fraction: float = 0.75):
+        """
+        Args:
+            tailed_files: The files to follow.
+            get_dispatcher: Returns the dispatcher of a stream name (None if the stream doesn't exist).
+            fire_event: Called as (button_id, time_offset_seconds, lsl_timestamp) for `event` mappings, returns whether the button exists.
+            poll_interval_sec: How often the files are checked for new lines.
+            checkpoint_path: Where read offsets are saved; defaults to `file_tail/checkpoints.json` in the app data folder.
+            max_read_bytes: Most bytes read from one file per poll (a long backlog is sent over several polls).
+            high_water_fraction: Reading pauses while a target dispatcher's queue is above this fraction of its capacity.
+        """
+        self._states = [_TailState(a_config) for a_config in tailed_files]
+        self._get_dispatcher = get_dispatcher
+        self._fire_event = fire_event
+        self.poll_interval_sec = poll_interval_sec
+        self.checkpoint_path = Path(checkpoint_path) if checkpoint_path is not None else (get_app_data_folder('file_tail') / 'checkpoints.json')
+        self.max_read_bytes = max_read_bytes
+        self.high_water_fraction = high_water_fraction
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._checkpoints: Dict[str, Dict[str, int]] = {}
+
+
+    @property
+    def is_running(self) -> bool:
+        return (self._thread is not None) and self._thread.is_alive()
+
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._checkpoints = self._load_checkpoints()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="FileTailIngest", daemon=True)
+        self._thread.start()
+        logger.info("Following %d file(s): %s", len(self._states), ', '.join(a_state.key for a_state in self._states))
+
+
+    def stop(self, timeout: float = 2.0):
+        """Stop following (lines already read are queued and checkpointed)."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        for a_state in self._states:
+            a_state.close()
+
+
+    def get_metrics(self) -> List[Dict[str, Any]]:
+        """Counters of every followed file."""
+        return [a_state.get_metrics() for a_state in self._states]
+
+
+    def _run(self):
+        while True:
+            for a_state in self._states:
+                try:
+                    self._poll_file(a_state)
+                except Exception as e:
+                    a_state.errors += 1
+                    a_state.last_error = str(e)
+                    logger.error("Error following %s: %s", a_state.key, e)
+                    a_state.close()
+            self._save_checkpoints()
+            if self._stop_event.wait(self.poll_interval_sec):
+                break
+
+
+    # ---------------------------------------------------------------------------- #
+    #                                    Reading                                   #
+    # ---------------------------------------------------------------------------- #
+
+    def _open(self, state: _TailState) -> bool:
+        """Open the file at `state`'s path, positioned at its checkpoint (same file only), its start or its end"""
+        try:
+            handle = open(state.config.path, 'rb')
+        except OSError:
+            state.was_missing = True
+            return False # not created yet (or gone mid-rotation), retried on the next poll
+        st = os.fstat(handle.fileno())
+        identity = (st.st_dev, st.st_ino)
+        checkpoint = self._checkpoints.get(state.key)
+        if ((checkpoint is not None) and (tuple(checkpoint.get('identity', ())) == identity) and (checkpoint.get('offset', 0) <= st.st_size)
+                and (_read_fingerprint(handle, checkpoint['offset']).hex() == checkpoint.get('fingerprint', ''))):
+            offset = checkpoint['offset'] # same file as before, resume without duplicates
+        elif (checkpoint is not None) or state.was_missing or (state.config.start_at == 'beginning'):
+            offset = 0 # a new file: rotated (while we were or weren't running) or created after we started
+        else:
+            offset = st.st_size # first time we see this file: only follow new lines
+        state.fingerprint = _read_fingerprint(handle, offset)
+        handle.seek(offset)
+        state.handle, state.identity, state.offset, state.pending = handle, identity, offset, b''
+        logger.info("Following %s from byte %d", state.key, offset)
+        return True
+
+
+    def _poll_file(self, state: _TailState):
+        if state.handle is None:
+            if not self._open(state):
+                return
+        if self._is_backed_up(state):
+            return # leave the lines in the file until the outlets catch up
+
+        try:
+            st = os.stat(state.config.path)
+            path_identity = (st.st_dev, st.st_ino)
+        except OSError:
+            path_identity = None # rotated away and not recreated yet
+        if (path_identity == state.identity) and (st.st_size != state.last_size):
+            state.last_size = st.st_size
+            if (st.st_size < state.offset) or (_read_fingerprint(state.handle, state.offset) != state.fingerprint):
+                self._restart_truncated_file(state)
+
+        data = state.handle.read(self.max_read_bytes)
+        if data:
+            self._process_data(state, data)
+        elif (path_identity is not None) and (path_identity != state.identity):
+            # The old file is fully read and a new one took its place
+            state.rotations += 1
+            logger.info("%s was rotated, following the new file", state.key)
+            state.close()
+            self._open(state)
+
+
+    def _restart_truncated_file(self, state: _TailState):
+        state.truncations += 1
+        logger.info("%s was truncated or rewritten, reading it again from the start", state.key)
+        state.handle.seek(0)
+        state.offset, state.pending, state.fingerprint = 0, b'', b''
+
+
+    def _is_backed_up(self, state: _TailState) -> bool:
+        for a_stream_name in set([a_mapping.stream for a_mapping in state.config.mappings] + [state.config.unmatched]):
+            dispatcher = self._get_dispatcher(a_stream_name) if a_stream_name else None
+            if (dispatcher is not None) and (dispatcher.queue_depth > dispatcher.max_pending * self.high_water_fraction):
+                return True
+        return False
+
+
+    def _get_free_capacity(self, stream_name: str) -> int:
+        """How many more samples the dispatcher of `stream_name` can queue right now"""
+        dispatcher = self._get_dispatcher(stream_name)
+        if dispatcher is None:
+            return sys.maxsize # nothing to wait for, `_flush_batches` counts its lines as dropped
+        return max(0, dispatcher.max_pending - dispatcher.queue_depth)
+
+
+    def _process_data(self, state: _TailState, data: bytes):
+        """Queue the complete lines of `state.pending + data`, at most as many per stream as its dispatcher has room for
+
+        Lines that don't fit are left unread: the offset (and checkpoint) stops at the end of the last line consumed and
+        the next poll reads them again from the file.
+        """
+        read_lsl_timestamp = pylsl.local_clock()
+        buffer_start_offset = state.offset # `state.pending` starts at the read offset
+        lines = (state.pending + data).split(b'\n')
+        state.pending = lines.pop()
+        line_ends: List[int] = [] # byte position in the buffer just past each line (and its newline)
+        a_line_end = 0
+        for a_raw_line in lines:
+            a_line_end += len(a_raw_line) + 1
+            line_ends.append(a_line_end)
+        if len(state.pending) >= self.max_read_bytes: # a "line" this long is not a log line, don't buffer it forever
+            lines.append(state.pending)
+            line_ends.append(a_line_end + len(state.pending))
+            state.pending = b''
+        batches: Dict[str, Tuple[list, list]] = {}
+        free_capacity: Dict[str, int] = {} # stream name -> room left in its dispatcher's queue at the start of this poll
+        n_consumed_bytes: Optional[int] = None # set when a full queue stops this poll early
+        for i, a_raw_line in enumerate(lines):
+            state.lines_read += 1
+            a_line = a_raw_line.rstrip(b'\r').decode(state.config.encoding, errors='replace')
+            if not a_line.strip():
+                state.lines_ignored += 1
+                continue
+            try:
+                stream_name, value = state.config.map_line(a_line)
+            except Exception as e: # a template that passed validation can still fail on a line, e.g. a format spec applied to an unmatched (None) group
+                state.errors += 1
+                state.last_error = f"could not format {a_line!r}: {e}"
+                continue
+            if stream_name is None:
+                state.lines_ignored += 1
+            elif stream_name == '@event':
+                self._flush_batches(state, batches) # keep raw EventBoard lines and fired events in order
+                try:
+                    was_fired = (self._fire_event is not None) and self._fire_event(value, 0.0, read_lsl_timestamp)
+                except Exception as e: # never let a failing callback stop the line from being consumed (it would be re-read forever)
+                    state.errors += 1
+                    state.last_error = f"error firing EventBoard button '{value}': {e}"
+                    logger.error("Error firing EventBoard button '%s' for a line of %s: %s", value, state.config.path, e)
+                    continue
+                if was_fired:
+                    state.events_fired += 1
+                else:
+                    state.errors += 1
+                    state.last_error = f"unknown EventBoard button '{value}'"
+            else:
+                if stream_name not in free_capacity:
+                    free_capacity[stream_name] = self._get_free_capacity(stream_name)
+                samples, timestamps = batches.setdefault(stream_name, ([], []))
+                if len(samples) >= free_capacity[stream_name]:
+                    # Its outlet can't take more right now: leave this line and the rest in the file for a later poll
+                    state.lines_read -= 1
+                    n_consumed_bytes = line_ends[i - 1] if i > 0 else 0
+                    break
+                samples.append([value])
+                timestamps.append(read_lsl_timestamp)
+        self._flush_batches(state, batches)
+        if n_consumed_bytes is None:
+            state.offset = state.handle.tell() - len(state.pending)
+        else:
+            state.offset, state.pending = buffer_start_offset + n_consumed_bytes, b''
+            state.handle.seek(state.offset)
+        state.fingerprint = _read_fingerprint(state.handle, state.offset)
+
+
+    def _flush_batches(self, state: _TailState, batches: Dict[str, Tuple[list, list]]):
+        for a_stream_name, (samples, timestamps) in batches.items():
+            dispatcher = self._get_dispatcher(a_stream_name)
+            if dispatcher is None:
+                state.markers_dropped += len(samples)
+                state.last_error = f"stream '{a_stream_name}' is not available"
+                continue
+            n_queued = dispatcher.submit_batch(samples, timestamps)
+            state.markers_queued += n_queued
+            state.markers_dropped += len(samples) - n_queued
+        batches.clear()
+
+
+    # ---------------------------------------------------------------------------- #
+    #                                  Checkpoints                                 #
+    # ---------------------------------------------------------------------------- #
+
+    def _load_checkpoints(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
+                checkpoints = json.load(f)
+            return checkpoints if isinstance(checkpoints, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning("Could not read file-tail checkpoints %s, starting fresh: %s", self.checkpoint_path, e)
+            return {}
+
+
+    def _save_checkpoints(self):
+        """Write the offsets of every open file (atomically) if any changed since the last save"""
+        changed = False
+        for a_state in self._states:
+            if (a_state.identity is None) or (a_state.offset == a_state.checkpointed_offset):
+                continue
+            self._checkpoints[a_state.key] = {'identity': list(a_state.identity), 'offset': a_state.offset, 'fingerprint': a_state.fingerprint.hex(), 'saved': int(time.time())}
+            a_state.checkpointed_offset = a_state.offset
+            changed = True
+        if not changed:
+            return
+        try:
+            self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.checkpoint_path.with_suffix('.json.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._checkpoints, f, indent=1)
+            os.replace(tmp_path, self.checkpoint_path)
+        except OSError as e:
+            logger.error("Could not save file-tail checkpoints: %s", e)
+
+
+def create_file_tail_ingest_from_config(get_dispatcher: Callable[[str], Optional[OutletDispatcher]], fire_event: Optional[Callable[[str, float, float], bool]] = None,
+                                        config_path: Optional[Path] = None) -> Optional[FileTailIngest]:
+    """
+    Build a (not yet started) `FileTailIngest` from `config_path` or the resolved `file_tail_config.json`.
+
+    Returns:
+        None if there is no config file or it lists no files.
+
+    Raises:
+        FileTailConfigError: if the config file is invalid.
+    """
+    config_path = config_path or resolve_file_tail_config_path()
+    if config_path is None:
+        return None
+    tailed_files, poll_interval_sec = load_file_tail_config_file(config_path)
+    if not tailed_files:
+        return None
+    logger.info("File-tail configuration loaded from %s", config_path)
+    return FileTailIngest(tailed_files, get_dispatcher=get_dispatcher, fire_event=fire_event, poll_interval_sec=poll_interval_sec)
@@ -1,29 +1,8 @@
-from typing import Dict, List, Tuple, Optional, Callable, Union, Any
-from copy import deepcopy
 import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox, filedialog
-import pylsl
-import pyxdf
-from datetime import datetime, timedelta
-import pytz
-import os
-import threading
-import time
-import numpy as np
-import json
-import pickle
-import mne
-from pathlib import Path
-import pystray
-from PIL import Image, ImageDraw
-import keyboard
-import socket
-import sys
-from phopylslhelper.general_helpers import unwrap_single_element_listlike_if_needed, readable_dt_str, from_readable_dt_str, localize_datetime_to_timezone, tz_UTC, tz_Eastern, _default_tz
-from phopylslhelper.easy_time_sync import EasyTimeSyncParsingMixin
-from phopylslhelper.mixins.app_helpers import SingletonInstanceMixin, AppThemeMixin, SystemTrayAppMixin
-from whisper_timestamped.mixins.live_whisper_transcription import LiveWhisperTranscriptionAppMixin
-from labrecorder import LabRecorder
+from tkinter import ttk
+from phologtolabstreaminglayer.features.lazy_import import lazy_import
+
+keyboard = lazy_import('keyboard') # only needed once a global hotkey is registered
 
 
 class GlobalHotkeyMixin:
@@ -0,0 +1,401 @@
+# Batched InfluxDB sink for recorded markers
+# Copyright (C) 2025 Pho Hale. All rights reserved.
+
+"""
+Optionally mirrors recorded markers to InfluxDB (e.g. for live Grafana dashboards next to the recording).
+
+Markers are converted to line protocol, one point per sample in the `markers` measurement (configurable):
+- tags: `stream`, `host`, and for EventBoard markers the `event` name
+- fields: `message` (the marker text) and `lsl_timestamp`; EventBoard markers add `button_text` and `toggle`,
+  the numeric 'EventBoardCodes' stream is written with one field per channel label
+- time: the marker's LSL timestamp mapped to wall-clock time (nanoseconds)
+
+The sink implements the `RecordingSink` interface (see `features/recording_sinks.py`), so it is added to a recording's
+`RecordingSinkRouter` next to the file outputs (with the 'drop' policy). `write_batch` never blocks: it appends to a deque and returns. A feeder thread converts the samples and hands the lines
+to the client's batching write API, which batches by size/interval and retries failed batches on its own scheduler
+thread. The lines handed over but not yet confirmed (written or given up on) are the retry buffer; it is bounded by
+`max_buffered_lines`, and markers beyond it are dropped and counted, so a slow or unreachable database costs memory
+up to that bound and nothing else.
+
+Configured from the environment (the sink is disabled unless the URL is set):
+    PHO_LOGTOLABSTREAMINGLAYER_INFLUXDB_URL          e.g. http://localhost:8086
+    PHO_LOGTOLABSTREAMINGLAYER_INFLUXDB_TOKEN        (falls back to INFLUXDB_TOKEN)
+    PHO_LOGTOLABSTREAMINGLAYER_INFLUXDB_ORG
+    PHO_LOGTOLABSTREAMINGLAYER_INFLUXDB_BUCKET
+    PHO_LOGTOLABSTREAMINGLAYER_INFLUXDB_MEASUREMENT  (default "markers")
+
+This module provides:
+- marker_to_line_protocol: convert one recorded sample to a line protocol line
+- InfluxDBMarkerSink: the non-blocking batched writer
+- get_influxdb_sink_settings_from_env / create_influxdb_sink_from_env: environment configuration
+"""
+
+import os
+import socket
+import threading
+import time
+from collections import deque
+from typing import Optional, Dict, List, Any
+
+import pylsl
+
+from phologtolabstreaminglayer.features.app_logging import get_logger
+from phologtolabstreaminglayer.features.lazy_import import lazy_import
+from phologtolabstreaminglayer.features.lsl_stream_infos import eventboard_codes_channel_labels
+from phologtolabstreaminglayer.features.recording_sinks import RecordingSink, RecordingTarget
+
+influxdb_client = lazy_import('influxdb_client')
+influxdb_write_api = lazy_import('influxdb_client.client.write_api')
+
+logger = get_logger('influxdb')
+
+_influxdb_env_variable_prefix: str = "PHO_LOGTOLABSTREAMINGLAYER_INFLUXDB_"
+default_influxdb_measurement: str = "markers"
+
+
+# ---------------------------------------------------------------------------- #
+#                                 Line Protocol                                #
+# ---------------------------------------------------------------------------- #
+
+def _escape_key(value: str) -> str:
+    """Escape a measurement name, tag key/value or field key."""
+    return str(value).replace('\\', '\\\\').replace(',', '\\,').replace('=', '\\=').replace(' ', '\\ ').replace('\n', '\\n').replace('\r', '\\r')
+
+
+def _format_field_value(value: Any) -> str:
+    """Format a field value; newlines in strings are written as '\\n'/'\\r' since a raw one would end the line."""
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, int):
+        return f"{value}i"
+    if isinstance(value, float):
+        return repr(value)
+    return '"' + str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n').replace('\r', '\\r') + '"'
+
+
+def marker_to_line_protocol(stream_name: str, sample: List[Any], lsl_timestamp: float, unix_time_ns: int, measurement: str = default_influxdb_measurement,
+                            tags: Optional[Dict[str, str]] = None) -> Optional[str]:
+    """
+    Convert one recorded sample to a line protocol line.
+
+    Args:
+        stream_name: Stream the sample was recorded from.
+        sample: The sample values (one per channel).
+        lsl_timestamp: The sample's LSL timestamp (kept as a field).
+        unix_time_ns: Point time in nanoseconds since the epoch.
+        measurement: Measurement name.
+        tags: Extra tags (e.g. host).
+
+    Returns:
+        The line (without a newline), or None for an empty sample.
+    """
+    if not sample:
+        return None
+    point_tags = dict(tags or {})
+    point_tags['stream'] = stream_name
+    fields: Dict[str, Any] = {}
+    if stream_name == 'EventBoardCodes':
+        for a_label, a_value in zip(eventboard_codes_channel_labels, sample):
+            fields[a_label] = float(a_value)
+    elif isinstance(sample[0], str):
+        message = sample[0] if len(sample) == 1 else '|'.join(str(v) for v in sample)
+        fields['message'] = message
+        if stream_name == 'EventBoard':
+            # "event_name|button_text|iso_timestamp[|TOGGLE:state]", see `send_eventboard_message`
+            parts = message.split('|')
+            point_tags['event'] = parts[0]
+            if len(parts) > 1:
+                fields['button_text'] = parts[1]
+            if (len(parts) > 3) and parts[3].startswith('TOGGLE:'):
+                fields['toggle'] = (parts[3][len('TOGGLE:'):] == 'True')
+    else:
+        for a_channel_idx, a_value in enumerate(sample):
+            fields['value' if len(sample) == 1 else f'ch{a_channel_idx}'] = float(a_value)
+    fields['lsl_timestamp'] = float(lsl_timestamp)
+
+    tag_str = ''.join(f",{_escape_key(k)}={_escape_key(v)}" for k, v in sorted(point_tags.items()) if v not in (None, ''))
+    field_str = ','.join(f"{_escape_key(k)}={_format_field_value(v)}" for k, v in fields.items())
+    return f"{_escape_key(measurement)}{tag_str} {field_str} {int(unix_time_ns)}"
+
+
+# ---------------------------------------------------------------------------- #
+#                                     Sink                                     #
+# ---------------------------------------------------------------------------- #
+
+class InfluxDBMarkerSink(RecordingSink):
+    """Writes recorded markers to InfluxDB without ever blocking the caller.
+
+    A database isn't split into files: `rotate` keeps the connection and only reports the metrics so far.
+
+    Usage:
+        sink = InfluxDBMarkerSink(url='http://localhost:8086', token=..., org='lab', bucket='markers')
+        sink.start()
+        sink.write_batch('TextLogger', [['hello']], [pylsl.local_clock()])
+        ...
+        sink.close()  # flushes (waiting up to `close_timeout_sec`)
+    """
+
+    name = 'influxdb'
+    policy = 'drop'
+
+    def __init__(self, url: str, token: Optional[str], org: str, bucket: str, measurement: str = default_influxdb_measurement, tags: Optional[Dict[str, str]] = None,
+                 batch_size: int = 500, flush_interval_ms: int = 1000, retry_interval_ms: int = 2000, max_retries: int = 5, max_retry_time_ms: int = 60000,
+                 max_buffered_lines: int = 50000, timeout_ms: int = 10000, close_timeout_sec: float = 5.0):
+        """
+        Args:
+            url: InfluxDB URL, e.g. 'http://localhost:8086'.
+            token: API token (None/empty for servers without authentication).
+            org: Organization.
+            bucket: Bucket the markers are written to.
+            measurement: Measurement name of the points.
+            tags: Tags added to every point; defaults to {'host': <hostname>}.
+            batch_size: Most lines per write request.
+            flush_interval_ms: Longest time a line waits for its batch to fill.
+            retry_interval_ms: Delay before the first retry of a failed batch (grows exponentially).
+            max_retries: Retries of a failed batch before it is dropped.
+            max_retry_time_ms: Total time spent retrying one batch before it is dropped.
+            max_buffered_lines: Most lines queued or in flight (including batches being retried); further markers are dropped.
+            timeout_ms: HTTP timeout of one write request.
+            close_timeout_sec: How long `close` waits for pending batches.
+        """
+        self.url = url
+        self.token = token
+        self.org = org
+        self.bucket = bucket
+        self.measurement = measurement
+        self.tags: Dict[str, str] = dict(tags) if tags is not None else {'host': socket.gethostname()}
+        self.batch_size = batch_size
+        self.flush_interval_ms = flush_interval_ms
+        self.retry_interval_ms = retry_interval_ms
+        self.max_retries = max_retries
+        self.max_retry_time_ms = max_retry_time_ms
+        self.max_buffered_lines = max_buffered_lines
+        self.timeout_ms = timeout_ms
+        self.close_timeout_sec = close_timeout_sec
+        self.max_pending = max_buffered_lines  # the router's queue in front of this sink
+
+        self._incoming: deque = deque()  # (stream_name, samples, timestamps) from `write_batch`
+        self._n_incoming_samples = 0
+        self._wakeup = threading.Event()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+        self._client = None
+        self._write_api = None
+        self._in_flight_lock = threading.Lock()
+        self._lines_in_flight = 0
+        # LSL timestamps -> wall clock (`pylsl.local_clock()` has an arbitrary epoch)
+        self._lsl_to_unix_offset_sec: float = time.time() - pylsl.local_clock()
+
+        # Metrics
+        self.lines_written = 0
+        self.batches_written = 0
+        self.lines_failed = 0  # batches given up on after their retries
+        self.lines_dropped = 0  # rejected because the buffer was full
+        self.retries = 0
+        self.last_error: Optional[str] = None
+
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+
+    @property
+    def buffered_lines(self) -> int:
+        """Markers queued or in flight (the retry buffer)."""
+        return self._n_incoming_samples + self._lines_in_flight
+
+
+    def start(self, target: Optional[RecordingTarget] = None):
+        """Create the client and start the feeder thread (the client import and connection setup happen on the thread)."""
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="InfluxDBMarkerSink", daemon=True)
+        self._thread.start()
+
+
+    def write_batch(self, stream_name: str, samples: List[List[Any]], timestamps: List[float]) -> int:
+        """
+        Queue recorded samples for writing (safe from any thread, never blocks).
+
+        Returns:
+            Number of samples queued (the rest were dropped because the buffer is full).
+        """
+        if not self._running:
+            return 0
+        n_free = max(0, self.max_buffered_lines - self.buffered_lines)
+        n_accepted = min(n_free, len(samples))
+        if n_accepted < len(samples):
+            self.lines_dropped += len(samples) - n_accepted
+        if n_accepted == 0:
+            return 0
+        self._n_incoming_samples += n_accepted
+        self._incoming.append((stream_name, samples[:n_accepted], timestamps[:n_accepted]))
+        self._wakeup.set()
+        return n_accepted
+
+
+    def rotate(self, target: RecordingTarget) -> Dict[str, Any]:
+        return self.get_metrics()
+
+
+    def close(self) -> Dict[str, Any]:
+        """Write what is still queued (waiting up to `close_timeout_sec`) and release the client. Returns the metrics."""
+        if self._running:
+            self._running = False
+            self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.close_timeout_sec)
+            self._thread = None
+        return self.get_metrics()
+
+
+    # ---------------------------------------------------------------------------- #
+    #                                 Feeder Thread                                #
+    # ---------------------------------------------------------------------------- #
+
+    def _create_write_api(self):
+        write_options = influxdb_write_api.WriteOptions(write_type=influxdb_write_api.WriteType.batching, batch_size=self.batch_size, flush_interval=self.flush_interval_ms,
+                                                        retry_interval=self.retry_interval_ms, max_retries=self.max_retries, max_retry_time=self.max_retry_time_ms,
+                                                        max_retry_delay=self.max_retry_time_ms, max_close_wait=int(self.close_timeout_sec * 1000))
+        self._client = influxdb_client.InfluxDBClient(url=self.url, token=self.token or None, org=self.org, timeout=self.timeout_ms)
+        self._write_api = self._client.write_api(write_options=write_options, success_callback=self._on_batch_written,
+                                                 error_callback=self._on_batch_failed, retry_callback=self._on_batch_retry)
+
+
+    def _run(self):
+        try:
+            self._create_write_api()
+        except Exception as e:
+            self.last_error = str(e)
+            logger.error("InfluxDB sink disabled, could not create the client for %s: %s", self.url, e)
+            self._running = False
+            self._incoming.clear()
+            self._n_incoming_samples = 0
+            return
+        logger.info("InfluxDB sink writing to %s (org '%s', bucket '%s')", self.url, self.org, self.bucket)
+
+        try:
+            while self._running or self._incoming:
+                if not self._incoming:
+                    self._wakeup.wait(0.5)
+                    self._wakeup.clear()
+                    continue
+                lines = self._convert_incoming()
+                if lines:
+                    with self._in_flight_lock:
+                        self._lines_in_flight += len(lines)
+                    try:
+                        self._write_api.write(bucket=self.bucket, org=self.org, record=lines, write_precision='ns')
+                    except Exception as e:
+                        with self._in_flight_lock:
+                            self._lines_in_flight -= len(lines)
+                        self.lines_failed += len(lines)
+                        self.last_error = str(e)
+                        logger.error("Error queueing %d marker(s) for InfluxDB: %s", len(lines), e)
+        finally:
+            self._close_client()
+
+
+    def _convert_incoming(self) -> List[str]:
+        lines = []
+        offset_sec = self._lsl_to_unix_offset_sec
+        try:
+            while True:
+                stream_name, samples, timestamps = self._incoming.popleft()
+                self._n_incoming_samples -= len(samples)
+                for a_sample, a_timestamp in zip(samples, timestamps):
+                    try:
+                        line = marker_to_line_protocol(stream_name, a_sample, a_timestamp, int((a_timestamp + offset_sec) * 1e9), measurement=self.measurement, tags=self.tags)
+                    except (TypeError, ValueError) as e:
+                        logger.warning("Skipping %s sample that can't be converted to line protocol (%s): %r", stream_name, e, a_sample)
+                        continue
+                    if line is not None:
+                        lines.append(line)
+        except IndexError:
+            pass
+        return lines
+
+
+    def _close_client(self):
+        if self._write_api is not None:
+            try:
+                self._write_api.close() # flushes pending batches (bounded by max_close_wait)
+            except Exception as e:
+                logger.error("Error flushing the InfluxDB sink: %s", e)
+            self._write_api = None
+        if self._client is not None:
+            try:
+                self._client.close()
+            except Exception:
+                pass
+            self._client = None
+        logger.info("InfluxDB sink closed: %s", self.get_metrics())
+
+
+    # Client callbacks (run on the client's scheduler thread)
+
+    @staticmethod
+    def _count_batch_lines(data: bytes) -> int:
+        """Number of lines in a batch the client joined with newlines (our lines never contain one, see `_format_field_value`)"""
+        return len(data.split(b'\n')) if data else 0
+
+
+    def _on_batch_written(self, conf, data: bytes):
+        n_lines = self._count_batch_lines(data)
+        with self._in_flight_lock:
+            self._lines_in_flight -= n_lines
+        self.lines_written += n_lines
+        self.batches_written += 1
+
+
+    def _on_batch_failed(self, conf, data: bytes, exception: Exception):
+        n_lines = self._count_batch_lines(data)
+        with self._in_flight_lock:
+            self._lines_in_flight -= n_lines
+        self.lines_failed += n_lines
+        self.last_error = str(exception)
+        logger.error("InfluxDB write of %d marker(s) failed after retries: %s", n_lines, exception)
+
+
+    def _on_batch_retry(self, conf, data: bytes, exception: Exception):
+        self.retries += 1
+        self.last_error = str(exception)
+        logger.warning("InfluxDB write failed, retrying: %s", exception)
+
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {'url': self.url, 'bucket': self.bucket, 'running': self._running, 'buffered_lines': self.buffered_lines, 'lines_written': self.lines_written,
+                'batches_written': self.batches_written, 'lines_failed': self.lines_failed, 'lines_dropped': self.lines_dropped, 'retries': self.retries,
+                'last_error': self.last_error}
+
+
+# ---------------------------------------------------------------------------- #
+#                                 Configuration                                #
+# ---------------------------------------------------------------------------- #
+
+def get_influxdb_sink_settings_from_env() -> Optional[Dict[str, Any]]:
+    """The sink settings from the PHO_LOGTOLABSTREAMINGLAYER_INFLUXDB_* variables, or None if no URL is set (sink disabled)."""
+    url = os.environ.get(f"{_influxdb_env_variable_prefix}URL", '').strip()
+    if not url:
+        return None
+    return {
+        'url': url,
+        'token': os.environ.get(f"{_influxdb_env_variable_prefix}TOKEN") or os.environ.get("INFLUXDB_TOKEN"),
+        'org': os.environ.get(f"{_influxdb_env_variable_prefix}ORG", '').strip(),
+        'bucket': os.environ.get(f"{_influxdb_env_variable_prefix}BUCKET", '').strip(),
+        'measurement': os.environ.get(f"{_influxdb_env_variable_prefix}MEASUREMENT", '').strip() or default_influxdb_measurement,
+    }
+
+
+def create_influxdb_sink_from_env() -> Optional[InfluxDBMarkerSink]:
+    """Create (not start) the sink configured in the environment. Returns None if it isn't configured or the configuration is incomplete."""
+    settings = get_influxdb_sink_settings_from_env()
+    if settings is None:
+        return None
+    missing = [k for k in ('org', 'bucket') if not settings[k]]
+    if missing:
+        logger.error("InfluxDB sink disabled, missing %s", ', '.join(f"{_influxdb_env_variable_prefix}{k.upper()}" for k in missing))
+        return None
+    return InfluxDBMarkerSink(**settings)
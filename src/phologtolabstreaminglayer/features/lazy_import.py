@@ -0,0 +1,133 @@
+# Deferred imports for heavy optional dependencies
+# Copyright (C) 2025 Pho Hale. All rights reserved.
+
+"""
+Lets modules declare heavy dependencies (mne, numpy, pystray, PIL, labrecorder, ...) at the top of the file without
+paying for them at import time: the real import happens on first attribute access, or earlier in a background
+warm-up thread started once the main window is up.
+
+Import durations are recorded so cold-start improvements can be measured (see `get_import_timings` and
+`scripts/benchmark_cold_start.py`). Setting PHO_LOGTOLABSTREAMINGLAYER_EAGER_IMPORTS=1 restores eager imports, which
+gives the baseline for that comparison.
+
+This module provides:
+- LazyModule / lazy_import: a module proxy that imports on first use
+- warm_up_imports: import a list of lazy modules in a background thread
+- get_import_timings: seconds spent importing each lazily loaded module
+"""
+
+import importlib
+import os
+import threading
+import time
+from types import ModuleType
+from typing import Optional, Callable, Dict, List, Iterable, Union
+
+from phologtolabstreaminglayer.features.app_logging import get_logger
+
+logger = get_logger('startup')
+
+_eager_imports_env_variable_name: str = "PHO_LOGTOLABSTREAMINGLAYER_EAGER_IMPORTS"
+_import_timings: Dict[str, float] = {}
+_import_timings_lock = threading.Lock()
+
+
+class LazyModule(ModuleType):
+    """Proxy for a module that is imported on first attribute access.
+
+    Usage:
+        np = lazy_import('numpy')
+        ...
+        np.zeros(3)  # numpy is imported here
+    """
+
+    def __init__(self, module_name: str):
+        super().__init__(module_name)
+        self.__dict__['_lazy_module_name'] = module_name
+        self.__dict__['_lazy_module'] = None
+        self.__dict__['_lazy_lock'] = threading.RLock()
+
+
+    # NOTE: the proxy's own methods are underscore-prefixed so they can't shadow attributes of the real module (e.g. `numpy.load`)
+    @property
+    def _lazy_is_loaded(self) -> bool:
+        return self.__dict__['_lazy_module'] is not None
+
+
+    def _lazy_load(self) -> ModuleType:
+        """Import the real module (if not done yet) and return it."""
+        module = self.__dict__['_lazy_module']
+        if module is not None:
+            return module
+        with self.__dict__['_lazy_lock']:
+            module = self.__dict__['_lazy_module']
+            if module is None:
+                module_name = self.__dict__['_lazy_module_name']
+                start_t = time.perf_counter()
+                module = importlib.import_module(module_name)
+                with _import_timings_lock:
+                    _import_timings[module_name] = time.perf_counter() - start_t
+                self.__dict__['_lazy_module'] = module
+        return module
+
+
+    def __getattr__(self, name: str):
+        return getattr(self._lazy_load(), name)
+
+
+    def __dir__(self):
+        return dir(self._lazy_load())
+
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._lazy_is_loaded else "not loaded"
+        return f"<LazyModule {self.__dict__['_lazy_module_name']!r} ({state})>"
+
+
+def is_eager_import_mode() -> bool:
+    """Whether lazy imports are disabled via PHO_LOGTOLABSTREAMINGLAYER_EAGER_IMPORTS."""
+    return os.environ.get(_eager_imports_env_variable_name, '').strip().lower() in ('1', 'true', 'yes')
+
+
+def lazy_import(module_name: str) -> Union[LazyModule, ModuleType]:
+    """Return a `LazyModule` proxy for `module_name` (or the module itself in eager import mode)."""
+    proxy = LazyModule(module_name)
+    if is_eager_import_mode():
+        return proxy._lazy_load()
+    return proxy
+
+
+def warm_up_imports(modules: Iterable[Union[LazyModule, ModuleType]], on_done: Optional[Callable[[Dict[str, float]], None]] = None, start_delay_sec: float = 0.0) -> threading.Thread:
+    """
+    Import lazy modules one after another in a daemon thread so they are ready before first use.
+
+    Args:
+        modules: Lazy modules to load (already loaded/regular modules are skipped).
+        on_done: Called (on the warm-up thread) with `get_import_timings()` once everything is loaded.
+        start_delay_sec: Wait this long before starting, e.g. to let the GUI finish its first paint.
+
+    Returns:
+        The started thread.
+    """
+    pending: List[LazyModule] = [a_module for a_module in modules if isinstance(a_module, LazyModule) and not a_module._lazy_is_loaded]
+
+    def _warm_up():
+        if start_delay_sec > 0:
+            time.sleep(start_delay_sec)
+        for a_module in pending:
+            try:
+                a_module._lazy_load()
+            except Exception as e:
+                logger.error("Error warming up import of '%s': %s", a_module.__dict__['_lazy_module_name'], e)
+        if on_done is not None:
+            on_done(get_import_timings())
+
+    thread = threading.Thread(target=_warm_up, name="ImportWarmUp", daemon=True)
+    thread.start()
+    return thread
+
+
+def get_import_timings() -> Dict[str, float]:
+    """Seconds spent importing each lazily loaded module so far."""
+    with _import_timings_lock:
+        return dict(_import_timings)
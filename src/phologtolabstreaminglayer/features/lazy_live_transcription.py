@@ -0,0 +1,74 @@
+# Lazily imported in-process live transcription mixin
+# Copyright (C) 2025 Pho Hale. All rights reserved.
+
+"""
+`whisper_timestamped.mixins.live_whisper_transcription` imports whisper and torch when it is loaded, which takes
+seconds. The app can't list that mixin as a base class without paying for the import before the window exists, so it
+derives from `LazyLiveWhisperTranscriptionAppMixin` instead: its entry points forward to the real mixin, which is
+imported on first use (the app imports it on a background thread at startup, see `live_whisper_transcription_module`).
+
+The real mixin is not part of the app's MRO: its methods are looked up on the mixin class and bound to the app
+instance, so they can call each other (and the app) through `self` but must not rely on `super()`.
+
+This module provides:
+- live_whisper_transcription_module: lazy proxy for the mixin's module (pass it to `warm_up_imports`)
+- is_live_whisper_transcription_loaded: whether the mixin has been imported
+- LazyLiveWhisperTranscriptionAppMixin: stand-in base class forwarding to `LiveWhisperTranscriptionAppMixin`
+"""
+
+import inspect
+from types import ModuleType
+
+from phologtolabstreaminglayer.features.lazy_import import LazyModule, lazy_import
+
+
+live_whisper_transcription_module = lazy_import('whisper_timestamped.mixins.live_whisper_transcription')
+
+
+def is_live_whisper_transcription_loaded() -> bool:
+    """Whether the real mixin's module has been imported (never triggers the import)."""
+    if isinstance(live_whisper_transcription_module, LazyModule):
+        return live_whisper_transcription_module._lazy_is_loaded
+    return isinstance(live_whisper_transcription_module, ModuleType) # eager import mode
+
+
+class LazyLiveWhisperTranscriptionAppMixin:
+    """Stands in for `LiveWhisperTranscriptionAppMixin` as a base class; calling one of its entry points imports it."""
+
+    def _live_whisper_mixin_attribute(self, name: str):
+        """Look up `name` on the real mixin class (importing it if needed) and bind it to this instance."""
+        mixin_class = live_whisper_transcription_module.LiveWhisperTranscriptionAppMixin
+        attribute = inspect.getattr_static(mixin_class, name) # raises AttributeError if the mixin doesn't have it either
+        if hasattr(attribute, '__get__'):
+            return attribute.__get__(self, type(self)) # methods, properties, class/static methods
+        return attribute
+
+
+    def init_LiveWhisperTranscriptionAppMixin(self, *args, **kwargs):
+        return self._live_whisper_mixin_attribute('init_LiveWhisperTranscriptionAppMixin')(*args, **kwargs)
+
+    def setup_gui_LiveWhisperTranscriptionAppMixin(self, *args, **kwargs):
+        return self._live_whisper_mixin_attribute('setup_gui_LiveWhisperTranscriptionAppMixin')(*args, **kwargs)
+
+    def setup_lsl_outlet_LiveWhisperTranscriptionAppMixin(self, *args, **kwargs):
+        return self._live_whisper_mixin_attribute('setup_lsl_outlet_LiveWhisperTranscriptionAppMixin')(*args, **kwargs)
+
+    def auto_start_live_transcription(self, *args, **kwargs):
+        return self._live_whisper_mixin_attribute('auto_start_live_transcription')(*args, **kwargs)
+
+    def start_live_transcription(self, *args, **kwargs):
+        return self._live_whisper_mixin_attribute('start_live_transcription')(*args, **kwargs)
+
+    def stop_live_transcription(self, *args, **kwargs):
+        return self._live_whisper_mixin_attribute('stop_live_transcription')(*args, **kwargs)
+
+
+    def __getattr__(self, name: str):
+        # Only reached for attributes the instance and its real bases don't have, i.e. the mixin's own helpers. Nothing is
+        # imported from here, so `hasattr`/`getattr(..., default)` checks elsewhere in the app stay cheap.
+        if name.startswith('__') or not is_live_whisper_transcription_loaded():
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        try:
+            return self._live_whisper_mixin_attribute(name)
+        except AttributeError:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'") from None
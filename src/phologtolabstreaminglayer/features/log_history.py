@@ -0,0 +1,217 @@
+# Bounded Log History display backed by an on-disk session log
+# Copyright (C) 2025 Pho Hale. All rights reserved.
+
+"""
+Keeps the Log History text widget at a fixed size while the full history stays available on disk.
+
+This module provides:
+- LogHistoryFile: an append-only session log file with a line-offset index for random-access paging
+- LogHistoryModel: a fixed-capacity ring buffer of lines mirrored into a Tk text widget, with paging through the file
+"""
+
+import tkinter as tk
+from array import array
+from collections import deque
+from pathlib import Path
+from typing import Optional, List
+
+
+def _split_lines(text: str) -> List[str]:
+    """Split after every '\\n' only, keeping it, like `readline()` on the file and the Tk text widget do (`str.splitlines`
+    also splits on '\\r', '\\x0b', '\\x85', '\\u2028', ..., which would put line offsets out of step with the file)."""
+    lines = [a_line + '\n' for a_line in text.split('\n')]
+    lines[-1] = lines[-1][:-1] # text after the last newline (if any)
+    return lines if lines[-1] else lines[:-1]
+
+
+class LogHistoryFile:
+    """Append-only text file of log lines with an in-memory index of line start offsets.
+
+    The index is an `array('q')` (8 bytes per line), so paging to any line is a single seek regardless of file size.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._line_offsets = array('q')
+        self._end_offset = 0
+        self._file = open(self.path, 'ab')
+        self._end_offset = self._file.tell()
+
+
+    @property
+    def line_count(self) -> int:
+        """Number of lines appended to this file."""
+        return len(self._line_offsets)
+
+
+    def append(self, text: str):
+        """Append text (may contain several lines; a trailing newline is added if missing)."""
+        if self._file is None:
+            return
+        if not text.endswith('\n'):
+            text = text + '\n'
+        for a_line in _split_lines(text):
+            encoded = a_line.encode('utf-8', errors='replace')
+            self._line_offsets.append(self._end_offset)
+            self._file.write(encoded)
+            self._end_offset += len(encoded)
+        self._file.flush()
+
+
+    def read_lines(self, start_line: int, count: int) -> List[str]:
+        """Read up to `count` lines starting at `start_line` (0-based)."""
+        if (count <= 0) or (start_line >= self.line_count) or (start_line < 0):
+            return []
+        with open(self.path, 'rb') as f:
+            f.seek(self._line_offsets[start_line])
+            return [f.readline().decode('utf-8', errors='replace') for _ in range(min(count, self.line_count - start_line))]
+
+
+    def close(self):
+        """Close the file handle."""
+        if self._file is not None:
+            try:
+                self._file.close()
+            except Exception:
+                pass
+            self._file = None
+
+
+class LogHistoryModel:
+    """Fixed-capacity ring buffer of log lines shown in a Tk text widget.
+
+    Appending is constant cost: the widget is trimmed in batches of `trim_batch` lines once it exceeds `capacity`, so
+    the deletes are amortized and the widget never grows without bound. Every line is also written to a
+    `LogHistoryFile`, and `show_page(...)` replaces the widget content with a page read from it. While paging, new
+    lines only go to the ring buffer and file; `show_live()` restores the ring buffer view.
+    """
+
+    def __init__(self, text_widget: tk.Text, capacity: int = 2000, trim_batch: int = 200, history_file: Optional[LogHistoryFile] = None, page_size: int = 500):
+        """
+        Args:
+            text_widget: The text widget to display lines in.
+            capacity: Maximum number of lines kept in the widget and ring buffer.
+            trim_batch: Number of extra lines allowed before the oldest lines are deleted from the widget in one batch.
+            history_file: Optional on-disk log holding the full history (enables paging).
+            page_size: Number of lines per page when paging through the history file.
+        """
+        self._text_widget = text_widget
+        self.capacity = capacity
+        self.trim_batch = trim_batch
+        self.page_size = page_size
+        self.history_file = history_file
+        self._ring: deque = deque(maxlen=capacity)
+        self._widget_line_count = 0
+        self._current_page: Optional[int] = None  # None means live view
+        self._lines_since_paging = 0
+
+
+    @property
+    def is_live(self) -> bool:
+        """Whether the widget currently shows the live ring buffer (as opposed to a page from the history file)."""
+        return self._current_page is None
+
+
+    @property
+    def current_page(self) -> Optional[int]:
+        """The page currently shown, or None in live view."""
+        return self._current_page
+
+
+    @property
+    def page_count(self) -> int:
+        """Number of pages in the on-disk history."""
+        if self.history_file is None:
+            return 0
+        return max(1, (self.history_file.line_count + self.page_size - 1) // self.page_size)
+
+
+    @property
+    def lines_since_paging(self) -> int:
+        """Lines appended while a history page was shown (not yet visible)."""
+        return self._lines_since_paging
+
+
+    def append(self, log_entry: str):
+        """Append a log entry (one or more newline-terminated lines)."""
+        if self.history_file is not None:
+            self.history_file.append(log_entry)
+        new_lines = _split_lines(log_entry)
+        self._ring.extend(new_lines)
+        if not self.is_live:
+            self._lines_since_paging += len(new_lines)
+            return
+        self._text_widget.insert(tk.END, log_entry)
+        self._widget_line_count += len(new_lines)
+        self._trim_if_needed()
+        self._text_widget.see(tk.END)  # Auto-scroll to bottom
+
+
+    def _trim_if_needed(self):
+        """Delete the oldest lines from the widget in one batch once it is `trim_batch` lines over capacity."""
+        if self._widget_line_count <= (self.capacity + self.trim_batch):
+            return
+        lines_to_remove = self._widget_line_count - self.capacity
+        self._text_widget.delete('1.0', f'{lines_to_remove + 1}.0')
+        self._widget_line_count -= lines_to_remove
+
+
+    def _replace_widget_lines(self, lines: List[str]):
+        """Replace the whole widget content with `lines`."""
+        self._text_widget.delete('1.0', tk.END)
+        if lines:
+            self._text_widget.insert(tk.END, ''.join(lines))
+        self._widget_line_count = len(lines)
+
+
+    def show_live(self):
+        """Show the live ring buffer and resume appending to the widget."""
+        self._current_page = None
+        self._lines_since_paging = 0
+        self._replace_widget_lines(list(self._ring))
+        self._text_widget.see(tk.END)
+
+
+    def show_page(self, page_index: int):
+        """Show page `page_index` (0 = oldest) of the on-disk history."""
+        if self.history_file is None:
+            return
+        page_index = max(0, min(page_index, self.page_count - 1))
+        self._current_page = page_index
+        self._replace_widget_lines(self.history_file.read_lines(page_index * self.page_size, self.page_size))
+        self._text_widget.see('1.0')
+
+
+    def show_older_page(self):
+        """Page back in history (from live view this shows the newest page)."""
+        if self.history_file is None:
+            return
+        if self.is_live:
+            self.show_page(self.page_count - 1)
+        else:
+            self.show_page(self._current_page - 1)
+
+
+    def show_newer_page(self):
+        """Page forward in history, returning to the live view past the newest page."""
+        if self.is_live:
+            return
+        if self._current_page >= (self.page_count - 1):
+            self.show_live()
+        else:
+            self.show_page(self._current_page + 1)
+
+
+    def clear_display(self):
+        """Clear the widget and ring buffer (the on-disk history is kept)."""
+        self._ring.clear()
+        self._current_page = None
+        self._lines_since_paging = 0
+        self._replace_widget_lines([])
+
+
+    def close(self):
+        """Close the on-disk history file."""
+        if self.history_file is not None:
+            self.history_file.close()
@@ -0,0 +1,93 @@
+# LSL stream definitions of our own marker outlets
+# Copyright (C) 2025 Pho Hale. All rights reserved.
+
+"""
+The `pylsl.StreamInfo`s of the marker streams this app publishes, shared by the GUI app and the headless daemon so
+both create identical streams (same names, types, source ids and metadata) that recordings can't tell apart.
+
+The EasyTimeSync timestamp fields are added by the caller (`EasyTimeSyncParsingMixin_add_lsl_outlet_info`).
+
+This module provides:
+- make_textlogger_stream_info: the 'TextLogger' string marker stream
+- make_eventboard_stream_info: the 'EventBoard' string marker stream
+- make_eventboard_codes_stream_info: the numeric 'EventBoardCodes' companion stream
+"""
+
+import pylsl
+
+from phologtolabstreaminglayer.features.eventboard_config import CompiledEventBoardConfig
+
+
+eventboard_codes_channel_labels = ['event_id', 'toggle_state', 'offset_seconds', 'sequence_number']
+
+
+def make_textlogger_stream_info() -> pylsl.StreamInfo:
+    """StreamInfo of the 'TextLogger' outlet (user entered text log events)."""
+    info = pylsl.StreamInfo(
+        name='TextLogger',
+        type='Markers',
+        channel_count=1,
+        nominal_srate=pylsl.IRREGULAR_RATE,
+        channel_format=pylsl.cf_string,
+        source_id='textlogger_001'
+    )
+
+    # Add some metadata
+    info.desc().append_child_value("manufacturer", "PhoLogToLabStreamingLayer")
+    info.desc().append_child_value("version", "2.1")
+    info.desc().append_child_value("description", "TextLogger user entered text logs events")
+    return info
+
+
+def make_eventboard_stream_info() -> pylsl.StreamInfo:
+    """StreamInfo of the 'EventBoard' outlet (button events as strings)."""
+    info = pylsl.StreamInfo(
+        name='EventBoard',
+        type='Markers',
+        channel_count=1,
+        nominal_srate=pylsl.IRREGULAR_RATE,
+        channel_format=pylsl.cf_string,
+        source_id='eventboard_001'
+    )
+
+    # Add some metadata
+    info.desc().append_child_value("manufacturer", "PhoLogToLabStreamingLayer")
+    info.desc().append_child_value("version", "2.1")
+    info.desc().append_child_value("description", "EventBoard button events")
+    return info
+
+
+def make_eventboard_codes_stream_info(compiled_config: CompiledEventBoardConfig) -> pylsl.StreamInfo:
+    """StreamInfo of the numeric 'EventBoardCodes' companion outlet
+
+    Channels: event_id, toggle_state (1=ON, 0=OFF, -1=instantaneous), offset_seconds, sequence_number.
+    The event_id -> event_name table is written to the stream's desc XML under <events>.
+    """
+    info = pylsl.StreamInfo(
+        name='EventBoardCodes',
+        type='Markers',
+        channel_count=len(eventboard_codes_channel_labels),
+        nominal_srate=pylsl.IRREGULAR_RATE,
+        channel_format=pylsl.cf_double64,
+        source_id='eventboard_codes_001'
+    )
+
+    # Add some metadata
+    info.desc().append_child_value("manufacturer", "PhoLogToLabStreamingLayer")
+    info.desc().append_child_value("version", "2.1")
+    info.desc().append_child_value("description", "EventBoard button events as numeric codes (companion to the EventBoard string stream)")
+
+    channels = info.desc().append_child("channels")
+    for a_label in eventboard_codes_channel_labels:
+        a_channel = channels.append_child("channel")
+        a_channel.append_child_value("label", a_label)
+        a_channel.append_child_value("type", "Markers")
+
+    events = info.desc().append_child("events")
+    for a_button_config in compiled_config.buttons:
+        an_event = events.append_child("event")
+        an_event.append_child_value("id", str(a_button_config.code))
+        an_event.append_child_value("name", a_button_config.event_name)
+        an_event.append_child_value("text", a_button_config.text)
+        an_event.append_child_value("type", a_button_config.type)
+    return info
@@ -0,0 +1,302 @@
+# Searchable marker history backed by SQLite (WAL + FTS5)
+# Copyright (C) 2025 Pho Hale. All rights reserved.
+
+"""
+Persists every sent and received marker to a local SQLite database so past sessions can be searched without opening
+CSV files by hand.
+
+Inserts are queued with a constant-cost `deque.append` and written in batches (one transaction per batch) by a
+background writer thread, so neither the Tk thread nor the LSL push/pull threads ever wait on disk I/O. The database
+runs in WAL mode, so searches from the GUI read concurrently with the writer. Message text is indexed with an FTS5
+external-content table; on SQLite builds without FTS5, search falls back to a `LIKE` scan.
+
+This module provides:
+- MarkerHistoryDB: the database, its batching writer thread and the search API
+"""
+
+import sqlite3
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Optional, List, Dict, Any
+
+import pylsl
+
+from phologtolabstreaminglayer.features.app_logging import get_logger
+
+logger = get_logger('marker_history')
+
+
+class MarkerHistoryDB:
+    """Marker history database with a batching writer thread and full-text search.
+
+    Usage:
+        db = MarkerHistoryDB(get_app_data_folder('marker_history') / 'marker_history.sqlite3')
+        db.start()
+        db.add_marker('TextLogger', 'sent', 'hello', lsl_timestamp=pylsl.local_clock())
+        results = db.search('hello')
+        db.stop()
+    """
+
+    schema_version: int = 1
+
+    def __init__(self, db_path: Path, batch_size: int = 500, flush_interval_sec: float = 0.25, max_pending: int = 100000):
+        """
+        Args:
+            db_path: Path of the SQLite database file (created if missing).
+            batch_size: Maximum number of markers written per transaction.
+            flush_interval_sec: Maximum time a queued marker waits before being written.
+            max_pending: Maximum number of queued markers; further markers are dropped (and counted) until the writer catches up.
+        """
+        self.db_path = Path(db_path)
+        self.batch_size = batch_size
+        self.flush_interval_sec = flush_interval_sec
+        self.max_pending = max_pending
+        self.session_id: str = time.strftime('%Y%m%d_%H%M%S')
+
+        self._queue: deque = deque()
+        self._wake_event = threading.Event()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+        self._read_conn: Optional[sqlite3.Connection] = None  # shared by every searching thread, callers may be short-lived threads
+        self._read_lock = threading.Lock()
+        self._has_fts: bool = False
+
+        # Metrics
+        self._markers_written = 0
+        self._markers_dropped = 0
+        self._batches_written = 0
+        self._last_batch_ms = 0.0
+
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # Connection / schema
+    # ------------------------------------------------------------------------------------------------------------------
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), timeout=5.0, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        return conn
+
+
+    def _create_schema(self, conn: sqlite3.Connection):
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS markers (
+                id INTEGER PRIMARY KEY,
+                wall_time REAL NOT NULL,
+                lsl_timestamp REAL,
+                stream_name TEXT NOT NULL,
+                direction TEXT NOT NULL,
+                message TEXT NOT NULL,
+                recording_file TEXT,
+                session_id TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_markers_wall_time ON markers(wall_time);
+            CREATE INDEX IF NOT EXISTS idx_markers_stream_time ON markers(stream_name, wall_time);
+        """)
+        try:
+            conn.execute("CREATE VIRTUAL TABLE IF NOT EXISTS markers_fts USING fts5(message, stream_name, content='markers', content_rowid='id')")
+            self._has_fts = True
+        except sqlite3.OperationalError as e:
+            logger.warning("SQLite FTS5 not available, marker search will use LIKE scans: %s", e)
+            self._has_fts = False
+        conn.execute(f'PRAGMA user_version={self.schema_version}')
+        conn.commit()
+
+
+    def _get_read_connection(self) -> sqlite3.Connection:
+        """The read connection, opened on first use (WAL readers never block the writer); call with `_read_lock` held"""
+        if self._read_conn is None:
+            self._read_conn = self._connect()
+        return self._read_conn
+
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # Writer
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+
+    @property
+    def has_fts(self) -> bool:
+        """Whether full-text search (FTS5) is available."""
+        return self._has_fts
+
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._queue)
+
+
+    def start(self):
+        """Create the schema and start the writer thread."""
+        if self._running:
+            return
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        try:
+            self._create_schema(conn)
+        finally:
+            conn.close()
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="MarkerHistoryDBWriter", daemon=True)
+        self._thread.start()
+
+
+    def stop(self, timeout: float = 5.0):
+        """Write any queued markers and stop the writer thread."""
+        self._running = False
+        self._wake_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        with self._read_lock:
+            if self._read_conn is not None:
+                try:
+                    self._read_conn.close()
+                except Exception:
+                    pass
+                self._read_conn = None
+
+
+    def add_marker(self, stream_name: str, direction: str, message: str, lsl_timestamp: Optional[float] = None, wall_time: Optional[float] = None, recording_file: Optional[str] = None) -> bool:
+        """
+        Queue a marker for insertion (safe from any thread, never blocks).
+
+        Args:
+            stream_name: LSL stream the marker was sent on or received from.
+            direction: 'sent' or 'received'.
+            message: Marker text.
+            lsl_timestamp: LSL timestamp of the marker. If `wall_time` is None it is converted to wall-clock time.
+            wall_time: Wall-clock time (seconds since the epoch). Defaults to now.
+            recording_file: Recording file that was active when the marker was logged, if any.
+
+        Returns:
+            False if the marker was dropped because the queue is full.
+        """
+        if len(self._queue) >= self.max_pending:
+            self._markers_dropped += 1
+            return False
+        if wall_time is None:
+            wall_time = time.time()
+            if lsl_timestamp is not None:
+                wall_time -= (pylsl.local_clock() - lsl_timestamp)
+        self._queue.append((wall_time, lsl_timestamp, stream_name, direction, message, recording_file, self.session_id))
+        if len(self._queue) >= self.batch_size:
+            self._wake_event.set()
+        return True
+
+
+    def _run(self):
+        conn = self._connect()
+        try:
+            while self._running or self._queue:
+                if not self._queue:
+                    self._wake_event.wait(timeout=self.flush_interval_sec)
+                    self._wake_event.clear()
+                    continue
+                if self._running and (len(self._queue) < self.batch_size):
+                    # Give the batch a moment to fill up
+                    self._wake_event.wait(timeout=self.flush_interval_sec)
+                    self._wake_event.clear()
+                rows = []
+                while self._queue and (len(rows) < self.batch_size):
+                    rows.append(self._queue.popleft())
+                self._write_batch(conn, rows)
+        finally:
+            conn.close()
+
+
+    def _write_batch(self, conn: sqlite3.Connection, rows: List[tuple]):
+        start_t = time.perf_counter()
+        try:
+            with conn:
+                for a_row in rows:
+                    cursor = conn.execute("INSERT INTO markers (wall_time, lsl_timestamp, stream_name, direction, message, recording_file, session_id) VALUES (?, ?, ?, ?, ?, ?, ?)", a_row)
+                    if self._has_fts:
+                        conn.execute("INSERT INTO markers_fts (rowid, message, stream_name) VALUES (?, ?, ?)", (cursor.lastrowid, a_row[4], a_row[2]))
+            self._markers_written += len(rows)
+            self._batches_written += 1
+        except sqlite3.Error as e:
+            self._markers_dropped += len(rows)
+            logger.error("Error writing %d marker(s) to history database: %s", len(rows), e)
+        self._last_batch_ms = (time.perf_counter() - start_t) * 1000.0
+
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------------------------------------------------------
+    @classmethod
+    def build_fts_query(cls, text: str) -> str:
+        """Turn free text into an FTS5 query matching all words as prefixes (e.g. 'red but' -> '"red"* "but"*')."""
+        terms = [a_term.replace('"', '""') for a_term in text.split()]
+        return ' '.join(f'"{a_term}"*' for a_term in terms if a_term)
+
+
+    def search(self, text: str, limit: int = 200, stream_name: Optional[str] = None, since: Optional[float] = None, until: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Search marker messages (newest first).
+
+        Args:
+            text: Words to search for (all must match, each as a prefix). Empty text returns the newest markers.
+            limit: Maximum number of results.
+            stream_name: Only return markers from this stream.
+            since / until: Optional wall-clock time bounds (seconds since the epoch).
+
+        Returns:
+            A list of dicts with keys id, wall_time, datetime, lsl_timestamp, stream_name, direction, message, recording_file, session_id.
+        """
+        conditions = []
+        params: List[Any] = []
+        fts_query = self.build_fts_query(text or '')
+        if fts_query and self._has_fts:
+            sql = "SELECT m.* FROM markers_fts JOIN markers AS m ON m.id = markers_fts.rowid"
+            conditions.append("markers_fts MATCH ?")
+            params.append(fts_query)
+        else:
+            sql = "SELECT m.* FROM markers AS m"
+            for a_term in (text or '').split():
+                conditions.append("m.message LIKE ?")
+                params.append(f"%{a_term}%")
+        if stream_name:
+            conditions.append("m.stream_name = ?")
+            params.append(stream_name)
+        if since is not None:
+            conditions.append("m.wall_time >= ?")
+            params.append(since)
+        if until is not None:
+            conditions.append("m.wall_time <= ?")
+            params.append(until)
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY m.wall_time DESC LIMIT ?"
+        params.append(int(limit))
+
+        try:
+            with self._read_lock: # one connection for all searches, so searching from a new thread each time opens nothing new
+                rows = self._get_read_connection().execute(sql, params).fetchall()
+        except sqlite3.Error as e:
+            logger.error("Error searching marker history: %s", e)
+            return []
+        results = []
+        for a_row in rows:
+            a_result = dict(a_row)
+            a_result['datetime'] = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(a_result['wall_time']))
+            results.append(a_result)
+        return results
+
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return written/dropped/batch counters and the last batch write time."""
+        return {
+            'queue_depth': len(self._queue),
+            'markers_written': self._markers_written,
+            'markers_dropped': self._markers_dropped,
+            'batches_written': self._batches_written,
+            'last_batch_ms': self._last_batch_ms,
+            'has_fts': self._has_fts,
+        }
@@ -0,0 +1,387 @@
+# Local socket ingest API for high-rate marker submission
+# Copyright (C) 2025 Pho Hale. All rights reserved.
+
+"""
+A TCP server on 127.0.0.1 that lets other local processes (stimulus scripts, instrument bridges, ...) push markers to
+our TextLogger and EventBoard outlets at high rates without going through the GUI.
+
+Protocol: UTF-8, one message per '\\n' terminated line, fire-and-forget (nothing is sent back except for `!` commands):
+    <text>                                   TextLogger marker, timestamped when the line is received
+    @<lsl_timestamp> <text>                  TextLogger marker with an explicit `pylsl.local_clock()` timestamp
+    {"text": "...", "stream": "EventBoard", "timestamp": 1234.5, "offset": 0.25}
+                                             JSON form; `stream` defaults to TextLogger, `timestamp` to the receive time
+                                             and `offset` (seconds, subtracted from the timestamp) to 0
+    {"event": "<button_id>", "offset": 0.25, "timestamp": 1234.5}
+                                             fire an EventBoard button like a click (toggles flip, EventBoardCodes too)
+    !ping                                    reply {"ok": true, "pong": <local_clock>} once every earlier line is queued
+    !stats                                   reply with this connection's counters
+
+Everything read in one `recv` is parsed together and handed to the outlet dispatchers as one batch per stream, which
+push it with a single `push_chunk`. Backpressure: before a batch is queued the client's reader waits while the target
+dispatcher's queue is above its high-water mark, so a producer that outruns the outlet is slowed down by TCP flow
+control instead of having markers dropped. Every connection keeps counters (bytes, lines, markers, drops, parse
+errors, time spent throttled) available from `get_metrics()`.
+
+This module provides:
+- MarkerIngestServer: the ingest server
+- IngestClientStats: per-connection counters
+- get_default_ingest_port: ingest port from the environment (or the default)
+"""
+
+import json
+import os
+import socket
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Optional, Callable, Dict, List, Tuple, Any
+
+import pylsl
+
+from phologtolabstreaminglayer.features.app_logging import get_logger
+from phologtolabstreaminglayer.features.outlet_dispatcher import OutletDispatcher
+
+logger = get_logger('ingest')
+
+_ingest_port_env_variable_name: str = "PHO_LOGTOLABSTREAMINGLAYER_INGEST_PORT"
+default_ingest_port: int = 13381
+
+
+def get_default_ingest_port() -> int:
+    """Ingest server port (PHO_LOGTOLABSTREAMINGLAYER_INGEST_PORT, default 13381; 0 disables the server)."""
+    try:
+        return int(os.environ.get(_ingest_port_env_variable_name, default_ingest_port))
+    except ValueError:
+        return default_ingest_port
+
+
+class IngestClientStats:
+    """Counters of one ingest connection (only written by its reader thread)."""
+
+    def __init__(self, client_name: str):
+        self.client_name = client_name
+        self.connected_at: datetime = datetime.now()
+        self.disconnected_at: Optional[datetime] = None
+        self.bytes_received = 0
+        self.lines_received = 0
+        self.markers_queued = 0
+        self.markers_dropped = 0  # the dispatcher queue was still full after the backpressure wait
+        self.events_fired = 0
+        self.parse_errors = 0
+        self.rejected = 0  # unknown stream or EventBoard button
+        self.backpressure_waits = 0
+        self.backpressure_sec = 0.0
+        self.last_error: Optional[str] = None
+
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            'client': self.client_name,
+            'connected_at': self.connected_at.isoformat(timespec='seconds'),
+            'disconnected_at': self.disconnected_at.isoformat(timespec='seconds') if self.disconnected_at else None,
+            'bytes_received': self.bytes_received,
+            'lines_received': self.lines_received,
+            'markers_queued': self.markers_queued,
+            'markers_dropped': self.markers_dropped,
+            'events_fired': self.events_fired,
+            'parse_errors': self.parse_errors,
+            'rejected': self.rejected,
+            'backpressure_waits': self.backpressure_waits,
+            'backpressure_sec': round(self.backpressure_sec, 3),
+            'last_error': self.last_error,
+        }
+
+
+class MarkerIngestServer:
+    """Accepts marker lines from local TCP clients and queues them on our outlet dispatchers.
+
+    The host (GUI app or headless daemon) provides the dispatchers and, optionally, how EventBoard buttons are fired.
+
+    Usage:
+        server = MarkerIngestServer(get_dispatcher=self.outlet_dispatchers.get, fire_event=self._fire_ingested_eventboard_event)
+        if server.start():
+            ...
+        server.stop()
+    """
+
+    def __init__(self, get_dispatcher: Callable[[str], Optional[OutletDispatcher]], fire_event: Optional[Callable[[str, float, float], bool]] = None,
+                 port: Optional[int] = None, host: str = '127.0.0.1', accepted_stream_names: Tuple[str, ...] = ('TextLogger', 'EventBoard'),
+                 high_water_fraction: float = 0.75, low_water_fraction: float = 0.5, max_backpressure_wait_sec: float = 5.0,
+                 max_clients: int = 32, max_line_bytes: int = 65536, recv_size: int = 65536):
+        """
+        Args:
+            get_dispatcher: Returns the dispatcher of a stream name (None if the stream doesn't exist).
+            fire_event: Called as (button_id, time_offset_seconds, lsl_timestamp) for `{"event": ...}` messages, returns
+                whether the button exists. None to reject events.
+            port: TCP port; None for the default (see `get_default_ingest_port`).
+            host: Interface to listen on (keep it local, there is no authentication).
+            accepted_stream_names: Streams clients may send text markers to.
+            high_water_fraction: Reading from a client pauses while a target dispatcher's queue is above this fraction of its capacity...
+            low_water_fraction: ...until it drains below this fraction.
+            max_backpressure_wait_sec: Give up waiting after this long; the markers that don't fit are then dropped (and counted).
+            max_clients: Connections beyond this are refused.
+            max_line_bytes: Longer lines are discarded as parse errors.
+            recv_size: Bytes read per `recv` call (everything read at once is queued as one batch).
+        """
+        self._get_dispatcher = get_dispatcher
+        self._fire_event = fire_event
+        self.port: int = get_default_ingest_port() if port is None else int(port)
+        self.host = host
+        self.accepted_stream_names = tuple(accepted_stream_names)
+        self.high_water_fraction = high_water_fraction
+        self.low_water_fraction = low_water_fraction
+        self.max_backpressure_wait_sec = max_backpressure_wait_sec
+        self.max_clients = max_clients
+        self.max_line_bytes = max_line_bytes
+        self.recv_size = recv_size
+
+        self._server_socket: Optional[socket.socket] = None
+        self._accept_thread: Optional[threading.Thread] = None
+        self._running = False
+        self._clients_lock = threading.Lock()
+        self._clients: Dict[int, Tuple[socket.socket, IngestClientStats]] = {}  # id(socket) -> (socket, stats)
+        self._recent_clients: deque = deque(maxlen=20)  # stats of disconnected clients
+        self._clients_total = 0
+        self._totals: Dict[str, float] = {'bytes_received': 0, 'lines_received': 0, 'markers_queued': 0, 'markers_dropped': 0, 'events_fired': 0,
+                                          'parse_errors': 0, 'rejected': 0, 'backpressure_waits': 0, 'backpressure_sec': 0.0}
+
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+
+    def start(self) -> bool:
+        """Bind the socket and start accepting clients. Returns False (and logs) if the port is unavailable."""
+        if self._running:
+            return True
+        try:
+            self._server_socket = socket.create_server((self.host, self.port))
+            self._server_socket.settimeout(1.0)
+        except OSError as e:
+            logger.error("Could not open the marker ingest socket on %s:%d: %s", self.host, self.port, e)
+            self._server_socket = None
+            return False
+        self.port = self._server_socket.getsockname()[1]  # resolved if port 0 was given
+        self._running = True
+        self._accept_thread = threading.Thread(target=self._accept_worker, name="MarkerIngestServer", daemon=True)
+        self._accept_thread.start()
+        logger.info("Marker ingest server listening on %s:%d", self.host, self.port)
+        return True
+
+
+    def stop(self, timeout: float = 2.0):
+        """Stop accepting and disconnect every client (markers already read are still queued)."""
+        self._running = False
+        if self._server_socket is not None:
+            try:
+                self._server_socket.close()
+            except OSError:
+                pass
+        with self._clients_lock:
+            client_sockets = [a_socket for a_socket, _stats in self._clients.values()]
+        for a_socket in client_sockets:
+            try:
+                a_socket.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        if self._accept_thread is not None:
+            self._accept_thread.join(timeout=timeout)
+        self._accept_thread = None
+        self._server_socket = None
+
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Totals plus the counters of connected and recently disconnected clients."""
+        with self._clients_lock:
+            connected = [a_stats.get_metrics() for _socket, a_stats in self._clients.values()]
+            recent = [a_stats.get_metrics() for a_stats in self._recent_clients]
+            totals = dict(self._totals)
+            clients_total = self._clients_total
+        for a_client in connected: # totals only include disconnected clients until then
+            for a_key in totals:
+                totals[a_key] += a_client[a_key]
+        totals['backpressure_sec'] = round(totals['backpressure_sec'], 3)
+        return {'port': self.port, 'running': self._running, 'clients_connected': len(connected), 'clients_total': clients_total, **totals,
+                'clients': connected, 'recent_clients': recent}
+
+
+    # ---------------------------------------------------------------------------- #
+    #                                  Connections                                 #
+    # ---------------------------------------------------------------------------- #
+
+    def _accept_worker(self):
+        while self._running:
+            try:
+                client_socket, address = self._server_socket.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                break # socket closed by stop()
+            with self._clients_lock:
+                n_clients = len(self._clients)
+            if n_clients >= self.max_clients:
+                logger.warning("Refusing marker ingest client %s:%d (%d clients connected)", address[0], address[1], n_clients)
+                client_socket.close()
+                continue
+            threading.Thread(target=self._client_worker, args=(client_socket, f"{address[0]}:{address[1]}"), name=f"MarkerIngestClient-{address[1]}", daemon=True).start()
+
+
+    def _client_worker(self, client_socket: socket.socket, client_name: str):
+        stats = IngestClientStats(client_name)
+        with self._clients_lock:
+            self._clients[id(client_socket)] = (client_socket, stats)
+            self._clients_total += 1
+        logger.info("Marker ingest client connected: %s", client_name)
+        try:
+            with client_socket:
+                client_socket.settimeout(1.0)
+                self._read_client(client_socket, stats)
+        except OSError as e:
+            logger.debug("Marker ingest client %s disconnected: %s", client_name, e)
+        finally:
+            stats.disconnected_at = datetime.now()
+            with self._clients_lock:
+                self._clients.pop(id(client_socket), None)
+                self._recent_clients.append(stats)
+                for a_key, a_value in stats.get_metrics().items():
+                    if a_key in self._totals:
+                        self._totals[a_key] += a_value
+            logger.info("Marker ingest client disconnected: %s (%d markers queued, %d dropped, %d parse errors)", client_name, stats.markers_queued, stats.markers_dropped, stats.parse_errors)
+
+
+    def _read_client(self, client_socket: socket.socket, stats: IngestClientStats):
+        pending = b''
+        while self._running:
+            try:
+                data = client_socket.recv(self.recv_size)
+            except socket.timeout:
+                continue
+            if not data:
+                break
+            receive_lsl_timestamp = pylsl.local_clock() # one clock read per batch, every line in it arrived together
+            stats.bytes_received += len(data)
+            lines = (pending + data).split(b'\n')
+            pending = lines.pop()
+            if len(pending) > self.max_line_bytes:
+                stats.parse_errors += 1
+                stats.last_error = f"line longer than {self.max_line_bytes} bytes discarded"
+                pending = b''
+            replies = self._process_lines(lines, receive_lsl_timestamp, stats)
+            if replies:
+                client_socket.sendall(''.join(json.dumps(a_reply) + '\n' for a_reply in replies).encode('utf-8'))
+
+
+    # ---------------------------------------------------------------------------- #
+    #                                    Parsing                                   #
+    # ---------------------------------------------------------------------------- #
+
+    def _process_lines(self, lines: List[bytes], receive_lsl_timestamp: float, stats: IngestClientStats) -> List[Dict[str, Any]]:
+        """Parse the lines of one read and queue them; returns the replies to `!` commands"""
+        batches: Dict[str, Tuple[list, list]] = {}  # stream name -> (samples, timestamps), in arrival order
+        replies = []
+        for a_raw_line in lines:
+            a_line = a_raw_line.rstrip(b'\r')
+            if not a_line:
+                continue
+            stats.lines_received += 1
+            try:
+                text = a_line.decode('utf-8')
+                if text.startswith('!'):
+                    self._flush_batches(batches, stats)
+                    replies.append(self._handle_command(text[1:].strip().lower(), stats))
+                elif text.startswith('{'):
+                    self._handle_json_message(json.loads(text), receive_lsl_timestamp, batches, stats)
+                elif text.startswith('@'):
+                    timestamp_str, _, message = text[1:].partition(' ')
+                    self._add_to_batch(batches, 'TextLogger', message, float(timestamp_str))
+                else:
+                    self._add_to_batch(batches, 'TextLogger', text, receive_lsl_timestamp)
+            except (ValueError, TypeError, KeyError) as e: # includes UnicodeDecodeError and json.JSONDecodeError
+                stats.parse_errors += 1
+                stats.last_error = f"{type(e).__name__}: {e}"
+        self._flush_batches(batches, stats)
+        return replies
+
+
+    def _handle_json_message(self, message: Dict[str, Any], receive_lsl_timestamp: float, batches: Dict[str, Tuple[list, list]], stats: IngestClientStats):
+        if not isinstance(message, dict):
+            raise TypeError("JSON messages must be objects")
+        lsl_timestamp = float(message['timestamp']) if message.get('timestamp') is not None else receive_lsl_timestamp
+        time_offset_seconds = float(message.get('offset') or 0.0)
+        if 'event' in message:
+            self._flush_batches(batches, stats) # keep raw EventBoard markers and fired events in order
+            try:
+                was_fired = (self._fire_event is not None) and self._fire_event(str(message['event']), time_offset_seconds, lsl_timestamp)
+            except Exception as e: # a failing callback must not take down this client's handler thread
+                stats.rejected += 1
+                stats.last_error = f"error firing EventBoard button '{message['event']}': {type(e).__name__}: {e}"
+                logger.error("Error firing EventBoard button '%s' for ingest client %s: %s", message['event'], stats.client_name, e)
+                return
+            if was_fired:
+                stats.events_fired += 1
+            else:
+                stats.rejected += 1
+                stats.last_error = f"unknown EventBoard button '{message['event']}'"
+            return
+        stream_name = message.get('stream') or 'TextLogger'
+        if stream_name not in self.accepted_stream_names:
+            stats.rejected += 1
+            stats.last_error = f"stream '{stream_name}' not accepted"
+            return
+        self._add_to_batch(batches, stream_name, str(message['text']), lsl_timestamp - time_offset_seconds)
+
+
+    def _add_to_batch(self, batches: Dict[str, Tuple[list, list]], stream_name: str, text: str, lsl_timestamp: float):
+        samples, timestamps = batches.setdefault(stream_name, ([], []))
+        samples.append([text])
+        timestamps.append(lsl_timestamp)
+
+
+    def _handle_command(self, command: str, stats: IngestClientStats) -> Dict[str, Any]:
+        if command == 'ping':
+            return {'ok': True, 'pong': pylsl.local_clock()}
+        if command == 'stats':
+            return {'ok': True, 'stats': stats.get_metrics()}
+        return {'ok': False, 'error': f"unknown command '!{command}' (commands: !ping, !stats)"}
+
+
+    # ---------------------------------------------------------------------------- #
+    #                                 Backpressure                                 #
+    # ---------------------------------------------------------------------------- #
+
+    def _flush_batches(self, batches: Dict[str, Tuple[list, list]], stats: IngestClientStats):
+        """Queue every pending batch on its dispatcher (waiting for room first) and clear them"""
+        for a_stream_name, (samples, timestamps) in batches.items():
+            if not samples:
+                continue
+            dispatcher = self._get_dispatcher(a_stream_name)
+            if dispatcher is None:
+                stats.rejected += len(samples)
+                stats.last_error = f"stream '{a_stream_name}' is not available"
+                continue
+            slice_size = max(1, dispatcher.max_pending - int(dispatcher.max_pending * self.low_water_fraction)) # what fits once the queue is at its low-water mark
+            for a_start in range(0, len(samples), slice_size):
+                a_samples, a_timestamps = samples[a_start:(a_start + slice_size)], timestamps[a_start:(a_start + slice_size)]
+                self._wait_for_room(dispatcher, len(a_samples), stats)
+                n_queued = dispatcher.submit_batch(a_samples, a_timestamps)
+                stats.markers_queued += n_queued
+                if n_queued < len(a_samples):
+                    stats.markers_dropped += len(a_samples) - n_queued
+                    stats.last_error = f"'{a_stream_name}' send queue full, {len(a_samples) - n_queued} markers dropped"
+        batches.clear()
+
+
+    def _wait_for_room(self, dispatcher: OutletDispatcher, n_samples: int, stats: IngestClientStats):
+        """Block this client's reader while the dispatcher is above its high-water mark (TCP then throttles the sender)"""
+        high_water = int(dispatcher.max_pending * self.high_water_fraction)
+        if (dispatcher.queue_depth + n_samples) <= high_water:
+            return
+        low_water = min(int(dispatcher.max_pending * self.low_water_fraction), max(0, dispatcher.max_pending - n_samples))
+        stats.backpressure_waits += 1
+        start_t = time.perf_counter()
+        deadline = start_t + self.max_backpressure_wait_sec
+        while self._running and (dispatcher.queue_depth > low_water) and (time.perf_counter() < deadline):
+            time.sleep(0.002)
+        stats.backpressure_sec += time.perf_counter() - start_t
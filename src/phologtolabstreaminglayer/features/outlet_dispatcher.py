@@ -0,0 +1,275 @@
+# Background LSL outlet dispatcher with burst coalescing
+# Copyright (C) 2025 Pho Hale. All rights reserved.
+
+"""
+A per-outlet dispatcher thread that takes pushing samples off the calling (Tk) thread.
+
+Producers call `OutletDispatcher.submit(...)` which only appends to a deque and sets an event, so it never blocks
+on the LSL outlet. The dispatcher thread drains the deque and pushes everything that accumulated since its last
+wakeup as a single `push_chunk` call with per-sample timestamps, so bursts cost one outlet call instead of many.
+
+A dispatcher can be created before its outlet exists: samples submitted in the meantime stay queued (bounded by
+`max_pending`) with their original timestamps and are flushed in order once `attach_outlet(...)` is called.
+
+This module provides:
+- OutletDispatcher: the dispatcher thread for a single `pylsl.StreamOutlet`
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Optional, Callable, List, Dict, Any
+import pylsl
+from phologtolabstreaminglayer.features.app_logging import get_logger
+
+logger = get_logger('lsl')
+
+
+class OutletDispatcher:
+    """Pushes samples to a single LSL outlet from a dedicated background thread.
+
+    The queue is a `collections.deque`: `append` and `popleft` are atomic in CPython, so producers and the dispatcher
+    thread never contend on a lock. Each queued item carries the LSL timestamp captured at submit time, which is
+    passed through to `push_chunk`/`push_sample` unchanged.
+
+    Attributes:
+        stream_name: Name of the stream this dispatcher pushes to (used in log output and metrics).
+    """
+
+    def __init__(self, stream_name: str, outlet: Optional[pylsl.StreamOutlet] = None, max_chunk_size: int = 256, max_pending: int = 10000, on_error: Optional[Callable[[str, Exception], None]] = None):
+        """
+        Initialize the dispatcher (the thread is not started until `start()` is called).
+
+        Args:
+            stream_name: Name of the stream this dispatcher pushes to.
+            outlet: The outlet to push to. If None, samples are buffered until `attach_outlet` is called.
+            max_chunk_size: Maximum number of samples coalesced into a single `push_chunk` call.
+            max_pending: Maximum number of queued samples; further submits are dropped (and counted) until the queue drains.
+            on_error: Optional callback called from the dispatcher thread with (stream_name, exception) when a push fails.
+        """
+        self.stream_name = stream_name
+        self._outlet = outlet
+        self._max_chunk_size = max_chunk_size
+        self._max_pending = max_pending
+        self._on_error = on_error
+
+        self._push_listeners: List[Callable[[str, list, list], None]] = []
+        self._queue: deque = deque()  # items are (sample, lsl_timestamp, enqueue_perf_counter)
+        self._wakeup = threading.Event()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+        # Metrics (only written by the dispatcher thread)
+        self._samples_pushed = 0
+        self._chunks_pushed = 0
+        self._push_errors = 0
+        self._last_push_latency_sec = 0.0
+        self._max_push_latency_sec = 0.0
+        self._total_push_latency_sec = 0.0
+        self._max_chunk_size_seen = 0
+        # Metrics (written by producers)
+        self._samples_buffered = 0  # submitted while no outlet was attached
+        self._samples_dropped = 0  # rejected because the queue was full
+
+
+    @property
+    def outlet(self) -> Optional[pylsl.StreamOutlet]:
+        """The outlet samples are pushed to."""
+        return self._outlet
+
+
+    @property
+    def is_outlet_attached(self) -> bool:
+        """Whether an outlet is attached (otherwise submitted samples are being buffered)."""
+        return self._outlet is not None
+
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of samples waiting to be pushed."""
+        return len(self._queue)
+
+
+    @property
+    def max_pending(self) -> int:
+        """Maximum number of queued samples before submits are dropped."""
+        return self._max_pending
+
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the dispatcher thread is running."""
+        return self._running and (self._thread is not None) and self._thread.is_alive()
+
+
+    def start(self):
+        """Start the dispatcher thread."""
+        if self.is_running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name=f"OutletDispatcher-{self.stream_name}", daemon=True)
+        self._thread.start()
+
+
+    def attach_outlet(self, outlet: pylsl.StreamOutlet):
+        """Attach the outlet, flushing any buffered samples in order with their original timestamps."""
+        self._outlet = outlet
+        self._wakeup.set()
+
+
+    def stop(self, timeout: float = 2.0):
+        """Stop the dispatcher thread after pushing any samples that are still queued (samples buffered without an outlet are discarded)."""
+        self._running = False
+        self._wakeup.set()
+        if self._thread is not None and self._thread.is_alive():
+            self._thread.join(timeout=timeout)
+        self._thread = None
+
+
+    def add_push_listener(self, listener: Callable[[str, list, list], None]):
+        """Register an in-process tap called from the dispatcher thread after every successful push.
+
+        Args:
+            listener: Called with (stream_name, samples, timestamps) using exactly the timestamps given to the outlet.
+        """
+        self._push_listeners.append(listener)
+
+
+    def remove_push_listener(self, listener: Callable[[str, list, list], None]):
+        """Unregister a listener added with `add_push_listener`."""
+        try:
+            self._push_listeners.remove(listener)
+        except ValueError:
+            pass
+
+
+    def submit(self, sample: List[Any], timestamp: Optional[float] = None) -> bool:
+        """Queue a sample for pushing (safe to call from any thread, never blocks on the outlet).
+
+        Args:
+            sample: The sample values (one entry per channel).
+            timestamp: LSL timestamp for the sample. Defaults to `pylsl.local_clock()` at the time of the call.
+
+        Returns:
+            True if the sample was queued, False if it was dropped because the queue is full.
+        """
+        if timestamp is None:
+            timestamp = pylsl.local_clock()
+        if len(self._queue) >= self._max_pending:
+            self._samples_dropped += 1
+            return False
+        if self._outlet is None:
+            self._samples_buffered += 1
+        self._queue.append((sample, timestamp, time.perf_counter()))
+        self._wakeup.set()
+        return True
+
+
+    def submit_batch(self, samples: List[List[Any]], timestamps: List[float]) -> int:
+        """Queue several samples with one wakeup of the dispatcher thread (safe to call from any thread).
+
+        Samples are queued in order until the queue is full; the rest are dropped (and counted).
+
+        Returns:
+            Number of samples queued.
+        """
+        n_free = max(0, self._max_pending - len(self._queue))
+        n_accepted = min(n_free, len(samples))
+        if n_accepted < len(samples):
+            self._samples_dropped += len(samples) - n_accepted
+        if n_accepted == 0:
+            return 0
+        if self._outlet is None:
+            self._samples_buffered += n_accepted
+        enqueue_t = time.perf_counter()
+        self._queue.extend((a_sample, a_timestamp, enqueue_t) for a_sample, a_timestamp in zip(samples[:n_accepted], timestamps[:n_accepted]))
+        self._wakeup.set()
+        return n_accepted
+
+
+    def _drain_chunk(self) -> list:
+        """Pop up to max_chunk_size queued items."""
+        items = []
+        try:
+            while len(items) < self._max_chunk_size:
+                items.append(self._queue.popleft())
+        except IndexError:
+            pass
+        return items
+
+
+    def _run(self):
+        """Dispatcher thread main loop."""
+        while self._running or (self._queue and self._outlet is not None):
+            if (not self._queue) or (self._outlet is None):
+                self._wakeup.wait(timeout=0.5)
+                self._wakeup.clear()
+                continue
+
+            items = self._drain_chunk()
+            if not items:
+                continue
+            self._push_items(items)
+
+
+    def _push_items(self, items: list):
+        """Push a batch of (sample, timestamp, enqueue_time) items as one chunk."""
+        outlet = self._outlet
+        if outlet is None:
+            return
+
+        samples = [a_sample for a_sample, _, _ in items]
+        timestamps = [a_timestamp for _, a_timestamp, _ in items]
+        try:
+            if len(samples) == 1:
+                outlet.push_sample(samples[0], timestamps[0])
+            else:
+                outlet.push_chunk(samples, timestamps)
+        except Exception as e:
+            self._push_errors += 1
+            logger.error("Error pushing %d sample(s) to %s LSL outlet: %s", len(samples), self.stream_name, e)
+            if self._on_error is not None:
+                try:
+                    self._on_error(self.stream_name, e)
+                except Exception:
+                    pass  # Don't let callback errors kill the dispatcher
+            return
+
+        # Update metrics
+        pushed_at = time.perf_counter()
+        for _, _, enqueued_at in items:
+            latency = pushed_at - enqueued_at
+            self._total_push_latency_sec += latency
+            if latency > self._max_push_latency_sec:
+                self._max_push_latency_sec = latency
+        self._last_push_latency_sec = pushed_at - items[-1][2]
+        self._samples_pushed += len(items)
+        self._chunks_pushed += 1
+        self._max_chunk_size_seen = max(self._max_chunk_size_seen, len(items))
+
+        logger.debug("%s LSL message(s) sent: %s", self.stream_name, samples)
+
+        for a_listener in list(self._push_listeners):
+            try:
+                a_listener(self.stream_name, samples, timestamps)
+            except Exception as e:
+                logger.error("Error in %s push listener: %s", self.stream_name, e)
+
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return a snapshot of the dispatcher metrics."""
+        mean_latency = (self._total_push_latency_sec / self._samples_pushed) if self._samples_pushed > 0 else 0.0
+        return {
+            'stream_name': self.stream_name,
+            'outlet_attached': self.is_outlet_attached,
+            'queue_depth': self.queue_depth,
+            'samples_buffered': self._samples_buffered,
+            'samples_dropped': self._samples_dropped,
+            'samples_pushed': self._samples_pushed,
+            'chunks_pushed': self._chunks_pushed,
+            'push_errors': self._push_errors,
+            'max_chunk_size': self._max_chunk_size_seen,
+            'last_push_latency_ms': self._last_push_latency_sec * 1000.0,
+            'mean_push_latency_ms': mean_latency * 1000.0,
+            'max_push_latency_ms': self._max_push_latency_sec * 1000.0,
+        }
@@ -0,0 +1,624 @@
+# Out-of-process recording engine
+# Copyright (C) 2025 Pho Hale. All rights reserved.
+
+"""
+Hosts the recorder (LabRecorder or the legacy inlet-pulling recorder, whose outputs are the FIF/CSV file and crash-recovery
+backups, see `features/recording_sinks.py`) in
+a separate worker process, so recording throughput and timing don't depend on what the GUI, transcription or other
+ML code is doing with the GIL, and a slow save never freezes the window.
+
+The worker opens its own LabRecorder / inlets (LSL streams are visible from every process). Our own dispatcher-backed
+streams are not pulled over the network in legacy mode: the GUI forwards the samples it pushes, with the exact
+timestamps given to the outlet, through the pipe (batched on a sender thread, so the dispatcher threads never block).
+
+Commands to the worker (tuples):
+    ('start', recording_spec_dict)      see `RecorderProcessClient.start_recording`
+    ('samples', [(stream_name, samples, timestamps), ...])
+    ('stop',)                           stop and save the current recording (saving runs on a worker thread)
+    ('shutdown',)                       stop/save, wait for pending saves and exit
+
+Messages from the worker (tuples):
+    ('ready', info_dict)                LabRecorder availability, startup seconds
+    ('started', filename, method)       method in 'LabRecorder', 'Legacy'
+    ('received', stream_name, samples, timestamps)   samples pulled from foreign streams (for the marker history)
+    ('status', status_dict)             every `status_interval_sec` while recording
+    ('stopped', filename, info_dict)    recording stopped and saved (method, sample_count, fif_path, csv_path, error)
+    ('warning', message)
+    ('error', message, is_fatal)
+
+This module provides:
+- is_recorder_worker_enabled: environment configuration
+- RecorderProcessClient: starts/controls the worker process and dispatches its messages on a reader thread
+"""
+
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Optional, Callable, Dict, List, Any
+
+from phologtolabstreaminglayer.features.app_logging import get_logger
+
+logger = get_logger('recording')
+
+_in_process_recorder_env_variable_name: str = "PHO_LOGTOLABSTREAMINGLAYER_RECORDER_IN_PROCESS"
+
+
+def is_recorder_worker_enabled() -> bool:
+    """Whether recording runs in the worker process (disable with PHO_LOGTOLABSTREAMINGLAYER_RECORDER_IN_PROCESS=1)."""
+    return os.environ.get(_in_process_recorder_env_variable_name, '').strip().lower() not in ('1', 'true', 'yes')
+
+
+# ---------------------------------------------------------------------------- #
+#                                Worker Process                                #
+# ---------------------------------------------------------------------------- #
+
+class _RecordingSession:
+    """One recording (one output file) inside the worker process."""
+
+    def __init__(self, spec: Dict[str, Any]):
+        self.filename: str = spec['filename']
+        self.stream_descriptors: List[Dict[str, str]] = spec.get('streams') or []
+        self.inlet_stream_names: List[str] = spec.get('inlet_stream_names') or []
+        self.recording_start_datetime: datetime = spec['recording_start_datetime']
+        self.recording_start_lsl_local_offset: float = spec['recording_start_lsl_local_offset']
+        self.method: Optional[str] = None  # 'LabRecorder' or 'Legacy' once started
+        self.sinks = None  # `RecordingSinkRouter` of a legacy recording
+        self.results: Dict[str, Dict[str, Any]] = {}  # sink results once the recording is finished
+        self._pending_batches: list = []  # forwarded before the recording method is known
+        self._sinks_lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+
+    @property
+    def is_legacy(self) -> bool:
+        return self.method == 'Legacy'
+
+    @property
+    def n_pending_samples(self) -> int:
+        return sum(len(samples) for _stream_name, samples, _timestamps in self._pending_batches)
+
+    def write_batch(self, stream_name: str, samples: list, timestamps: list):
+        with self._sinks_lock:
+            if self.sinks is None:
+                self._pending_batches.append((stream_name, samples, timestamps))
+                return
+        self.sinks.write_batch(stream_name, samples, timestamps)
+
+    def start_sinks(self, sinks, target):
+        """Start recording to `sinks` (a `RecordingSinkRouter`), including the samples forwarded so far."""
+        with self._sinks_lock:
+            sinks.start(target)
+            for a_batch in self._pending_batches:
+                sinks.write_batch(*a_batch)
+            self._pending_batches = []
+            self.sinks = sinks
+
+
+class _RecorderEngine:
+    """Runs recordings in the worker process; all output goes through `send`."""
+
+    def __init__(self, send: Callable, backup_every_n_samples: int):
+        self._send = send
+        self.backup_every_n_samples = backup_every_n_samples
+        self.lab_recorder = None
+        self.session: Optional[_RecordingSession] = None
+        self._save_threads: List[threading.Thread] = []
+        self.samples_discarded = 0  # forwarded while nothing was being recorded in legacy mode
+
+
+    def init_lab_recorder(self) -> Optional[str]:
+        """Create the LabRecorder. Returns the error message if it isn't available."""
+        try:
+            import labrecorder
+            self.lab_recorder = labrecorder.LabRecorder()
+            return None
+        except Exception as e:
+            self.lab_recorder = None
+            return str(e)
+
+
+    def start(self, spec: Dict[str, Any]):
+        if self.session is not None:
+            self.stop() # a start while recording splits the recording
+        self.session = _RecordingSession(spec)
+        self.session.thread = threading.Thread(target=self._session_worker, args=(self.session,), name="RecorderSession", daemon=True)
+        self.session.thread.start()
+
+
+    def add_samples(self, batches: list):
+        session = self.session
+        for stream_name, samples, timestamps in batches:
+            if (session is None) or session.stop_event.is_set() or (session.method == 'LabRecorder'):
+                self.samples_discarded += len(samples)
+                continue
+            session.write_batch(stream_name, samples, timestamps)
+
+
+    def stop(self):
+        """Stop the current recording; it is finished and saved on a separate thread so commands keep being handled."""
+        session, self.session = self.session, None
+        if session is None:
+            return
+        session.stop_event.set()
+        a_thread = threading.Thread(target=self._finish_session, args=(session,), name="RecorderSave", daemon=True)
+        self._save_threads = [t for t in self._save_threads if t.is_alive()] + [a_thread]
+        a_thread.start()
+
+
+    def wait_for_saves(self, timeout: float = 60.0):
+        deadline = time.monotonic() + timeout
+        for a_thread in self._save_threads:
+            a_thread.join(timeout=max(0.0, deadline - time.monotonic()))
+
+
+    def get_status(self) -> Dict[str, Any]:
+        session = self.session
+        if session is None:
+            return {'recording': False, 'samples_discarded': self.samples_discarded}
+        sink_metrics = session.sinks.get_metrics() if session.sinks is not None else {}
+        return {'recording': True, 'filename': session.filename, 'method': session.method, 'recorded_samples': sink_metrics.get('markers_file', {}).get('recorded_samples'),
+                'backups_written': sink_metrics.get('backup_json', {}).get('backups_written', 0), 'sinks': sink_metrics, 'samples_discarded': self.samples_discarded}
+
+
+    def _session_worker(self, session: _RecordingSession):
+        """Record with LabRecorder if possible, otherwise (or if it fails) with the legacy recorder."""
+        if (self.lab_recorder is not None) and session.stream_descriptors:
+            try:
+                self._record_with_lab_recorder(session)
+                self.samples_discarded += session.n_pending_samples
+                return
+            except Exception as e:
+                self._send('warning', f"LabRecorder error: {str(e)[:100]}... Falling back to legacy recording")
+        self._record_legacy(session)
+
+
+    def _resolve_stream_infos(self, session: _RecordingSession) -> list:
+        """Find the StreamInfos selected in the GUI (they can't be pickled, so they're matched by uid, then by name and source id)."""
+        import pylsl
+        found = pylsl.resolve_streams(wait_time=1.0)
+        by_uid = {a_info.uid(): a_info for a_info in found}
+        by_key = {(a_info.name(), a_info.source_id()): a_info for a_info in found}
+        stream_infos, missing = [], []
+        for a_descriptor in session.stream_descriptors:
+            a_info = by_uid.get(a_descriptor.get('uid')) or by_key.get((a_descriptor.get('name'), a_descriptor.get('source_id')))
+            if a_info is None:
+                missing.append(a_descriptor.get('name'))
+            else:
+                stream_infos.append(a_info)
+        if missing:
+            self._send('warning', f"Selected stream(s) not found by the recorder: {', '.join(str(n) for n in missing)}")
+        return stream_infos
+
+
+    def _record_with_lab_recorder(self, session: _RecordingSession):
+        stream_infos = self._resolve_stream_infos(session)
+        if not stream_infos:
+            raise RuntimeError("none of the selected streams could be resolved")
+        max_retries = 3
+        for attempt in range(max_retries):
+            try:
+                self.lab_recorder.start_recording(filename=session.filename, streams=stream_infos)
+                break
+            except Exception:
+                if attempt == max_retries - 1:
+                    raise
+                time.sleep(1.0)  # Wait before retry
+        session.method = 'LabRecorder'
+        self._send('started', session.filename, session.method)
+
+        consecutive_errors = 0
+        while not session.stop_event.wait(0.1):
+            try:
+                if hasattr(self.lab_recorder, 'is_recording') and not self.lab_recorder.is_recording:
+                    self._send('warning', "Warning: LabRecorder stopped unexpectedly")
+                    break
+                consecutive_errors = 0
+            except Exception as e:
+                consecutive_errors += 1
+                if consecutive_errors >= 10:
+                    self._send('error', f"Too many consecutive LabRecorder monitoring errors, stopping: {e}", False)
+                    break
+        try:
+            if hasattr(self.lab_recorder, 'stop_recording'):
+                self.lab_recorder.stop_recording()
+        except Exception as e:
+            self._send('error', f"Error stopping LabRecorder: {e}", False)
+
+
+    def _record_legacy(self, session: _RecordingSession):
+        """Pull foreign streams from inlets (our own streams arrive as forwarded samples) into the FIF/CSV and backup sinks."""
+        import pylsl
+        from phologtolabstreaminglayer.features.recording_sinks import RecordingSinkRouter, RecordingTarget, MarkerFileSink, BackupJsonSink
+
+        sinks = RecordingSinkRouter(on_recording_finished=lambda target, results: session.results.update(results))
+        sinks.add_sink(MarkerFileSink())
+        sinks.add_sink(BackupJsonSink(every_n_samples=self.backup_every_n_samples))
+        session.start_sinks(sinks, RecordingTarget(session.filename, session.recording_start_datetime, session.recording_start_lsl_local_offset))
+        session.method = 'Legacy'
+        self._send('started', session.filename, session.method)
+
+        inlets = {}
+        for a_stream_name in session.inlet_stream_names:
+            if session.stop_event.is_set():
+                break
+            try:
+                found_streams = pylsl.resolve_byprop('name', a_stream_name, timeout=2.0)
+                if found_streams:
+                    inlets[a_stream_name] = pylsl.StreamInlet(found_streams[0])
+                else:
+                    self._send('warning', f"Could not find '{a_stream_name}' stream for recording")
+            except Exception as e:
+                self._send('warning', f"Error creating recording inlet for stream named '{a_stream_name}': {e}")
+
+        while not session.stop_event.is_set():
+            got_any = False
+            for a_stream_name, an_inlet in list(inlets.items()):
+                try:
+                    samples, timestamps = an_inlet.pull_chunk(timeout=0.0)
+                except Exception as e:
+                    self._send('error', f"Error pulling from '{a_stream_name}', no longer recording it: {e}", False)
+                    inlets.pop(a_stream_name, None)
+                    continue
+                if samples:
+                    got_any = True
+                    sinks.write_batch(a_stream_name, samples, timestamps)
+                    self._send('received', a_stream_name, samples, timestamps)
+            if not got_any:
+                session.stop_event.wait(0.02)
+        # Pull whatever arrived right before the stop
+        for a_stream_name, an_inlet in inlets.items():
+            try:
+                samples, timestamps = an_inlet.pull_chunk(timeout=0.0)
+            except Exception:
+                continue
+            sinks.write_batch(a_stream_name, samples, timestamps)
+
+
+    def _finish_session(self, session: _RecordingSession):
+        """Wait for the session's recording thread and (legacy) for its sinks to save, then report 'stopped'."""
+        if session.thread is not None:
+            session.thread.join(timeout=10.0)
+        info = {'method': session.method, 'sample_count': None, 'fif_path': None, 'csv_path': None, 'error': None}
+        if session.sinks is not None:
+            if not session.sinks.close(timeout=600.0):
+                info['error'] = "Timed out saving the recording"
+            file_result = session.results.get('markers_file') or {}
+            info['sample_count'] = file_result.get('sample_count')
+            info['fif_path'], info['csv_path'] = file_result.get('fif_path'), file_result.get('csv_path')
+            if file_result.get('error'):
+                info['error'] = f"Failed to save file: {file_result['error']}"
+            elif (info['error'] is None) and not info['sample_count']:
+                info['error'] = "No data to save"
+            if (session.results.get('backup_json') or {}).get('error'):
+                self._send('error', f"Error saving backup: {session.results['backup_json']['error']}", False)
+        self._send('stopped', session.filename, info)
+
+
+def _recorder_process_main(conn, backup_every_n_samples: int, status_interval_sec: float):
+    """Entry point of the worker process (must stay importable without Tk)."""
+    send_lock = threading.Lock()
+
+    def _send(*message):
+        with send_lock:
+            try:
+                conn.send(message)
+            except (BrokenPipeError, EOFError, OSError):
+                pass
+
+    load_start_t = time.perf_counter()
+    engine = _RecorderEngine(_send, backup_every_n_samples=backup_every_n_samples)
+    try:
+        import pylsl  # noqa: F401 (fail early if LSL can't be loaded)
+    except Exception as e:
+        _send('error', f"failed to load pylsl: {e}", True)
+        return
+    lab_recorder_error = engine.init_lab_recorder()
+    _send('ready', {'lab_recorder_available': engine.lab_recorder is not None, 'lab_recorder_error': lab_recorder_error, 'load_seconds': time.perf_counter() - load_start_t})
+
+    last_status_t = time.monotonic()
+    try:
+        while True:
+            if conn.poll(status_interval_sec):
+                try:
+                    message = conn.recv()
+                except (EOFError, OSError):
+                    break # the GUI is gone: save what we have
+                command = message[0]
+                if command == 'samples':
+                    engine.add_samples(message[1])
+                elif command == 'start':
+                    engine.start(message[1])
+                elif command == 'stop':
+                    engine.stop()
+                elif command == 'shutdown':
+                    break
+            if (engine.session is not None) and (time.monotonic() - last_status_t) >= status_interval_sec:
+                last_status_t = time.monotonic()
+                _send('status', engine.get_status())
+    finally:
+        engine.stop()
+        engine.wait_for_saves()
+        if engine.lab_recorder is not None:
+            try:
+                if hasattr(engine.lab_recorder, 'is_recording') and engine.lab_recorder.is_recording:
+                    engine.lab_recorder.stop_recording()
+            except Exception:
+                pass
+        conn.close()
+
+
+# ---------------------------------------------------------------------------- #
+#                                 Parent Client                                #
+# ---------------------------------------------------------------------------- #
+
+class RecorderProcessClient:
+    """Starts the recorder worker process, sends it commands and forwarded samples, and relays its messages.
+
+    Commands and samples go through one queue drained by a sender thread, so they reach the worker in order and callers
+    (Tk thread, dispatcher threads) never block on the pipe. Callbacks run on the client's reader thread; GUI code should
+    marshal them to the Tk thread.
+
+    Usage:
+        client = RecorderProcessClient(on_status=..., on_stopped=lambda filename, info: ...)
+        client.start_process()
+        client.start_recording(filename, stream_infos, inlet_stream_names, start_datetime, start_lsl_offset)
+        client.submit_samples('TextLogger', samples, timestamps)  # own streams, legacy mode
+        client.stop_recording()  # saved in the worker, reported through on_stopped
+        client.shutdown()
+    """
+
+    def __init__(self, on_status: Optional[Callable[[str, Dict[str, Any]], Any]] = None, on_stopped: Optional[Callable[[str, Dict[str, Any]], Any]] = None,
+                 on_received: Optional[Callable[[str, list, list], Any]] = None, backup_every_n_samples: int = 10, status_interval_sec: float = 1.0, max_pending: int = 100000):
+        """
+        Args:
+            on_status: Called with (state, info) on readiness/recording state changes/warnings/errors. States: 'starting',
+                'ready', 'recording', 'idle', 'warning', 'error', 'failed' (fatal: the process is gone), 'stopped'.
+            on_stopped: Called with (filename, info) once a recording was stopped and saved (see the module docstring).
+            on_received: Called with (stream_name, samples, timestamps) for samples the worker pulled from foreign streams.
+            backup_every_n_samples: Legacy recordings write their crash-recovery backup after this many new samples.
+            status_interval_sec: How often the worker reports its status while recording.
+            max_pending: Most queued forwarded samples; further samples are dropped (and counted) if the worker falls behind.
+        """
+        self.on_status = on_status
+        self.on_stopped = on_stopped
+        self.on_received = on_received
+        self.backup_every_n_samples = backup_every_n_samples
+        self.status_interval_sec = status_interval_sec
+        self.max_pending = max_pending
+
+        self._process: Optional[multiprocessing.Process] = None
+        self._conn = None
+        self._reader_thread: Optional[threading.Thread] = None
+        self._sender_thread: Optional[threading.Thread] = None
+        self._outgoing: deque = deque()  # ('samples', name, samples, timestamps) items and command tuples
+        self._n_pending_samples = 0
+        self._wakeup = threading.Event()
+        self._ready_event = threading.Event()
+        self._is_sending = False
+        self._shutdown_requested = False
+        self.state: str = 'stopped'
+        self.ready_info: Dict[str, Any] = {}
+        self.last_status: Dict[str, Any] = {}
+        self.last_error: Optional[str] = None
+        self.is_recording = False  # a recording was requested and not stopped yet (forwarded samples are queued)
+        self.recording_method: Optional[str] = None
+        self.samples_forwarded = 0
+        self.samples_dropped = 0
+        self.samples_received = 0
+
+
+    @property
+    def is_alive(self) -> bool:
+        return (self._process is not None) and self._process.is_alive()
+
+
+    @property
+    def lab_recorder_available(self) -> bool:
+        return bool(self.ready_info.get('lab_recorder_available', False))
+
+
+    @property
+    def has_reported_ready(self) -> bool:
+        """Whether `wait_until_ready` would return right away (the worker reported 'ready' or failed)."""
+        return self._ready_event.is_set()
+
+
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """Block until the worker reported 'ready' (False on timeout or if it failed)."""
+        return self._ready_event.wait(timeout) and (self.state != 'failed')
+
+
+    def _set_state(self, state: str, info: Optional[Dict[str, Any]] = None):
+        self.state = state
+        if self.on_status is not None:
+            try:
+                self.on_status(state, info or {})
+            except Exception as e:
+                logger.error("Error in recorder status callback: %s", e)
+
+
+    def start_process(self):
+        """Spawn the worker process; it creates its LabRecorder right away."""
+        if self.is_alive:
+            return
+        ctx = multiprocessing.get_context('spawn') # never fork a process that has Tk/LSL threads running
+        parent_conn, child_conn = ctx.Pipe(duplex=True)
+        self._conn = parent_conn
+        self._process = ctx.Process(target=_recorder_process_main, name="RecorderWorker", daemon=True, args=(child_conn, self.backup_every_n_samples, self.status_interval_sec))
+        self._shutdown_requested = False
+        self._set_state('starting')
+        self._process.start()
+        child_conn.close() # the child owns its end now
+        self._is_sending = True
+        self._sender_thread = threading.Thread(target=self._sender_loop, name="RecorderWorkerSender", daemon=True)
+        self._sender_thread.start()
+        self._reader_thread = threading.Thread(target=self._reader_loop, name="RecorderWorkerReader", daemon=True)
+        self._reader_thread.start()
+
+
+    # ---------------------------------------------------------------------------- #
+    #                                   Commands                                   #
+    # ---------------------------------------------------------------------------- #
+
+    def start_recording(self, filename: str, stream_infos: list, inlet_stream_names: List[str], recording_start_datetime: datetime, recording_start_lsl_local_offset: float):
+        """
+        Start recording to `filename` in the worker (a start while recording splits the recording).
+
+        Args:
+            filename: Output XDF filename (legacy recordings are saved next to it as FIF + events CSV).
+            stream_infos: `pylsl.StreamInfo`s to record with LabRecorder (empty for legacy recording).
+            inlet_stream_names: Foreign streams the legacy recorder pulls from inlets.
+            recording_start_datetime: Wall-clock start of the recording.
+            recording_start_lsl_local_offset: `pylsl.local_clock()` at the start of the recording.
+        """
+        spec = {
+            'filename': str(filename),
+            'streams': [{'name': a_info.name(), 'source_id': a_info.source_id(), 'uid': a_info.uid()} for a_info in stream_infos],
+            'inlet_stream_names': list(inlet_stream_names),
+            'recording_start_datetime': recording_start_datetime,
+            'recording_start_lsl_local_offset': recording_start_lsl_local_offset,
+        }
+        self.recording_method = None
+        self.is_recording = True
+        self._enqueue(('start', spec))
+
+
+    def stop_recording(self):
+        """Stop the current recording; the worker saves it and reports through `on_stopped`."""
+        self.is_recording = False
+        self._enqueue(('stop',))
+
+
+    def submit_samples(self, stream_name: str, samples: list, timestamps: list) -> bool:
+        """Forward samples of our own streams to the current recording (never blocks). Returns False if they were dropped."""
+        if not self.is_recording or (self.recording_method == 'LabRecorder'):
+            return False # LabRecorder records our outlets itself
+        if self._n_pending_samples >= self.max_pending:
+            self.samples_dropped += len(samples)
+            return False
+        self._n_pending_samples += len(samples)
+        self._enqueue(('samples', stream_name, list(samples), list(timestamps)))
+        return True
+
+
+    def _enqueue(self, item: tuple):
+        self._outgoing.append(item)
+        self._wakeup.set()
+
+
+    def _sender_loop(self):
+        """Send queued commands in order, coalescing consecutive forwarded samples into one message."""
+        conn = self._conn
+        while self._is_sending or self._outgoing:
+            if not self._outgoing:
+                self._wakeup.wait(0.5)
+                self._wakeup.clear()
+                continue
+            batches = []
+            command = None
+            try:
+                while True:
+                    item = self._outgoing.popleft()
+                    if item[0] != 'samples':
+                        command = item
+                        break
+                    batches.append(item[1:])
+            except IndexError:
+                pass
+            try:
+                if batches:
+                    n_samples = sum(len(a_batch[1]) for a_batch in batches)
+                    self._n_pending_samples -= n_samples
+                    conn.send(('samples', batches))
+                    self.samples_forwarded += n_samples
+                if command is not None:
+                    conn.send(command)
+                    if command[0] == 'shutdown':
+                        break
+            except (BrokenPipeError, EOFError, OSError):
+                break # the reader thread reports the dead process
+
+
+    def _reader_loop(self):
+        conn = self._conn
+        while True:
+            try:
+                message = conn.recv()
+            except (EOFError, OSError):
+                break
+            kind = message[0]
+            if kind == 'received':
+                self.samples_received += len(message[2])
+                if self.on_received is not None:
+                    try:
+                        self.on_received(message[1], message[2], message[3])
+                    except Exception as e:
+                        logger.error("Error handling recorded samples: %s", e)
+            elif kind == 'status':
+                self.last_status = message[1]
+            elif kind == 'ready':
+                self.ready_info = message[1]
+                self._set_state('ready', dict(message[1]))
+                self._ready_event.set()
+            elif kind == 'started':
+                self.recording_method = message[2]
+                self._set_state('recording', {'filename': message[1], 'method': message[2]})
+            elif kind == 'stopped':
+                if not self.is_recording:
+                    self._set_state('idle', {'filename': message[1]})
+                if self.on_stopped is not None:
+                    try:
+                        self.on_stopped(message[1], message[2])
+                    except Exception as e:
+                        logger.error("Error handling stopped recording: %s", e)
+            elif kind == 'warning':
+                if self.on_status is not None:
+                    try:
+                        self.on_status('warning', {'message': message[1]})
+                    except Exception as e:
+                        logger.error("Error in recorder status callback: %s", e)
+            elif kind == 'error':
+                self.last_error = message[1]
+                self._set_state('failed' if message[2] else 'error', {'error': message[1]})
+
+        # Pipe closed: the process exited (normally after 'shutdown', or it crashed)
+        self._is_sending = False
+        self._wakeup.set()
+        self._ready_event.set() # unblock waiters, `wait_until_ready` reports the failure
+        if self._shutdown_requested:
+            self._set_state('stopped') # an orderly exit isn't reported as a failure
+        elif self.state != 'failed':
+            exit_code = self._process.exitcode if self._process is not None else None
+            self.last_error = self.last_error or f"recorder worker exited unexpectedly (exit code {exit_code})"
+            self._set_state('failed', {'error': self.last_error, 'was_recording': self.is_recording})
+
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {'state': self.state, 'recording': self.is_recording, 'method': self.recording_method, 'samples_forwarded': self.samples_forwarded,
+                'samples_dropped': self.samples_dropped, 'samples_received': self.samples_received, 'pending_samples': self._n_pending_samples,
+                'worker_status': dict(self.last_status), 'last_error': self.last_error}
+
+
+    def shutdown(self, timeout: float = 30.0):
+        """Stop any recording, wait for the worker to finish saving and exit (terminating it if it doesn't exit in time)."""
+        self.is_recording = False
+        self._shutdown_requested = True
+        self._enqueue(('shutdown',))
+        self._is_sending = False
+        if self._sender_thread is not None:
+            self._sender_thread.join(timeout=2.0)
+        if self._process is not None:
+            self._process.join(timeout=timeout)
+            if self._process.is_alive():
+                self._process.terminate()
+                self._process.join(timeout=1.0)
+            self._process = None
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+            self._conn = None
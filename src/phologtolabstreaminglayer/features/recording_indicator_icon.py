@@ -3,7 +3,10 @@ import io
 import tempfile
 import os
 from typing import Optional
-from PIL import Image, ImageDraw
+from phologtolabstreaminglayer.features.lazy_import import lazy_import
+
+Image = lazy_import('PIL.Image') # only needed to draw the taskbar overlay icon
+ImageDraw = lazy_import('PIL.ImageDraw')
 
 # Windows-specific imports for taskbar overlay
 _windows_taskbar_available = False
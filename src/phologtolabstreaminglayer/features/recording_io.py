@@ -0,0 +1,161 @@
+# Writing recorded marker data to disk
+# Copyright (C) 2025 Pho Hale. All rights reserved.
+
+"""
+File output of the legacy (non-LabRecorder) recording path, shared by the GUI app and the headless daemon.
+
+Recorded data is a list of `{'sample': [...], 'timestamp': lsl_time, 'stream_name': name}` dicts. It is saved as an
+MNE FIF file whose annotations are the markers plus an events CSV next to it, and periodically backed up to a JSON file
+so a crashed session can be recovered.
+
+This module provides:
+- get_backup_filename: backup path belonging to a recording file
+- write_backup_file / read_backup_file: crash-recovery backups
+- save_markers_fif_and_csv: save recorded markers as FIF + events CSV
+- save_events_csv: write the events CSV only
+"""
+
+import csv
+import json
+from copy import deepcopy
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Tuple, Union
+
+import pytz
+
+from phologtolabstreaminglayer.features.lazy_import import lazy_import
+
+np = lazy_import('numpy')
+mne = lazy_import('mne')
+
+
+def get_backup_filename(xdf_filename: Union[str, Path]) -> str:
+    """The crash-recovery backup file of a recording, e.g. `20250101_120000_log.backup.json`."""
+    return str(Path(xdf_filename).with_suffix('.backup.json'))
+
+
+def write_backup_file(backup_filename: Union[str, Path], recorded_data: List[Dict[str, Any]], recording_start_lsl_local_offset: float):
+    """Write a crash-recovery backup of `recorded_data` (a snapshot is taken, producers may append concurrently)."""
+    snapshot = list(recorded_data)
+    backup_data = {
+        'recorded_data': snapshot,
+        'recording_start_time': recording_start_lsl_local_offset,
+        'sample_count': len(snapshot)
+    }
+    with open(backup_filename, 'w') as f:
+        json.dump(backup_data, f, default=str)
+
+
+def read_backup_file(backup_filename: Union[str, Path]) -> Dict[str, Any]:
+    """Load a backup written by `write_backup_file`."""
+    with open(backup_filename, 'r') as f:
+        return json.load(f)
+
+
+def _get_messages_and_timestamps(recorded_data: List[Dict[str, Any]]) -> Tuple[List[str], List[float]]:
+    messages = []
+    timestamps = []
+    for data_point in recorded_data:
+        a_sample = data_point['sample']
+        if not a_sample:
+            message = ''
+        elif len(a_sample) == 1:
+            message = a_sample[0]
+        else:
+            message = '|'.join(str(v) for v in a_sample) # multi-channel streams (e.g. EventBoardCodes)
+        messages.append(message)
+        timestamps.append(data_point['timestamp'])
+    return messages, timestamps
+
+
+def save_markers_fif_and_csv(recorded_data: List[Dict[str, Any]], xdf_filename: Union[str, Path], recording_start_datetime: datetime, recording_start_lsl_local_offset: float) -> Tuple[Path, Optional[Path]]:
+    """
+    Save recorded markers as MNE annotations in a FIF file (`.xdf` -> `.fif`) and as an events CSV in a `CSV` subfolder.
+
+    Seems highly incorrect but does load and display kinda reasonably in MNELAB. The CSV output has the correct timestamps.
+
+    Returns:
+        (fif_path, csv_path), csv_path is None if only the CSV failed to save
+
+    Raises:
+        Exception: anything raised by MNE or the file system.
+    """
+    xdf_filename = str(xdf_filename)
+    messages, timestamps = _get_messages_and_timestamps(recorded_data)
+    recording_start_datetime = deepcopy(recording_start_datetime)
+    recording_start_lsl_local_offset = deepcopy(recording_start_lsl_local_offset)
+
+    # Convert timestamps to relative times (from the recording start)
+    relative_ts_offset_sec = [ts - recording_start_lsl_local_offset for ts in timestamps]
+
+    # Create annotations (MNE's way of handling markers/events)
+    # Set orig_time=None to avoid timing conflicts
+    annotations = mne.Annotations(
+        onset=relative_ts_offset_sec,
+        duration=[0.0] * len(relative_ts_offset_sec),  # Instantaneous events
+        description=messages,
+        orig_time=None  # This fixes the timing conflict
+    )
+
+    # Create a minimal info structure for the markers
+    info = mne.create_info(
+        ch_names=['TextLogger_Markers'],
+        sfreq=1000, # Dummy sampling rate for the minimal channel, `pylsl.IRREGULAR_RATE` does not work (Error: "Failed to save file: sfreq must be positive")
+        ch_types=['misc']
+    )
+
+    # Create raw object with minimal dummy data spanning the recording duration
+    if len(timestamps) > 0:
+        duration = relative_ts_offset_sec[-1] if relative_ts_offset_sec else 1.0 # the last timestamp in seconds (recording length) or arbitrarily 1.0 if no samples
+        n_samples = int(duration * 1000) + 1000  # Add buffer
+        dummy_data = np.zeros((1, n_samples))
+    else:
+        dummy_data = np.zeros((1, 1000))  # Minimum 1 second of data
+
+    raw = mne.io.RawArray(dummy_data, info)
+
+    # Set measurement date to match the recording start
+    if timestamps:
+        raw.set_meas_date(recording_start_datetime.astimezone(pytz.timezone("UTC")).strftime('%Y-%m-%d %H:%M:%S.%f'))
+
+    raw.set_annotations(annotations)
+
+    # Add metadata to the raw object
+    raw.info['description'] = 'TextLogger LSL Stream Recording'
+    raw.info['experimenter'] = 'PhoLogToLabStreamingLayer'
+
+    # Save as FIF (MNE's native format)
+    fif_filename = xdf_filename.replace('.xdf', '.fif') if xdf_filename.endswith('.xdf') else xdf_filename
+    raw.save(fif_filename, overwrite=True)
+    fif_path = Path(fif_filename).resolve()
+
+    # Also save a CSV for easy reading
+    csv_folder = fif_path.parent.joinpath('CSV')
+    csv_folder.mkdir(parents=True, exist_ok=True)
+    csv_path: Optional[Path] = csv_folder.joinpath(fif_path.name.replace('.fif', '_events.csv')).resolve()
+    try:
+        save_events_csv(csv_path, messages, timestamps, recording_start_datetime=recording_start_datetime, recording_start_lsl_local_offset=recording_start_lsl_local_offset)
+    except Exception as e:
+        print(f"Error saving CSV: {e}") # the FIF file is already saved
+        csv_path = None
+    return fif_path, csv_path
+
+
+def save_events_csv(csv_filename: Union[str, Path], messages: List[str], timestamps: List[float], recording_start_datetime: datetime, recording_start_lsl_local_offset: float):
+    """Save events as CSV for easy reading"""
+    with open(csv_filename, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(['Timestamp', 'LSL_Time', 'LSL_Time_Offset', 'Message'])
+
+        initial_lsl_time = recording_start_lsl_local_offset # timestamps[0]
+
+        for message, lsl_time in zip(messages, timestamps):
+            ## compute relative LSL offset:
+            relative_lsl_time_sec: float = lsl_time - initial_lsl_time
+            assert (relative_lsl_time_sec >= 0), f"Relative LSL time is negative: {relative_lsl_time_sec}"
+
+            # Convert LSL timestamp to readable datetime
+            readable_datetime: datetime = (recording_start_datetime + timedelta(seconds=relative_lsl_time_sec)).astimezone(pytz.timezone("US/Eastern")) ## using timedelta(seconds=lsl_time) was clearly wrong (off by several days)
+            readable_datetime_str: str = readable_datetime.strftime("%Y-%m-%d %I:%M:%S.%f %p") ## 12H AM/PM format
+            writer.writerow([readable_datetime_str, lsl_time, relative_lsl_time_sec, message])
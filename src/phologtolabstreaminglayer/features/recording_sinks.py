@@ -0,0 +1,503 @@
+# Pluggable recording sinks and a fan-out router
+# Copyright (C) 2025 Pho Hale. All rights reserved.
+
+"""
+Every output of a (legacy) recording is a `RecordingSink`: the FIF + events CSV file, the crash-recovery backup JSON,
+InfluxDB, ... A `RecordingSinkRouter` hands each batch of recorded samples to all of its sinks. Every sink has its own
+queue and worker thread, so a slow sink (a database, a big save at the end of a split) never delays the recorder or
+the other sinks. Adding an output format means writing a sink and adding it to the router, not editing the recorder.
+
+Sink lifecycle (all calls are made on the sink's own worker thread, in order):
+    start(target)                 begin recording to `target` (a `RecordingTarget`)
+    write_batch(stream_name, samples, timestamps)
+    rotate(new_target)            finish the current target (e.g. save its file) and continue with `new_target`
+    close()                       finish the current target and release resources
+    on_recording_finished(target, results)   after every sink finished `target`, with each sink's result
+
+`rotate`/`close` return a result dict for the finished target (an 'error' key marks a failure); `results` maps sink
+names to those dicts, which lets e.g. the backup sink delete its backup only once the recording was saved elsewhere.
+
+Per-sink queue policy (`add_sink(..., policy=...)`):
+    'block' - the producer waits for room (up to `max_block_sec`, then drops); for sinks that must not lose data
+    'drop'  - samples that don't fit are dropped and counted; for best-effort sinks such as databases
+
+This module provides:
+- RecordingTarget: one output recording (filename and start timestamps)
+- RecordingSink: the sink interface
+- MarkerFileSink: saves the recorded markers as FIF + events CSV (see `recording_io.save_markers_fif_and_csv`)
+- BackupJsonSink: periodic crash-recovery backups (see `recording_io.write_backup_file`)
+- RecordingSinkRouter: fans recorded batches out to the sinks, with per-sink queues, policies and latency metrics
+"""
+
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Optional, Callable, Dict, List, Any, Tuple, Union
+from pathlib import Path
+
+from phologtolabstreaminglayer.features.app_logging import get_logger
+from phologtolabstreaminglayer.features.recording_io import get_backup_filename, write_backup_file, save_markers_fif_and_csv
+
+logger = get_logger('recording')
+
+
+class RecordingTarget:
+    """One output recording: the file it goes to and its start timestamps (shared by all sinks)."""
+
+    def __init__(self, filename: Union[str, Path], recording_start_datetime: datetime, recording_start_lsl_local_offset: float):
+        self.filename: str = str(filename)
+        self.recording_start_datetime = recording_start_datetime
+        self.recording_start_lsl_local_offset = recording_start_lsl_local_offset
+
+
+    @property
+    def backup_filename(self) -> str:
+        return get_backup_filename(self.filename)
+
+
+    def __repr__(self) -> str:
+        return f"RecordingTarget({self.filename!r})"
+
+
+# ---------------------------------------------------------------------------- #
+#                                     Sinks                                    #
+# ---------------------------------------------------------------------------- #
+
+class RecordingSink:
+    """Base class of recording outputs. Methods are only ever called from the sink's worker thread (see the module docstring).
+
+    Attributes:
+        name: Unique name of the sink in a router (used in metrics and results).
+        policy: Default queue policy, 'block' or 'drop'.
+        max_pending: Default queue capacity in samples.
+    """
+
+    name: str = 'sink'
+    policy: str = 'block'
+    max_pending: int = 1000000
+
+    def start(self, target: RecordingTarget):
+        pass
+
+    def write_batch(self, stream_name: str, samples: List[List[Any]], timestamps: List[float]):
+        raise NotImplementedError
+
+    def rotate(self, target: RecordingTarget) -> Optional[Dict[str, Any]]:
+        try:
+            return self.close()
+        finally:
+            self.start(target) # the next file is recorded even if finishing this one failed
+
+    def close(self) -> Optional[Dict[str, Any]]:
+        return None
+
+    def on_recording_finished(self, target: RecordingTarget, results: Dict[str, Dict[str, Any]]):
+        pass
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {}
+
+
+class MarkerFileSink(RecordingSink):
+    """Keeps the recorded markers in memory and saves them as FIF + events CSV when the target is finished."""
+
+    name = 'markers_file'
+
+    def __init__(self):
+        self._target: Optional[RecordingTarget] = None
+        self.recorded_data: List[Dict[str, Any]] = []
+
+
+    @property
+    def sample_count(self) -> int:
+        return len(self.recorded_data)
+
+
+    def start(self, target: RecordingTarget):
+        self._target = target
+        self.recorded_data = []
+
+
+    def write_batch(self, stream_name: str, samples: List[List[Any]], timestamps: List[float]):
+        self.recorded_data.extend({'sample': a_sample, 'timestamp': a_timestamp, 'stream_name': stream_name} for a_sample, a_timestamp in zip(samples, timestamps))
+
+
+    def close(self) -> Optional[Dict[str, Any]]:
+        target, recorded_data = self._target, self.recorded_data
+        self._target, self.recorded_data = None, []
+        if target is None:
+            return None
+        result = {'filename': target.filename, 'sample_count': len(recorded_data), 'fif_path': None, 'csv_path': None, 'error': None}
+        if not recorded_data:
+            return result # nothing to save (not an error, the backup has nothing worth keeping either)
+        recorded_data.sort(key=lambda a_point: a_point['timestamp']) # samples of different streams may arrive out of order
+        try:
+            fif_path, csv_path = save_markers_fif_and_csv(recorded_data, target.filename, recording_start_datetime=target.recording_start_datetime, recording_start_lsl_local_offset=target.recording_start_lsl_local_offset)
+        except Exception as e:
+            result['error'] = str(e)
+            return result
+        result['fif_path'], result['csv_path'] = str(fif_path), (str(csv_path) if csv_path is not None else None)
+        return result
+
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {'recorded_samples': self.sample_count}
+
+
+class BackupJsonSink(RecordingSink):
+    """Writes the crash-recovery backup of the current target every `every_n_samples` samples.
+
+    When the target is finished a final backup is written, and it is deleted once every other sink finished the target
+    without an error, so a recording whose file couldn't be saved stays recoverable.
+    """
+
+    name = 'backup_json'
+
+    def __init__(self, every_n_samples: int = 10):
+        self.every_n_samples = every_n_samples
+        self._target: Optional[RecordingTarget] = None
+        self._recorded_data: List[Dict[str, Any]] = []
+        self._last_backup_sample_count = 0
+        self.backups_written = 0
+
+
+    def start(self, target: RecordingTarget):
+        self._target = target
+        self._recorded_data = []
+        self._last_backup_sample_count = 0
+
+
+    def write_batch(self, stream_name: str, samples: List[List[Any]], timestamps: List[float]):
+        self._recorded_data.extend({'sample': a_sample, 'timestamp': a_timestamp, 'stream_name': stream_name} for a_sample, a_timestamp in zip(samples, timestamps))
+        if (len(self._recorded_data) - self._last_backup_sample_count) >= self.every_n_samples:
+            self._write_backup()
+
+
+    def _write_backup(self):
+        self._last_backup_sample_count = len(self._recorded_data)
+        write_backup_file(self._target.backup_filename, self._recorded_data, self._target.recording_start_lsl_local_offset)
+        self.backups_written += 1
+
+
+    def close(self) -> Optional[Dict[str, Any]]:
+        target = self._target
+        if target is None:
+            return None
+        try:
+            if len(self._recorded_data) > self._last_backup_sample_count:
+                self._write_backup()
+        finally:
+            self._target, self._recorded_data = None, []
+        return {'backup_filename': target.backup_filename, 'backups_written': self.backups_written, 'error': None}
+
+
+    def on_recording_finished(self, target: RecordingTarget, results: Dict[str, Dict[str, Any]]):
+        if not os.path.exists(target.backup_filename):
+            return
+        failed = [a_name for a_name, a_result in results.items() if (a_name != self.name) and (a_result or {}).get('error')]
+        if failed:
+            logger.warning("Keeping backup '%s' for recovery (%s failed)", target.backup_filename, ', '.join(failed))
+            return
+        try:
+            os.remove(target.backup_filename)
+        except OSError as e:
+            logger.error("Error removing backup file: %s", e)
+
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {'backups_written': self.backups_written}
+
+
+# ---------------------------------------------------------------------------- #
+#                                    Router                                    #
+# ---------------------------------------------------------------------------- #
+
+class _SinkWorker:
+    """The queue, worker thread, policy and metrics of one sink in a router."""
+
+    def __init__(self, sink: RecordingSink, policy: str, max_pending: int, max_block_sec: float, on_finished: Callable[[RecordingTarget, str, Optional[Dict[str, Any]]], None]):
+        if policy not in ('block', 'drop'):
+            raise ValueError(f"unknown sink queue policy {policy!r} (expected 'block' or 'drop')")
+        self.sink = sink
+        self.policy = policy
+        self.max_pending = max_pending
+        self.max_block_sec = max_block_sec
+        self._on_finished = on_finished
+        self._queue: deque = deque()  # ('batch', stream_name, samples, timestamps, enqueue_perf_counter) and control items
+        self._n_pending_samples = 0
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._current_target: Optional[RecordingTarget] = None
+
+        # Metrics
+        self.batches_written = 0
+        self.samples_written = 0
+        self.samples_dropped = 0
+        self.errors = 0
+        self.last_error: Optional[str] = None
+        self.blocked_sec_total = 0.0
+        self.blocked_sec_max = 0.0
+        self.last_latency_sec = 0.0
+        self.max_latency_sec = 0.0
+        self._total_latency_sec = 0.0
+
+
+    def start(self, target: RecordingTarget):
+        self._queue.append(('start', target))
+        self._thread = threading.Thread(target=self._run, name=f"RecordingSink-{self.sink.name}", daemon=True)
+        self._thread.start()
+
+
+    def put_batch(self, stream_name: str, samples: list, timestamps: list) -> int:
+        """Queue a batch according to the policy. Returns the number of samples queued."""
+        n_samples = len(samples)
+        with self._condition:
+            if (self._n_pending_samples + n_samples > self.max_pending) and (self.policy == 'block'):
+                block_start_t = time.perf_counter()
+                self._condition.wait_for(lambda: self._n_pending_samples + n_samples <= self.max_pending, timeout=self.max_block_sec)
+                blocked_sec = time.perf_counter() - block_start_t
+                self.blocked_sec_total += blocked_sec
+                self.blocked_sec_max = max(self.blocked_sec_max, blocked_sec)
+            n_accepted = min(n_samples, max(0, self.max_pending - self._n_pending_samples))
+            if n_accepted < n_samples:
+                self.samples_dropped += n_samples - n_accepted
+            if n_accepted == 0:
+                return 0
+            self._n_pending_samples += n_accepted
+            self._queue.append(('batch', stream_name, samples[:n_accepted], timestamps[:n_accepted], time.perf_counter()))
+            self._condition.notify_all()
+        return n_accepted
+
+
+    def put_control(self, item: tuple):
+        """Queue 'rotate'/'close' (never dropped)."""
+        with self._condition:
+            self._queue.append(item)
+            self._condition.notify_all()
+
+
+    def join(self, timeout: Optional[float]) -> bool:
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            return not self._thread.is_alive()
+        return True
+
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: len(self._queue) > 0)
+                item = self._queue.popleft()
+                if item[0] == 'batch':
+                    self._n_pending_samples -= len(item[2])
+                    self._condition.notify_all() # room for blocked producers
+            kind = item[0]
+            if kind == 'batch':
+                self._write(item[1], item[2], item[3], item[4])
+            elif kind == 'start':
+                self._call('start', item[1])
+                self._current_target = item[1]
+            elif kind == 'rotate':
+                finished_target, self._current_target = self._current_target, item[1]
+                result = self._call('rotate', item[1])
+                self._on_finished(finished_target, self.sink.name, result)
+            elif kind == 'close':
+                finished_target, self._current_target = self._current_target, None
+                result = self._call('close')
+                self._on_finished(finished_target, self.sink.name, result)
+                return
+
+
+    def _write(self, stream_name: str, samples: list, timestamps: list, enqueued_at: float):
+        try:
+            self.sink.write_batch(stream_name, samples, timestamps)
+        except Exception as e:
+            self.errors += 1
+            self.last_error = str(e)
+            logger.error("Recording sink '%s' failed to write %d sample(s): %s", self.sink.name, len(samples), e)
+            return
+        latency = time.perf_counter() - enqueued_at
+        self.last_latency_sec = latency
+        self.max_latency_sec = max(self.max_latency_sec, latency)
+        self._total_latency_sec += latency * len(samples)
+        self.batches_written += 1
+        self.samples_written += len(samples)
+
+
+    def _call(self, method_name: str, *args) -> Optional[Dict[str, Any]]:
+        """Call a lifecycle method; a raised exception becomes the result's 'error'."""
+        try:
+            return getattr(self.sink, method_name)(*args)
+        except Exception as e:
+            self.errors += 1
+            self.last_error = str(e)
+            logger.error("Recording sink '%s' failed to %s: %s", self.sink.name, method_name, e)
+            return {'error': str(e)}
+
+
+    def get_metrics(self) -> Dict[str, Any]:
+        mean_latency = (self._total_latency_sec / self.samples_written) if self.samples_written > 0 else 0.0
+        metrics = {
+            'policy': self.policy,
+            'queue_depth': self._n_pending_samples,
+            'batches_written': self.batches_written,
+            'samples_written': self.samples_written,
+            'samples_dropped': self.samples_dropped,
+            'errors': self.errors,
+            'last_error': self.last_error,
+            'blocked_ms_total': self.blocked_sec_total * 1000.0,
+            'blocked_ms_max': self.blocked_sec_max * 1000.0,
+            'last_latency_ms': self.last_latency_sec * 1000.0,
+            'mean_latency_ms': mean_latency * 1000.0,
+            'max_latency_ms': self.max_latency_sec * 1000.0,
+        }
+        try:
+            metrics.update(self.sink.get_metrics() or {})
+        except Exception:
+            pass
+        return metrics
+
+
+class RecordingSinkRouter:
+    """Delivers recorded sample batches to several sinks concurrently, each on its own queue and thread.
+
+    Usage:
+        router = RecordingSinkRouter(on_recording_finished=lambda target, results: ...)
+        router.add_sink(MarkerFileSink())
+        router.add_sink(BackupJsonSink(every_n_samples=10))
+        router.add_sink(InfluxDBMarkerSink(...), policy='drop')
+        router.start(RecordingTarget(filename, start_datetime, start_lsl_offset))
+        router.write_batch('TextLogger', samples, timestamps)   # any thread; never waits for a 'drop' sink
+        router.rotate(RecordingTarget(new_filename, ...))       # split without a gap
+        router.close()
+    """
+
+    def __init__(self, on_recording_finished: Optional[Callable[[RecordingTarget, Dict[str, Dict[str, Any]]], Any]] = None, max_block_sec: float = 1.0):
+        """
+        Args:
+            on_recording_finished: Called with (target, {sink_name: result}) once every sink finished a target (rotate/close),
+                on the thread of the sink that finished last.
+            max_block_sec: Default for how long a 'block' sink may hold up `write_batch` before samples are dropped.
+        """
+        self.on_recording_finished = on_recording_finished
+        self.max_block_sec = max_block_sec
+        self._workers: Dict[str, _SinkWorker] = {}
+        self._pending_results: Dict[int, Tuple[RecordingTarget, Dict[str, Optional[Dict[str, Any]]]]] = {}  # id(target) -> (target, results so far)
+        self._results_lock = threading.Lock()
+        self._is_started = False
+        self._is_closed = False
+        self.target: Optional[RecordingTarget] = None
+
+
+    @property
+    def sinks(self) -> List[RecordingSink]:
+        return [a_worker.sink for a_worker in self._workers.values()]
+
+
+    def get_sink(self, name: str) -> Optional[RecordingSink]:
+        a_worker = self._workers.get(name)
+        return a_worker.sink if a_worker is not None else None
+
+
+    def add_sink(self, sink: RecordingSink, policy: Optional[str] = None, max_pending: Optional[int] = None, max_block_sec: Optional[float] = None):
+        """
+        Add a sink (before `start`).
+
+        Args:
+            sink: The sink; its `name` must be unique in the router.
+            policy: 'block' or 'drop'; defaults to `sink.policy`.
+            max_pending: Queue capacity in samples; defaults to `sink.max_pending`.
+            max_block_sec: Longest wait of a 'block' sink for room; defaults to the router's.
+
+        Raises:
+            ValueError: if the name is taken or the policy is unknown.
+            RuntimeError: if the router was already started.
+        """
+        if self._is_started:
+            raise RuntimeError("sinks must be added before the router is started")
+        if sink.name in self._workers:
+            raise ValueError(f"a recording sink named {sink.name!r} was already added")
+        self._workers[sink.name] = _SinkWorker(sink, policy=policy or sink.policy, max_pending=max_pending or sink.max_pending,
+                                               max_block_sec=self.max_block_sec if max_block_sec is None else max_block_sec, on_finished=self._on_sink_finished)
+
+
+    def start(self, target: RecordingTarget):
+        """Start every sink's worker thread, recording to `target`."""
+        if self._is_started:
+            raise RuntimeError("the router was already started")
+        self._is_started = True
+        self.target = target
+        for a_worker in self._workers.values():
+            a_worker.start(target)
+
+
+    def write_batch(self, stream_name: str, samples: List[List[Any]], timestamps: List[float]):
+        """Queue a batch of recorded samples for every sink (safe from any thread)."""
+        if (not self._is_started) or self._is_closed or (not samples):
+            return
+        for a_worker in self._workers.values():
+            a_worker.put_batch(stream_name, samples, timestamps)
+
+
+    def rotate(self, target: RecordingTarget):
+        """Finish the current target in every sink and continue with `target` (samples written after this call go to it)."""
+        if (not self._is_started) or self._is_closed:
+            return
+        self._expect_results(self.target)
+        self.target = target
+        for a_worker in self._workers.values():
+            a_worker.put_control(('rotate', target))
+
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """Finish the current target and stop the sinks, waiting up to `timeout` seconds (None: don't wait). Returns whether all stopped."""
+        if self._is_started and not self._is_closed:
+            self._is_closed = True
+            self._expect_results(self.target)
+            for a_worker in self._workers.values():
+                a_worker.put_control(('close',))
+        return self.join(timeout) if timeout is not None else False
+
+
+    def join(self, timeout: float) -> bool:
+        """Wait for the sink threads to stop after `close`."""
+        deadline = time.monotonic() + timeout
+        return all(a_worker.join(max(0.0, deadline - time.monotonic())) for a_worker in self._workers.values())
+
+
+    def _expect_results(self, target: Optional[RecordingTarget]):
+        if target is not None:
+            with self._results_lock:
+                self._pending_results[id(target)] = (target, {})
+
+
+    def _on_sink_finished(self, target: Optional[RecordingTarget], sink_name: str, result: Optional[Dict[str, Any]]):
+        """Collect a sink's result for `target`; the last one runs the `on_recording_finished` hooks (sink thread)."""
+        if target is None:
+            return
+        with self._results_lock:
+            entry = self._pending_results.get(id(target))
+            if entry is None:
+                return
+            entry[1][sink_name] = result or {}
+            if len(entry[1]) < len(self._workers):
+                return
+            del self._pending_results[id(target)]
+        results = entry[1]
+        for a_sink in self.sinks:
+            try:
+                a_sink.on_recording_finished(target, results)
+            except Exception as e:
+                logger.error("Recording sink '%s' failed to finish %s: %s", a_sink.name, target, e)
+        if self.on_recording_finished is not None:
+            try:
+                self.on_recording_finished(target, results)
+            except Exception as e:
+                logger.error("Error in recording finished callback: %s", e)
+
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Queue depth, dropped/blocked counters and write latency of each sink."""
+        return {a_name: a_worker.get_metrics() for a_name, a_worker in self._workers.items()}
@@ -0,0 +1,198 @@
+# Startup phase timing instrumentation
+# Copyright (C) 2025 Pho Hale. All rights reserved.
+
+"""
+Records how long each phase of app startup takes so slow launches can be diagnosed on the machine they happen on.
+
+All times are taken from `time.perf_counter()` (monotonic) relative to the profiler's origin, which is when the
+profiler was created. Foreground phases are timed back to back with `lap()` (or `phase()`), background phases that
+run on other threads (outlet creation, LabRecorder init, model loading, ...) with `begin()`/`end()` or `record()`,
+and single points in time (window shown, first recording started, ...) with `mark()`. Once startup is over (first
+recording started, app closed or a timeout) `finish()` freezes the profile, which can then be written to a JSON report.
+
+This module provides:
+- StartupProfiler: thread-safe recorder of startup phases and milestones
+- write_startup_report: write a report to `startup_profile_latest.json` and append a summary to `startup_profiles.jsonl`
+"""
+
+import json
+import os
+import platform
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Dict, List, Any
+
+
+class StartupProfiler:
+    """Thread-safe recorder of startup phase timings.
+
+    Usage:
+        profiler = StartupProfiler()
+        do_first_thing()
+        profiler.lap('first_thing')          # phase from the previous lap (or origin) until now
+        profiler.begin('outlets')            # background phase, ended from another thread
+        ...
+        profiler.end('outlets')
+        profiler.mark('window_shown')
+        report = profiler.finish('first_recording')
+    """
+
+    def __init__(self, origin_perf_counter: Optional[float] = None):
+        self._lock = threading.Lock()
+        self.origin_perf_counter: float = origin_perf_counter if origin_perf_counter is not None else time.perf_counter()
+        self.origin_datetime: datetime = datetime.now()
+        self._last_lap_perf_counter: float = self.origin_perf_counter
+        self._phases: List[Dict[str, Any]] = []
+        self._open_phases: Dict[str, Dict[str, Any]] = {}
+        self._milestones: List[Dict[str, Any]] = []
+        self.finish_reason: Optional[str] = None
+        self.finished_at_sec: Optional[float] = None
+
+
+    @property
+    def is_finished(self) -> bool:
+        return self.finish_reason is not None
+
+
+    def _now_sec(self) -> float:
+        return time.perf_counter() - self.origin_perf_counter
+
+
+    def record(self, name: str, start_perf_counter: float, end_perf_counter: float, background: bool = False, details: Optional[Dict[str, Any]] = None):
+        """Add a phase measured by the caller (perf_counter values). Ignored once the profile is finished."""
+        with self._lock:
+            if self.is_finished:
+                return
+            self._phases.append({
+                'name': name,
+                'start_sec': start_perf_counter - self.origin_perf_counter,
+                'duration_sec': end_perf_counter - start_perf_counter,
+                'background': background,
+                'thread': threading.current_thread().name,
+                'details': dict(details or {}),
+            })
+
+
+    def lap(self, name: str, details: Optional[Dict[str, Any]] = None) -> float:
+        """Record a foreground phase running from the previous lap (or the origin) until now. Returns its duration in seconds."""
+        now = time.perf_counter()
+        with self._lock:
+            start = self._last_lap_perf_counter
+            self._last_lap_perf_counter = now
+        self.record(name, start, now, background=False, details=details)
+        return now - start
+
+
+    @contextmanager
+    def phase(self, name: str, background: bool = False, details: Optional[Dict[str, Any]] = None):
+        """Context manager timing the enclosed block as a phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self.record(name, start, end, background=background, details=details)
+            if not background:
+                with self._lock:
+                    self._last_lap_perf_counter = end
+
+
+    def begin(self, name: str):
+        """Start a background phase; finish it with `end(name)` from any thread."""
+        with self._lock:
+            self._open_phases[name] = {'start': time.perf_counter(), 'thread': threading.current_thread().name}
+
+
+    def end(self, name: str, details: Optional[Dict[str, Any]] = None) -> Optional[float]:
+        """End a background phase started with `begin(name)`. Returns its duration in seconds (None if it wasn't started)."""
+        now = time.perf_counter()
+        with self._lock:
+            open_phase = self._open_phases.pop(name, None)
+        if open_phase is None:
+            return None
+        self.record(name, open_phase['start'], now, background=True, details=details)
+        return now - open_phase['start']
+
+
+    def mark(self, name: str, details: Optional[Dict[str, Any]] = None):
+        """Record a milestone at the current time (only the first occurrence of each name is kept)."""
+        at_sec = self._now_sec()
+        with self._lock:
+            if self.is_finished or any(a_milestone['name'] == name for a_milestone in self._milestones):
+                return
+            self._milestones.append({'name': name, 'at_sec': at_sec, 'details': dict(details or {})})
+
+
+    def finish(self, reason: str) -> Dict[str, Any]:
+        """Freeze the profile (phases still running are reported as unfinished) and return the report. Idempotent."""
+        with self._lock:
+            if not self.is_finished:
+                self.finish_reason = reason
+                self.finished_at_sec = self._now_sec()
+        return self.get_report()
+
+
+    def get_report(self) -> Dict[str, Any]:
+        """The profile as a JSON-serializable dict (phases sorted by start time)."""
+        now_sec = self._now_sec()
+        with self._lock:
+            phases = sorted((dict(a_phase) for a_phase in self._phases), key=lambda a_phase: a_phase['start_sec'])
+            milestones = sorted((dict(a_milestone) for a_milestone in self._milestones), key=lambda a_milestone: a_milestone['at_sec'])
+            unfinished = [{'name': a_name, 'start_sec': a_phase['start'] - self.origin_perf_counter, 'running_sec': (self.finished_at_sec if self.finished_at_sec is not None else now_sec) - (a_phase['start'] - self.origin_perf_counter), 'thread': a_phase['thread']}
+                          for a_name, a_phase in self._open_phases.items()]
+            foreground_sec = sum(a_phase['duration_sec'] for a_phase in phases if not a_phase['background'])
+            return {
+                'started': self.origin_datetime.isoformat(timespec='seconds'),
+                'finish_reason': self.finish_reason,
+                'elapsed_sec': self.finished_at_sec if self.finished_at_sec is not None else now_sec,
+                'foreground_sec': foreground_sec,
+                'before_profiler_sec': _get_seconds_since_process_start(self.origin_perf_counter),
+                'host': {'platform': platform.platform(), 'python': sys.version.split()[0], 'cpu_count': os.cpu_count()},
+                'phases': phases,
+                'unfinished_phases': unfinished,
+                'milestones': milestones,
+            }
+
+
+def _get_seconds_since_process_start(perf_counter_value: float) -> Optional[float]:
+    """Seconds between process start and `perf_counter_value` (interpreter start-up + imports), if psutil is available."""
+    try:
+        import psutil
+        process_age_sec = time.time() - psutil.Process().create_time()
+    except Exception:
+        return None
+    return max(0.0, process_age_sec - (time.perf_counter() - perf_counter_value))
+
+
+def write_startup_report(report: Dict[str, Any], folder: Path) -> Path:
+    """
+    Write `report` to `folder/startup_profile_latest.json` and append a one-line summary to `folder/startup_profiles.jsonl`
+    (so launches can be compared over time).
+
+    Returns:
+        Path of the written JSON report.
+    """
+    folder = Path(folder)
+    folder.mkdir(parents=True, exist_ok=True)
+    report_path = folder / 'startup_profile_latest.json'
+    tmp_path = report_path.with_suffix('.json.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    os.replace(tmp_path, report_path)
+
+    summary = {
+        'started': report['started'],
+        'finish_reason': report['finish_reason'],
+        'elapsed_sec': report['elapsed_sec'],
+        'foreground_sec': report['foreground_sec'],
+        'before_profiler_sec': report['before_profiler_sec'],
+        'phases': {a_phase['name']: round(a_phase['duration_sec'], 4) for a_phase in report['phases']},
+        'milestones': {a_milestone['name']: round(a_milestone['at_sec'], 4) for a_milestone in report['milestones']},
+    }
+    with open(folder / 'startup_profiles.jsonl', 'a', encoding='utf-8') as f:
+        f.write(json.dumps(summary) + '\n')
+    return report_path
@@ -0,0 +1,307 @@
+# Out-of-process live transcription engine
+# Copyright (C) 2025 Pho Hale. All rights reserved.
+
+"""
+Hosts the Whisper live-transcription engine in a separate worker process.
+
+Importing torch and loading the Whisper model takes seconds of CPU time and holds the GIL. In a child process that work
+runs in parallel with GUI startup, outlet creation and stream discovery, and later transcription never competes with
+the GUI or the recorder for the GIL. The child captures microphone audio itself, transcribes it in chunks and streams
+each segment back over a pipe with its LSL timestamp (`pylsl.local_clock()` is the same clock in every process on a
+machine), so the parent only has to push it to the WhisperLiveLogger outlet.
+
+Messages from the child are tuples:
+    ('progress', stage, fraction)   stage in 'importing', 'loading_model'
+    ('ready', info_dict)            model loaded (model name, device, load seconds)
+    ('state', 'transcribing' | 'idle')
+    ('segment', text, lsl_timestamp, duration_seconds)
+    ('error', message, is_fatal)
+
+Commands to the child: ('start',), ('stop',), ('shutdown',).
+
+This module provides:
+- is_transcription_worker_enabled / get_whisper_model_name: environment configuration
+- TranscriptionProcessClient: starts/controls the worker process and dispatches its messages on a reader thread
+"""
+
+import multiprocessing
+import os
+import threading
+import time
+from typing import Optional, Callable, Dict, Any
+
+from phologtolabstreaminglayer.features.app_logging import get_logger
+
+logger = get_logger('transcription')
+
+_in_process_transcription_env_variable_name: str = "PHO_LOGTOLABSTREAMINGLAYER_TRANSCRIPTION_IN_PROCESS"
+_whisper_model_env_variable_name: str = "PHO_LOGTOLABSTREAMINGLAYER_WHISPER_MODEL"
+default_whisper_model_name: str = "base"
+
+
+def is_transcription_worker_enabled() -> bool:
+    """Whether transcription runs in the worker process (disable with PHO_LOGTOLABSTREAMINGLAYER_TRANSCRIPTION_IN_PROCESS=1)."""
+    return os.environ.get(_in_process_transcription_env_variable_name, '').strip().lower() not in ('1', 'true', 'yes')
+
+
+def get_whisper_model_name() -> str:
+    """Whisper model loaded by the worker (PHO_LOGTOLABSTREAMINGLAYER_WHISPER_MODEL, default "base")."""
+    return os.environ.get(_whisper_model_env_variable_name, '').strip() or default_whisper_model_name
+
+
+def _transcription_process_main(conn, model_name: str, device: Optional[str], language: Optional[str], sample_rate: int, chunk_seconds: float):
+    """Entry point of the worker process (must stay importable without Tk or torch)."""
+    def _send(*message):
+        try:
+            conn.send(message)
+        except (BrokenPipeError, EOFError, OSError):
+            pass
+
+    try:
+        _send('progress', 'importing', 0.1)
+        load_start_t = time.perf_counter()
+        import numpy as np
+        import pylsl
+        import sounddevice as sd
+        import torch
+        import whisper_timestamped
+
+        if device is None:
+            device = 'cuda' if torch.cuda.is_available() else 'cpu'
+        _send('progress', 'loading_model', 0.4)
+        model = whisper_timestamped.load_model(model_name, device=device)
+        _send('ready', {'model': model_name, 'device': device, 'load_seconds': time.perf_counter() - load_start_t})
+    except Exception as e:
+        _send('error', f"failed to load transcription model: {e}", True)
+        return
+
+    chunk_frames = int(sample_rate * chunk_seconds)
+    audio_blocks = []
+    buffered_frames = 0
+    buffer_start_lsl = None
+    audio_lock = threading.Lock()
+    stream = None
+    is_running = True
+
+    def _on_audio(indata, frames, time_info, status):
+        nonlocal buffered_frames, buffer_start_lsl
+        with audio_lock:
+            if buffer_start_lsl is None:
+                buffer_start_lsl = pylsl.local_clock() - (frames / float(sample_rate)) # LSL time of the first frame in the buffer
+            audio_blocks.append(indata[:, 0].copy())
+            buffered_frames += frames
+
+    try:
+        while is_running:
+            if conn.poll(0.05):
+                command = conn.recv()[0]
+                if (command == 'start') and (stream is None):
+                    with audio_lock:
+                        audio_blocks.clear()
+                        buffered_frames, buffer_start_lsl = 0, None
+                    stream = sd.InputStream(samplerate=sample_rate, channels=1, dtype='float32', callback=_on_audio)
+                    stream.start()
+                    _send('state', 'transcribing')
+                elif (command == 'stop') and (stream is not None):
+                    stream.stop()
+                    stream.close()
+                    stream = None
+                    _send('state', 'idle')
+                elif command == 'shutdown':
+                    is_running = False
+                    continue
+
+            if (stream is None) or (buffered_frames < chunk_frames):
+                continue
+
+            # Take the buffered chunk and transcribe it (audio keeps being captured by the callback meanwhile)
+            with audio_lock:
+                blocks = list(audio_blocks)
+                audio_blocks.clear()
+                chunk_start_lsl = buffer_start_lsl
+                buffered_frames, buffer_start_lsl = 0, None
+            audio = np.concatenate(blocks)
+            try:
+                result = whisper_timestamped.transcribe(model, audio, language=language, verbose=None)
+            except Exception as e:
+                _send('error', f"transcription failed: {e}", False)
+                continue
+            for a_segment in result.get('segments', []):
+                text = a_segment.get('text', '').strip()
+                if text:
+                    _send('segment', text, chunk_start_lsl + float(a_segment.get('start', 0.0)), float(a_segment.get('end', 0.0)) - float(a_segment.get('start', 0.0)))
+    finally:
+        if stream is not None:
+            try:
+                stream.stop()
+                stream.close()
+            except Exception:
+                pass
+        conn.close()
+
+
+class TranscriptionProcessClient:
+    """Starts the transcription worker process and relays its messages.
+
+    Callbacks run on the client's reader thread; GUI code should marshal them to the Tk thread.
+
+    Usage:
+        client = TranscriptionProcessClient(on_segment=lambda text, ts, dur: ..., on_status=lambda state, info: ...)
+        client.start_process()   # model loads in the background
+        client.start_transcription()  # queued until the model is ready
+        ...
+        client.shutdown()
+    """
+
+    def __init__(self, on_segment: Callable[[str, float, float], Any], on_status: Optional[Callable[[str, Dict[str, Any]], Any]] = None,
+                 model_name: str = 'base', device: Optional[str] = None, language: Optional[str] = None, sample_rate: int = 16000, chunk_seconds: float = 5.0):
+        """
+        Args:
+            on_segment: Called with (text, lsl_timestamp, duration_seconds) for every transcribed segment.
+            on_status: Called with (state, info) on progress/ready/state changes/errors. States: 'starting', 'importing',
+                'loading_model', 'ready', 'transcribing', 'idle', 'error', 'failed' (fatal: the process is gone), 'stopped'.
+            model_name: Whisper model name (e.g. 'tiny', 'base', 'small').
+            device: Torch device, or None to pick CUDA when available.
+            language: Transcription language, or None to auto-detect.
+            sample_rate: Microphone sample rate (Whisper expects 16 kHz).
+            chunk_seconds: Length of the audio chunks that are transcribed.
+        """
+        self.on_segment = on_segment
+        self.on_status = on_status
+        self.model_name = model_name
+        self.device = device
+        self.language = language
+        self.sample_rate = sample_rate
+        self.chunk_seconds = chunk_seconds
+
+        self._process: Optional[multiprocessing.Process] = None
+        self._conn = None
+        self._reader_thread: Optional[threading.Thread] = None
+        self._send_lock = threading.Lock()
+        self._start_requested = False
+        self.state: str = 'stopped'
+        self.progress: float = 0.0
+        self.ready_info: Dict[str, Any] = {}
+        self.last_error: Optional[str] = None
+        self.segments_received = 0
+
+
+    @property
+    def is_ready(self) -> bool:
+        return self.state in ('ready', 'transcribing', 'idle')
+
+
+    @property
+    def is_transcribing(self) -> bool:
+        return self.state == 'transcribing'
+
+
+    @property
+    def is_alive(self) -> bool:
+        return (self._process is not None) and self._process.is_alive()
+
+
+    def _set_state(self, state: str, info: Optional[Dict[str, Any]] = None):
+        self.state = state
+        if self.on_status is not None:
+            try:
+                self.on_status(state, info or {})
+            except Exception as e:
+                logger.error("Error in transcription status callback: %s", e)
+
+
+    def start_process(self):
+        """Spawn the worker process; it starts importing torch and loading the model immediately."""
+        if self.is_alive:
+            return
+        ctx = multiprocessing.get_context('spawn') # never fork a process that has Tk/LSL threads running
+        parent_conn, child_conn = ctx.Pipe(duplex=True)
+        self._conn = parent_conn
+        self._process = ctx.Process(target=_transcription_process_main, name="TranscriptionWorker", daemon=True,
+                                    args=(child_conn, self.model_name, self.device, self.language, self.sample_rate, self.chunk_seconds))
+        self.progress = 0.0
+        self._set_state('starting', {'progress': 0.0})
+        self._process.start()
+        child_conn.close() # the child owns its end now
+        self._reader_thread = threading.Thread(target=self._reader_loop, name="TranscriptionWorkerReader", daemon=True)
+        self._reader_thread.start()
+
+
+    def _send_command(self, command: str) -> bool:
+        with self._send_lock:
+            if self._conn is None:
+                return False
+            try:
+                self._conn.send((command,))
+                return True
+            except (BrokenPipeError, EOFError, OSError):
+                return False
+
+
+    def start_transcription(self):
+        """Start transcribing (deferred until the model is ready if it is still loading)."""
+        self._start_requested = True
+        if self.is_ready:
+            self._send_command('start')
+
+
+    def stop_transcription(self):
+        self._start_requested = False
+        self._send_command('stop')
+
+
+    def _reader_loop(self):
+        conn = self._conn
+        while True:
+            try:
+                message = conn.recv()
+            except (EOFError, OSError):
+                break
+            kind = message[0]
+            if kind == 'segment':
+                self.segments_received += 1
+                try:
+                    self.on_segment(message[1], message[2], message[3])
+                except Exception as e:
+                    logger.error("Error handling transcription segment: %s", e)
+            elif kind == 'progress':
+                self.progress = message[2]
+                self._set_state(message[1], {'progress': message[2]})
+            elif kind == 'ready':
+                self.progress = 1.0
+                self.ready_info = message[1]
+                self._set_state('ready', dict(message[1]))
+                if self._start_requested:
+                    self._send_command('start')
+            elif kind == 'state':
+                self._set_state(message[1])
+            elif kind == 'error':
+                self.last_error = message[1]
+                self._set_state('failed' if message[2] else 'error', {'error': message[1]})
+
+        # Pipe closed: the process exited (normally after 'shutdown', or it crashed)
+        if self.state not in ('failed', 'stopped'):
+            exit_code = self._process.exitcode if self._process is not None else None
+            if self._start_requested or (self.state != 'idle'):
+                self.last_error = self.last_error or f"transcription worker exited unexpectedly (exit code {exit_code})"
+                self._set_state('failed', {'error': self.last_error})
+
+
+    def shutdown(self, timeout: float = 5.0):
+        """Ask the worker to stop and wait for it (terminating it if it doesn't exit in time)."""
+        self._start_requested = False
+        self.state = 'stopped' # an orderly exit isn't reported as a failure
+        self._send_command('shutdown')
+        if self._process is not None:
+            self._process.join(timeout=timeout)
+            if self._process.is_alive():
+                self._process.terminate()
+                self._process.join(timeout=1.0)
+            self._process = None
+        with self._send_lock:
+            if self._conn is not None:
+                try:
+                    self._conn.close()
+                except Exception:
+                    pass
+                self._conn = None
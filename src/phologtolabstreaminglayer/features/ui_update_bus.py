@@ -0,0 +1,129 @@
+# Coalescing, frame-rate-limited GUI update bus for worker threads
+# Copyright (C) 2025 Pho Hale. All rights reserved.
+
+"""
+A single funnel for GUI updates posted from worker threads.
+
+Instead of every worker calling `root.after(0, ...)` per status change (one Tk callback each), workers post updates to
+a `UIUpdateBus`. Keyed updates are coalesced so only the latest callback per key survives until the next frame, and a
+single pump callback applies everything on the Tk main thread at most `max_fps` times per second.
+
+This module provides:
+- UIUpdateBus: the update bus
+"""
+
+import threading
+import time
+import tkinter as tk
+from typing import Callable, Dict, List, Any
+
+
+class UIUpdateBus:
+    """Coalesces GUI updates from worker threads and applies them on the Tk main thread in frame-limited batches.
+
+    Two kinds of updates are supported:
+        - `post(key, callback)`: keyed state updates (e.g. a label's text). A newer post for the same key replaces an
+          older one that has not been applied yet (counted as coalesced).
+        - `post_ordered(callback)`: updates that must all be applied, in order (e.g. appending a log line).
+    """
+
+    def __init__(self, root: tk.Tk, max_fps: float = 30.0):
+        """
+        Args:
+            root: The root Tk window (used to schedule the pump on the main thread).
+            max_fps: Maximum number of pump runs per second.
+        """
+        self._root = root
+        self._min_interval_sec = 1.0 / max(1.0, float(max_fps))
+        self._lock = threading.Lock()
+        self._keyed_updates: Dict[str, Callable[[], Any]] = {}
+        self._ordered_updates: List[Callable[[], Any]] = []
+        self._pump_scheduled = False
+        self._last_pump_time = 0.0
+        self._stopped = False
+
+        # Metrics
+        self._posted_count = 0
+        self._coalesced_count = 0
+        self._applied_count = 0
+        self._pump_count = 0
+
+
+    def post(self, key: str, callback: Callable[[], Any]):
+        """Post a keyed update (safe from any thread). Only the latest callback per key is applied."""
+        if self._stopped:
+            return
+        with self._lock:
+            self._posted_count += 1
+            if key in self._keyed_updates:
+                self._coalesced_count += 1
+            self._keyed_updates[key] = callback
+        self._schedule_pump()
+
+
+    def post_ordered(self, callback: Callable[[], Any]):
+        """Post an update that must not be coalesced (safe from any thread). Applied in posting order."""
+        if self._stopped:
+            return
+        with self._lock:
+            self._posted_count += 1
+            self._ordered_updates.append(callback)
+        self._schedule_pump()
+
+
+    def _schedule_pump(self):
+        """Schedule a single pump run no sooner than one frame after the previous one."""
+        with self._lock:
+            if self._pump_scheduled:
+                return
+            self._pump_scheduled = True
+            delay_sec = max(0.0, (self._last_pump_time + self._min_interval_sec) - time.perf_counter())
+        try:
+            self._root.after(int(delay_sec * 1000.0), self._pump)
+        except (tk.TclError, RuntimeError):
+            with self._lock:
+                self._pump_scheduled = False  # GUI is being destroyed
+
+
+    def _pump(self):
+        """Apply all pending updates (runs on the Tk main thread)."""
+        with self._lock:
+            self._pump_scheduled = False
+            self._last_pump_time = time.perf_counter()
+            ordered_updates = self._ordered_updates
+            keyed_updates = self._keyed_updates
+            self._ordered_updates = []
+            self._keyed_updates = {}
+
+        if self._stopped:
+            return
+        self._pump_count += 1
+
+        for a_callback in ordered_updates + list(keyed_updates.values()):
+            try:
+                a_callback()
+                self._applied_count += 1
+            except tk.TclError:
+                pass  # GUI is being destroyed
+            except Exception as e:
+                print(f"Error applying UI update: {e}")
+
+
+    def stop(self):
+        """Stop applying updates (pending updates are discarded)."""
+        self._stopped = True
+        with self._lock:
+            self._keyed_updates.clear()
+            self._ordered_updates.clear()
+
+
+    def get_metrics(self) -> Dict[str, int]:
+        """Return posted/coalesced/applied/pump counters."""
+        with self._lock:
+            return {
+                'posted': self._posted_count,
+                'coalesced': self._coalesced_count,
+                'applied': self._applied_count,
+                'pumps': self._pump_count,
+                'pending': len(self._keyed_updates) + len(self._ordered_updates),
+            }
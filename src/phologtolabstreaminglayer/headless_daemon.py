@@ -0,0 +1,695 @@
+# Headless daemon mode (no Tk)
+# Copyright (C) 2025 Pho Hale. All rights reserved.
+
+"""
+Runs the LSL side of the logger without any GUI: our marker outlets, stream discovery, auto-recording, timed rotation
+(splitting) of recordings and crash-recovery backups (legacy recordings write through a `RecordingSinkRouter`, see
+`features/recording_sinks.py`). Meant for rack machines where only outlets and recording are
+wanted; nothing from tkinter, the tray (pystray/PIL) or the GUI widgets is imported.
+
+Control:
+- Signals: SIGINT/SIGTERM (SIGBREAK on Windows) stop the daemon cleanly; on POSIX SIGHUP splits the recording and
+  SIGUSR1 logs a status line.
+- Control socket: a TCP socket on 127.0.0.1 (port 13380 by default, PHO_LOGTOLABSTREAMINGLAYER_CONTROL_PORT or
+  `--control-port`) taking one command per line and answering one JSON object per line:
+      help | status | start | stop | split | log <text> | event <button_id> [offset_seconds] | shutdown
+  `send_control_command` (and `logger_app --control "<command>"`) is a client for it. The socket also acts as the
+  singleton lock: a second daemon can't bind the same port.
+
+Other processes can push markers at high rates through the marker ingest socket (see `MarkerIngestServer`), and
+instrument log files listed in `file_tail_config.json` are followed (see `FileTailIngest`).
+
+This module provides:
+- HeadlessLoggerDaemon: the daemon
+- send_control_command: send one command to a running daemon and return its JSON reply
+- get_default_control_port: control port from the environment (or the default)
+- run_headless_daemon: set up logging and run the daemon (the `--headless` entry point)
+"""
+
+import json
+import os
+import signal
+import socket
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional, Dict, List, Any
+
+import pylsl
+from phopylslhelper.easy_time_sync import EasyTimeSyncParsingMixin
+
+from phologtolabstreaminglayer.features.app_logging import get_logger, setup_app_logging, shutdown_app_logging
+from phologtolabstreaminglayer.features.app_paths import get_app_data_folder
+from phologtolabstreaminglayer.features.eventboard_config import CompiledEventBoardConfig, EventBoardConfigError, resolve_eventboard_config_path, load_eventboard_config_file, get_default_eventboard_config
+from phologtolabstreaminglayer.features.file_tail_ingest import FileTailIngest, FileTailConfigError, create_file_tail_ingest_from_config
+from phologtolabstreaminglayer.features.influxdb_sink import create_influxdb_sink_from_env
+from phologtolabstreaminglayer.features.lazy_import import lazy_import
+from phologtolabstreaminglayer.features.lsl_stream_infos import make_textlogger_stream_info, make_eventboard_stream_info, make_eventboard_codes_stream_info
+from phologtolabstreaminglayer.features.marker_history_db import MarkerHistoryDB
+from phologtolabstreaminglayer.features.marker_ingest_server import MarkerIngestServer, get_default_ingest_port
+from phologtolabstreaminglayer.features.outlet_dispatcher import OutletDispatcher
+from phologtolabstreaminglayer.features.recording_io import get_backup_filename, read_backup_file, save_markers_fif_and_csv
+from phologtolabstreaminglayer.features.recording_sinks import RecordingSinkRouter, RecordingTarget, MarkerFileSink, BackupJsonSink
+
+labrecorder = lazy_import('labrecorder')
+
+daemon_logger = get_logger('daemon')
+lsl_logger = get_logger('lsl')
+discovery_logger = get_logger('discovery')
+recording_logger = get_logger('recording')
+
+_control_port_env_variable_name: str = "PHO_LOGTOLABSTREAMINGLAYER_CONTROL_PORT"
+default_control_port: int = 13380
+_control_commands_help: str = "help | status | start | stop | split | log <text> | event <button_id> [offset_seconds] | shutdown"
+
+
+def get_default_control_port() -> int:
+    """Control socket port (PHO_LOGTOLABSTREAMINGLAYER_CONTROL_PORT, default 13380)."""
+    try:
+        return int(os.environ.get(_control_port_env_variable_name, default_control_port))
+    except ValueError:
+        return default_control_port
+
+
+def send_control_command(command: str, port: Optional[int] = None, timeout: float = 10.0) -> Dict[str, Any]:
+    """
+    Send one command line to a running headless daemon.
+
+    Returns:
+        The daemon's JSON reply as a dict (always has an 'ok' key).
+
+    Raises:
+        OSError: if no daemon is listening on the port.
+    """
+    port = port or get_default_control_port()
+    with socket.create_connection(('127.0.0.1', port), timeout=timeout) as sock:
+        sock.sendall(command.strip().encode('utf-8') + b'\n')
+        with sock.makefile('r', encoding='utf-8') as reader:
+            return json.loads(reader.readline())
+
+
+class HeadlessLoggerDaemon(EasyTimeSyncParsingMixin):
+    """The logger's outlets, discovery and recording without a GUI.
+
+    Usage:
+        daemon = HeadlessLoggerDaemon(xdf_folder=Path('recordings'), rotate_minutes=60.0)
+        exit_code = daemon.run()  # blocks until shutdown (signal or control command)
+    """
+
+    own_stream_names: List[str] = ['TextLogger', 'EventBoard']
+
+    def __init__(self, xdf_folder: Path, control_port: Optional[int] = None, rotate_minutes: Optional[float] = None, auto_record: bool = True, backup_every_n_samples: int = 10,
+                 ingest_port: Optional[int] = None):
+        """
+        Args:
+            xdf_folder: Folder for recordings (falls back to the app data folder if it can't be created).
+            control_port: Control socket port; None for the default, 0 to disable the socket.
+            rotate_minutes: Split the recording into a new file this often (None/0 to never rotate).
+            auto_record: Start recording as soon as streams are discovered.
+            backup_every_n_samples: Write the legacy recording's crash-recovery backup after this many new samples.
+            ingest_port: Marker ingest socket port; None for the default, 0 to disable it.
+        """
+        self.xdf_folder = Path(xdf_folder) if xdf_folder is not None else get_app_data_folder('recordings')
+        self.control_port: int = get_default_control_port() if control_port is None else int(control_port)
+        self.rotate_minutes: Optional[float] = rotate_minutes if (rotate_minutes or 0) > 0 else None
+        self.auto_record = auto_record
+        self.backup_every_n_samples = backup_every_n_samples
+
+        self._stop_event = threading.Event()
+        self._split_requested = threading.Event()
+        self._started_monotonic = time.monotonic()
+        self._threads: List[threading.Thread] = []
+        self._control_socket: Optional[socket.socket] = None
+
+        # Outlets
+        self.outlets: Dict[str, Optional[pylsl.StreamOutlet]] = {}
+        self.outlet_dispatchers: Dict[str, OutletDispatcher] = {}
+        self.marker_history_db: Optional[MarkerHistoryDB] = None
+        self.ingest_port: int = get_default_ingest_port() if ingest_port is None else int(ingest_port)
+        self.marker_ingest_server: Optional[MarkerIngestServer] = None
+        self.file_tail_ingest: Optional[FileTailIngest] = None
+
+        # EventBoard
+        self.eventboard_compiled_config: Optional[CompiledEventBoardConfig] = None
+        self.eventboard_toggle_states: Dict[str, bool] = {}
+        self._eventboard_state_lock = threading.Lock()
+        self._eventboard_sequence_number = 0
+
+        # Discovery
+        self.discovered_streams: Dict[str, pylsl.StreamInfo] = {}
+        self._stream_discovery_lock = threading.Lock()
+        self.auto_start_attempted = False
+
+        # Recording
+        self._recording_lock = threading.RLock()  # start/stop/split may come from signals, control clients and the monitor thread
+        self.recording = False
+        self.xdf_filename: Optional[str] = None
+        self.recording_sinks: Optional[RecordingSinkRouter] = None  # outputs of the current recording
+        self._closing_recording_sinks: List[RecordingSinkRouter] = []  # stopped recordings that may still be saving
+        self.recording_started_monotonic: Optional[float] = None
+        self.recording_uses_lab_recorder = False
+        self.lab_recorder = None
+        self.lab_recorder_init_done_event = threading.Event()
+
+        self.init_EasyTimeSyncParsingMixin()
+        self.capture_stream_start_timestamps()
+        self.capture_recording_start_timestamps()
+
+
+    # ---------------------------------------------------------------------------- #
+    #                                   Lifecycle                                  #
+    # ---------------------------------------------------------------------------- #
+
+    def run(self) -> int:
+        """Start everything and block until shutdown is requested. Must be called on the main thread (signal handlers)."""
+        if self.control_port and not self._open_control_socket():
+            return 1
+        self._install_signal_handlers()
+        self._prepare_xdf_folder()
+        self.recover_backups()
+        self.load_eventboard_config()
+
+        self.marker_history_db = MarkerHistoryDB(get_app_data_folder('marker_history') / 'marker_history.sqlite3')
+        try:
+            self.marker_history_db.start()
+        except Exception as e:
+            daemon_logger.error("Could not open the marker history database: %s", e)
+            self.marker_history_db = None
+
+        for a_stream_name in self.own_stream_names:
+            self._create_outlet_dispatcher(a_stream_name)
+
+        self._start_thread(self.setup_lsl_outlets, "setup_outlets")
+        if self.ingest_port:
+            ingest_server = MarkerIngestServer(get_dispatcher=self.outlet_dispatchers.get, fire_event=self._fire_ingested_eventboard_event, port=self.ingest_port)
+            if ingest_server.start():
+                self.marker_ingest_server = ingest_server
+        try:
+            self.file_tail_ingest = create_file_tail_ingest_from_config(get_dispatcher=self.outlet_dispatchers.get, fire_event=self._fire_ingested_eventboard_event)
+        except FileTailConfigError as e:
+            daemon_logger.error("File tailing disabled: %s", e)
+        if self.file_tail_ingest is not None:
+            self.file_tail_ingest.start()
+        self._start_thread(self.init_lab_recorder, "init_lab_recorder")
+        self._start_thread(self._stream_discovery_worker, "stream_discovery")
+        self._start_thread(self._recording_monitor_worker, "recording_monitor")
+        if self._control_socket is not None:
+            self._start_thread(self._control_server_worker, "control_server")
+        daemon_logger.info("Headless daemon running (recordings: %s, control port: %s, ingest port: %s, rotation: %s)", self.xdf_folder, self.control_port or 'disabled',
+                           self.marker_ingest_server.port if self.marker_ingest_server is not None else 'disabled',
+                           f"every {self.rotate_minutes:g} min" if self.rotate_minutes else 'off')
+
+        try:
+            while not self._stop_event.wait(timeout=0.5): # short waits so signals are handled promptly on every platform
+                pass
+        except KeyboardInterrupt:
+            pass
+        self.shutdown()
+        return 0
+
+
+    def request_stop(self):
+        """Ask the daemon to shut down (safe from any thread or a signal handler)."""
+        self._stop_event.set()
+
+
+    def shutdown(self):
+        """Stop recording, flush outlets and stop every worker."""
+        self._stop_event.set()
+        if self.marker_ingest_server is not None:
+            self.marker_ingest_server.stop()
+        if self.file_tail_ingest is not None:
+            self.file_tail_ingest.stop()
+        self.stop_recording()
+        for a_router in self._closing_recording_sinks:
+            if not a_router.join(timeout=30.0):
+                recording_logger.error("Recording sinks still busy at shutdown: %s", a_router.get_metrics())
+        if self._control_socket is not None:
+            try:
+                self._control_socket.close()
+            except OSError:
+                pass
+        for a_thread in self._threads:
+            a_thread.join(timeout=3.0)
+        for a_name, a_dispatcher in list(self.outlet_dispatchers.items()):
+            a_dispatcher.stop()
+            lsl_logger.info("Outlet dispatcher '%s' stopped: %s", a_name, a_dispatcher.get_metrics())
+        self.outlet_dispatchers.clear()
+        self.outlets.clear()
+        if self.marker_history_db is not None:
+            self.marker_history_db.stop()
+        daemon_logger.info("Headless daemon stopped after %.0f s", time.monotonic() - self._started_monotonic)
+        shutdown_app_logging()
+
+
+    def _start_thread(self, target, name: str):
+        a_thread = threading.Thread(target=target, name=name, daemon=True)
+        a_thread.start()
+        self._threads.append(a_thread)
+
+
+    def _install_signal_handlers(self):
+        signal.signal(signal.SIGINT, lambda signum, frame: self.request_stop())
+        signal.signal(signal.SIGTERM, lambda signum, frame: self.request_stop())
+        if hasattr(signal, 'SIGBREAK'): # Windows Ctrl+Break
+            signal.signal(signal.SIGBREAK, lambda signum, frame: self.request_stop())
+        if hasattr(signal, 'SIGHUP'):
+            signal.signal(signal.SIGHUP, lambda signum, frame: self._split_requested.set())
+        if hasattr(signal, 'SIGUSR1'):
+            signal.signal(signal.SIGUSR1, lambda signum, frame: daemon_logger.info("Status: %s", json.dumps(self.get_status(), default=str)))
+
+
+    def _prepare_xdf_folder(self):
+        try:
+            self.xdf_folder.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            fallback_folder = get_app_data_folder('recordings')
+            recording_logger.error("Recording folder '%s' is not usable (%s), recording to '%s' instead", self.xdf_folder, e, fallback_folder)
+            self.xdf_folder = fallback_folder
+
+
+    def get_status(self) -> Dict[str, Any]:
+        """Snapshot of the daemon's state (returned by the `status` control command)."""
+        with self._stream_discovery_lock:
+            discovered = sorted(self.discovered_streams.keys())
+        return {
+            'uptime_sec': round(time.monotonic() - self._started_monotonic, 1),
+            'recording': self.recording,
+            'recording_file': self.xdf_filename if self.recording else None,
+            'recording_method': ('LabRecorder' if self.recording_uses_lab_recorder else 'Legacy') if self.recording else None,
+            'recorded_samples': self.recording_sinks.get_sink('markers_file').sample_count if (self.recording and self.recording_sinks is not None and not self.recording_uses_lab_recorder) else None,
+            'recording_elapsed_sec': round(time.monotonic() - self.recording_started_monotonic, 1) if (self.recording and self.recording_started_monotonic) else None,
+            'rotate_minutes': self.rotate_minutes,
+            'outlets': {a_name: (an_outlet is not None) for a_name, an_outlet in self.outlets.items()},
+            'dispatchers': {a_name: a_dispatcher.get_metrics() for a_name, a_dispatcher in self.outlet_dispatchers.items()},
+            'ingest': self.marker_ingest_server.get_metrics() if self.marker_ingest_server is not None else None,
+            'file_tail': self.file_tail_ingest.get_metrics() if self.file_tail_ingest is not None else None,
+            'recording_sinks': self.recording_sinks.get_metrics() if (self.recording and self.recording_sinks is not None) else None,
+            'discovered_streams': discovered,
+            'lab_recorder_available': self.lab_recorder is not None,
+        }
+
+
+    # ---------------------------------------------------------------------------- #
+    #                                    Outlets                                   #
+    # ---------------------------------------------------------------------------- #
+
+    def load_eventboard_config(self):
+        """Load the EventBoard config (its buttons can be fired with the `event` control command)"""
+        compiled = None
+        config_path = resolve_eventboard_config_path()
+        if config_path is not None:
+            try:
+                compiled = load_eventboard_config_file(config_path)
+                daemon_logger.info("EventBoard configuration loaded from %s", config_path)
+            except EventBoardConfigError as e:
+                daemon_logger.error("Error loading EventBoard config, using default configuration: %s", e)
+        self.eventboard_compiled_config = compiled or CompiledEventBoardConfig.from_dict(get_default_eventboard_config())
+        for a_warning in self.eventboard_compiled_config.warnings:
+            daemon_logger.warning("EventBoard config: %s", a_warning)
+        if self.eventboard_compiled_config.typed_outlet and ('EventBoardCodes' not in self.own_stream_names):
+            self.own_stream_names = self.own_stream_names + ['EventBoardCodes']
+
+
+    def _create_outlet_dispatcher(self, stream_name: str) -> OutletDispatcher:
+        dispatcher = OutletDispatcher(stream_name, outlet=None, on_error=lambda name, e: lsl_logger.error("Error pushing to the '%s' outlet: %s", name, e))
+        dispatcher.add_push_listener(self._on_own_samples_pushed)
+        dispatcher.start()
+        self.outlet_dispatchers[stream_name] = dispatcher
+        return dispatcher
+
+
+    def setup_lsl_outlets(self):
+        """Create our marker outlets and attach them to their dispatchers (flushing anything sent before)"""
+        stream_info_fns = {
+            'TextLogger': make_textlogger_stream_info,
+            'EventBoard': make_eventboard_stream_info,
+            'EventBoardCodes': lambda: make_eventboard_codes_stream_info(self.eventboard_compiled_config),
+        }
+        for a_stream_name in self.own_stream_names:
+            start_t = time.perf_counter()
+            try:
+                info = self.EasyTimeSyncParsingMixin_add_lsl_outlet_info(info=stream_info_fns[a_stream_name]())
+                self.outlets[a_stream_name] = pylsl.StreamOutlet(info)
+                self.outlet_dispatchers[a_stream_name].attach_outlet(self.outlets[a_stream_name])
+                lsl_logger.info("'%s' outlet created in %.1f ms", a_stream_name, (time.perf_counter() - start_t) * 1000.0)
+            except Exception as e:
+                lsl_logger.error("Error creating the '%s' outlet: %s", a_stream_name, e)
+                self.outlets[a_stream_name] = None
+
+
+    def _on_own_samples_pushed(self, stream_name: str, samples: list, timestamps: list):
+        """Hand our own samples to the recording's sinks at push time and persist them to the marker history (dispatcher thread)"""
+        recording_sinks = self.recording_sinks
+        if self.recording and (recording_sinks is not None):
+            recording_sinks.write_batch(stream_name, samples, timestamps)
+        for a_sample, a_timestamp in zip(samples, timestamps):
+            if (self.marker_history_db is not None) and a_sample and all(isinstance(v, str) for v in a_sample):
+                self.marker_history_db.add_marker(stream_name, 'sent', '|'.join(a_sample), lsl_timestamp=a_timestamp, recording_file=self.xdf_filename if self.recording else None)
+
+
+    def send_text_message(self, message: str, lsl_timestamp: Optional[float] = None) -> bool:
+        """Queue a message on the TextLogger outlet"""
+        if not self.outlet_dispatchers['TextLogger'].submit([message], timestamp=lsl_timestamp):
+            lsl_logger.warning("LSL message dropped (send queue full): %s", message)
+            return False
+        return True
+
+
+    def fire_eventboard_event(self, button_id: str, time_offset_seconds: float = 0.0, lsl_timestamp: Optional[float] = None) -> Optional[str]:
+        """Fire an EventBoard button like a click in the GUI (toggle buttons flip). Returns the sent event name, or None if the button doesn't exist."""
+        button_config = self.eventboard_compiled_config.get_button(button_id)
+        if button_config is None:
+            return None
+        actual_lsl_timestamp = (pylsl.local_clock() if lsl_timestamp is None else lsl_timestamp) - time_offset_seconds
+        actual_timestamp = datetime.now() - timedelta(seconds=time_offset_seconds)
+        with self._eventboard_state_lock:
+            new_state = None
+            event_name = button_config.event_name
+            if button_config.is_toggleable:
+                new_state = not self.eventboard_toggle_states.get(button_id, False)
+                self.eventboard_toggle_states[button_id] = new_state
+                event_name = f"{event_name}{'_START' if new_state else '_END'}"
+
+            event_message = f"{event_name}|{button_config.text}|{actual_timestamp.isoformat()}"
+            if new_state is not None:
+                event_message += f"|TOGGLE:{new_state}"
+            if not self.outlet_dispatchers['EventBoard'].submit([event_message], timestamp=actual_lsl_timestamp):
+                lsl_logger.warning("EventBoard marker dropped (send queue full): %s", event_message)
+                return event_name
+
+            codes_dispatcher = self.outlet_dispatchers.get('EventBoardCodes')
+            if codes_dispatcher is not None: # only once the string marker was accepted
+                self._eventboard_sequence_number += 1
+                toggle_value = -1.0 if new_state is None else float(new_state)
+                codes_dispatcher.submit([float(button_config.code), toggle_value, float(time_offset_seconds), float(self._eventboard_sequence_number)], timestamp=actual_lsl_timestamp)
+        return event_name
+
+
+    def _fire_ingested_eventboard_event(self, button_id: str, time_offset_seconds: float, lsl_timestamp: float) -> bool:
+        """`MarkerIngestServer`/`FileTailIngest` callback for EventBoard events (ingest thread)"""
+        return self.fire_eventboard_event(button_id, time_offset_seconds, lsl_timestamp=lsl_timestamp) is not None
+
+
+    # ---------------------------------------------------------------------------- #
+    #                               Stream Discovery                               #
+    # ---------------------------------------------------------------------------- #
+
+    def _stream_discovery_worker(self):
+        """Resolve LSL streams every couple of seconds; auto-starts recording once streams show up"""
+        consecutive_errors = 0
+        while not self._stop_event.is_set():
+            try:
+                streams = pylsl.resolve_streams(wait_time=1.0)
+                consecutive_errors = 0
+                new_discovered = {}
+                for a_stream in streams:
+                    new_discovered[f"{a_stream.name()}_{a_stream.source_id()}"] = a_stream
+                with self._stream_discovery_lock:
+                    new_streams = set(new_discovered.keys()) - set(self.discovered_streams.keys())
+                    disconnected_streams = set(self.discovered_streams.keys()) - set(new_discovered.keys())
+                    self.discovered_streams = new_discovered
+                if new_streams:
+                    discovery_logger.info("New streams discovered: %s", new_streams)
+                if disconnected_streams:
+                    discovery_logger.info("Streams disconnected: %s", disconnected_streams)
+                if self.auto_record and new_streams and not self.auto_start_attempted:
+                    self.auto_start_attempted = True
+                    self.start_recording(auto_started=True)
+            except Exception as e:
+                consecutive_errors += 1
+                discovery_logger.error("Error in stream discovery (attempt %d): %s", consecutive_errors, e)
+            self._stop_event.wait(timeout=min(2.0 * (1 + consecutive_errors), 30.0))
+
+
+    # ---------------------------------------------------------------------------- #
+    #                                   Recording                                  #
+    # ---------------------------------------------------------------------------- #
+
+    def init_lab_recorder(self):
+        """Create the LabRecorder in the background (falls back to legacy in-process recording if unavailable)"""
+        try:
+            self.lab_recorder = labrecorder.LabRecorder()
+            recording_logger.info("LabRecorder initialized successfully")
+        except Exception as e:
+            recording_logger.warning("LabRecorder not available, using legacy recording: %s", e)
+        finally:
+            self.lab_recorder_init_done_event.set()
+
+
+    def start_recording(self, auto_started: bool = False) -> Optional[str]:
+        """Start recording to a new timestamped file. Returns its filename (None if already recording or it failed)."""
+        self.lab_recorder_init_done_event.wait(timeout=10.0)
+        with self._recording_lock:
+            if self.recording or self._stop_event.is_set():
+                return None
+            self.capture_recording_start_timestamps()
+            filename = self._new_recording_filename()
+
+            self.recording_uses_lab_recorder = False
+            if self.lab_recorder is not None:
+                with self._stream_discovery_lock:
+                    stream_infos = list(self.discovered_streams.values())
+                try:
+                    self.lab_recorder.start_recording(filename=filename, streams=stream_infos)
+                    self.recording_uses_lab_recorder = True
+                except Exception as e:
+                    recording_logger.error("LabRecorder failed to start, using legacy recording: %s", e)
+
+            self.recording_sinks = self._create_recording_sinks(RecordingTarget(filename, self.recording_start_datetime, self.recording_start_lsl_local_offset),
+                                                                record_in_process=not self.recording_uses_lab_recorder)
+            self.xdf_filename = filename
+            self.recording_started_monotonic = time.monotonic()
+            self.recording = True
+
+        method = 'LabRecorder' if self.recording_uses_lab_recorder else 'Legacy'
+        self.send_text_message(f"RECORDING_AUTO_STARTED: {filename}" if auto_started else f"RECORDING_STARTED: {filename}")
+        recording_logger.info("%s recording (%s) to: %s", "Auto-started" if auto_started else "Started", method, filename)
+        return filename
+
+
+    def _new_recording_filename(self) -> str:
+        file_stamp = self.recording_start_datetime.strftime('%Y%m%d_%H%M%S')
+        filename = str(self.xdf_folder / f"{file_stamp}_log.xdf")
+        n_tries = 1
+        while (filename == self.xdf_filename) or Path(filename).exists() or Path(get_backup_filename(filename)).exists(): # splits can happen within the same second
+            filename = str(self.xdf_folder / f"{file_stamp}_{n_tries}_log.xdf")
+            n_tries += 1
+        return filename
+
+
+    def _create_recording_sinks(self, target: RecordingTarget, record_in_process: bool) -> RecordingSinkRouter:
+        """The outputs of a recording: the FIF/CSV file and backups when recording in-process (LabRecorder writes its XDF itself), and InfluxDB if configured"""
+        router = RecordingSinkRouter(on_recording_finished=self._on_recording_saved)
+        if record_in_process:
+            router.add_sink(MarkerFileSink())
+            router.add_sink(BackupJsonSink(every_n_samples=self.backup_every_n_samples))
+        influxdb_sink = create_influxdb_sink_from_env()
+        if influxdb_sink is not None:
+            router.add_sink(influxdb_sink)
+        router.start(target)
+        return router
+
+
+    def stop_recording(self) -> Optional[str]:
+        """Stop recording; the file is saved in the background by the recording's sinks. Returns the recording's filename (None if not recording)."""
+        with self._recording_lock:
+            if not self.recording:
+                return None
+            filename = self.xdf_filename
+            self.send_text_message(f"RECORDING_STOPPED: {os.path.basename(filename)}")
+            if self.recording_uses_lab_recorder:
+                try:
+                    self.lab_recorder.stop_recording()
+                    recording_logger.info("LabRecorder XDF file saved: %s", filename)
+                except Exception as e:
+                    recording_logger.error("Error stopping LabRecorder: %s", e)
+            else:
+                self._wait_for_dispatchers_to_drain() # so the stop marker is part of the recording
+            self.recording = False
+            recording_sinks, self.recording_sinks = self.recording_sinks, None
+            if recording_sinks is not None:
+                recording_sinks.close()
+                self._closing_recording_sinks = [a_router for a_router in self._closing_recording_sinks if not a_router.join(timeout=0.0)] + [recording_sinks]
+            self.recording_started_monotonic = None
+        return filename
+
+
+    def split_recording(self) -> Optional[str]:
+        """Continue the recording in a new file (legacy recordings rotate their sinks without a gap). Returns the new filename."""
+        with self._recording_lock:
+            if not self.recording:
+                return None
+            if self.recording_uses_lab_recorder or (self.lab_recorder is not None) or (self.recording_sinks is None):
+                self.stop_recording() # a new LabRecorder recording (or another attempt to start one)
+                filename = self.start_recording()
+            else:
+                filename = self._rotate_legacy_recording()
+        if filename is not None:
+            self.send_text_message(f"RECORDING_SPLIT_NEW_FILE: {filename}")
+            recording_logger.info("Split recording to new file: %s", filename)
+        return filename
+
+
+    def _rotate_legacy_recording(self) -> str:
+        self.send_text_message(f"RECORDING_STOPPED: {os.path.basename(self.xdf_filename)}")
+        self._wait_for_dispatchers_to_drain() # so the stop marker ends up in the old file
+        self.capture_recording_start_timestamps()
+        filename = self._new_recording_filename()
+        self.recording_sinks.rotate(RecordingTarget(filename, self.recording_start_datetime, self.recording_start_lsl_local_offset))
+        self.xdf_filename = filename
+        self.recording_started_monotonic = time.monotonic()
+        self.send_text_message(f"RECORDING_STARTED: {filename}")
+        recording_logger.info("Started recording (Legacy) to: %s", filename)
+        return filename
+
+
+    def _wait_for_dispatchers_to_drain(self, timeout: float = 1.0):
+        deadline = time.monotonic() + timeout
+        while any(a_dispatcher.queue_depth > 0 for a_dispatcher in self.outlet_dispatchers.values() if a_dispatcher.is_outlet_attached) and (time.monotonic() < deadline):
+            time.sleep(0.01)
+        time.sleep(0.02) # the recording tap runs right after the push
+
+
+    def _on_recording_saved(self, target: RecordingTarget, results: Dict[str, Dict[str, Any]]):
+        """Log what the sinks made of a finished recording (called on a sink thread)"""
+        file_result = results.get('markers_file')
+        if file_result is not None:
+            if file_result.get('error'):
+                recording_logger.error("Failed to save %s, keeping its backup: %s", target.filename, file_result['error'])
+            elif not file_result.get('sample_count'):
+                recording_logger.warning("No data recorded, nothing saved for %s", target.filename)
+            else:
+                recording_logger.info("FIF file saved: '%s', events CSV: '%s' (%d samples)", file_result.get('fif_path'), file_result.get('csv_path'), file_result['sample_count'])
+        for a_name, a_result in results.items():
+            if (a_name != 'markers_file') and a_result.get('error'):
+                recording_logger.error("Recording sink '%s' failed for %s: %s", a_name, target.filename, a_result['error'])
+
+
+    def _recording_monitor_worker(self):
+        """Rotates files, handles split requests and restarts LabRecorder if it stops (backups are written by the `BackupJsonSink`)"""
+        while not self._stop_event.wait(timeout=0.5):
+            if self._split_requested.is_set():
+                self._split_requested.clear()
+                self.split_recording()
+            if not self.recording:
+                continue
+            if self.rotate_minutes and self.recording_started_monotonic and ((time.monotonic() - self.recording_started_monotonic) >= (self.rotate_minutes * 60.0)):
+                self.split_recording()
+                continue
+            if self.recording_uses_lab_recorder:
+                if hasattr(self.lab_recorder, 'is_recording') and not self.lab_recorder.is_recording:
+                    recording_logger.warning("LabRecorder stopped recording unexpectedly, restarting")
+                    with self._recording_lock:
+                        self.recording = False
+                        recording_sinks, self.recording_sinks = self.recording_sinks, None
+                    if recording_sinks is not None:
+                        recording_sinks.close()
+                    self.start_recording()
+
+
+    def recover_backups(self):
+        """Save leftover crash-recovery backups as `<name>_recovered` FIF/CSV files (no user to ask in headless mode)"""
+        for a_backup_file in sorted(self.xdf_folder.glob('*.backup.json')):
+            try:
+                backup_data = read_backup_file(a_backup_file)
+                recorded_data = backup_data['recorded_data']
+                if recorded_data:
+                    start_offset = backup_data.get('recording_start_time') or recorded_data[0]['timestamp']
+                    start_datetime = datetime.fromtimestamp(a_backup_file.stat().st_mtime) - timedelta(seconds=(recorded_data[-1]['timestamp'] - start_offset))
+                    recovered_filename = a_backup_file.parent / f"{a_backup_file.name.replace('.backup.json', '')}_recovered.xdf"
+                    fif_path, _csv_path = save_markers_fif_and_csv(recorded_data, recovered_filename, recording_start_datetime=start_datetime.astimezone(), recording_start_lsl_local_offset=start_offset)
+                    recording_logger.info("Recovered %d samples from %s to %s", len(recorded_data), a_backup_file.name, fif_path)
+                os.remove(a_backup_file)
+            except Exception as e:
+                recording_logger.error("Failed to recover from backup %s: %s", a_backup_file, e)
+
+
+    # ---------------------------------------------------------------------------- #
+    #                                Control Socket                                #
+    # ---------------------------------------------------------------------------- #
+
+    def _open_control_socket(self) -> bool:
+        try:
+            self._control_socket = socket.create_server(('127.0.0.1', self.control_port))
+            self._control_socket.settimeout(1.0)
+            return True
+        except OSError as e:
+            daemon_logger.error("Could not open the control socket on port %d (is another daemon running?): %s", self.control_port, e)
+            return False
+
+
+    def _control_server_worker(self):
+        while not self._stop_event.is_set():
+            try:
+                client_socket, _address = self._control_socket.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                break # socket closed on shutdown
+            threading.Thread(target=self._handle_control_client, args=(client_socket,), name="control_client", daemon=True).start()
+
+
+    def _handle_control_client(self, client_socket: socket.socket):
+        with client_socket:
+            client_socket.settimeout(30.0)
+            try:
+                with client_socket.makefile('rw', encoding='utf-8', newline='\n') as stream:
+                    for a_line in stream:
+                        if not a_line.strip():
+                            continue
+                        reply = self.handle_control_command(a_line)
+                        stream.write(json.dumps(reply, default=str) + '\n')
+                        stream.flush()
+                        if self._stop_event.is_set():
+                            break
+            except (OSError, ValueError) as e:
+                daemon_logger.debug("Control client disconnected: %s", e)
+
+
+    def handle_control_command(self, line: str) -> Dict[str, Any]:
+        """Execute one control command line and return the JSON-serializable reply"""
+        command, _, argument = line.strip().partition(' ')
+        command = command.lower()
+        argument = argument.strip()
+        daemon_logger.info("Control command: %s", command)
+        try:
+            if command == 'help':
+                return {'ok': True, 'commands': _control_commands_help}
+            if command == 'status':
+                return {'ok': True, 'status': self.get_status()}
+            if command == 'start':
+                filename = self.start_recording()
+                return {'ok': filename is not None, 'recording_file': filename} if filename else {'ok': False, 'error': 'already recording'}
+            if command == 'stop':
+                filename = self.stop_recording()
+                return {'ok': True, 'recording_file': filename} if filename else {'ok': False, 'error': 'not recording'}
+            if command == 'split':
+                filename = self.split_recording()
+                return {'ok': True, 'recording_file': filename} if filename else {'ok': False, 'error': 'not recording'}
+            if command == 'log':
+                if not argument:
+                    return {'ok': False, 'error': 'usage: log <text>'}
+                return {'ok': self.send_text_message(argument)}
+            if command == 'event':
+                parts = argument.split()
+                if not parts:
+                    return {'ok': False, 'error': 'usage: event <button_id> [offset_seconds]'}
+                event_name = self.fire_eventboard_event(parts[0], float(parts[1]) if len(parts) > 1 else 0.0)
+                return {'ok': True, 'event_name': event_name} if event_name else {'ok': False, 'error': f"unknown EventBoard button '{parts[0]}'"}
+            if command == 'shutdown':
+                self.request_stop()
+                return {'ok': True}
+            return {'ok': False, 'error': f"unknown command '{command}' (commands: {_control_commands_help})"}
+        except Exception as e:
+            daemon_logger.error("Error executing control command '%s': %s", command, e)
+            return {'ok': False, 'error': str(e)}
+
+
+def run_headless_daemon(xdf_folder: Optional[Path] = None, control_port: Optional[int] = None, rotate_minutes: Optional[float] = None, auto_record: bool = True, ingest_port: Optional[int] = None) -> int:
+    """Set up logging (file + stderr) and run a `HeadlessLoggerDaemon` until it is shut down. Returns the exit code."""
+    import logging
+    setup_app_logging(get_app_data_folder('logs'), extra_handlers=[logging.StreamHandler()])
+    daemon = HeadlessLoggerDaemon(xdf_folder=xdf_folder, control_port=control_port, rotate_minutes=rotate_minutes, auto_record=auto_record, ingest_port=ingest_port)
+    return daemon.run()
@@ -3,38 +3,66 @@ from copy import deepcopy
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
 import pylsl
-import pyxdf
 from datetime import datetime, timedelta
-import pytz
 import os
 import threading
 import time
-import numpy as np
-import json
-import pickle
-import mne
 from pathlib import Path
-import pystray
-from PIL import Image, ImageDraw
 import sys
+import subprocess
 from phopylslhelper.general_helpers import unwrap_single_element_listlike_if_needed, readable_dt_str, from_readable_dt_str, localize_datetime_to_timezone, tz_UTC, tz_Eastern, _default_tz
 from phopylslhelper.easy_time_sync import EasyTimeSyncParsingMixin
 from phopylslhelper.mixins.app_helpers import SingletonInstanceMixin, AppThemeMixin, SystemTrayAppMixin
-from whisper_timestamped.mixins.live_whisper_transcription import LiveWhisperTranscriptionAppMixin
-from labrecorder import LabRecorder
+from phologtolabstreaminglayer.features.lazy_import import lazy_import, warm_up_imports
 from phologtolabstreaminglayer.features.global_hotkey import GlobalHotkeyMixin
 from phologtolabstreaminglayer.features.recording_indicator_icon import RecordingIndicatorIconMixin
 from phologtolabstreaminglayer.features.console_output_tk import ConsoleOutputFrame
+from phologtolabstreaminglayer.features.outlet_dispatcher import OutletDispatcher
+from phologtolabstreaminglayer.features.log_history import LogHistoryFile, LogHistoryModel
+from phologtolabstreaminglayer.features.app_paths import get_app_data_folder
+from phologtolabstreaminglayer.features.ui_update_bus import UIUpdateBus
+from phologtolabstreaminglayer.features.marker_history_db import MarkerHistoryDB
+from phologtolabstreaminglayer.features.marker_ingest_server import MarkerIngestServer, get_default_ingest_port
+from phologtolabstreaminglayer.features.file_tail_ingest import FileTailIngest, FileTailConfigError, create_file_tail_ingest_from_config
+from phologtolabstreaminglayer.features.eventboard_hotkeys import EventBoardHotkeyBinder, LatencyStats
+from phologtolabstreaminglayer.features.eventboard_config import CompiledEventBoardConfig, EventBoardConfigError, EventBoardConfigWatcher, resolve_eventboard_config_path, load_eventboard_config_file, get_default_eventboard_config, default_eventboard_button_color
+from phologtolabstreaminglayer.features.app_logging import get_logger, setup_app_logging, shutdown_app_logging, add_log_subscriber, remove_log_subscriber
+from phologtolabstreaminglayer.features.lsl_stream_infos import make_textlogger_stream_info, make_eventboard_stream_info, make_eventboard_codes_stream_info
+from phologtolabstreaminglayer.features.recording_io import read_backup_file, save_markers_fif_and_csv, save_events_csv
+from phologtolabstreaminglayer.features.recording_sinks import RecordingSinkRouter, RecordingTarget, MarkerFileSink, BackupJsonSink
+from phologtolabstreaminglayer.features.startup_profiler import StartupProfiler, write_startup_report
+from phologtolabstreaminglayer.features.transcription_process import TranscriptionProcessClient, is_transcription_worker_enabled, get_whisper_model_name
+from phologtolabstreaminglayer.features.lazy_live_transcription import LazyLiveWhisperTranscriptionAppMixin, live_whisper_transcription_module, is_live_whisper_transcription_loaded
+from phologtolabstreaminglayer.features.recorder_process import RecorderProcessClient, is_recorder_worker_enabled
+from phologtolabstreaminglayer.features.influxdb_sink import create_influxdb_sink_from_env
+
+# Heavy dependencies only needed for saving (mne/numpy), the tray (pystray/PIL) and LabRecorder recording: imported on first use or by the warm-up thread started once the window is up
+np = lazy_import('numpy')
+mne = lazy_import('mne')
+pystray = lazy_import('pystray')
+Image = lazy_import('PIL.Image')
+ImageDraw = lazy_import('PIL.ImageDraw')
+labrecorder = lazy_import('labrecorder')
+_warm_up_modules = (np, mne, pystray, Image, ImageDraw, labrecorder)
 
 # program_lock_port = int(os.environ.get("LIVE_WHISPER_LOCK_PORT", 13372))
 # program_lock_port = int(os.environ.get("PHO_LOGTOLABSTREAMINGLAYER_LOCK_PORT", 13379))  # No longer needed - using file-based locking
 
 
+lsl_logger = get_logger('lsl')
+eventboard_logger = get_logger('eventboard')
+discovery_logger = get_logger('discovery')
+recording_logger = get_logger('recording')
+transcription_logger = get_logger('transcription')
+startup_logger = get_logger('startup')
+
+_startup_profile_timeout_ms: int = 120000 # finish the startup profile after this long if no recording has started
+
 _default_xdf_folder = Path(r'E:\Dropbox (Personal)\Databases\UnparsedData\PhoLogToLabStreamingLayer_logs').resolve()
 # _default_xdf_folder = Path('/media/halechr/MAX/cloud/University of Michigan Dropbox/Pho Hale/Personal/LabRecordedTextLog').resolve() ## Lab computer
 
 
-class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, SystemTrayAppMixin, SingletonInstanceMixin, LiveWhisperTranscriptionAppMixin, EasyTimeSyncParsingMixin):
+class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, SystemTrayAppMixin, SingletonInstanceMixin, LazyLiveWhisperTranscriptionAppMixin, EasyTimeSyncParsingMixin):
     # Class variable to track if an instance is already running
     # _SingletonInstanceMixin_env_lock_port_variable_name: str = "LIVE_WHISPER_LOCK_PORT"
     _SingletonInstanceMixin_env_lock_file_name: str = "PHO_LOGTOLABSTREAMINGLAYER_LOCK_FILE"
@@ -44,11 +72,25 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
     # _default_xdf_folder = Path(r'E:\Dropbox (Personal)\Databases\UnparsedData\PhoLogToLabStreamingLayer_logs').resolve()
     xdf_folder: Path = None # Path('/media/halechr/MAX/cloud/University of Michigan Dropbox/Pho Hale/Personal/LabRecordedTextLog').resolve() ## Lab computer
     
-    def __init__(self, root, xdf_folder=None):
+    def __init__(self, root, xdf_folder=None, ingest_port: Optional[int] = None):
+        # Shutdown flag to prevent GUI updates during shutdown; set first, worker/thread callbacks read it as soon as they are started
+        self._shutting_down = False
+
+        # Per-phase startup timings (foreground phases are lapped below, background ones end on their own threads)
+        self.startup_profiler = StartupProfiler()
+        self.startup_profile_report_path: Optional[Path] = None
+        self.startup_profile_tree = None
+        self.startup_profile_summary_label = None
 
         self.init_SingletonInstanceMixin()
+        self.startup_profiler.lap('singleton_lock')
+
+        # Asynchronous leveled logging (rotating file sink; the console panel subscribes once it exists)
+        setup_app_logging(get_app_data_folder('logs'))
+        self.startup_profiler.lap('logging_setup')
 
         self.root = root
+        self.ui_bus = UIUpdateBus(self.root, max_fps=30.0) # all GUI updates from worker threads go through here
         self.root.title("LSL Logger with XDF Recording")
         self.root.geometry("900x720") # WxH
         
@@ -56,6 +98,7 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
 
         # Set application icon
         self.setup_app_icon()
+        self.startup_profiler.lap('window_and_icon')
         self.xdf_folder = (xdf_folder or _default_xdf_folder)
 
         # Recording state
@@ -64,14 +107,41 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
         # self.inlet = None
         self.inlets = {}
         self.outlets = {}
-
-        self.recorded_data = []
+        self.outlet_dispatchers: Dict[str, OutletDispatcher] = {}  # Background pushers for our own marker outlets, keyed by stream name
+        self.outlets_ready_event = threading.Event()  # Set once `setup_lsl_outlet` has attempted every outlet
+        self.outlet_setup_timings: Dict[str, float] = {}  # stream name -> seconds taken to create the outlet
+        self.outlet_setup_status: Dict[str, bool] = {}  # stream name -> whether the outlet was created
+
+        self.recorded_data = []  # data being recovered from a backup (see `recover_from_backup`)
+        self.recording_sinks: Optional[RecordingSinkRouter] = None  # Outputs of the current recording (FIF/CSV and backups when recording in-process, InfluxDB if configured)
+        self._closing_recording_sinks: List[RecordingSinkRouter] = []  # Stopped recordings that may still be saving
+        self.marker_history_db: Optional[MarkerHistoryDB] = None  # Searchable history of every sent/received marker across sessions
+        self.marker_search_window = None
         # self.recording_start_lsl_local_offset = None
         # self.recording_start_datetime = None
 
         self.init_EasyTimeSyncParsingMixin()
-        # Live transcription state
-        self.init_LiveWhisperTranscriptionAppMixin()
+        self.startup_profiler.lap('init_easy_time_sync')
+        # Live transcription state: the in-process mixin (whisper/torch) is imported in the background and initialized, with
+        # its tab, by `_on_live_transcription_mixin_loaded` once that's done
+        self.transcription_active = False
+        self.live_audio_tab = None
+        self.live_transcription_loading_label = None
+        self.live_transcription_ready_event = threading.Event()  # set on the Tk thread once the mixin was loaded and initialized (or failed to load)
+        self.startup_profiler.begin('live_transcription_import')
+        warm_up_imports([live_whisper_transcription_module], on_done=self._on_live_transcription_mixin_imported)
+        self.startup_profiler.lap('live_transcription_import_start')
+        # Start loading the Whisper model in its worker process right away so it overlaps GUI/outlet setup
+        self.use_transcription_worker: bool = is_transcription_worker_enabled()
+        self.transcription_worker: Optional[TranscriptionProcessClient] = None
+        self.transcription_worker_status_label = None
+        self.start_transcription_worker()
+        self.startup_profiler.lap('transcription_worker_spawn')
+        # Recording runs in its own worker process too, isolated from GUI and transcription load
+        self.use_recorder_worker: bool = is_recorder_worker_enabled()
+        self.recorder_worker: Optional[RecorderProcessClient] = None
+        self.start_recorder_worker()
+        self.startup_profiler.lap('recorder_worker_spawn')
 
         # System tray and hotkey state
         self.init_SystemTrayAppMixin()
@@ -81,59 +151,117 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
         
         # Windows taskbar recording indicator
         self.init_RecordingIndicatorIconMixin()
+        self.startup_profiler.lap('init_tray_hotkey_indicator')
         
         # # Singleton lock socket
         # self._lock_socket = None
         
-        # Shutdown flag to prevent GUI updates during shutdown
-        self._shutting_down = False
-        
-        # Timestamp tracking for text entry
+        # Timestamp tracking for text entry (wall-clock datetime for display, LSL local_clock() for the outgoing marker)
         self.main_text_start_editing_timestamp = None
+        self.main_text_start_editing_lsl_timestamp: Optional[float] = None
         self.popover_text_timestamp = None
+        self.popover_text_lsl_timestamp: Optional[float] = None
         
         # EventBoard configuration and outlet
         self.eventboard_config = None
+        self.eventboard_compiled_config: Optional[CompiledEventBoardConfig] = None  # validated config with id/event_name indexes
+        self.eventboard_config_path: Optional[Path] = None
+        self.eventboard_config_watcher: Optional[EventBoardConfigWatcher] = None
+        self.eventboard_frame = None
+        self.eventboard_tab = None
+        self.eventboard_page_frames = {}  # page name -> frame, created the first time the page is shown and then cached
+        self.eventboard_current_page: Optional[str] = None
+        self.eventboard_page_var = None
+        self.eventboard_page_selector_frame = None
+        self.eventboard_pages_container = None
         self.eventboard_outlet = None
         self.eventboard_buttons = {}
+        self.eventboard_cell_frames = {}  # button_id -> container frame (button + time offset entry)
+        self.eventboard_time_offset_entries = {}
+        self.eventboard_original_colors = {}
         self.eventboard_toggle_states = {}  # Track toggle states
         self.eventboard_time_offsets = {}   # Track time offset dropdowns
+        self.eventboard_event_codes: Dict[str, int] = {}  # event_name -> numeric event id for the typed 'EventBoardCodes' outlet
+        self._eventboard_sequence_number = 0
+        self._eventboard_state_lock = threading.Lock()  # guards toggle states + send order, events may fire from the Tk thread and hotkey threads
+        self.eventboard_hotkey_binder: Optional[EventBoardHotkeyBinder] = None
+        self.eventboard_fire_latency: Dict[str, LatencyStats] = {a_source: LatencyStats() for a_source in ('click', 'local_hotkey', 'global_hotkey')}  # trigger -> marker queued, in ms
         
         # Lab-recorder integration
-        self.lab_recorder: Optional[LabRecorder] = None
+        self.lab_recorder = None  # labrecorder.LabRecorder, created in the background by `init_lab_recorder`
+        self.lab_recorder_init_done_event = threading.Event()
+        self._is_start_recording_deferred = False  # a start was requested before LabRecorder finished initializing
         self.discovered_streams: Dict[str, pylsl.StreamInfo] = {}
         self.selected_streams: set = set()
         self._stream_discovery_lock = threading.Lock()  # Lock for thread-safe access to discovered_streams and selected_streams
         self.stream_monitor_thread: Optional[threading.Thread] = None
         self.stream_discovery_active = False
         self.auto_start_attempted = False  # Track if we've tried to auto-start recording
+        self._manual_refresh_thread: Optional[threading.Thread] = None
+        self._manual_refresh_in_progress = False  # While True the continuous discovery worker skips its cycles and uses the manual refresh result
         
         self.capture_stream_start_timestamps() ## `EasyTimeSyncParsingMixin`: capture timestamps for use in LSL streams
         self.capture_recording_start_timestamps() ## capture timestamps for use in LSL streams
+        self.startup_profiler.lap('easy_time_sync_capture')
 
         # Load EventBoard configuration
         self.load_eventboard_config()
+        if self.is_eventboard_typed_outlet_enabled:
+            self.stream_names.append('EventBoardCodes')
+        self.startup_profiler.lap('eventboard_config_load')
+
+        # Open the searchable marker history before the dispatchers so the very first marker is persisted
+        self.start_marker_history_db()
+        self.startup_profiler.lap('marker_history_db_open')
+
+        # Create the outlet dispatchers up-front so messages sent before their outlet exists are buffered, not dropped
+        for a_stream_name in self.own_dispatched_stream_names:
+            self.create_outlet_dispatcher(a_stream_name)
+        self.startup_profiler.lap('outlet_dispatchers_create')
+
+        # Let other local processes push markers through the ingest socket (queued on the dispatchers just created)
+        self.marker_ingest_server: Optional[MarkerIngestServer] = None
+        self.start_marker_ingest_server(ingest_port)
+        self.file_tail_ingest: Optional[FileTailIngest] = None
+        self.start_file_tail_ingest()
+        self.startup_profiler.lap('marker_ingest_start')
         
         # Create GUI elements first
         self.setup_gui()
+        self.startup_profiler.lap('setup_gui')
+        self.start_eventboard_config_watcher()
+        self.setup_eventboard_hotkeys()
+        self.startup_profiler.lap('eventboard_watcher_and_hotkeys')
         
         # Check for recovery files
         self.check_for_recovery()
+        self.startup_profiler.lap('check_for_recovery')
         
         # Create LSL outlets in background thread to avoid blocking GUI
+        self.startup_profiler.begin('outlets')
         threading.Thread(target=self.setup_lsl_outlet, daemon=True).start()
 
-        ## setup transcirption
-        self.root.after(200, self.auto_start_live_transcription)
+        self.startup_profiler.lap('outlet_thread_start')
 
         # Setup system tray and global hotkey
         self.setup_SystemTrayAppMixin()
+        self.startup_profiler.lap('system_tray_setup')
         
-        # Initialize lab-recorder integration
-        self.init_lab_recorder()
+        # Initialize lab-recorder integration off the Tk thread (importing labrecorder is slow); recording start waits for it
+        if not self.use_recorder_worker:
+            self.startup_profiler.begin('lab_recorder_init')
+            threading.Thread(target=self.init_lab_recorder, daemon=True).start()
+
+        # Load the remaining heavy dependencies in the background once the window has had a chance to paint
+        self.startup_profiler.begin('import_warm_up')
+        warm_up_imports(_warm_up_modules, on_done=self._on_import_warm_up_done, start_delay_sec=0.5)
         
         # Start stream discovery after a short delay to allow outlets to be created
         self.root.after(2000, self.start_stream_discovery)
+        self.startup_profiler.lap('background_tasks_start')
+        self.startup_profiler.mark('init_done')
+        self.root.after(0, lambda: self.startup_profiler.mark('event_loop_running')) # first pass through mainloop, i.e. the window is shown
+        self.root.after(_startup_profile_timeout_ms, lambda: self.finish_startup_profile('timeout'))
 
 
     @property
@@ -152,6 +280,11 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
     def outlet_TextLogger(self, value):
         self.outlets['TextLogger'] = value
 
+    @property
+    def is_eventboard_typed_outlet_enabled(self) -> bool:
+        """Whether the numeric 'EventBoardCodes' companion outlet is enabled (`"typed_outlet": true` in eventboard_config.json)"""
+        return bool((self.eventboard_config or {}).get('typed_outlet', False))
+
     @property
     def has_any_inlets(self) -> bool:
         """The has_any_inlets property."""
@@ -159,6 +292,26 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
             return False
         return (self.inlets is not None) and (len(self.inlets) > 0)
 
+    @property
+    def own_dispatched_stream_names(self) -> List[str]:
+        """Names of our own marker streams that are pushed through an `OutletDispatcher`"""
+        stream_names = ['TextLogger', 'EventBoard']
+        if self.is_eventboard_typed_outlet_enabled:
+            stream_names.append('EventBoardCodes')
+        if self.use_transcription_worker:
+            stream_names.append('WhisperLiveLogger') # segments arrive from the worker process and are pushed by us
+        return stream_names
+
+    @property
+    def has_any_recording_sources(self) -> bool:
+        """Whether legacy recording has anything to record: network inlets for foreign streams or our own dispatcher-backed outlets (recorded in-process).
+
+        Dispatchers exist from startup to buffer early messages, so only those whose outlet has been created count.
+        """
+        if self._shutting_down:
+            return False
+        return self.has_any_inlets or any(a_dispatcher.is_outlet_attached for a_dispatcher in list(self.outlet_dispatchers.values()))
+
 
     def parse_time_offset(self, time_str):
         """Parse time offset string (e.g., '5s', '2m', '1h') to seconds"""
@@ -188,6 +341,14 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
             return 0
 
 
+    def capture_input_lsl_timestamp(self, time_offset_seconds: float = 0.0) -> float:
+        """Capture the LSL timestamp of a user input event, shifted back by `time_offset_seconds` (as returned by `parse_time_offset`).
+
+        Call this first thing in an input handler so the marker is stamped with when the user acted rather than when it is pushed.
+        """
+        return pylsl.local_clock() - float(time_offset_seconds or 0.0)
+
+
 
     # ---------------------------------------------------------------------------- #
     #                               Recording Methods                              #
@@ -205,112 +366,163 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
         stream_names: List[str] = self.stream_names # ['TextLogger', 'EventBoard', 'WhisperLiveLogger']
         were_any_success: bool = False
         for a_stream_name in stream_names:
-            should_remove_stream: bool = False
-            try:
-                # Look for our own stream
-                found_streams = pylsl.resolve_byprop('name', a_stream_name, timeout=2.0)
-                if found_streams:
-                    self.inlets[a_stream_name] = pylsl.StreamInlet(found_streams[0])
-                    print("Recording inlet created successfully")
-                    were_any_success = True                        
-                else:
-                    print(f"Could not find '{a_stream_name}' stream for recording")
-                    should_remove_stream = True
-
-            except Exception as e:
-                print(f"Error creating recording inlet for stream named '{a_stream_name}': {e}")
-                should_remove_stream = True
-
-            if (a_stream_name in self.inlets) and should_remove_stream:
-                _a_removed_stream = self.inlets.pop(a_stream_name)
-                if _a_removed_stream is not None:
-                    print(f'WARN: removed stream named "{a_stream_name}" from self.inlets.')
+            if a_stream_name in self.outlet_dispatchers:
+                continue # recorded in-process by the loopback tap, no network inlet needed
+            if self._setup_recording_inlet_for_stream(a_stream_name):
+                were_any_success = True
 
         ## END for a_stream_name in stream_names...
         # Update LSL status label when inlets are successfully set up
-        if were_any_success and self.inlets:
-            connected_streams = ', '.join(self.inlets.keys())
-            try:
-                if not self._shutting_down:
-                    self.root.after(0, lambda streams=connected_streams: self.lsl_status_label.config(text=f"LSL Status: Ready - {streams}", foreground="green"))
-            except tk.TclError:
-                pass  # GUI is being destroyed
+        if were_any_success:
+            self._update_lsl_status_for_inlets()
         # Note: Auto-start recording is now triggered after streams are discovered
         # (see stream_discovery_worker for when new streams are found)
 
 
-    def setup_lsl_outlet(self):
-        """Create an LSL outlet for sending messages
+    def _setup_recording_inlet_for_stream(self, a_stream_name: str, timeout: float = 2.0) -> bool:
+        """Resolve our own stream named `a_stream_name` and create a recording inlet for it
 
         Modifies: self.inlets
 
+        Returns True if the inlet was created.
+        """
+        should_remove_stream: bool = False
+        was_success: bool = False
+        try:
+            # Look for our own stream (resolve_byprop returns as soon as it is found, so no fixed delay is needed after outlet creation)
+            found_streams = pylsl.resolve_byprop('name', a_stream_name, timeout=timeout)
+            if found_streams:
+                self.inlets[a_stream_name] = pylsl.StreamInlet(found_streams[0])
+                print(f"Recording inlet for '{a_stream_name}' created successfully")
+                was_success = True
+            else:
+                print(f"Could not find '{a_stream_name}' stream for recording")
+                should_remove_stream = True
+
+        except Exception as e:
+            print(f"Error creating recording inlet for stream named '{a_stream_name}': {e}")
+            should_remove_stream = True
+
+        if (a_stream_name in self.inlets) and should_remove_stream:
+            _a_removed_stream = self.inlets.pop(a_stream_name)
+            if _a_removed_stream is not None:
+                print(f'WARN: removed stream named "{a_stream_name}" from self.inlets.')
+        return was_success
+
+
+    def _update_lsl_status_for_inlets(self):
+        """Show the currently connected recording inlets in the LSL status label (safe to call from any thread)"""
+        if not self.inlets:
+            return
+        connected_streams = ', '.join(self.inlets.keys())
+        try:
+            if not self._shutting_down:
+                self.ui_bus.post('lsl_status_label', lambda streams=connected_streams: self.lsl_status_label.config(text=f"LSL Status: Ready - {streams}", foreground="green"))
+        except tk.TclError:
+            pass  # GUI is being destroyed
+
+
+    def wait_for_outlets_ready(self, timeout: Optional[float] = None) -> bool:
+        """Block until `setup_lsl_outlet` has finished attempting every outlet (successfully or not). Returns False on timeout."""
+        return self.outlets_ready_event.wait(timeout=timeout)
+
+
+    def setup_lsl_outlet(self):
+        """Create the LSL outlets for sending messages
+
+        Each outlet is created on its own thread with independent error handling, so one failing outlet neither blocks
+        nor prevents the others. As soon as an outlet is ready its recording inlet is set up. `self.outlets_ready_event`
+        is set once every outlet has been attempted.
+
+        Modifies: self.outlets, self.inlets, self.outlet_setup_timings
+
         """
         stream_setup_fn_dict: Dict = {
             'TextLogger': self.setup_TextLogger_outlet,
             'EventBoard': self.setup_eventboard_outlet,
-            'WhisperLiveLogger': self.setup_lsl_outlet_LiveWhisperTranscriptionAppMixin,
+            'WhisperLiveLogger': self.setup_live_transcription_outlet,
         }
-        were_any_success: bool = False
+        if self.is_eventboard_typed_outlet_enabled:
+            stream_setup_fn_dict['EventBoardCodes'] = self.setup_eventboard_typed_outlet
         print(f'setup_lsl_outlet():')
         print(f'\tstream_setup_fn_dict: {stream_setup_fn_dict}')
+        self.outlets_ready_event.clear()
+        setup_start_t = time.perf_counter()
+
+        setup_threads: List[threading.Thread] = []
         for a_stream_name, a_setup_fn in stream_setup_fn_dict.items():
+            a_thread = threading.Thread(target=self._setup_single_lsl_outlet, args=(a_stream_name, a_setup_fn), name=f"setup_outlet-{a_stream_name}", daemon=True)
+            a_thread.start()
+            setup_threads.append(a_thread)
+
+        ## Readiness barrier: wait for every outlet to be attempted
+        for a_thread in setup_threads:
+            a_thread.join()
+        self.outlets_ready_event.set()
+
+        ready_outlets = [a_name for a_name, a_ok in self.outlet_setup_status.items() if a_ok]
+        failed_outlets = [a_name for a_name, a_ok in self.outlet_setup_status.items() if not a_ok]
+        self.startup_profiler.end('outlets', details={'ready': ready_outlets, 'failed': failed_outlets})
+        print(f'done. {len(ready_outlets)}/{len(stream_setup_fn_dict)} outlets ready in {(time.perf_counter() - setup_start_t) * 1000.0:.1f} ms (failed: {failed_outlets})')
+
+
+    def _setup_single_lsl_outlet(self, a_stream_name: str, a_setup_fn: Callable):
+        """Create one outlet (on its own thread), log its timing and set up its recording inlet as soon as it is ready"""
+        a_start_t = time.perf_counter()
+        was_success: bool = False
+        try:
+            # Create stream info
+            a_setup_fn() ## just setup
+            # Setup functions that handle their own errors leave a None outlet behind on failure
+            was_success = (self.outlets.get(a_stream_name, True) is not None)
+        except Exception as e:
+            print(f'\terror in "{a_stream_name}" setup: {e}')
             try:
-                # Create stream info
-                a_setup_fn() ## just setup
-                were_any_success = True
-            
-                # Update LSL status label safely
-                try:
-                    if not self._shutting_down:
-                        self.root.after(0, lambda name=a_stream_name: self.lsl_status_label.config(text=f"LSL Status: Connected - {name}", foreground="green"))
-                except tk.TclError:
-                    pass  # GUI is being destroyed
-                print(f'\tfinished: "{a_stream_name}" setup.')
-                
-            except Exception as e:
-                print(f'\terror in "{a_stream_name}" setup: {e}')
-                try:
-                    if not self._shutting_down:
-                        self.root.after(0, lambda name=a_stream_name, err=str(e): self.lsl_status_label.config(text=f"LSL Status: Error - {name} - {err}", foreground="red"))
-                except tk.TclError:
-                    pass  # GUI is being destroyed
-                raise
+                if not self._shutting_down:
+                    self.ui_bus.post('lsl_status_label', lambda name=a_stream_name, err=str(e): self.lsl_status_label.config(text=f"LSL Status: Error - {name} - {err}", foreground="red"))
+            except tk.TclError:
+                pass  # GUI is being destroyed
 
-        ## END for a_stream_name, a_setup_fn in stream_setup_fn_dict...
-        print(f'done.')
+        elapsed_sec = time.perf_counter() - a_start_t
+        self.outlet_setup_timings[a_stream_name] = elapsed_sec
+        self.outlet_setup_status[a_stream_name] = was_success
+        self.startup_profiler.record(f'outlet:{a_stream_name}', a_start_t, a_start_t + elapsed_sec, background=True, details={'ok': was_success})
+        if not was_success:
+            print(f'\tfailed: "{a_stream_name}" setup after {elapsed_sec * 1000.0:.1f} ms.')
+            return
 
-        if were_any_success:
-            # Setup inlet for recording our own stream (with delay to allow outlet to be discovered)
-            # Run in background thread to avoid blocking GUI, but schedule GUI updates on main thread
-            def delayed_setup_inlet():
-                time.sleep(1.0)  # Wait for outlets to be discoverable
-                self.setup_recording_inlet()
-            threading.Thread(target=delayed_setup_inlet, daemon=True).start()
+        print(f'\tfinished: "{a_stream_name}" setup in {elapsed_sec * 1000.0:.1f} ms.')
+        # Update LSL status label safely
+        try:
+            if not self._shutting_down:
+                self.ui_bus.post('lsl_status_label', lambda name=a_stream_name: self.lsl_status_label.config(text=f"LSL Status: Connected - {name}", foreground="green"))
+        except tk.TclError:
+            pass  # GUI is being destroyed
+
+        # Setup inlet for recording our own stream right away (we're already off the GUI thread)
+        if self._shutting_down:
+            return
+        dispatcher = self.outlet_dispatchers.get(a_stream_name)
+        if dispatcher is not None:
+            if not dispatcher.is_outlet_attached:
+                self.start_outlet_dispatcher(a_stream_name, self.outlets[a_stream_name]) # outlets created by mixins don't attach their dispatcher themselves
+            return # pushed through our own dispatcher, so it is recorded in-process by the loopback tap
+        if self._setup_recording_inlet_for_stream(a_stream_name):
+            self._update_lsl_status_for_inlets()
    
 
     def setup_TextLogger_outlet(self):
         """Create an LSL outlet for sending messages"""
         try:
             # Create stream info
-            info = pylsl.StreamInfo(
-                name='TextLogger',
-                type='Markers',
-                channel_count=1,
-                nominal_srate=pylsl.IRREGULAR_RATE,
-                channel_format=pylsl.cf_string,
-                source_id='textlogger_001'
-            )
-            
-            # Add some metadata
-            info.desc().append_child_value("manufacturer", "PhoLogToLabStreamingLayer")
-            info.desc().append_child_value("version", "2.1")
-            info.desc().append_child_value("description", "TextLogger user entered text logs events")
+            info = make_textlogger_stream_info()
 
             ## add a custom timestamp field to the stream info:
             info = self.EasyTimeSyncParsingMixin_add_lsl_outlet_info(info=info)
 
             # Create outlet
             self.outlet_TextLogger = pylsl.StreamOutlet(info)
+            self.start_outlet_dispatcher('TextLogger', self.outlet_TextLogger)
             print("TextLogger LSL outlet created successfully")
 
         except Exception as e:
@@ -318,7 +530,7 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
             self.outlet_TextLogger = None
             try:
                 if not self._shutting_down:
-                    self.lsl_status_label.config(text=f"LSL Status: Error - {str(e)}", foreground="red")
+                    self.ui_bus.post('lsl_status_label', lambda err=str(e): self.lsl_status_label.config(text=f"LSL Status: Error - {err}", foreground="red"))
             except tk.TclError:
                 pass  # GUI is being destroyed
             
@@ -327,19 +539,7 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
         """Create an LSL outlet for EventBoard events"""
         try:
             # Create stream info for EventBoard
-            info = pylsl.StreamInfo(
-                name='EventBoard',
-                type='Markers',
-                channel_count=1,
-                nominal_srate=pylsl.IRREGULAR_RATE,
-                channel_format=pylsl.cf_string,
-                source_id='eventboard_001'
-            )
-            
-            # Add some metadata
-            info.desc().append_child_value("manufacturer", "PhoLogToLabStreamingLayer")
-            info.desc().append_child_value("version", "2.1")
-            info.desc().append_child_value("description", "EventBoard button events")
+            info = make_eventboard_stream_info()
 
             ## add a custom timestamp field to the stream info:
             info = self.EasyTimeSyncParsingMixin_add_lsl_outlet_info(info=info)
@@ -355,6 +555,7 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
             
             # Create outlet
             self.outlets['EventBoard'] = pylsl.StreamOutlet(info)
+            self.start_outlet_dispatcher('EventBoard', self.outlets['EventBoard'])
             print("EventBoard LSL outlet created successfully")
             
         except Exception as e:
@@ -362,6 +563,399 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
             self.outlets['EventBoard'] = None
     
 
+    def setup_eventboard_typed_outlet(self):
+        """Create the numeric companion outlet for EventBoard events ('EventBoardCodes')
+
+        Channels: event_id, toggle_state (1=ON, 0=OFF, -1=instantaneous), offset_seconds, sequence_number.
+        The event_id -> event_name table is written to the stream's desc XML under <events>.
+        """
+        try:
+            info = make_eventboard_codes_stream_info(self.eventboard_compiled_config)
+
+            ## add a custom timestamp field to the stream info:
+            info = self.EasyTimeSyncParsingMixin_add_lsl_outlet_info(info=info)
+
+            # Create outlet
+            self.outlets['EventBoardCodes'] = pylsl.StreamOutlet(info)
+            self.start_outlet_dispatcher('EventBoardCodes', self.outlets['EventBoardCodes'])
+            print("EventBoardCodes LSL outlet created successfully")
+
+        except Exception as e:
+            print(f"Error creating EventBoardCodes LSL outlet: {e}")
+            self.outlets['EventBoardCodes'] = None
+
+
+    def create_outlet_dispatcher(self, stream_name: str) -> OutletDispatcher:
+        """Create and start the background dispatcher for `stream_name` with no outlet yet (messages are buffered until one is attached)"""
+        dispatcher = OutletDispatcher(stream_name, outlet=None, on_error=self._on_outlet_dispatcher_error)
+        dispatcher.add_push_listener(self._on_own_samples_pushed)
+        dispatcher.add_push_listener(self._on_own_samples_pushed_to_marker_history)
+        dispatcher.start()
+        self.outlet_dispatchers[stream_name] = dispatcher
+        return dispatcher
+
+
+    def start_outlet_dispatcher(self, stream_name: str, outlet: pylsl.StreamOutlet) -> OutletDispatcher:
+        """Attach `outlet` to the dispatcher for `stream_name` (creating it if needed), flushing any buffered messages with their original timestamps"""
+        dispatcher = self.outlet_dispatchers.get(stream_name)
+        if dispatcher is None:
+            dispatcher = self.create_outlet_dispatcher(stream_name)
+        n_buffered = dispatcher.queue_depth
+        dispatcher.attach_outlet(outlet)
+        if n_buffered > 0:
+            lsl_logger.info("Flushing %d buffered message(s) to the new '%s' outlet", n_buffered, stream_name)
+        return dispatcher
+
+
+    def _on_own_samples_pushed(self, stream_name: str, samples: list, timestamps: list):
+        """In-process loopback tap: record our own samples at push time with the exact timestamps given to the outlet (called on the dispatcher thread)"""
+        if self.recording and not self._shutting_down:
+            self.write_recorded_samples(stream_name, samples, timestamps)
+        worker = self.recorder_worker
+        if worker is not None:
+            worker.submit_samples(stream_name, samples, timestamps) # ignored unless the worker is recording (legacy)
+
+
+    def _on_own_samples_pushed_to_marker_history(self, stream_name: str, samples: list, timestamps: list):
+        """Persist our own sent markers to the marker history database (called on the dispatcher thread)"""
+        for a_sample, a_timestamp in zip(samples, timestamps):
+            self.add_marker_to_history(stream_name, 'sent', a_sample, a_timestamp)
+
+
+    def _on_outlet_dispatcher_error(self, stream_name: str, error: Exception):
+        """Report a failed push from a dispatcher thread in the log display"""
+        if self._shutting_down:
+            return
+        try:
+            self.ui_bus.post_ordered(lambda: self.update_log_display(f"Failed to send {stream_name} LSL message: {error}", datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
+        except (tk.TclError, RuntimeError):
+            pass  # GUI is being destroyed
+
+
+    def get_outlet_dispatcher_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Queue depth, buffered/dropped counters and push latency metrics for each outlet dispatcher"""
+        return {a_name: a_dispatcher.get_metrics() for a_name, a_dispatcher in self.outlet_dispatchers.items()}
+
+
+    def stop_outlet_dispatchers(self):
+        """Flush and stop all outlet dispatchers"""
+        for a_name, a_dispatcher in list(self.outlet_dispatchers.items()):
+            if not a_dispatcher.is_outlet_attached and a_dispatcher.queue_depth > 0:
+                lsl_logger.warning("Discarding %d message(s) buffered for '%s', its outlet was never created", a_dispatcher.queue_depth, a_name)
+            a_dispatcher.stop()
+            lsl_logger.info("Outlet dispatcher '%s' stopped: %s", a_name, a_dispatcher.get_metrics())
+        self.outlet_dispatchers.clear()
+
+
+    # ---------------------------------------------------------------------------- #
+    #                     Marker Ingest (Socket and File Tail)                     #
+    # ---------------------------------------------------------------------------- #
+
+    def start_marker_ingest_server(self, port: Optional[int] = None):
+        """Start the local marker ingest socket (port None for the default, 0 to disable it)"""
+        port = get_default_ingest_port() if port is None else int(port)
+        if not port:
+            lsl_logger.info("Marker ingest socket disabled")
+            return
+        server = MarkerIngestServer(get_dispatcher=self.outlet_dispatchers.get, fire_event=self._fire_ingested_eventboard_event, port=port)
+        if server.start():
+            self.marker_ingest_server = server
+
+
+    def stop_marker_ingest_server(self):
+        """Disconnect ingest clients and close the socket"""
+        if self.marker_ingest_server is None:
+            return
+        self.marker_ingest_server.stop()
+        lsl_logger.info("Marker ingest socket stopped: %s", {a_key: a_value for a_key, a_value in self.marker_ingest_server.get_metrics().items() if a_key not in ('clients', 'recent_clients')})
+        self.marker_ingest_server = None
+
+
+    def start_file_tail_ingest(self):
+        """Follow the instrument log files listed in `file_tail_config.json` (if there is one)"""
+        try:
+            self.file_tail_ingest = create_file_tail_ingest_from_config(get_dispatcher=self.outlet_dispatchers.get, fire_event=self._fire_ingested_eventboard_event)
+        except FileTailConfigError as e:
+            lsl_logger.error("File tailing disabled: %s", e)
+            return
+        if self.file_tail_ingest is not None:
+            self.file_tail_ingest.start()
+
+
+    def stop_file_tail_ingest(self):
+        """Stop following files (their read offsets are checkpointed)"""
+        if self.file_tail_ingest is None:
+            return
+        self.file_tail_ingest.stop()
+        lsl_logger.info("File tailing stopped: %s", self.file_tail_ingest.get_metrics())
+        self.file_tail_ingest = None
+
+
+    def _fire_ingested_eventboard_event(self, button_id: str, time_offset_seconds: float, lsl_timestamp: float) -> bool:
+        """`MarkerIngestServer`/`FileTailIngest` callback for EventBoard events (ingest thread): fire now, show it via the UI bus"""
+        if self._shutting_down:
+            return False
+        result = self.fire_eventboard_event(button_id, time_offset_seconds=time_offset_seconds, source='ingest', lsl_timestamp=lsl_timestamp)
+        if result is None:
+            return False
+        new_state, log_message, actual_timestamp = result
+        self.ui_bus.post_ordered(lambda: self._show_eventboard_event_fired(button_id, new_state, f"{log_message} [ingest]", actual_timestamp))
+        return True
+
+
+    # ---------------------------------------------------------------------------- #
+    #                     Out-of-Process Live Transcription                         #
+    # ---------------------------------------------------------------------------- #
+
+    def _on_live_transcription_mixin_imported(self, import_timings: Dict[str, float]):
+        """The in-process transcription mixin finished importing (or failed to) on its warm-up thread"""
+        self.startup_profiler.end('live_transcription_import', details={'ok': is_live_whisper_transcription_loaded()})
+        self.ui_bus.post_ordered(self._on_live_transcription_mixin_loaded)
+
+
+    def _on_live_transcription_mixin_loaded(self):
+        """Initialize the transcription mixin and build its controls in the Live Audio tab (Tk thread, after `setup_gui`)"""
+        try:
+            if not is_live_whisper_transcription_loaded():
+                transcription_logger.error("Live transcription is unavailable: its module could not be imported")
+                if self.live_transcription_loading_label is not None:
+                    self.live_transcription_loading_label.config(text="Live transcription unavailable (see log)", foreground="red")
+                return
+            self.init_LiveWhisperTranscriptionAppMixin()
+            if self._shutting_down:
+                return
+            if self.live_transcription_loading_label is not None:
+                self.live_transcription_loading_label.destroy()
+                self.live_transcription_loading_label = None
+            self.setup_gui_LiveWhisperTranscriptionAppMixin(self.live_audio_tab, row=0)
+        except tk.TclError:
+            pass  # GUI is being destroyed
+        finally:
+            self.live_transcription_ready_event.set() # lets `setup_live_transcription_outlet` go ahead
+        self.root.after(200, self.auto_start_live_transcription)
+
+
+    def setup_live_transcription_outlet(self):
+        """Create the WhisperLiveLogger outlet through the transcription mixin once it has been initialized (outlet setup thread)"""
+        self.live_transcription_ready_event.wait()
+        if not is_live_whisper_transcription_loaded():
+            raise RuntimeError("live transcription module could not be imported")
+        self.setup_lsl_outlet_LiveWhisperTranscriptionAppMixin()
+
+
+    def start_transcription_worker(self):
+        """Spawn the transcription worker process; it imports torch and loads the Whisper model in parallel with the rest of startup"""
+        if not self.use_transcription_worker:
+            return
+        self.transcription_worker = TranscriptionProcessClient(on_segment=self._on_transcription_worker_segment, on_status=self._on_transcription_worker_status, model_name=get_whisper_model_name())
+        self.startup_profiler.begin('transcription_model_load')
+        try:
+            self.transcription_worker.start_process()
+            transcription_logger.info("Transcription worker process started (model '%s')", self.transcription_worker.model_name)
+        except Exception as e:
+            transcription_logger.error("Could not start the transcription worker process: %s", e)
+            self._fall_back_to_in_process_transcription(str(e))
+
+
+    def stop_transcription_worker(self, timeout: float = 5.0):
+        """Shut down the transcription worker process (if any)"""
+        worker, self.transcription_worker = self.transcription_worker, None
+        if worker is not None:
+            worker.shutdown(timeout=timeout)
+            transcription_logger.info("Transcription worker stopped (%d segment(s) received)", worker.segments_received)
+
+
+    def _fall_back_to_in_process_transcription(self, reason: str):
+        """Switch to the in-process transcription of `LiveWhisperTranscriptionAppMixin` after the worker failed (Tk thread)"""
+        if not self.use_transcription_worker:
+            return
+        transcription_logger.warning("Falling back to in-process transcription: %s", reason)
+        self.use_transcription_worker = False
+        worker, self.transcription_worker = self.transcription_worker, None
+        if worker is not None:
+            threading.Thread(target=worker.shutdown, name="TranscriptionWorkerShutdown", daemon=True).start()
+        was_transcribing: bool = self.transcription_active
+
+        # The mixin pushes to its outlet directly, so its samples are recorded through a regular inlet again
+        dispatcher = self.outlet_dispatchers.pop('WhisperLiveLogger', None)
+        if dispatcher is not None:
+            dispatcher.stop()
+        if (self.outlets or {}).get('WhisperLiveLogger') is not None:
+            threading.Thread(target=lambda: self._setup_recording_inlet_for_stream('WhisperLiveLogger') and self._update_lsl_status_for_inlets(), daemon=True).start()
+
+        self._update_transcription_worker_status_label()
+        if was_transcribing and not self._shutting_down:
+            self.transcription_active = False
+            super().start_live_transcription()
+
+
+    def _on_transcription_worker_segment(self, text: str, lsl_timestamp: float, duration_seconds: float):
+        """Push a transcribed segment to the WhisperLiveLogger outlet with the timestamp of its audio (worker reader thread)"""
+        dispatcher = self.outlet_dispatchers.get('WhisperLiveLogger')
+        if dispatcher is None:
+            return
+        if not dispatcher.submit([text], timestamp=lsl_timestamp):
+            lsl_logger.warning("WhisperLiveLogger queue is full, dropped transcription segment")
+        transcription_logger.info("[%.1fs] %s", duration_seconds, text)
+
+
+    def _on_transcription_worker_status(self, state: str, info: Dict[str, Any]):
+        """Progress/readiness/errors reported by the worker (worker reader thread)"""
+        if self._shutting_down:
+            return
+        if state == 'ready':
+            self.startup_profiler.end('transcription_model_load', details=info)
+            transcription_logger.info("Whisper model '%s' ready on %s after %.1f s (worker process)", info.get('model'), info.get('device'), info.get('load_seconds', 0.0))
+        elif state == 'error':
+            transcription_logger.error("Transcription worker: %s", info.get('error'))
+        elif state == 'failed':
+            self.startup_profiler.end('transcription_model_load', details={'failed': info.get('error')})
+            transcription_logger.error("Transcription worker failed: %s", info.get('error'))
+            self.ui_bus.post_ordered(lambda reason=info.get('error', ''): self._fall_back_to_in_process_transcription(reason))
+        self.ui_bus.post('transcription_worker_status', self._update_transcription_worker_status_label)
+
+
+    def _update_transcription_worker_status_label(self):
+        """Show the worker's loading progress/state in the Live Audio tab (Tk thread)"""
+        if self.transcription_worker_status_label is None:
+            return
+        worker = self.transcription_worker
+        if worker is None:
+            text, color = "Transcription engine: in-process", "gray"
+        elif worker.state in ('starting', 'importing', 'loading_model'):
+            text, color = f"Transcription engine: loading '{worker.model_name}' model... ({worker.progress * 100.0:.0f}%)", "orange"
+        elif worker.state in ('error', 'failed'):
+            text, color = f"Transcription engine: {worker.last_error}", "red"
+        else:
+            device = worker.ready_info.get('device', '?')
+            text, color = f"Transcription engine: worker process, '{worker.model_name}' on {device} ({worker.state})", "green"
+        try:
+            self.transcription_worker_status_label.config(text=text, foreground=color)
+        except tk.TclError:
+            pass  # GUI is being destroyed
+
+
+    def auto_start_live_transcription(self, *args, **kwargs):
+        """Start transcribing on launch; with the worker the start is queued until its model has loaded"""
+        if not self.use_transcription_worker:
+            return super().auto_start_live_transcription(*args, **kwargs)
+        self.start_live_transcription()
+
+
+    def start_live_transcription(self, *args, **kwargs):
+        """Start live transcription in the worker process (or in-process via `LiveWhisperTranscriptionAppMixin` when the worker is disabled/failed)"""
+        if not self.use_transcription_worker:
+            return super().start_live_transcription(*args, **kwargs)
+        self.transcription_worker.start_transcription()
+        self.transcription_active = True
+        transcription_logger.info("Live transcription started%s", "" if self.transcription_worker.is_ready else " (waiting for the model to load)")
+
+
+    def stop_live_transcription(self, *args, **kwargs):
+        """Stop live transcription (the worker keeps its model loaded for the next start)"""
+        if not self.use_transcription_worker:
+            return super().stop_live_transcription(*args, **kwargs)
+        self.transcription_worker.stop_transcription()
+        self.transcription_active = False
+        transcription_logger.info("Live transcription stopped")
+
+
+    # ---------------------------------------------------------------------------- #
+    #                          Out-of-Process Recording                            #
+    # ---------------------------------------------------------------------------- #
+
+    def start_recorder_worker(self):
+        """Spawn the recorder worker process; it creates its LabRecorder in parallel with the rest of startup"""
+        if not self.use_recorder_worker:
+            return
+        self.recorder_worker = RecorderProcessClient(on_status=self._on_recorder_worker_status, on_stopped=self._on_recorder_worker_stopped, on_received=self._on_recorder_worker_received)
+        self.startup_profiler.begin('recorder_worker_ready')
+        try:
+            self.recorder_worker.start_process()
+            recording_logger.info("Recorder worker process started")
+        except Exception as e:
+            recording_logger.error("Could not start the recorder worker process: %s", e)
+            self.recorder_worker = None
+            self.use_recorder_worker = False
+            self.startup_profiler.end('recorder_worker_ready', details={'failed': str(e)})
+
+
+    def stop_recorder_worker(self, timeout: float = 30.0):
+        """Shut down the recorder worker process (if any), waiting for it to finish saving"""
+        worker, self.recorder_worker = self.recorder_worker, None
+        if worker is not None:
+            worker.shutdown(timeout=timeout)
+            recording_logger.info("Recorder worker stopped: %s", worker.get_metrics())
+
+
+    def _fall_back_to_in_process_recording(self, reason: str):
+        """Record in-process (`recording_worker`/`legacy_recording_worker`) after the recorder worker died (Tk thread)"""
+        if not self.use_recorder_worker:
+            return
+        recording_logger.warning("Falling back to in-process recording: %s", reason)
+        self.use_recorder_worker = False
+        worker, self.recorder_worker = self.recorder_worker, None
+        if worker is not None:
+            threading.Thread(target=worker.shutdown, kwargs={'timeout': 1.0}, name="RecorderWorkerShutdown", daemon=True).start()
+        self.startup_profiler.begin('lab_recorder_init')
+        threading.Thread(target=self.init_lab_recorder, daemon=True).start()
+        if self.recording and not self._shutting_down:
+            # Whatever the worker recorded up to its last backup is offered for recovery on the next start
+            self.update_log_display(f"Recorder process failed ({reason}); continuing the recording in-process in a new file", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+            self.recording = False
+            self.start_new_split_recording()
+
+
+    def _start_recording_in_worker(self):
+        """Hand the recording set up by `_common_initiate_recording` to the worker (called on the recording thread)"""
+        selected_stream_infos = self.get_selected_streams() if self.is_lab_recorder_available(wait_timeout=10.0) else []
+        self.recorder_worker.start_recording(self.xdf_filename, stream_infos=selected_stream_infos, inlet_stream_names=list((self.inlets or {}).keys()),
+                                             recording_start_datetime=self.recording_start_datetime, recording_start_lsl_local_offset=self.recording_start_lsl_local_offset)
+
+
+    def _on_recorder_worker_status(self, state: str, info: Dict[str, Any]):
+        """Readiness/recording state/warnings/errors reported by the worker (worker reader thread)"""
+        if state == 'ready':
+            self.startup_profiler.end('recorder_worker_ready', details=info)
+            recording_logger.info("Recorder worker ready after %.1f s (LabRecorder %s)", info.get('load_seconds', 0.0), "available" if info.get('lab_recorder_available') else f"not available: {info.get('lab_recorder_error')}")
+            return
+        if state == 'recording':
+            recording_logger.info("Recorder worker recording to %s (%s)", info.get('filename'), info.get('method'))
+            return
+        if state in ('warning', 'error'):
+            message = info.get('message') or info.get('error')
+            recording_logger.warning("Recorder worker: %s", message)
+            if not self._shutting_down:
+                self.ui_bus.post_ordered(lambda: self.update_log_display(f"Recorder: {message}", datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
+        elif state == 'failed':
+            recording_logger.error("Recorder worker failed: %s", info.get('error'))
+            self.startup_profiler.end('recorder_worker_ready', details={'failed': info.get('error')})
+            if not self._shutting_down:
+                self.ui_bus.post_ordered(lambda reason=info.get('error', ''): self._fall_back_to_in_process_recording(reason))
+
+
+    def _on_recorder_worker_stopped(self, filename: str, info: Dict[str, Any]):
+        """A recording was stopped and saved by the worker (worker reader thread)"""
+        if info.get('method') == 'LabRecorder':
+            _status_str = f"LabRecorder XDF file saved: '{filename}'"
+        elif info.get('error'):
+            _status_str = f"Recording '{os.path.basename(filename)}' could not be saved: {info['error']}"
+        else:
+            _status_str = (f"FIF file saved: '{info.get('fif_path')}'\n"
+                f"Events CSV saved: '{info.get('csv_path')}'\n"
+                f"Recorded {info.get('sample_count')} samples")
+        recording_logger.info(_status_str)
+        if not self._shutting_down:
+            self.ui_bus.post_ordered(lambda: self.update_log_display(_status_str, timestamp=None))
+
+
+    def _on_recorder_worker_received(self, stream_name: str, samples: list, timestamps: list):
+        """Samples the worker recorded from foreign streams go to the marker history and the GUI-side recording sinks (worker reader thread)"""
+        for a_sample, a_timestamp in zip(samples, timestamps):
+            self.add_marker_to_history(stream_name, 'received', a_sample, a_timestamp)
+        self.write_recorded_samples(stream_name, samples, timestamps)
+
+
     # ==================================================================================================================================================================================================================================================================================== #
     # Other GUI/Status Methods                                                                                                                                                                                                                                                             #
     # ==================================================================================================================================================================================================================================================================================== #
@@ -375,11 +969,13 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
     def on_main_text_change(self, event=None):
         """Track when user first types in main text field"""
         if self.main_text_start_editing_timestamp is None:
+            self.main_text_start_editing_lsl_timestamp = self.capture_input_lsl_timestamp()
             self.main_text_start_editing_timestamp = datetime.now()
     
     def on_popover_text_change(self, event=None):
         """Track when user first types in popover text field"""
         if self.popover_text_timestamp is None:
+            self.popover_text_lsl_timestamp = self.capture_input_lsl_timestamp()
             self.popover_text_timestamp = datetime.now()
     
     def on_main_text_clear(self, event=None):
@@ -388,6 +984,7 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
             # Check if field is now empty
             if not self.text_entry.get().strip():
                 self.main_text_start_editing_timestamp = None
+                self.main_text_start_editing_lsl_timestamp = None
     
     def on_popover_text_clear(self, event=None):
         """Reset timestamp when popover text field is cleared"""
@@ -395,25 +992,42 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
             # Check if field is now empty
             if not self.quick_log_entry.get().strip():
                 self.popover_text_timestamp = None
+                self.popover_text_lsl_timestamp = None
     
     def get_main_text_timestamp(self):
         """Get the timestamp when user first started typing in main field"""
+        return self.get_main_text_timestamps()[0]
+
+    def get_main_text_timestamps(self) -> Tuple[datetime, float]:
+        """Get the (datetime, LSL timestamp) when user first started typing in main field, resetting them for the next entry"""
         if self.main_text_start_editing_timestamp:
             ## check if we were previously editing (meaning the self.main_text_timestamp) was set to a previous datetime:
             timestamp = deepcopy(self.main_text_start_editing_timestamp)
+            lsl_timestamp = self.main_text_start_editing_lsl_timestamp
             self.main_text_start_editing_timestamp = None  # Reset for next entry
-            return timestamp
+            self.main_text_start_editing_lsl_timestamp = None
+            if lsl_timestamp is None:
+                lsl_timestamp = self.capture_input_lsl_timestamp()
+            return timestamp, lsl_timestamp
         else:
             ## otherwise return the current datetime 
-            return datetime.now()
+            return datetime.now(), self.capture_input_lsl_timestamp()
     
     def get_popover_text_timestamp(self):
         """Get the timestamp when user first started typing in popover field"""
+        return self.get_popover_text_timestamps()[0]
+
+    def get_popover_text_timestamps(self) -> Tuple[datetime, float]:
+        """Get the (datetime, LSL timestamp) when user first started typing in popover field, resetting them for the next entry"""
         if self.popover_text_timestamp:
             timestamp = deepcopy(self.popover_text_timestamp)
+            lsl_timestamp = self.popover_text_lsl_timestamp
             self.popover_text_timestamp = None  # Reset for next entry
-            return timestamp
-        return datetime.now()
+            self.popover_text_lsl_timestamp = None
+            if lsl_timestamp is None:
+                lsl_timestamp = self.capture_input_lsl_timestamp()
+            return timestamp, lsl_timestamp
+        return datetime.now(), self.capture_input_lsl_timestamp()
     
     def center_popover_on_active_monitor(self):
         """Center the popover on the currently active monitor"""
@@ -438,13 +1052,15 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
         """Log the message and close the popover"""
         message = self.quick_log_entry.get().strip()
         if message:
+            # Use the timestamp when user first started typing in popover
+            timestamp_dt, lsl_timestamp = self.get_popover_text_timestamps()
+
             # Send LSL message
-            self.send_lsl_message(message)
+            self.send_lsl_message(message, lsl_timestamp=lsl_timestamp)
             
             # Update main app display if visible
             if not self.is_minimized:
-                # Use the timestamp when user first started typing in popover
-                timestamp = self.get_popover_text_timestamp().strftime("%Y-%m-%d %H:%M:%S")
+                timestamp = timestamp_dt.strftime("%Y-%m-%d %H:%M:%S")
                 self.update_log_display(message, timestamp)
             
             # Clear entry
@@ -462,7 +1078,11 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
 
     # SystemTrayAppMixin _________________________________________________________________________________________________________________________________________________________________________________________________________________________________________________________________ #
     def setup_system_tray(self):
-        """Setup system tray icon and menu"""
+        """Setup system tray icon and menu (built and run on a background thread so importing pystray/PIL doesn't delay the window)"""
+        threading.Thread(target=self._setup_system_tray_worker, daemon=True).start()
+
+
+    def _setup_system_tray_worker(self):
         try:
             # Create a simple icon (you can replace this with a custom icon file)
             icon_image = self.create_tray_icon()
@@ -493,8 +1113,8 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
             # Double-click/activate handler
             self.system_tray.on_activate = self.on_tray_activate ## double-clicking should restore only when hidden
 
-            # Start system tray in a separate thread
-            threading.Thread(target=self.system_tray.run, daemon=True).start()
+            # Run the system tray (blocks this background thread)
+            self.system_tray.run()
 
         except Exception as e:
             print(f"Error setting up system tray: {e}")
@@ -672,7 +1292,12 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
         self.setup_stream_monitor_gui(recording_tab, row=2)
 
         # ------------------------- Live Audio Tab -------------------------
-        self.setup_gui_LiveWhisperTranscriptionAppMixin(live_audio_tab, row=0)
+        self.live_audio_tab = live_audio_tab
+        self.live_transcription_loading_label = ttk.Label(live_audio_tab, text="Loading live transcription...", foreground="gray")
+        self.live_transcription_loading_label.grid(row=0, column=0, sticky=tk.W) # replaced by the mixin's controls in `_on_live_transcription_mixin_loaded`
+        self.transcription_worker_status_label = ttk.Label(live_audio_tab, text="", foreground="gray")
+        self.transcription_worker_status_label.grid(row=1, column=0, sticky=tk.W, pady=(5, 0))
+        self._update_transcription_worker_status_label()
 
         # ------------------------- EventBoard Tab -------------------------
         self.setup_eventboard_gui(eventboard_tab, row=0)
@@ -712,7 +1337,7 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
         self.text_entry.focus()
 
         # ------------------------- Settings Tab -------------------------
-        ttk.Label(settings_tab, text="Settings will appear here.").grid(row=0, column=0, sticky=tk.W, pady=(0, 10))
+        self.setup_startup_profile_gui(settings_tab, row=0)
 
         # Keyboard shortcuts for tab switching (Ctrl+1..5)
         def _select_tab(index: int):
@@ -743,6 +1368,14 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
         self.log_display = scrolledtext.ScrolledText(log_display_frame, height=15, width=70)
         self.log_display.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
 
+        # Fixed-size ring buffer in the widget, full session history on disk for paging
+        history_file = None
+        try:
+            history_file = LogHistoryFile(get_app_data_folder('log_history') / f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_log_history.txt")
+        except Exception as e:
+            print(f"Error opening log history file (paging disabled): {e}")
+        self.log_history = LogHistoryModel(self.log_display, capacity=2000, trim_batch=200, history_file=history_file, page_size=500)
+
         # Bottom frame for clear button
         log_bottom_frame = ttk.Frame(log_display_frame)
         log_bottom_frame.grid(row=2, column=0, sticky=(tk.W, tk.E), pady=(5, 0))
@@ -750,11 +1383,26 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
 
         # Clear log button
         ttk.Button(log_bottom_frame, text="Clear Log Display", command=self.clear_log_display).grid(row=0, column=0, sticky=tk.W)
+
+        # History paging controls
+        self.log_history_page_label = ttk.Label(log_bottom_frame, text="Live")
+        self.log_history_page_label.grid(row=0, column=1, padx=(10, 5))
+        ttk.Button(log_bottom_frame, text="◀ Older", command=self.on_log_history_older).grid(row=0, column=2, padx=2)
+        ttk.Button(log_bottom_frame, text="Newer ▶", command=self.on_log_history_newer).grid(row=0, column=3, padx=2)
+        ttk.Button(log_bottom_frame, text="Live", command=self.on_log_history_live).grid(row=0, column=4, padx=(2, 0))
+
+        # Marker history search (all sessions, backed by the SQLite FTS index)
+        ttk.Label(log_bottom_frame, text="Search:").grid(row=0, column=5, padx=(15, 2))
+        self.marker_search_entry = ttk.Entry(log_bottom_frame, width=24)
+        self.marker_search_entry.grid(row=0, column=6, padx=2)
+        self.marker_search_entry.bind('<Return>', lambda event: self.search_marker_history())
+        ttk.Button(log_bottom_frame, text="Find", command=self.search_marker_history).grid(row=0, column=7, padx=(2, 0))
         
         # ------------------------- Console Output Panel (Collapsible) -------------------------
         # Create collapsible console output frame for stdout/stderr capture
         self.console_output_frame = ConsoleOutputFrame(self.root, root=self.root, capture_stdout=True, capture_stderr=True, max_lines=10000, initial_visible=False, height=8)
         self.console_output_frame.grid(row=2, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=10, pady=(0, 10))
+        add_log_subscriber(self.console_output_frame.append_text) # structured log lines are rendered by the console panel
     
 
     def setup_stream_monitor_gui(self, parent, row: int = 2):
@@ -809,7 +1457,8 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
         button_frame.grid(row=1, column=0, sticky=(tk.W, tk.E))
         
         # Stream control buttons
-        ttk.Button(button_frame, text="Refresh Streams", command=self.refresh_streams).grid(row=0, column=0, padx=(0, 5))
+        self.refresh_streams_button = ttk.Button(button_frame, text="Refresh Streams", command=self.refresh_streams)
+        self.refresh_streams_button.grid(row=0, column=0, padx=(0, 5))
         ttk.Button(button_frame, text="Select All", command=self.select_all_streams).grid(row=0, column=1, padx=5)
         ttk.Button(button_frame, text="Select None", command=self.select_no_streams).grid(row=0, column=2, padx=5)
         ttk.Button(button_frame, text="Auto-Select Own", command=self.auto_select_own_streams).grid(row=0, column=3, padx=(5, 0))
@@ -824,127 +1473,306 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
     # Eventboard methods _________________________________________________________________________________________________________________________________________________________________________________________________________________________________________________________________ #
 
     def load_eventboard_config(self):
-        """Load EventBoard configuration from file"""
-        config_file = Path("eventboard_config.json")
+        """Locate, load and compile the EventBoard configuration (falls back to the default board if missing or invalid)"""
+        self.eventboard_config_path = resolve_eventboard_config_path()
+        compiled = None
+        if self.eventboard_config_path is None:
+            eventboard_logger.warning("EventBoard config file not found, using default configuration")
+        else:
+            try:
+                compiled = load_eventboard_config_file(self.eventboard_config_path)
+                eventboard_logger.info("EventBoard configuration loaded from %s", self.eventboard_config_path)
+            except EventBoardConfigError as e:
+                eventboard_logger.error("Error loading EventBoard config, using default configuration: %s", e)
 
-        if not config_file.exists():
-            print(f"EventBoard config file not found: {config_file}")
-            print("Using default configuration")
-            self.eventboard_config = self.get_default_eventboard_config()
-            return
+        if compiled is None:
+            compiled = CompiledEventBoardConfig.from_dict(self.get_default_eventboard_config())
+        self._set_eventboard_compiled_config(compiled)
+
+
+    def _set_eventboard_compiled_config(self, compiled: CompiledEventBoardConfig):
+        """Make `compiled` the active EventBoard config (raw dict, compiled indexes and numeric event codes)"""
+        self.eventboard_compiled_config = compiled
+        self.eventboard_config = compiled.raw
+        self.eventboard_event_codes = dict(compiled.event_codes)
+        for a_warning in compiled.warnings:
+            eventboard_logger.warning("EventBoard config: %s", a_warning)
 
-        try:
-            with open(config_file, 'r') as f:
-                config_data = json.load(f)
-                self.eventboard_config = config_data.get('eventboard_config', {})
-                print(f"EventBoard configuration loaded from {config_file}")
-        except Exception as e:
-            print(f"Error loading EventBoard config: {e}")
-            print("Using default configuration")
-            self.eventboard_config = self.get_default_eventboard_config()
 
     def get_default_eventboard_config(self):
         """Get default EventBoard configuration"""
-        return {
-            "title": "Event Board",
-            "buttons": [
-                {"id": f"button_{i}_{j}", "row": i, "col": j, "text": f"Button {i}-{j}", 
-                 "event_name": f"EVENT_{i}_{j}", "color": "#2196F3", "type": "instantaneous"}
-                for i in range(1, 4) for j in range(1, 6)
-            ]
-        }
+        return get_default_eventboard_config()
 
     def setup_eventboard_gui(self, parent, row: int=2):
-        """Setup EventBoard GUI with 3x5 grid of buttons and time offset dropdowns"""
-        if not self.eventboard_config:
+        """Setup the EventBoard GUI: a page selector (only shown for multi-page boards) above the button grid of the current page
+
+        Page widgets are not created here; each page is built the first time it is shown (see `show_eventboard_page`) and
+        cached, so startup and tab-open cost depend on the size of one page rather than the whole config.
+        """
+        if not self.eventboard_compiled_config:
             return
+        self.eventboard_tab = parent
         
         # EventBoard frame
-        eventboard_frame = ttk.LabelFrame(parent, text=self.eventboard_config.get('title', 'Event Board'), padding="10")
+        eventboard_frame = ttk.LabelFrame(parent, text=self.eventboard_compiled_config.title, padding="10")
         eventboard_frame.grid(row=row, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(0, 10))
-        
-        # Configure grid for 3 rows and 5 columns (each cell has button + dropdown)
-        for i in range(3):
-            eventboard_frame.rowconfigure(i, weight=1)
-        for j in range(5):
-            eventboard_frame.columnconfigure(j, weight=1)
-        
-        # Create buttons based on configuration
-        buttons = self.eventboard_config.get('buttons', [])
-        for button_config in buttons:
-            row = button_config.get('row', 1) - 1  # Convert to 0-based indexing
-            col = button_config.get('col', 1) - 1  # Convert to 0-based indexing
-            text = button_config.get('text', 'Button')
-            event_name = button_config.get('event_name', 'UNKNOWN_EVENT')
-            color = button_config.get('color', '#2196F3')
-            button_type = button_config.get('type', 'instantaneous')
-            button_id = button_config.get('id', f'button_{row}_{col}')
-            
-            # Create container frame for button and dropdown with integrated styling
-            cell_frame = tk.Frame(eventboard_frame, bg=color, relief="raised", bd=2)
-            cell_frame.grid(row=row, column=col, sticky=(tk.W, tk.E, tk.N, tk.S), padx=2, pady=2)
-            cell_frame.columnconfigure(0, weight=4)  # Button takes 80% of width
-            cell_frame.columnconfigure(1, weight=1)  # Dropdown takes 20% of width
-            cell_frame.rowconfigure(0, weight=1)
-            
-            # Create button with custom styling (no border to integrate with container)
-            button_text = text
-            if button_type == 'toggleable':
-                button_text = f"🔘 {text}"  # Add indicator for toggleable buttons
-            
-            button = tk.Button(
-                cell_frame,
-                text=button_text,
-                font=("Arial", 9, "bold"),
-                bg=color,
-                fg="white",
-                relief="flat",  # Flat relief to integrate with container
-                bd=0,  # No border
-                padx=5,
-                pady=5,
-                command=lambda e=event_name, t=text, bt=button_type, bid=button_id: self.on_eventboard_button_click(e, t, bt, bid)
-            )
-            
-            button.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=(0, 1))
-            
-            # Create time offset entry with matching styling
-            time_offset_var = tk.StringVar()
-            time_offset_entry = tk.Entry(
-                cell_frame,
-                textvariable=time_offset_var,
-                font=("Arial", 8),
-                width=4,
-                justify='center',
-                bg=color,  # Match button background
-                fg="white",  # Match button text color
-                relief="flat",  # Flat relief to integrate
-                bd=0,  # No border
-                insertbackground="white"  # White cursor for visibility
-            )
-            time_offset_entry.grid(row=0, column=1, sticky=(tk.W, tk.E, tk.N, tk.S), padx=(1, 0))
-            
-            # Add placeholder text
-            time_offset_entry.insert(0, "0s")
-            time_offset_entry.config(fg='lightgray')  # Light gray for better visibility on colored background
-            
-            # Bind events for placeholder behavior and Enter key
-            time_offset_entry.bind('<FocusIn>', lambda e, entry=time_offset_entry: self.on_time_offset_focus_in(entry))
-            time_offset_entry.bind('<FocusOut>', lambda e, entry=time_offset_entry: self.on_time_offset_focus_out(entry))
-            time_offset_entry.bind('<Key>', lambda e, entry=time_offset_entry: self.on_time_offset_key(entry))
-            time_offset_entry.bind('<Return>', lambda e, entry=time_offset_entry, bid=button_id: self.on_time_offset_enter(entry, bid))
-            
-            # Store references
-            self.eventboard_buttons[button_id] = button
-            self.eventboard_time_offsets[button_id] = time_offset_var
-            
-            # Store original color for toggleable buttons
-            if button_type == 'toggleable':
-                self.eventboard_toggle_states[button_id] = False
-                # Store the original color for later restoration
-                if not hasattr(self, 'eventboard_original_colors'):
-                    self.eventboard_original_colors = {}
-                self.eventboard_original_colors[button_id] = color
-    
+        eventboard_frame.columnconfigure(0, weight=1)
+        self.eventboard_frame = eventboard_frame
+
+        self.eventboard_page_var = tk.StringVar()
+        self.eventboard_page_selector_frame = ttk.Frame(eventboard_frame)
+        self.eventboard_pages_container = ttk.Frame(eventboard_frame)
+        self.eventboard_pages_container.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.eventboard_pages_container.columnconfigure(0, weight=1)
+        self.eventboard_pages_container.rowconfigure(0, weight=1)
+        self._rebuild_eventboard_page_selector()
+
+        # Build the first page when the EventBoard tab is first opened
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_main_notebook_tab_changed, add='+')
+
+
+    def _on_main_notebook_tab_changed(self, event=None):
+        """Build/show the current EventBoard page when the EventBoard tab is selected"""
+        try:
+            if (self.eventboard_tab is None) or (self.notebook.select() != str(self.eventboard_tab)):
+                return
+        except tk.TclError:
+            return  # GUI is being destroyed
+        if self.eventboard_compiled_config.pages:
+            self.show_eventboard_page(self.eventboard_current_page or self.eventboard_compiled_config.pages[0])
+
+
+    def _rebuild_eventboard_page_selector(self):
+        """Recreate the page selector buttons (hidden when the board has a single page)"""
+        for a_child in self.eventboard_page_selector_frame.winfo_children():
+            a_child.destroy()
+        if not self.eventboard_compiled_config.is_paged:
+            self.eventboard_page_selector_frame.grid_remove()
+            return
+        for i, a_page in enumerate(self.eventboard_compiled_config.pages):
+            ttk.Radiobutton(self.eventboard_page_selector_frame, text=a_page, value=a_page, variable=self.eventboard_page_var, style='Toolbutton',
+                            command=lambda p=a_page: self.show_eventboard_page(p)).grid(row=0, column=i, padx=(0, 2))
+        self.eventboard_page_selector_frame.grid(row=0, column=0, sticky=tk.W, pady=(0, 5))
+
+
+    def show_eventboard_page(self, page: str):
+        """Show an EventBoard page, building its widgets the first time it is shown"""
+        if page not in self.eventboard_compiled_config.buttons_by_page:
+            return
+        page_frame = self.eventboard_page_frames.get(page)
+        if page_frame is None:
+            start_t = time.perf_counter()
+            page_frame = ttk.Frame(self.eventboard_pages_container)
+            self.eventboard_page_frames[page] = page_frame
+            self._configure_eventboard_grid(page)
+            for button_config in self.eventboard_compiled_config.buttons_by_page[page]:
+                self._create_eventboard_button_widgets(button_config)
+            eventboard_logger.debug("Built EventBoard page '%s' (%d buttons) in %.1f ms", page, len(self.eventboard_compiled_config.buttons_by_page[page]), (time.perf_counter() - start_t) * 1000.0)
+
+        if (self.eventboard_current_page is not None) and (self.eventboard_current_page != page) and (self.eventboard_current_page in self.eventboard_page_frames):
+            self.eventboard_page_frames[self.eventboard_current_page].grid_remove()
+        page_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.eventboard_current_page = page
+        self.eventboard_page_var.set(page)
+
+
+    def _configure_eventboard_grid(self, page: str):
+        """Give every row/column spanned by the page's buttons equal weight"""
+        page_frame = self.eventboard_page_frames.get(page)
+        if page_frame is None:
+            return
+        n_rows, n_cols = self.eventboard_compiled_config.get_grid_shape(page)
+        for i in range(n_rows):
+            page_frame.rowconfigure(i, weight=1)
+        for j in range(n_cols):
+            page_frame.columnconfigure(j, weight=1)
+
+
+    def _resolve_eventboard_color(self, button_config) -> str:
+        """The button's color if Tk knows it, else the default button color (the config only checks the color's syntax)"""
+        try:
+            self.root.winfo_rgb(button_config.color)
+            return button_config.color
+        except tk.TclError:
+            eventboard_logger.warning("EventBoard button '%s': unknown color %r, using %s", button_config.id, button_config.color, default_eventboard_button_color)
+            return default_eventboard_button_color
+
+
+    def _create_eventboard_button_widgets(self, button_config):
+        """Create the container, button and time offset entry for one compiled button config (no-op until its page has been built)"""
+        eventboard_frame = self.eventboard_page_frames.get(button_config.page)
+        if eventboard_frame is None:
+            return # built lazily when the page is first shown
+        row = button_config.row - 1  # Convert to 0-based indexing
+        col = button_config.col - 1  # Convert to 0-based indexing
+        text = button_config.text
+        event_name = button_config.event_name
+        color = self._resolve_eventboard_color(button_config)
+        button_type = button_config.type
+        button_id = button_config.id
+
+        # Create container frame for button and dropdown with integrated styling
+        cell_frame = tk.Frame(eventboard_frame, bg=color, relief="raised", bd=2)
+        cell_frame.grid(row=row, column=col, sticky=(tk.W, tk.E, tk.N, tk.S), padx=2, pady=2)
+        cell_frame.columnconfigure(0, weight=4)  # Button takes 80% of width
+        cell_frame.columnconfigure(1, weight=1)  # Dropdown takes 20% of width
+        cell_frame.rowconfigure(0, weight=1)
+        
+        # Create button with custom styling (no border to integrate with container)
+        button_text = text
+        if button_type == 'toggleable':
+            button_text = f"🔘 {text}"  # Add indicator for toggleable buttons
+        
+        button = tk.Button(
+            cell_frame,
+            text=button_text,
+            font=("Arial", 9, "bold"),
+            bg=color,
+            fg="white",
+            relief="flat",  # Flat relief to integrate with container
+            bd=0,  # No border
+            padx=5,
+            pady=5,
+            command=lambda e=event_name, t=text, bt=button_type, bid=button_id: self.on_eventboard_button_click(e, t, bt, bid)
+        )
+        
+        button.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=(0, 1))
+        
+        # Create time offset entry with matching styling
+        time_offset_var = tk.StringVar()
+        time_offset_entry = tk.Entry(
+            cell_frame,
+            textvariable=time_offset_var,
+            font=("Arial", 8),
+            width=4,
+            justify='center',
+            bg=color,  # Match button background
+            fg="white",  # Match button text color
+            relief="flat",  # Flat relief to integrate
+            bd=0,  # No border
+            insertbackground="white"  # White cursor for visibility
+        )
+        time_offset_entry.grid(row=0, column=1, sticky=(tk.W, tk.E, tk.N, tk.S), padx=(1, 0))
+        
+        # Add placeholder text
+        time_offset_entry.insert(0, "0s")
+        time_offset_entry.config(fg='lightgray')  # Light gray for better visibility on colored background
+        
+        # Bind events for placeholder behavior and Enter key
+        time_offset_entry.bind('<FocusIn>', lambda e, entry=time_offset_entry: self.on_time_offset_focus_in(entry))
+        time_offset_entry.bind('<FocusOut>', lambda e, entry=time_offset_entry: self.on_time_offset_focus_out(entry))
+        time_offset_entry.bind('<Key>', lambda e, entry=time_offset_entry: self.on_time_offset_key(entry))
+        time_offset_entry.bind('<Return>', lambda e, entry=time_offset_entry, bid=button_id: self.on_time_offset_enter(entry, bid))
+        
+        # Store references
+        self.eventboard_buttons[button_id] = button
+        self.eventboard_time_offsets[button_id] = time_offset_var
+        self.eventboard_cell_frames[button_id] = cell_frame
+        self.eventboard_time_offset_entries[button_id] = time_offset_entry
+        
+        # Store original color for toggleable buttons
+        if button_type == 'toggleable':
+            # Store the original color for later restoration
+            self.eventboard_original_colors[button_id] = color
+            if self.eventboard_toggle_states.setdefault(button_id, False):
+                self._apply_eventboard_toggle_appearance(button_id, True, text) # toggled ON (e.g. by a hotkey) before its page was built
+
+
+    def _destroy_eventboard_button_widgets(self, button_id: str):
+        """Destroy the widgets of one button and forget its references (toggle state is kept by the caller if needed)"""
+        cell_frame = self.eventboard_cell_frames.pop(button_id, None)
+        self.eventboard_buttons.pop(button_id, None)
+        self.eventboard_time_offsets.pop(button_id, None)
+        self.eventboard_time_offset_entries.pop(button_id, None)
+        self.eventboard_original_colors.pop(button_id, None)
+        if cell_frame is not None:
+            try:
+                cell_frame.destroy()
+            except tk.TclError:
+                pass  # GUI is being destroyed
+
+
+    # EventBoard config hot reload ________________________________________________________________________________________ #
+
+    def start_eventboard_config_watcher(self):
+        """Watch the EventBoard config file and hot-reload it on change"""
+        if self.eventboard_config_path is None:
+            return
+        self.eventboard_config_watcher = EventBoardConfigWatcher(self.eventboard_config_path, on_change=self._on_eventboard_config_file_changed, on_error=self._on_eventboard_config_file_error)
+        self.eventboard_config_watcher.start()
+
+
+    def stop_eventboard_config_watcher(self):
+        if self.eventboard_config_watcher is not None:
+            self.eventboard_config_watcher.stop()
+            self.eventboard_config_watcher = None
+
+
+    def _on_eventboard_config_file_changed(self, compiled: CompiledEventBoardConfig):
+        """Called on the watcher thread with a valid new config"""
+        if not self._shutting_down:
+            self.ui_bus.post('eventboard_config_reload', lambda: self.apply_eventboard_config(compiled))
+
+
+    def _on_eventboard_config_file_error(self, error: EventBoardConfigError):
+        """Called on the watcher thread when the edited config is invalid: report it and keep the current board"""
+        eventboard_logger.error("EventBoard config not reloaded (keeping the current board): %s", error)
+        if not self._shutting_down:
+            self.ui_bus.post('eventboard_config_reload', lambda: self.update_log_display(f"EventBoard config invalid, keeping the current board: {error}", datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
+
+
+    def apply_eventboard_config(self, compiled: CompiledEventBoardConfig):
+        """Switch to a new EventBoard config, rebuilding only added/removed/changed button widgets (Tk thread)
+
+        A toggleable button that is ON stays ON across the reload as long as it keeps its id, event name and type.
+        """
+        old_compiled = self.eventboard_compiled_config
+        added_ids, removed_ids, changed_ids = old_compiled.diff(compiled)
+
+        for a_button_id in removed_ids:
+            if self.eventboard_toggle_states.get(a_button_id, False):
+                eventboard_logger.warning("Toggleable EventBoard button '%s' was removed while ON; no _END event was sent", a_button_id)
+            self.eventboard_toggle_states.pop(a_button_id, None)
+            self._destroy_eventboard_button_widgets(a_button_id)
+
+        self._set_eventboard_compiled_config(compiled)
+        if compiled.typed_outlet != old_compiled.typed_outlet:
+            eventboard_logger.warning("EventBoard 'typed_outlet' setting changed; restart the app to apply it")
+        elif self.is_eventboard_typed_outlet_enabled and (compiled.event_codes_signature != old_compiled.event_codes_signature):
+            # The event id table lives in the outlet's desc XML, which can't be changed on a live outlet: recreate it (off the Tk
+            # thread, creating an outlet can take a while); `start_outlet_dispatcher` swaps it into the existing dispatcher.
+            eventboard_logger.info("EventBoard event codes changed; recreating the 'EventBoardCodes' outlet")
+            threading.Thread(target=self.setup_eventboard_typed_outlet, name='EventBoardCodesOutletSetup', daemon=True).start()
+
+        if self.eventboard_frame is not None:
+            self.eventboard_frame.config(text=compiled.title)
+            # Drop cached pages that no longer exist
+            for a_page in [a_page for a_page in self.eventboard_page_frames if a_page not in compiled.buttons_by_page]:
+                self.eventboard_page_frames.pop(a_page).destroy()
+            for a_page in self.eventboard_page_frames:
+                self._configure_eventboard_grid(a_page)
+            for a_button_id in changed_ids:
+                old_button, new_button = old_compiled.by_id[a_button_id], compiled.by_id[a_button_id]
+                keep_toggle_state = new_button.is_toggleable and old_button.is_toggleable and (old_button.event_name == new_button.event_name)
+                if not keep_toggle_state:
+                    self.eventboard_toggle_states.pop(a_button_id, None)
+                self._destroy_eventboard_button_widgets(a_button_id)
+                self._create_eventboard_button_widgets(new_button) # only if its page is built; ON toggles are restored
+            for a_button_id in added_ids:
+                self._create_eventboard_button_widgets(compiled.by_id[a_button_id])
+            self._rebuild_eventboard_page_selector()
+            if self.eventboard_current_page not in compiled.buttons_by_page:
+                self.eventboard_current_page = None
+                self._on_main_notebook_tab_changed() # show the first page if the EventBoard tab is open
+
+        if compiled.hotkey_signature != old_compiled.hotkey_signature:
+            self.setup_eventboard_hotkeys()
+
+        summary = f"EventBoard config reloaded: {len(changed_ids)} changed, {len(added_ids)} added, {len(removed_ids)} removed"
+        eventboard_logger.info(summary)
+        self.update_log_display(summary, datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+
+
     def on_time_offset_focus_in(self, entry):
         """Handle focus in on time offset entry"""
         if entry.get() == "0s":
@@ -966,166 +1794,269 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
     def on_time_offset_enter(self, entry, button_id):
         """Handle Enter key press in time offset entry - trigger button click"""
         # Get the button and trigger its click
-        button = self.eventboard_buttons.get(button_id)
-        if button:
-            # Get button configuration to determine type and event details
-            buttons = self.eventboard_config.get('buttons', [])
-            button_config = next((b for b in buttons if b.get('id') == button_id), None)
-            
-            if button_config:
-                event_name = button_config.get('event_name', 'UNKNOWN_EVENT')
-                button_text = button_config.get('text', 'Button')
-                button_type = button_config.get('type', 'instantaneous')
-                
-                # Trigger the button click
-                self.on_eventboard_button_click(event_name, button_text, button_type, button_id)
-        
-        # Clear the field and reset to placeholder
-        entry.delete(0, tk.END)
-        entry.insert(0, "0s")
-        entry.config(fg='lightgray')  # Reset to placeholder color
-        
-        # Release focus from the entry field
-        entry.master.focus_set()  # Focus the container frame instead
-    
-    def on_eventboard_button_click(self, event_name, button_text, button_type, button_id):
-        """Handle EventBoard button click"""
-        try:
-            # Get time offset
-            time_offset_str = self.eventboard_time_offsets.get(button_id, tk.StringVar()).get()
-            time_offset_seconds = self.parse_time_offset(time_offset_str)
-            
-            # Calculate actual timestamp (current time - offset)
-            actual_timestamp = datetime.now() - timedelta(seconds=time_offset_seconds)
-            
-            if button_type == 'toggleable':
-                # Toggle the state
-                current_state = self.eventboard_toggle_states.get(button_id, False)
-                new_state = not current_state
-                self.eventboard_toggle_states[button_id] = new_state
-                
-                # Update button appearance with enhanced visual feedback
-                button = self.eventboard_buttons[button_id]
-                original_color = self.eventboard_original_colors.get(button_id, "#2196F3")  # Default fallback
-                
-                if new_state:
-                    # ON state - red border with original background
-                    button.config(
-                        text=f"🔴 {button_text}",
-                        font=("Arial", 10, "bold"),  # Slightly larger, bolder font
-                        bg=original_color,  # Keep original background color
-                        highlightthickness=3,  # Thicker highlight border
-                        highlightbackground="#FF4444",  # Red border
-                        highlightcolor="#FF4444"  # Red border when focused
-                    )
-                    # Update container frame to show pressed state with red border
-                    button.master.config(
-                        relief="sunken",
-                        bd=3,  # Thicker border for active state
-                        bg=original_color,  # Keep original background
-                        highlightthickness=3,  # Thicker highlight border
-                        highlightbackground="#FF4444",  # Red border
-                        highlightcolor="#FF4444"  # Red border when focused
-                    )
-                    event_suffix = "_START"
-                else:
-                    # OFF state - normal appearance
-                    button.config(
-                        text=f"🔘 {button_text}",
-                        font=("Arial", 9, "bold"),  # Normal font size
-                        bg=original_color,  # Original button color
-                        highlightthickness=0,  # No highlight border
-                        highlightbackground=original_color,
-                        highlightcolor=original_color
-                    )
-                    # Update container frame to show normal state
-                    button.master.config(
-                        relief="raised",
-                        bd=2,  # Normal border thickness
-                        bg=original_color,  # Original color
-                        highlightthickness=0,  # No highlight border
-                        highlightbackground=original_color,
-                        highlightcolor=original_color
-                    )
-                    event_suffix = "_END"
-                
-                # Update time offset entry field to match active state
-                time_offset_entry = None
-                for widget in button.master.winfo_children():
-                    if isinstance(widget, tk.Entry):
-                        time_offset_entry = widget
-                        break
-                
-                if time_offset_entry:
-                    if new_state:
-                        # Active state - red border with original background
-                        time_offset_entry.config(
-                            bg=original_color,  # Keep original background
-                            fg="white",
-                            highlightthickness=2,  # Thicker highlight border
-                            highlightbackground="#FF4444",  # Red border
-                            highlightcolor="#FF4444"  # Red border when focused
-                        )
-                    else:
-                        # Normal state - match original button color
-                        time_offset_entry.config(
-                            bg=original_color, 
-                            fg="white",
-                            highlightthickness=0,  # No highlight border
-                            highlightbackground=original_color,
-                            highlightcolor=original_color
-                        )
-                
-                # Send LSL event with toggle state
-                self.send_eventboard_message(f"{event_name}{event_suffix}", button_text, actual_timestamp, new_state)
-                
-                # Update log display
-                log_message = f"EventBoard: {button_text} {'ON' if new_state else 'OFF'} ({event_name}{event_suffix})"
-                if time_offset_seconds > 0:
-                    log_message += f" [offset: -{time_offset_str}]"
-                
-            else:
-                # Instantaneous event
-                self.send_eventboard_message(event_name, button_text, actual_timestamp, None)
-                
-                # Update log display
-                log_message = f"EventBoard: {button_text} ({event_name})"
-                if time_offset_seconds > 0:
-                    log_message += f" [offset: -{time_offset_str}]"
-            
-            # Update log display
-            timestamp = actual_timestamp.strftime("%Y-%m-%d %H:%M:%S")
-            self.update_log_display(log_message, timestamp)
-            
-            print(f"EventBoard button clicked: {button_text} -> {event_name} (type: {button_type})")
+        button_config = self.eventboard_compiled_config.get_button(button_id) if (button_id in self.eventboard_buttons) else None
+        if button_config:
+            self.on_eventboard_button_click(button_config.event_name, button_config.text, button_config.type, button_id)
+        
+        # Clear the field and reset to placeholder
+        entry.delete(0, tk.END)
+        entry.insert(0, "0s")
+        entry.config(fg='lightgray')  # Reset to placeholder color
+        
+        # Release focus from the entry field
+        entry.master.focus_set()  # Focus the container frame instead
+    
+    def on_eventboard_button_click(self, event_name, button_text, button_type, button_id):
+        """Handle EventBoard button click"""
+        trigger_perf_counter = time.perf_counter()
+        click_lsl_timestamp = self.capture_input_lsl_timestamp()
+        try:
+            # Get time offset
+            time_offset_var = self.eventboard_time_offsets.get(button_id)
+            time_offset_str = time_offset_var.get() if (time_offset_var is not None) else "0s"
+            time_offset_seconds = self.parse_time_offset(time_offset_str)
+
+            result = self.fire_eventboard_event(button_id, time_offset_seconds=time_offset_seconds, time_offset_str=time_offset_str, source='click',
+                                                trigger_perf_counter=trigger_perf_counter, lsl_timestamp=click_lsl_timestamp)
+            if result is None:
+                return
+            new_state, log_message, actual_timestamp = result
+            self._show_eventboard_event_fired(button_id, new_state, log_message, actual_timestamp)
+
+            eventboard_logger.debug("EventBoard button clicked: %s -> %s (type: %s)", button_text, event_name, button_type)
             
         except Exception as e:
-            print(f"Error handling EventBoard button click: {e}")
+            eventboard_logger.error("Error handling EventBoard button click: %s", e)
             messagebox.showerror("EventBoard Error", f"Failed to send event: {str(e)}")
-    
-    def send_eventboard_message(self, event_name, button_text, timestamp=None, toggle_state=None):
-        """Send EventBoard message via LSL"""
-        if self.eventboard_outlet:
-            try:
-                # Use provided timestamp or current time
-                if timestamp is None:
-                    timestamp = datetime.now()
-                
-                # Create event message with timestamp, button info, and toggle state
-                event_message = f"{event_name}|{button_text}|{timestamp.isoformat()}"
-                
-                # Add toggle state if provided
-                if toggle_state is not None:
-                    event_message += f"|TOGGLE:{toggle_state}"
-                
-                self.eventboard_outlet.push_sample([event_message])
-                print(f"EventBoard LSL message sent: {event_message}")
-            except Exception as e:
-                print(f"Error sending EventBoard LSL message: {e}")
-                raise
+
+
+    def fire_eventboard_event(self, button_id: str, time_offset_seconds: float = 0.0, time_offset_str: Optional[str] = None, source: str = 'click',
+                              trigger_perf_counter: Optional[float] = None, lsl_timestamp: Optional[float] = None) -> Optional[Tuple[Optional[bool], str, datetime]]:
+        """Fire the event of an EventBoard button: flip its toggle state (if toggleable) and queue the marker(s) for sending
+
+        Thread-safe and never touches widgets, so it can be called directly from hotkey threads; callers show the result
+        with `_show_eventboard_event_fired` on the Tk thread.
+
+        Args:
+            button_id: Id of the button to fire.
+            time_offset_seconds: How long ago the event happened (subtracted from both timestamps).
+            time_offset_str: The offset as the user typed it, for the log message.
+            source: What fired the event ('click', 'local_hotkey', 'global_hotkey' or 'ingest'), used for latency metrics.
+            trigger_perf_counter: `time.perf_counter()` when the click/key was received; the trigger -> queued latency is recorded per source.
+            lsl_timestamp: LSL timestamp of the trigger, defaults to now.
+
+        Returns:
+            (new_toggle_state or None for instantaneous buttons, log message, event datetime), or None if the button doesn't exist.
+        """
+        if lsl_timestamp is None:
+            lsl_timestamp = self.capture_input_lsl_timestamp()
+        button_config = self.eventboard_compiled_config.get_button(button_id)
+        if button_config is None:
+            eventboard_logger.warning("EventBoard event fired for unknown button '%s'", button_id)
+            return None
+
+        # Calculate actual timestamp (current time - offset)
+        actual_timestamp = datetime.now() - timedelta(seconds=time_offset_seconds)
+        actual_lsl_timestamp = lsl_timestamp - time_offset_seconds
+
+        new_state = None
+        event_name = button_config.event_name
+        with self._eventboard_state_lock: # toggle flips and their markers stay in the same order across threads
+            if button_config.is_toggleable:
+                new_state = not self.eventboard_toggle_states.get(button_id, False)
+                self.eventboard_toggle_states[button_id] = new_state
+                event_name = f"{event_name}{'_START' if new_state else '_END'}"
+            self.send_eventboard_message(event_name, button_config.text, actual_timestamp, new_state, lsl_timestamp=actual_lsl_timestamp, time_offset_seconds=time_offset_seconds)
+
+        if trigger_perf_counter is not None:
+            latency_ms = (time.perf_counter() - trigger_perf_counter) * 1000.0
+            self.eventboard_fire_latency.setdefault(source, LatencyStats()).add(latency_ms)
+            eventboard_logger.debug("EventBoard %s '%s' queued %.3f ms after trigger", source, event_name, latency_ms)
+
+        if new_state is not None:
+            log_message = f"EventBoard: {button_config.text} {'ON' if new_state else 'OFF'} ({event_name})"
         else:
-            print("EventBoard LSL outlet not available")
-            raise Exception("EventBoard LSL outlet not available")
+            log_message = f"EventBoard: {button_config.text} ({event_name})"
+        if time_offset_seconds > 0:
+            log_message += f" [offset: -{time_offset_str or f'{time_offset_seconds:g}s'}]"
+        return (new_state, log_message, actual_timestamp)
+
+
+    def _show_eventboard_event_fired(self, button_id: str, new_state: Optional[bool], log_message: str, actual_timestamp: datetime):
+        """Reflect a fired EventBoard event in the GUI (Tk thread): toggle appearance and log display"""
+        if new_state is not None:
+            button_config = self.eventboard_compiled_config.get_button(button_id)
+            if button_config is not None:
+                self._apply_eventboard_toggle_appearance(button_id, new_state, button_config.text)
+        self.update_log_display(log_message, actual_timestamp.strftime("%Y-%m-%d %H:%M:%S"))
+
+
+    # EventBoard hotkeys __________________________________________________________________________________________________ #
+
+    def setup_eventboard_hotkeys(self):
+        """(Re-)register the per-button global (`"hotkey"`) and window-local (`"local_hotkey"`) hotkeys of the EventBoard config"""
+        if self.eventboard_hotkey_binder is None:
+            self.eventboard_hotkey_binder = EventBoardHotkeyBinder(self.root, fire_callback=self._on_eventboard_hotkey)
+        problems = self.eventboard_hotkey_binder.register(self.eventboard_compiled_config)
+        for a_problem in problems:
+            eventboard_logger.error("Could not register EventBoard %s", a_problem)
+        if self.eventboard_hotkey_binder.global_hotkey_count or self.eventboard_hotkey_binder.local_hotkey_count:
+            eventboard_logger.info("EventBoard hotkeys registered: %d global, %d local", self.eventboard_hotkey_binder.global_hotkey_count, self.eventboard_hotkey_binder.local_hotkey_count)
+
+
+    def cleanup_eventboard_hotkeys(self):
+        if self.eventboard_hotkey_binder is not None:
+            self.eventboard_hotkey_binder.unregister_all()
+            self.eventboard_hotkey_binder = None
+            eventboard_logger.info("EventBoard fire latency (trigger -> queued): %s", self.get_eventboard_latency_metrics())
+
+
+    def _on_eventboard_hotkey(self, button_id: str, source: str, trigger_perf_counter: float):
+        """Hotkey callback (keyboard hook thread or Tk thread): fire immediately, then hand the GUI update to the UI bus"""
+        if self._shutting_down:
+            return
+        try:
+            result = self.fire_eventboard_event(button_id, source=source, trigger_perf_counter=trigger_perf_counter)
+        except Exception as e:
+            eventboard_logger.error("Error firing EventBoard hotkey for '%s': %s", button_id, e)
+            return
+        if result is None:
+            return
+        new_state, log_message, actual_timestamp = result
+        self.ui_bus.post_ordered(lambda: self._show_eventboard_event_fired(button_id, new_state, f"{log_message} [{source.replace('_', ' ')}]", actual_timestamp))
+
+
+    def get_eventboard_latency_metrics(self) -> Dict[str, Any]:
+        """Trigger -> queued latency per source, plus the EventBoard dispatcher's queued -> pushed latency"""
+        metrics: Dict[str, Any] = {a_source: a_stats.get_metrics() for a_source, a_stats in self.eventboard_fire_latency.items()}
+        dispatcher = self.outlet_dispatchers.get('EventBoard')
+        if dispatcher is not None:
+            dispatcher_metrics = dispatcher.get_metrics()
+            metrics['queued_to_pushed'] = {k: v for k, v in dispatcher_metrics.items() if k.endswith('latency_ms')}
+        return metrics
+
+
+    def _apply_eventboard_toggle_appearance(self, button_id: str, new_state: bool, button_text: str):
+        """Show a toggleable button (and its container and time offset entry) as ON (red border) or OFF"""
+        button = self.eventboard_buttons.get(button_id)
+        if button is None:
+            return # page not built yet; the state is applied when it is
+        original_color = self.eventboard_original_colors.get(button_id, "#2196F3")  # Default fallback
+        
+        if new_state:
+            # ON state - red border with original background
+            button.config(
+                text=f"🔴 {button_text}",
+                font=("Arial", 10, "bold"),  # Slightly larger, bolder font
+                bg=original_color,  # Keep original background color
+                highlightthickness=3,  # Thicker highlight border
+                highlightbackground="#FF4444",  # Red border
+                highlightcolor="#FF4444"  # Red border when focused
+            )
+            # Update container frame to show pressed state with red border
+            button.master.config(
+                relief="sunken",
+                bd=3,  # Thicker border for active state
+                bg=original_color,  # Keep original background
+                highlightthickness=3,  # Thicker highlight border
+                highlightbackground="#FF4444",  # Red border
+                highlightcolor="#FF4444"  # Red border when focused
+            )
+        else:
+            # OFF state - normal appearance
+            button.config(
+                text=f"🔘 {button_text}",
+                font=("Arial", 9, "bold"),  # Normal font size
+                bg=original_color,  # Original button color
+                highlightthickness=0,  # No highlight border
+                highlightbackground=original_color,
+                highlightcolor=original_color
+            )
+            # Update container frame to show normal state
+            button.master.config(
+                relief="raised",
+                bd=2,  # Normal border thickness
+                bg=original_color,  # Original color
+                highlightthickness=0,  # No highlight border
+                highlightbackground=original_color,
+                highlightcolor=original_color
+            )
+        
+        # Update time offset entry field to match active state
+        time_offset_entry = self.eventboard_time_offset_entries.get(button_id)
+        
+        if time_offset_entry:
+            if new_state:
+                # Active state - red border with original background
+                time_offset_entry.config(
+                    bg=original_color,  # Keep original background
+                    fg="white",
+                    highlightthickness=2,  # Thicker highlight border
+                    highlightbackground="#FF4444",  # Red border
+                    highlightcolor="#FF4444"  # Red border when focused
+                )
+            else:
+                # Normal state - match original button color
+                time_offset_entry.config(
+                    bg=original_color, 
+                    fg="white",
+                    highlightthickness=0,  # No highlight border
+                    highlightbackground=original_color,
+                    highlightcolor=original_color
+                )
+
+
+    def send_eventboard_message(self, event_name, button_text, timestamp=None, toggle_state=None, lsl_timestamp: Optional[float] = None, time_offset_seconds: float = 0.0):
+        """Send EventBoard message via LSL (queued to the EventBoard outlet dispatcher)
+
+        lsl_timestamp: explicit LSL timestamp for the marker (see `capture_input_lsl_timestamp`), defaults to now.
+        time_offset_seconds: the user-entered offset already applied to the timestamps, reported on the typed 'EventBoardCodes' outlet.
+        """
+        if lsl_timestamp is None:
+            lsl_timestamp = pylsl.local_clock()
+
+        dispatcher = self.outlet_dispatchers.get('EventBoard')
+        if dispatcher is None:
+            lsl_logger.warning("EventBoard LSL outlet not available")
+            return
+
+        # Use provided timestamp or current time
+        if timestamp is None:
+            timestamp = datetime.now()
+        
+        # Create event message with timestamp, button info, and toggle state
+        event_message = f"{event_name}|{button_text}|{timestamp.isoformat()}"
+        
+        # Add toggle state if provided
+        if toggle_state is not None:
+            event_message += f"|TOGGLE:{toggle_state}"
+        
+        # Queued even if the outlet isn't created yet; it's flushed with this timestamp once it is
+        if not dispatcher.submit([event_message], timestamp=lsl_timestamp):
+            lsl_logger.warning("EventBoard LSL message dropped (send queue full): %s", event_message)
+            return
+        # Only after the string marker was accepted, so the typed stream never has an event the text stream lacks
+        self._send_eventboard_typed_sample(event_name, toggle_state, time_offset_seconds, lsl_timestamp)
+
+
+    def _send_eventboard_typed_sample(self, event_name: str, toggle_state: Optional[bool], time_offset_seconds: float, lsl_timestamp: float):
+        """Queue the numeric companion sample for an EventBoard event on the 'EventBoardCodes' outlet (if enabled)"""
+        dispatcher = self.outlet_dispatchers.get('EventBoardCodes')
+        if dispatcher is None:
+            return
+
+        base_event_name = event_name
+        if toggle_state is not None:
+            for a_suffix in ('_START', '_END'):
+                if base_event_name.endswith(a_suffix):
+                    base_event_name = base_event_name[:-len(a_suffix)]
+                    break
+
+        self._eventboard_sequence_number += 1
+        event_id = self.eventboard_event_codes.get(base_event_name, 0)
+        toggle_value = -1.0 if toggle_state is None else float(bool(toggle_state))
+        dispatcher.submit([float(event_id), toggle_value, float(time_offset_seconds or 0.0), float(self._eventboard_sequence_number)], timestamp=lsl_timestamp)
+
 
     def user_select_xdf_folder_if_needed(self) -> Path:
         """Ensures the self.xdf_folder is valid, otherwise forces the user to select a valid one. returns the valid folder.
@@ -1197,12 +2128,11 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
             return
         
         self.recording = True
-        self.recorded_data = [] ## clear recorded data
+        if not self.startup_profiler.is_finished:
+            self.startup_profiler.mark('first_recording_started')
+            self.finish_startup_profile('first_recording')
         
         self.xdf_filename = filename
-        
-        # Create backup file for crash recovery
-        self.backup_filename = str(Path(filename).with_suffix('.backup.json'))
         return self.xdf_filename, (self.recording_start_datetime, self.recording_start_lsl_local_offset)
 
 
@@ -1210,13 +2140,21 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
 
     def start_recording(self):
         """Start XDF recording using LabRecorder or fallback to legacy method"""
+        if not self.is_lab_recorder_init_done:
+            # Which method is used (and so which streams are needed) isn't known yet: start once LabRecorder is initialized
+            if not self._is_start_recording_deferred:
+                self._is_start_recording_deferred = True
+                self.update_log_display("Waiting for LabRecorder to initialize before starting the recording...", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+                self._call_after_lab_recorder_init(self._start_deferred_recording)
+            return
+
         # Check if we have streams to record
         if self.is_lab_recorder_available():
             selected_streams = self.get_selected_streams()
             if not selected_streams:
                 messagebox.showerror("Error", "No LSL streams selected for recording")
                 return
-        elif not self.has_any_inlets:
+        elif not self.has_any_recording_sources:
             messagebox.showerror("Error", "No LSL inlet available for recording")
             return
         
@@ -1245,10 +2183,20 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
         self.update_log_display(f"XDF Recording started ({recording_method})", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
 
 
+    def _start_deferred_recording(self):
+        """Start the recording requested while LabRecorder was still initializing (Tk thread)"""
+        self._is_start_recording_deferred = False
+        if not self.recording:
+            self.start_recording()
+
+
     def _try_auto_start_after_stream_discovery(self):
         """Try to auto-start recording after streams are discovered (called from stream discovery)"""
         if self.auto_start_attempted:
             return  # Already tried
+        if not self.is_lab_recorder_init_done:
+            self._call_after_lab_recorder_init(self._try_auto_start_after_stream_discovery) # don't block the Tk thread on it
+            return
         
         self.auto_start_attempted = True
         
@@ -1260,12 +2208,12 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
                 # Streams are available and selected, try to start
                 self.auto_start_recording()
             else:
-                print("Cannot auto-start recording: no own streams found to select")
-        elif self.has_any_inlets:
-            # Legacy mode with inlets
+                recording_logger.warning("Cannot auto-start recording: no own streams found to select")
+        elif self.has_any_recording_sources:
+            # Legacy mode with inlets and/or our own streams
             self.auto_start_recording()
         else:
-            print("Cannot auto-start recording: no streams or inlets available")
+            recording_logger.warning("Cannot auto-start recording: no streams or inlets available")
 
 
     def auto_start_recording(self):
@@ -1276,10 +2224,10 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
             self.select_all_streams()
             selected_streams = self.get_selected_streams()
             if not selected_streams:
-                print("Cannot auto-start recording: no streams selected")
+                recording_logger.warning("Cannot auto-start recording: no streams selected")
                 return
-        elif not self.has_any_inlets:
-            print("Cannot auto-start recording: no inlet available")
+        elif not self.has_any_recording_sources:
+            recording_logger.warning("Cannot auto-start recording: no inlet available")
             return
         
         try:
@@ -1308,17 +2256,22 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
             self.update_log_display("XDF Recording auto-started", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
             auto_start_message = f"RECORDING_AUTO_STARTED: {new_filename}"
             self.send_lsl_message(auto_start_message)  # Send via LSL
-            print(f"Auto-started recording to: {self.xdf_filename}")
+            recording_logger.info("Auto-started recording to: %s", self.xdf_filename)
 
         except Exception as e:
-            print(f"Error auto-starting recording: {e}")
+            recording_logger.error("Error auto-starting recording: %s", e)
             self.update_log_display(f"Auto-start failed: {str(e)}", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
 
 
     def recording_worker(self):
-        """Background thread for recording LSL data using LabRecorder with robust error handling"""
-        if not self.is_lab_recorder_available():
-            print("LabRecorder not available, falling back to legacy recording")
+        """Background thread for recording LSL data using LabRecorder with robust error handling (or handing the recording to the recorder worker process)"""
+        if self.recorder_worker is not None:
+            self.start_recording_sinks(record_in_process=False) # the worker writes the file and its backups
+            self._start_recording_in_worker()
+            return
+
+        if not self.is_lab_recorder_available(wait_timeout=10.0):
+            recording_logger.info("LabRecorder not available, falling back to legacy recording")
             self.legacy_recording_worker()
             return
         
@@ -1326,15 +2279,17 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
             # Configure LabRecorder with selected streams
             selected_stream_infos = self.get_selected_streams()
             if not selected_stream_infos:
-                print("No streams selected for recording")
+                recording_logger.warning("No streams selected for recording")
                 # Notify user via GUI
                 if not self._shutting_down:
-                    self.root.after(0, lambda: self.update_log_display(
+                    self.ui_bus.post_ordered(lambda: self.update_log_display(
                         "Recording failed: No streams selected", 
                         datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                     ))
                 return
             
+            self.start_recording_sinks(record_in_process=False) # LabRecorder writes the XDF itself
+
             # Start LabRecorder recording with retry mechanism
             max_retries = 3
             for attempt in range(max_retries):
@@ -1343,10 +2298,10 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
                         filename=self.xdf_filename,
                         streams=selected_stream_infos
                     )
-                    print(f"LabRecorder started recording to: {self.xdf_filename}")
+                    recording_logger.info("LabRecorder started recording to: %s", self.xdf_filename)
                     break
                 except Exception as e:
-                    print(f"LabRecorder start attempt {attempt + 1} failed: {e}")
+                    recording_logger.warning("LabRecorder start attempt %d failed: %s", attempt + 1, e)
                     if attempt == max_retries - 1:
                         raise
                     time.sleep(1.0)  # Wait before retry
@@ -1359,10 +2314,10 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
                 try:
                     # Check if LabRecorder is still recording
                     if hasattr(self.lab_recorder, 'is_recording') and not self.lab_recorder.is_recording:
-                        print("LabRecorder stopped recording unexpectedly")
+                        recording_logger.warning("LabRecorder stopped recording unexpectedly")
                         # Notify user via GUI
                         if not self._shutting_down:
-                            self.root.after(0, lambda: self.update_log_display(
+                            self.ui_bus.post_ordered(lambda: self.update_log_display(
                                 "Warning: LabRecorder stopped unexpectedly", 
                                 datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                             ))
@@ -1376,10 +2331,10 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
                     
                 except Exception as e:
                     consecutive_errors += 1
-                    print(f"Error monitoring LabRecorder (attempt {consecutive_errors}): {e}")
+                    recording_logger.error("Error monitoring LabRecorder (attempt %d): %s", consecutive_errors, e)
                     
                     if consecutive_errors >= max_consecutive_errors:
-                        print("Too many consecutive monitoring errors. Stopping recording.")
+                        recording_logger.error("Too many consecutive monitoring errors. Stopping recording.")
                         break
                     
                     time.sleep(0.5)  # Wait longer on error
@@ -1388,55 +2343,50 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
             try:
                 if hasattr(self.lab_recorder, 'stop_recording'):
                     self.lab_recorder.stop_recording()
-                    print("LabRecorder recording stopped")
+                    recording_logger.info("LabRecorder recording stopped")
             except Exception as e:
-                print(f"Error stopping LabRecorder: {e}")
+                recording_logger.error("Error stopping LabRecorder: %s", e)
                 
         except Exception as e:
-            print(f"Critical error in LabRecorder recording: {e}")
+            recording_logger.critical("Critical error in LabRecorder recording: %s", e)
             # Notify user via GUI
             if not self._shutting_down:
-                self.root.after(0, lambda: self.update_log_display(
-                    f"LabRecorder error: {str(e)[:100]}... Falling back to legacy recording", 
+                self.ui_bus.post_ordered(lambda err_str=str(e): self.update_log_display(
+                    f"LabRecorder error: {err_str[:100]}... Falling back to legacy recording", 
                     datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 ))
             # Fall back to legacy recording
             self.legacy_recording_worker()
     
     def legacy_recording_worker(self):
-        """Legacy background thread for recording LSL data with incremental backup"""
-        sample_count = 0
-        
-        while self.recording and self.has_any_inlets and not self._shutting_down:
+        """Legacy background thread for recording LSL data into the FIF/CSV and backup sinks (`start_recording_sinks`)
+
+        Our own dispatcher-backed streams are handed to the sinks by the in-process tap (`_on_own_samples_pushed`),
+        so this loop only pulls from network inlets for foreign streams.
+        """
+        self.start_recording_sinks(record_in_process=True)
+        while self.recording and self.has_any_recording_sources and not self._shutting_down:
             # Check shutdown and inlets before accessing
             if self._shutting_down or self.inlets is None:
                 break
             
             ## loop through streams
-            should_save_backup: bool = False
-            for a_stream_name, an_inlet in self.inlets.items():
+            an_inlet_items = list(self.inlets.items())
+            if not an_inlet_items:
+                time.sleep(0.1) # only in-process sources, nothing to pull
+            
+            for a_stream_name, an_inlet in an_inlet_items:
                 try:
                     sample, timestamp = an_inlet.pull_sample(timeout=1.0)
                     if sample:
-                        data_point = {
-                            'sample': sample,
-                            'timestamp': timestamp,
-                            'stream_name': a_stream_name,
-                        }
-                        self.recorded_data.append(data_point)
-                        sample_count += 1
-                        
-                        # Auto-save every 10 samples to backup file
-                        if sample_count % 10 == 0:
-                            should_save_backup = True
+                        self.write_recorded_samples(a_stream_name, [sample], [timestamp])
+                        self.add_marker_to_history(a_stream_name, 'received', sample, timestamp)
                                     
                 except Exception as e:
-                    print(f"Error in legacy recording worker: {e}")
+                    recording_logger.error("Error in legacy recording worker: %s", e)
                     break
 
-            ## END for a_stream_name, a_setup_fn in stream_setup_fn_dict...
-            if should_save_backup:
-                self.save_backup()
+            ## END for a_stream_name, an_inlet in an_inlet_items...
 
 
     def stop_recording(self):
@@ -1458,19 +2408,14 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
             self.recording_thread.join(timeout=2.0)
         
         # Handle file saving based on recording method
-        if self.is_lab_recorder_available():
+        if self.recorder_worker is not None:
+            # The worker saves the file and reports it through `_on_recorder_worker_stopped`
+            self.recorder_worker.stop_recording()
+        elif self.is_lab_recorder_available():
             # LabRecorder handles XDF file creation automatically
-            print(f"LabRecorder XDF file saved: {self.xdf_filename}")
-        else:
-            # Legacy method - save XDF file using MNE
-            self.save_xdf_file()
-            
-            # Clean up backup file
-            try:
-                if hasattr(self, 'backup_filename') and os.path.exists(self.backup_filename):
-                    os.remove(self.backup_filename)
-            except Exception as e:
-                print(f"Error removing backup file: {e}")
+            recording_logger.info("LabRecorder XDF file saved: %s", self.xdf_filename)
+        # Legacy method - the sinks save the FIF/CSV file in the background and report through `_on_recording_sinks_finished`
+        self.stop_recording_sinks()
         
         # Update GUI
         try:
@@ -1483,8 +2428,13 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
         except tk.TclError:
             pass  # GUI is being destroyed
         
-        recording_method = "LabRecorder" if self.is_lab_recorder_available() else "Legacy"
-        self.update_log_display(f"XDF Recording stopped and saved ({recording_method})", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+        if self.recorder_worker is not None:
+            self.update_log_display(f"XDF Recording stopped ({self.recorder_worker.recording_method or 'not started'}), saving in the recorder process", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+            return
+        if self.is_lab_recorder_available():
+            self.update_log_display("XDF Recording stopped and saved (LabRecorder)", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+        else:
+            self.update_log_display("XDF Recording stopped (Legacy), saving", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
 
 
     def split_recording(self):
@@ -1500,14 +2450,14 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
             self.root.after(100, self.start_new_split_recording)
             
         except Exception as e:
-            print(f"Error splitting recording: {e}")
+            recording_logger.error("Error splitting recording: %s", e)
             self.update_log_display(f"Split recording failed: {str(e)}", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
 
 
     def start_new_split_recording(self):
         """Start new recording after split"""
-        if not self.has_any_inlets:
-            print("Cannot split recording: no inlet available")
+        if not self.has_any_recording_sources:
+            recording_logger.warning("Cannot split recording: no inlet available")
             return
         
         try:
@@ -1531,37 +2481,22 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
             self.recording_thread.start()
             
             self.update_log_display(f"Recording split to new file: {new_filename}", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-            print(f"Split recording to new file: {self.xdf_filename}")
+            recording_logger.info("Split recording to new file: %s", self.xdf_filename)
             
             # Log the split event both in GUI and via LSL
             split_message = f"RECORDING_SPLIT_NEW_FILE: {new_filename}"
             self.send_lsl_message(split_message)  # Send via LSL
             self.update_log_display(f"Recording split to new file: {new_filename}", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-            print(f"Split recording to new file: {self.xdf_filename}")
+            recording_logger.info("Split recording to new file: %s", self.xdf_filename)
             
         except Exception as e:
-            print(f"Error starting new split recording: {e}")
+            recording_logger.error("Error starting new split recording: %s", e)
             self.update_log_display(f"Split restart failed: {str(e)}", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
 
 
     # ---------------------------------------------------------------------------- #
     #                             Backups and Recovery                             #
     # ---------------------------------------------------------------------------- #
-    def save_backup(self):
-        """Save current data to backup file"""
-        try:
-            backup_data = {
-                'recorded_data': self.recorded_data,
-                'recording_start_time': self.recording_start_lsl_local_offset,
-                'sample_count': len(self.recorded_data)
-            }
-            
-            with open(self.backup_filename, 'w') as f:
-                json.dump(backup_data, f, default=str)
-                
-        except Exception as e:
-            print(f"Error saving backup: {e}")
-
     def check_for_recovery(self):
         """Check for backup files and offer recovery on startup"""
         self.xdf_folder = self.user_select_xdf_folder_if_needed()
@@ -1582,8 +2517,7 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
         """Recover data from backup file"""
         try:
             self.xdf_folder = self.user_select_xdf_folder_if_needed()
-            with open(backup_file, 'r') as f:
-                backup_data = json.load(f)
+            backup_data = read_backup_file(backup_file)
             
             # Ask user for recovery filename
             original_name = backup_file.stem.replace('.backup', '')
@@ -1616,11 +2550,11 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
     #                              Save/Write Methods                              #
     # ---------------------------------------------------------------------------- #
     def save_xdf_file(self):
-        """Save recorded data using MNE
+        """Save recorded data using MNE (see `recording_io.save_markers_fif_and_csv`)
         
         Seems highly incorrect but does load and display kinda reasonably in MNELAB
         
-        Also calls `self.save_events_csv(...)` to export CSVs, and this DOES work and outputs the correct timestamps as of 2025-10-18.
+        Also exports the events CSV, and this DOES work and outputs the correct timestamps as of 2025-10-18.
 
         """
         if not self.recorded_data:
@@ -1628,99 +2562,9 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
             return
         
         try:
-            # Extract messages and timestamps
-            messages = []
-            timestamps = []
-            
-            recording_start_datetime = deepcopy(self.recording_start_datetime)
-            recording_start_lsl_local_offset = deepcopy(self.recording_start_lsl_local_offset)
-
-
-            for data_point in self.recorded_data:
-                message = data_point['sample'][0] if data_point['sample'] else ''
-                timestamp = data_point['timestamp']
-                messages.append(message)
-                timestamps.append(timestamp)
-            
-            # Convert timestamps to relative times (from first sample)
-            if timestamps:
-                first_timestamp_offset = recording_start_lsl_local_offset # a seocnds offset
-                # first_timestamp_offset = timestamps[0] # a seocnds offset
-                relative_ts_offset_sec = [ts - first_timestamp_offset for ts in timestamps]
-            else:
-                relative_ts_offset_sec = []
-            
-            # Create annotations (MNE's way of handling markers/events)
-            # Set orig_time=None to avoid timing conflicts
-            annotations = mne.Annotations(
-                onset=relative_ts_offset_sec,
-                duration=[0.0] * len(relative_ts_offset_sec),  # Instantaneous events
-                description=messages,
-                orig_time=None  # This fixes the timing conflict
-            )
-            
-            # Create a minimal info structure for the markers
-            info = mne.create_info(
-                ch_names=['TextLogger_Markers'],
-                sfreq=1000, # Dummy sampling rate for the minimal channel, `pylsl.IRREGULAR_RATE` does not work (Error: "Failed to save file: sfreq must be positive")
-                ch_types=['misc']
-            )
-            
-            # Create raw object with minimal dummy data
-            # We need at least some data points to create a valid Raw object
-            if len(timestamps) > 0:
-                # Create dummy data spanning the recording duration
-                duration = relative_ts_offset_sec[-1] if relative_ts_offset_sec else 1.0 # the last timestamp in seconds (recording length) or arbitrarily 1.0 if no samples
-                n_samples = int(duration * 1000) + 1000  # Add buffer
-                dummy_data = np.zeros((1, n_samples))
-            else:
-                dummy_data = np.zeros((1, 1000))  # Minimum 1 second of data
-            
-            raw = mne.io.RawArray(dummy_data, info)
-            
-            # Set measurement date to match the first timestamp
-            if timestamps:
-                # raw.set_meas_date(timestamps[0])
-                # raw.set_meas_date(recording_start_datetime.astimezone(pytz.timezone("UTC"))) ## this seems better?!, but probably should be None
-                raw.set_meas_date(recording_start_datetime.astimezone(pytz.timezone("UTC")).strftime('%Y-%m-%d %H:%M:%S.%f')) ## this seems better?!, but probably should be None
-                # raw.set_meas_date(None)
-            
-            raw.set_annotations(annotations)
-            
-            # Add metadata to the raw object
-            raw.info['description'] = 'TextLogger LSL Stream Recording'
-            raw.info['experimenter'] = 'PhoLogToLabStreamingLayer'
-
-            # Determine output filename and format
-            if self.xdf_filename.endswith('.xdf'):
-                # Save as FIF (MNE's native format)
-                fif_filename = self.xdf_filename.replace('.xdf', '.fif')
-                raw.save(fif_filename, overwrite=True)
-                actual_filename = fif_filename
-                file_type = "FIF"
-            else:
-                # Use the original filename
-                raw.save(self.xdf_filename, overwrite=True)
-                actual_filename = self.xdf_filename
-                file_type = "FIF"
-            
-            # Also save a CSV for easy reading
-
-            
-            if isinstance(actual_filename, str):
-                actual_filename = Path(actual_filename).resolve()
-
-            _default_CSV_folder = actual_filename.parent.joinpath('CSV')
-            _default_CSV_folder.mkdir(parents=True, exist_ok=True)
-            print(f'_default_CSV_folder: "{_default_CSV_folder}"')
-
-            csv_filename: str = actual_filename.name.replace('.fif', '_events.csv')
-            csv_filepath: Path = _default_CSV_folder.joinpath(csv_filename).resolve()
-
-            self.save_events_csv(csv_filepath, messages, timestamps, recording_start_datetime=recording_start_datetime, recording_start_lsl_local_offset=recording_start_lsl_local_offset)
-            
-            _status_str: str = (f"{file_type} file saved: '{actual_filename}'\n"
-                f"Events CSV saved: '{csv_filepath}'\n"
+            fif_path, csv_path = save_markers_fif_and_csv(self.recorded_data, self.xdf_filename, recording_start_datetime=self.recording_start_datetime, recording_start_lsl_local_offset=self.recording_start_lsl_local_offset)
+            _status_str: str = (f"FIF file saved: '{fif_path}'\n"
+                f"Events CSV saved: '{csv_path}'\n"
                 f"Recorded {len(self.recorded_data)} samples")
             self.update_log_display(_status_str, timestamp=None)
             # messagebox.showinfo("Success", _status_str)
@@ -1735,26 +2579,7 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
     def save_events_csv(self, csv_filename, messages, timestamps, recording_start_datetime: datetime, recording_start_lsl_local_offset: float):
         """Save events as CSV for easy reading"""
         try:
-            import csv
-            
-            with open(csv_filename, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(['Timestamp', 'LSL_Time', 'LSL_Time_Offset', 'Message'])
-
-                initial_lsl_time = recording_start_lsl_local_offset # timestamps[0]
-                
-                for i, (message, lsl_time) in enumerate(zip(messages, timestamps)):
-                    ## compute relative LSL offset:
-                    relative_lsl_time_sec: float = lsl_time - initial_lsl_time
-                    assert (relative_lsl_time_sec >= 0), f"Relative LSL time is negative: {relative_lsl_time_sec}"
-
-                    # Convert LSL timestamp to readable datetime
-                    readable_datetime: datetime = (recording_start_datetime + timedelta(seconds=relative_lsl_time_sec)).astimezone(pytz.timezone("US/Eastern")) ## using timedelta(seconds=lsl_time) was clearly wrong (off by several days)
-                    readable_datetime_str: str = readable_datetime.strftime("%Y-%m-%d %I:%M:%S.%f %p") ## 12H AM/PM format
-                    # readable_datetime_str = readable_datetime.strftime('%Y-%m-%d %H:%M:%S.%f') ## 24H format
-                    # readable_time = datetime.fromtimestamp(lsl_time).strftime('%Y-%m-%d %H:%M:%S.%f')[:-3] ## Sadly this writes datetimes like "1/3/1970  11:35:25 AM", which are completely wrong (both date and time components not even close)
-                    writer.writerow([readable_datetime_str, lsl_time, relative_lsl_time_sec, message])
-                    
+            save_events_csv(csv_filename, messages, timestamps, recording_start_datetime=recording_start_datetime, recording_start_lsl_local_offset=recording_start_lsl_local_offset)
         except Exception as e:
             print(f"Error saving CSV: {e}")
 
@@ -1768,10 +2593,11 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
             return
         
         # Use the timestamp when user first started typing
-        timestamp = self.get_main_text_timestamp().strftime("%Y-%m-%d %H:%M:%S") # I'm guessing this is wrong too
+        timestamp_dt, lsl_timestamp = self.get_main_text_timestamps()
+        timestamp = timestamp_dt.strftime("%Y-%m-%d %H:%M:%S")
         
-        # Send LSL message
-        self.send_lsl_message(message)
+        # Send LSL message, stamped with the first keystroke
+        self.send_lsl_message(message, lsl_timestamp=lsl_timestamp)
         
         # Update display
         self.update_log_display(message, timestamp)
@@ -1781,18 +2607,19 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
         self.text_entry.focus()
     
 
-    def send_lsl_message(self, message):
-        """Send message via LSL"""
-        if self.outlet_TextLogger:
-            try:
-                # Send message with timestamp
-                self.outlet_TextLogger.push_sample([message])
-                print(f"LSL message sent: {message}")
-            except Exception as e:
-                print(f"Error sending LSL message: {e}")
-                messagebox.showerror("LSL Error", f"Failed to send LSL message: {str(e)}")
-        else:
-            print("LSL outlet not available")
+    def send_lsl_message(self, message, lsl_timestamp: Optional[float] = None):
+        """Send message via LSL (queued to the TextLogger outlet dispatcher)
+
+        lsl_timestamp: explicit LSL timestamp for the marker (see `capture_input_lsl_timestamp`), defaults to now.
+        """
+        dispatcher = self.outlet_dispatchers.get('TextLogger')
+        if dispatcher is None:
+            lsl_logger.warning("LSL outlet not available")
+            return
+        # Queue message; the dispatcher thread does the actual push with this exact timestamp.
+        # If the outlet isn't created yet the message is buffered and flushed (with this timestamp) once it is.
+        if not dispatcher.submit([message], timestamp=lsl_timestamp):
+            lsl_logger.warning("LSL message dropped (send queue full): %s", message)
     
 
     def update_log_display(self, message, timestamp=None):
@@ -1807,31 +2634,328 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
         
         try:
             log_entry = f"[{timestamp}] {message}\n"
-            self.log_display.insert(tk.END, log_entry)
-            self.log_display.see(tk.END)  # Auto-scroll to bottom
+            self.log_history.append(log_entry) # bounded widget + on-disk history
+            if not self.log_history.is_live:
+                self._update_log_history_page_label()
         except tk.TclError:
             # GUI is being destroyed, ignore the error
             pass
     
     def clear_log_display(self):
-        """Clear the log display area"""
-        self.log_display.delete(1.0, tk.END)
+        """Clear the log display area (the on-disk history is kept)"""
+        self.log_history.clear_display()
+        self._update_log_history_page_label()
+
+    def on_log_history_older(self):
+        """Show the previous page of the on-disk log history"""
+        self.log_history.show_older_page()
+        self._update_log_history_page_label()
+
+    def on_log_history_newer(self):
+        """Show the next page of the on-disk log history (or return to live view)"""
+        self.log_history.show_newer_page()
+        self._update_log_history_page_label()
+
+    def on_log_history_live(self):
+        """Return the log display to the live view"""
+        self.log_history.show_live()
+        self._update_log_history_page_label()
+
+    def _update_log_history_page_label(self):
+        """Show which history page (or live view) is displayed"""
+        try:
+            if self.log_history.is_live:
+                self.log_history_page_label.config(text="Live")
+            else:
+                page_text = f"Page {self.log_history.current_page + 1}/{self.log_history.page_count}"
+                if self.log_history.lines_since_paging > 0:
+                    page_text += f" ({self.log_history.lines_since_paging} new)"
+                self.log_history_page_label.config(text=page_text)
+        except tk.TclError:
+            pass  # GUI is being destroyed
     
+    # ---------------------------------------------------------------------------- #
+    #                            Marker History Search                             #
+    # ---------------------------------------------------------------------------- #
+
+    def start_marker_history_db(self):
+        """Open the SQLite marker history database in the app data folder and start its writer thread"""
+        try:
+            self.marker_history_db = MarkerHistoryDB(get_app_data_folder('marker_history') / 'marker_history.sqlite3')
+            self.marker_history_db.start()
+        except Exception as e:
+            print(f"Error opening marker history database (search disabled): {e}")
+            self.marker_history_db = None
+
+
+    def stop_marker_history_db(self):
+        """Write any queued markers and close the marker history database"""
+        if self.marker_history_db is not None:
+            self.marker_history_db.stop()
+            print(f"Marker history database stopped: {self.marker_history_db.get_metrics()}")
+            self.marker_history_db = None
+
+
+    def add_marker_to_history(self, stream_name: str, direction: str, sample, lsl_timestamp: Optional[float]):
+        """Queue a sent/received text marker for the marker history database (safe from any thread; non-text samples are skipped)"""
+        db = self.marker_history_db
+        if (db is None) or (not sample):
+            return
+        values = sample if isinstance(sample, (list, tuple)) else [sample]
+        if not isinstance(values[0], str):
+            return # numeric streams (e.g. 'EventBoardCodes') duplicate their text counterparts
+        recording_file = str(self.xdf_filename) if (self.recording and getattr(self, 'xdf_filename', None)) else None
+        db.add_marker(stream_name, direction, "|".join(str(v) for v in values), lsl_timestamp=lsl_timestamp, recording_file=recording_file)
+
+
+    # ---------------------------------------------------------------------------- #
+    #                                Recording Sinks                               #
+    # ---------------------------------------------------------------------------- #
+
+    def start_recording_sinks(self, record_in_process: bool):
+        """Create the outputs of the current recording (see `features/recording_sinks.py`): the FIF/CSV file and backups when recording in-process,
+        and InfluxDB if it is configured in the environment (see `features/influxdb_sink.py`). Replaces the sinks of a failed LabRecorder attempt.
+        """
+        if not self.recording:
+            return # stopped before the recording thread got here
+        router = RecordingSinkRouter(on_recording_finished=self._on_recording_sinks_finished)
+        if record_in_process:
+            router.add_sink(MarkerFileSink())
+            router.add_sink(BackupJsonSink(every_n_samples=10))
+        influxdb_sink = create_influxdb_sink_from_env()
+        if influxdb_sink is not None:
+            router.add_sink(influxdb_sink)
+        router.start(RecordingTarget(self.xdf_filename, self.recording_start_datetime, self.recording_start_lsl_local_offset))
+        previous_router, self.recording_sinks = self.recording_sinks, router
+        if previous_router is not None:
+            previous_router.close()
+
+
+    def stop_recording_sinks(self):
+        """Finish the current recording's outputs; saving continues on the sink threads"""
+        router, self.recording_sinks = self.recording_sinks, None
+        if router is not None:
+            router.close()
+            self._closing_recording_sinks = [a_router for a_router in self._closing_recording_sinks if not a_router.join(timeout=0.0)] + [router]
+
+
+    def wait_for_recording_sinks(self, timeout: float = 30.0):
+        """Wait for stopped recordings to finish saving (on exit)"""
+        for a_router in self._closing_recording_sinks:
+            if not a_router.join(timeout=timeout):
+                recording_logger.error("Recording sinks still busy on exit: %s", a_router.get_metrics())
+        self._closing_recording_sinks = []
+
+
+    def write_recorded_samples(self, stream_name: str, samples: list, timestamps: list):
+        """Queue recorded samples for every sink of the current recording (safe from any thread)"""
+        router = self.recording_sinks
+        if router is not None:
+            router.write_batch(stream_name, samples, timestamps)
+
+
+    def _on_recording_sinks_finished(self, target: RecordingTarget, results: Dict[str, Dict[str, Any]]):
+        """A recording's sinks are done (sink thread): report the saved FIF/CSV file or why it couldn't be saved"""
+        file_result = results.get('markers_file')
+        if file_result is None:
+            return
+        if file_result.get('error'):
+            _status_str = f"Recording '{os.path.basename(target.filename)}' could not be saved (its backup is kept for recovery): {file_result['error']}"
+            recording_logger.error(_status_str)
+        elif not file_result.get('sample_count'):
+            _status_str = f"No data recorded, nothing saved for '{os.path.basename(target.filename)}'"
+            recording_logger.warning(_status_str)
+        else:
+            _status_str = (f"FIF file saved: '{file_result.get('fif_path')}'\n"
+                f"Events CSV saved: '{file_result.get('csv_path')}'\n"
+                f"Recorded {file_result['sample_count']} samples")
+            recording_logger.info(_status_str)
+        if not self._shutting_down:
+            self.ui_bus.post_ordered(lambda: self.update_log_display(_status_str, timestamp=None))
+
+
+    def search_marker_history(self):
+        """Search the marker history for the text in the search box (the query runs off the Tk thread)"""
+        if self.marker_history_db is None:
+            messagebox.showwarning("Search Unavailable", "The marker history database could not be opened.")
+            return
+        query = self.marker_search_entry.get().strip()
+
+        def _search_worker():
+            start_t = time.perf_counter()
+            results = self.marker_history_db.search(query, limit=500) if self.marker_history_db is not None else []
+            elapsed_ms = (time.perf_counter() - start_t) * 1000.0
+            if not self._shutting_down:
+                self.ui_bus.post('marker_search_results', lambda: self.show_marker_search_results(query, results, elapsed_ms))
+
+        threading.Thread(target=_search_worker, daemon=True).start()
+
+
+    def show_marker_search_results(self, query: str, results: List[Dict[str, Any]], elapsed_ms: float):
+        """Show marker search results in a (reused) results window"""
+        if (self.marker_search_window is None) or (not self.marker_search_window.winfo_exists()):
+            window = tk.Toplevel(self.root)
+            window.geometry("900x400")
+            window.columnconfigure(0, weight=1)
+            window.rowconfigure(1, weight=1)
+
+            self.marker_search_status_label = ttk.Label(window, text="")
+            self.marker_search_status_label.grid(row=0, column=0, sticky=tk.W, padx=10, pady=(10, 5))
+
+            columns = ('time', 'stream', 'direction', 'message', 'recording')
+            tree = ttk.Treeview(window, columns=columns, show='headings')
+            for a_column, a_heading, a_width in zip(columns, ('Time', 'Stream', 'Dir', 'Message', 'Recording File'), (140, 100, 60, 320, 260)):
+                tree.heading(a_column, text=a_heading)
+                tree.column(a_column, width=a_width, stretch=(a_column in ('message', 'recording')))
+            tree.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=(10, 0))
+            scrollbar = ttk.Scrollbar(window, orient=tk.VERTICAL, command=tree.yview)
+            scrollbar.grid(row=1, column=1, sticky=(tk.N, tk.S), padx=(0, 10))
+            tree.configure(yscrollcommand=scrollbar.set)
+            tree.bind('<Double-1>', lambda event: self.open_selected_marker_recording())
+            self.marker_search_tree = tree
+
+            ttk.Button(window, text="Open Recording Folder", command=self.open_selected_marker_recording).grid(row=2, column=0, sticky=tk.E, padx=10, pady=10)
+            self.marker_search_window = window
+
+        self.marker_search_window.title(f"Marker History: '{query}'" if query else "Marker History: latest")
+        self.marker_search_tree.delete(*self.marker_search_tree.get_children())
+        for a_result in results:
+            self.marker_search_tree.insert('', tk.END, values=(a_result['datetime'], a_result['stream_name'], a_result['direction'], a_result['message'], a_result['recording_file'] or ''))
+        self.marker_search_status_label.config(text=f"{len(results)} result(s) in {elapsed_ms:.1f} ms")
+        self.marker_search_window.deiconify()
+        self.marker_search_window.lift()
+
+
+    def open_selected_marker_recording(self):
+        """Open the folder containing the recording file of the selected search result"""
+        selection = self.marker_search_tree.selection()
+        if not selection:
+            return
+        recording_file = self.marker_search_tree.item(selection[0], 'values')[4]
+        if not recording_file:
+            messagebox.showinfo("No Recording", "This marker was logged while no recording was active.", parent=self.marker_search_window)
+            return
+        folder = Path(recording_file).parent
+        if not folder.exists():
+            messagebox.showwarning("Folder Not Found", f"The recording folder no longer exists:\n{folder}", parent=self.marker_search_window)
+            return
+        self.open_folder_in_file_browser(folder, parent=self.marker_search_window)
+
+
+    def open_folder_in_file_browser(self, folder: Path, parent=None):
+        """Open `folder` in the platform's file browser"""
+        try:
+            if sys.platform == 'win32':
+                os.startfile(str(folder))
+            elif sys.platform == 'darwin':
+                subprocess.Popen(['open', str(folder)])
+            else:
+                subprocess.Popen(['xdg-open', str(folder)])
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not open folder:\n{e}", parent=parent)
+
+    # ---------------------------------------------------------------------------- #
+    #                               Startup Profile                                #
+    # ---------------------------------------------------------------------------- #
+
+    def finish_startup_profile(self, reason: str):
+        """Freeze the startup profile, write its JSON report to the app data folder and show it in the Settings tab"""
+        if self.startup_profiler.is_finished:
+            return
+        report = self.startup_profiler.finish(reason)
+        try:
+            self.startup_profile_report_path = write_startup_report(report, get_app_data_folder('startup'))
+        except Exception as e:
+            startup_logger.error("Could not write the startup profile report: %s", e)
+        slowest = sorted(report['phases'], key=lambda a_phase: a_phase['duration_sec'], reverse=True)[:3]
+        startup_logger.info("Startup profile finished (%s) after %.2f s, %.2f s in the foreground; slowest: %s", reason, report['elapsed_sec'], report['foreground_sec'],
+                            ", ".join(f"{a_phase['name']}={a_phase['duration_sec'] * 1000.0:.0f}ms" for a_phase in slowest))
+        if not self._shutting_down:
+            self.ui_bus.post('startup_profile', self.update_startup_profile_display)
+
+
+    def setup_startup_profile_gui(self, parent, row: int = 0):
+        """Table of startup phase timings (Settings tab)"""
+        profile_frame = ttk.LabelFrame(parent, text="Startup Profile", padding="5")
+        profile_frame.grid(row=row, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 10))
+        profile_frame.columnconfigure(0, weight=1)
+        parent.rowconfigure(row, weight=1)
+
+        self.startup_profile_summary_label = ttk.Label(profile_frame, text="")
+        self.startup_profile_summary_label.grid(row=0, column=0, sticky=tk.W, pady=(0, 5))
+
+        columns = ('start', 'duration', 'kind', 'details')
+        self.startup_profile_tree = ttk.Treeview(profile_frame, columns=columns, height=12)
+        self.startup_profile_tree.heading('#0', text='Phase')
+        self.startup_profile_tree.column('#0', width=220, stretch=False)
+        for a_column, a_heading, a_width in zip(columns, ('Start (ms)', 'Duration (ms)', 'Kind', 'Details'), (90, 100, 90, 300)):
+            self.startup_profile_tree.heading(a_column, text=a_heading)
+            self.startup_profile_tree.column(a_column, width=a_width, anchor=(tk.W if a_column in ('kind', 'details') else tk.E), stretch=(a_column == 'details'))
+        self.startup_profile_tree.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        profile_frame.rowconfigure(1, weight=1)
+        scrollbar = ttk.Scrollbar(profile_frame, orient=tk.VERTICAL, command=self.startup_profile_tree.yview)
+        scrollbar.grid(row=1, column=1, sticky=(tk.N, tk.S))
+        self.startup_profile_tree.configure(yscrollcommand=scrollbar.set)
+
+        buttons_frame = ttk.Frame(profile_frame)
+        buttons_frame.grid(row=2, column=0, sticky=tk.W, pady=(5, 0))
+        ttk.Button(buttons_frame, text="Refresh", command=self.update_startup_profile_display).grid(row=0, column=0, padx=(0, 5))
+        ttk.Button(buttons_frame, text="Open Report Folder", command=lambda: self.open_folder_in_file_browser(get_app_data_folder('startup'), parent=self.root)).grid(row=0, column=1)
+
+        self.update_startup_profile_display()
+
+
+    def update_startup_profile_display(self):
+        """Refresh the startup profile table from the profiler (Tk thread)"""
+        if self.startup_profile_tree is None:
+            return
+        report = self.startup_profiler.get_report()
+        rows = [(a_phase['start_sec'], a_phase['name'], f"{a_phase['duration_sec'] * 1000.0:.1f}", 'background' if a_phase['background'] else 'foreground', a_phase['details']) for a_phase in report['phases']]
+        rows += [(a_phase['start_sec'], a_phase['name'], f"> {a_phase['running_sec'] * 1000.0:.0f}", 'running', {}) for a_phase in report['unfinished_phases']]
+        rows += [(a_milestone['at_sec'], a_milestone['name'], '', 'milestone', a_milestone['details']) for a_milestone in report['milestones']]
+        try:
+            self.startup_profile_tree.delete(*self.startup_profile_tree.get_children())
+            for a_start_sec, a_name, a_duration, a_kind, a_details in sorted(rows, key=lambda a_row: a_row[0]):
+                details_str = ", ".join(f"{k}={v}" for k, v in a_details.items())
+                self.startup_profile_tree.insert('', tk.END, text=a_name, values=(f"{a_start_sec * 1000.0:.1f}", a_duration, a_kind, details_str))
+
+            if report['finish_reason'] is None:
+                summary = f"Startup in progress ({report['elapsed_sec']:.1f} s so far)"
+            else:
+                summary = f"Startup finished ({report['finish_reason']}) after {report['elapsed_sec']:.2f} s; {report['foreground_sec']:.2f} s in the foreground"
+            if report['before_profiler_sec'] is not None:
+                summary += f"; {report['before_profiler_sec']:.2f} s before the app object was created (interpreter + imports)"
+            if self.startup_profile_report_path is not None:
+                summary += f"\nReport: {self.startup_profile_report_path}"
+            self.startup_profile_summary_label.config(text=summary)
+        except tk.TclError:
+            pass  # GUI is being destroyed
+
+
     # ---------------------------------------------------------------------------- #
     #                          Lab-Recorder Integration                            #
     # ---------------------------------------------------------------------------- #
     
     def init_lab_recorder(self):
-        """Initialize lab-recorder for XDF recording"""
+        """Initialize lab-recorder for XDF recording (safe to call from a background thread)"""
         try:
             if self.lab_recorder is None:
                 # Create LabRecorder instance but don't start recording yet
-                self.lab_recorder = LabRecorder()
+                self.lab_recorder = labrecorder.LabRecorder()
                 print("LabRecorder initialized successfully")
             return True
         except Exception as e:
             print(f"Error initializing LabRecorder: {e}")
             return False
+        finally:
+            self.startup_profiler.end('lab_recorder_init', details={'ok': self.lab_recorder is not None})
+            self.lab_recorder_init_done_event.set()
+
+
+    def _on_import_warm_up_done(self, import_timings: Dict[str, float]):
+        """Report how long each deferred dependency took to import (called on the warm-up thread)"""
+        print("Background import warm-up done: " + ", ".join(f"{k}={v * 1000.0:.0f}ms" for k, v in import_timings.items()))
+        self.startup_profiler.end('import_warm_up', details={f'{k}_ms': round(v * 1000.0, 1) for k, v in import_timings.items()})
     
 
     def cleanup_lab_recorder(self):
@@ -1847,9 +2971,37 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
             print(f"Error cleaning up LabRecorder: {e}")
     
 
-    def is_lab_recorder_available(self) -> bool:
-        """Check if lab-recorder is available and initialized"""
+    @property
+    def is_lab_recorder_init_done(self) -> bool:
+        """Whether the background LabRecorder initialization (in-process or in the recorder worker) has finished, successfully or not"""
+        worker = self.recorder_worker
+        if worker is not None:
+            return worker.has_reported_ready
+        return self.lab_recorder_init_done_event.is_set()
+
+
+    def is_lab_recorder_available(self, wait_timeout: float = 0.0) -> bool:
+        """Check if lab-recorder is available and initialized
+
+        Doesn't wait by default (False while the background initialization is still running), so it's safe on the Tk thread;
+        only background threads should pass a `wait_timeout` to wait up to that many seconds for the initialization.
+        """
+        worker = self.recorder_worker
+        if worker is not None:
+            return worker.wait_until_ready(timeout=wait_timeout) and worker.lab_recorder_available
+        if wait_timeout > 0:
+            self.lab_recorder_init_done_event.wait(timeout=wait_timeout)
         return self.lab_recorder is not None
+
+
+    def _call_after_lab_recorder_init(self, callback: Callable[[], None], poll_interval_ms: int = 200):
+        """Call `callback` on the Tk thread once `is_lab_recorder_init_done` (polls with `root.after`, never blocks the Tk thread)"""
+        if self._shutting_down:
+            return
+        if self.is_lab_recorder_init_done:
+            callback()
+        else:
+            self.root.after(poll_interval_ms, lambda: self._call_after_lab_recorder_init(callback, poll_interval_ms))
     
 
     def start_stream_discovery(self):
@@ -1860,7 +3012,8 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
         self.stream_discovery_active = True
         self.stream_monitor_thread = threading.Thread(target=self.stream_discovery_worker, daemon=True)
         self.stream_monitor_thread.start()
-        print("Stream discovery started")
+        self.startup_profiler.mark('stream_discovery_started')
+        discovery_logger.info("Stream discovery started")
     
 
     def stop_stream_discovery(self):
@@ -1868,7 +3021,7 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
         self.stream_discovery_active = False
         if self.stream_monitor_thread and self.stream_monitor_thread.is_alive():
             self.stream_monitor_thread.join(timeout=2.0)
-        print("Stream discovery stopped")
+        discovery_logger.info("Stream discovery stopped")
     
 
     def stream_discovery_worker(self):
@@ -1877,6 +3030,10 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
         max_consecutive_errors = 5
         
         while self.stream_discovery_active and not self._shutting_down:
+            if self._manual_refresh_in_progress:
+                # A manual refresh is already resolving; merge with it instead of running a second resolve concurrently
+                time.sleep(0.2)
+                continue
             try:
                 # Discover all available LSL streams
                 streams = pylsl.resolve_streams(wait_time=1.0)
@@ -1885,43 +3042,20 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
                 consecutive_errors = 0
                 
                 # Update discovered streams dictionary
-                new_discovered = {}
-                for stream in streams:
-                    try:
-                        stream_key = f"{stream.name()}_{stream.source_id()}"
-                        new_discovered[stream_key] = stream
-                    except Exception as e:
-                        print(f"Error processing stream {stream}: {e}")
-                        continue
+                new_discovered = self._build_discovered_streams_dict(streams)
                 
                 # Check for changes and notify of disconnections
-                # Use lock to safely compare and update discovered_streams
-                new_streams = set()
-                with self._stream_discovery_lock:
-                    if self._shutting_down:
-                        break
-                    if new_discovered != self.discovered_streams:
-                        # Detect disconnected streams
-                        disconnected_streams = set(self.discovered_streams.keys()) - set(new_discovered.keys())
-                        if disconnected_streams:
-                            print(f"Streams disconnected: {disconnected_streams}")
-                            # Remove disconnected streams from selection
-                            for stream_key in disconnected_streams:
-                                self.selected_streams.discard(stream_key)
-                        
-                        # Detect new streams
-                        new_streams = set(new_discovered.keys()) - set(self.discovered_streams.keys())
-                        if new_streams:
-                            print(f"New streams discovered: {new_streams}")
-                        
-                        self.discovered_streams = new_discovered
+                if self._shutting_down:
+                    break
+                new_streams = self._apply_discovered_streams(new_discovered)
                 
                 # Schedule GUI update on main thread (outside lock to avoid blocking)
                 if not self._shutting_down:
-                    self.root.after(0, self.update_stream_display)
+                    self.ui_bus.post('stream_display', self.update_stream_display)
                     
                     # Try to auto-start recording if we haven't already and streams are available
                     if not self.auto_start_attempted and new_streams:
+                        self.startup_profiler.mark('first_streams_discovered', details={'count': len(new_streams)})
                         # Auto-select own streams and try to start recording
                         self.root.after(500, self._try_auto_start_after_stream_discovery)
                 
@@ -1930,15 +3064,15 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
                 
             except Exception as e:
                 consecutive_errors += 1
-                print(f"Error in stream discovery (attempt {consecutive_errors}): {e}")
+                discovery_logger.error("Error in stream discovery (attempt %d): %s", consecutive_errors, e)
                 
                 # If too many consecutive errors, increase wait time and potentially stop
                 if consecutive_errors >= max_consecutive_errors:
-                    print(f"Too many consecutive stream discovery errors ({consecutive_errors}). Stopping discovery.")
+                    discovery_logger.error("Too many consecutive stream discovery errors (%d). Stopping discovery.", consecutive_errors)
                     self.stream_discovery_active = False
                     # Notify user via GUI
                     if not self._shutting_down:
-                        self.root.after(0, lambda: self.update_log_display(
+                        self.ui_bus.post_ordered(lambda: self.update_log_display(
                             "Stream discovery stopped due to repeated errors", 
                             datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                         ))
@@ -2025,42 +3159,114 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
                 self.update_stream_tree_display()
     
 
+    def _build_discovered_streams_dict(self, streams) -> Dict[str, pylsl.StreamInfo]:
+        """Build the stream_key -> StreamInfo dictionary for a list of resolved streams"""
+        new_discovered = {}
+        for stream in streams:
+            try:
+                stream_key = f"{stream.name()}_{stream.source_id()}"
+                new_discovered[stream_key] = stream
+            except Exception as e:
+                discovery_logger.error("Error processing stream %s: %s", stream, e)
+                continue
+        return new_discovered
+
+
+    def _apply_discovered_streams(self, new_discovered: Dict[str, pylsl.StreamInfo]) -> set:
+        """Replace self.discovered_streams with new_discovered (thread-safe), dropping disconnected streams from the selection.
+
+        Returns the set of newly discovered stream keys.
+        """
+        new_streams = set()
+        # Use lock to safely compare and update discovered_streams
+        with self._stream_discovery_lock:
+            if new_discovered != self.discovered_streams:
+                # Detect disconnected streams
+                disconnected_streams = set(self.discovered_streams.keys()) - set(new_discovered.keys())
+                if disconnected_streams:
+                    discovery_logger.info("Streams disconnected: %s", disconnected_streams)
+                    # Remove disconnected streams from selection
+                    for stream_key in disconnected_streams:
+                        self.selected_streams.discard(stream_key)
+                
+                # Detect new streams
+                new_streams = set(new_discovered.keys()) - set(self.discovered_streams.keys())
+                if new_streams:
+                    discovery_logger.info("New streams discovered: %s", new_streams)
+                
+                self.discovered_streams = new_discovered
+        return new_streams
+
+
     def refresh_streams(self):
-        """Manually refresh stream discovery with error handling"""
+        """Manually refresh stream discovery without blocking the Tk main thread.
+
+        The resolve runs on a background thread; while it is running the continuous discovery worker pauses its own cycles
+        and clicking the button again is a no-op (the in-flight refresh is reused). Results are delivered on the main thread via `self.ui_bus`.
+        """
+        if self._manual_refresh_in_progress:
+            return  # Merge with the refresh that is already running
+
+        self._manual_refresh_in_progress = True
         try:
             # Update GUI to show refreshing status
+            if hasattr(self, 'refresh_streams_button'):
+                self.refresh_streams_button.config(state="disabled", text="Refreshing...")
             if hasattr(self, 'stream_info_label'):
                 self.stream_info_label.config(text="Refreshing streams...")
-            
+        except tk.TclError:
+            pass  # GUI is being destroyed
+
+        self._manual_refresh_thread = threading.Thread(target=self._refresh_streams_worker, daemon=True)
+        self._manual_refresh_thread.start()
+
+
+    def _refresh_streams_worker(self):
+        """Background worker for a manual stream refresh"""
+        found_count = None
+        error_msg = None
+        try:
             # Discover all available LSL streams
             streams = pylsl.resolve_streams(wait_time=2.0)
-            
-            # Update discovered streams dictionary
-            new_discovered = {}
-            for stream in streams:
-                try:
-                    stream_key = f"{stream.name()}_{stream.source_id()}"
-                    new_discovered[stream_key] = stream
-                except Exception as e:
-                    print(f"Error processing stream during refresh: {e}")
-                    continue
-            
-            with self._stream_discovery_lock:
-                self.discovered_streams = new_discovered
-            self.update_stream_tree_display()
-            
-            # Update status
-            self.update_log_display(f"Stream refresh completed: {len(new_discovered)} streams found", 
-                                  datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-            
+            new_discovered = self._build_discovered_streams_dict(streams)
+            if not self._shutting_down:
+                self._apply_discovered_streams(new_discovered)
+            found_count = len(new_discovered)
         except Exception as e:
             error_msg = f"Error refreshing streams: {e}"
-            print(error_msg)
+            discovery_logger.error(error_msg)
+        finally:
+            self._manual_refresh_in_progress = False
+
+        if self._shutting_down:
+            return
+        try:
+            self.ui_bus.post('stream_refresh_complete', lambda: self._on_refresh_streams_complete(found_count, error_msg))
+        except (tk.TclError, RuntimeError):
+            pass  # GUI is being destroyed
+
+
+    def _on_refresh_streams_complete(self, found_count: Optional[int], error_msg: Optional[str]):
+        """Apply the results of a manual stream refresh (called on the main thread)"""
+        if self._shutting_down:
+            return
+        try:
+            if hasattr(self, 'refresh_streams_button'):
+                self.refresh_streams_button.config(state="normal", text="Refresh Streams")
+        except tk.TclError:
+            return  # GUI is being destroyed
+
+        if error_msg is not None:
             self.update_log_display(error_msg, datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-            
             # Update GUI to show error status
             if hasattr(self, 'stream_info_label'):
                 self.stream_info_label.config(text="Stream refresh failed")
+            return
+
+        self.update_stream_tree_display()
+        # Update status
+        self.update_log_display(f"Stream refresh completed: {found_count} streams found", 
+                              datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
     
 
     def select_all_streams(self):
@@ -2126,14 +3332,25 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
         """Handle window closing"""
         # Set shutdown flag to prevent GUI updates
         self._shutting_down = True
+        self.ui_bus.stop()
+        print(f"UI update bus: {self.ui_bus.get_metrics()}")
         
+        self.finish_startup_profile('closed')
+
+        # No more markers from other processes or followed files
+        self.stop_marker_ingest_server()
+        self.stop_file_tail_ingest()
+
         # Stop transcription if active
         if self.transcription_active:
             self.stop_live_transcription()
+        self.stop_transcription_worker()
 
         # Stop recording if active
         if self.recording:
             self.stop_recording()
+        self.stop_recorder_worker() # waits for the worker to finish saving
+        self.wait_for_recording_sinks()
         
         # Stop stream discovery
         self.stop_stream_discovery()
@@ -2152,6 +3369,7 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
         
         # Restore stdout/stderr streams from console output capture
         if hasattr(self, 'console_output_frame') and self.console_output_frame is not None:
+            remove_log_subscriber(self.console_output_frame.append_text)
             self.console_output_frame.restore_streams()
         
         # Clean up system tray
@@ -2164,6 +3382,9 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
         # Stop taskbar overlay flashing
         self.stop_taskbar_overlay_flash()
         
+        # Push any queued messages (e.g. RECORDING_STOPPED) before the outlets go away
+        self.stop_outlet_dispatchers()
+
         # Clean up LSL resources (only after threads have stopped or been confirmed stopped)
         if hasattr(self, 'outlets') and self.outlets:
             # for an_outlet_name, an_outlet in self.outlets:
@@ -2181,6 +3402,17 @@ class LoggerApp(RecordingIndicatorIconMixin, GlobalHotkeyMixin, AppThemeMixin, S
             del self.inlets
 
 
+        # Close the on-disk log history
+        if hasattr(self, 'log_history'):
+            self.log_history.close()
+
+        self.stop_marker_history_db()
+        self.stop_eventboard_config_watcher()
+        self.cleanup_eventboard_hotkeys()
+
+        # Flush and stop the logging listener thread
+        shutdown_app_logging()
+
         # Release singleton lock
         self.release_singleton_lock()
         